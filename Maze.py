@@ -1,5 +1,23 @@
 import numpy as np
 import heapq
+from bisect import bisect_right
+from collections import deque
+
+import batch
+from anytime import DEFAULT_EPSILONS, ara_star
+from connectivity import ComponentIndex
+from distance_field import DistanceField, compute_distance_field
+from goal_cache import DEFAULT_MAX_BYTES, GoalFieldCache, descend
+from grid_graph import compile_grid_graph
+from jps import JumpTables
+from landmarks import LandmarkHeuristic
+from maze_file import load_maze, save_maze
+from path_cache import DEFAULT_RESULT_BYTES, PathCache, cached_solver
+from tiled_grid import DEFAULT_CACHE_BYTES, DEFAULT_TILE_SIZE, open_tiled, save_tiled
+from priority_queues import MONOTONE_QUEUE_TYPES, make_queue
+from search_state import SearchState
+from search_steps import DEFAULT_BATCH_SIZE, SearchStep, drive
+from storage import get_storage
 
 
 class Maze:
@@ -7,7 +25,19 @@ class Maze:
     Classe représentant un labyrinthe avec obstacles, récompenses et points de départ/arrivée.
     """
    
-    def __init__(self, width, height, grid=None, rewards=None, start=None, goal=None):
+    # Directions du voisinage : (delta_row, delta_col, multiplicateur_coût)
+    DIRECTIONS = (
+        (-1, 0, 1.0),  # Haut
+        (1, 0, 1.0),   # Bas
+        (0, -1, 1.0),  # Gauche
+        (0, 1, 1.0),   # Droite
+    )
+   
+    # Nombre maximal de cellules gardées dans le journal des modifications
+    CHANGE_LOG_SIZE = 65536
+   
+    def __init__(self, width, height, grid=None, rewards=None, start=None, goal=None,
+                 storage="default"):
         """
         Initialise un labyrinthe.
        
@@ -18,25 +48,597 @@ class Maze:
             rewards (np.ndarray, optional): Matrice de récompense
             start (tuple, optional): Coordonnées du point de départ (ligne, colonne)
             goal (tuple, optional): Coordonnées du point d'arrivée (ligne, colonne)
+            storage (str | GridStorage): Représentation de la grille et des récompenses
+                ("default", "compact", "packed", "packed_int16", voir storage.py)
         """
         self.width = width
         self.height = height
        
+        # Représentation mémoire de la grille et des récompenses
+        self.storage = get_storage(storage)
+       
+        # Version de la grille : incrémentée à chaque modification
+        # (sert à invalider le graphe compilé)
+        self._version = 0
+        # Version des obstacles seuls (les récompenses n'y contribuent pas)
+        self._obstacle_version = 0
+        # Journal des cellules modifiées : (version, (row, col)), pour la
+        # replanification incrémentale. Les versions antérieures à
+        # _change_log_origin ne sont plus couvertes.
+        self._change_log = []
+        self._change_log_origin = 0
+        self._reset_caches()
+       
+        # Cache des champs de coût restant par arrivée (désactivé par défaut)
+        self.goal_cache = None
+       
+        # Heuristique ALT par repères (désactivée par défaut, voir enable_landmarks)
+        self.landmarks = None
+       
+        # Index des composantes connexes (désactivé par défaut, voir enable_connectivity_index)
+        self.connectivity = None
+       
+        # Cache des résultats de recherche (désactivé par défaut, voir enable_path_cache)
+        self.path_cache = None
+       
+        # Fichier projeté en mémoire dont proviennent la grille et les récompenses (voir load)
+        self.mapped_file = None
+       
+        # Cache des tuiles d'un monde hors mémoire (voir open_tiled)
+        self.tiles = None
+       
         # Initialisation de la grille (0 = libre, 1 = obstacle)
         if grid is None:
-            self.grid = np.zeros((height, width), dtype=int)
+            self.grid = self.storage.empty_grid((height, width))
         else:
-            self.grid = np.array(grid, dtype=int)
+            self.grid = self.storage.as_grid(grid)
            
         # Initialisation de la matrice de récompense
         if rewards is None:
-            self.rewards = np.ones((height, width), dtype=float)
+            self.rewards = self.storage.full_rewards((height, width), 1.0)
         else:
-            self.rewards = np.array(rewards, dtype=float)
+            self.rewards = self.storage.as_rewards(rewards)
            
         # Initialisation des points de départ et d'arrivée
         self.start = start if start is not None else (0, 0)
         self.goal = goal if goal is not None else (height - 1, width - 1)
+   
+    def _reset_caches(self):
+        """Vide les structures dérivées de la grille (recalculées à la demande)."""
+        self._graph = None
+        self._graph_version = -1
+       
+        # Tampons de recherche NumPy réutilisés entre les requêtes (mode array_state)
+        self._search_states = {}
+       
+        # Profil des coûts d'arête entiers (files monotones), recalculé par version
+        self._cost_profile = None
+        self._cost_profile_version = -1
+       
+        # Tables de saut JPS+, recalculées quand les obstacles changent
+        self._jump_tables = None
+        self._jump_tables_version = -1
+   
+    @property
+    def grid(self):
+        """Grille des obstacles (0 = libre, 1 = obstacle)."""
+        return self._grid
+   
+    @grid.setter
+    def grid(self, value):
+        # Une grille déjà au bon format est gardée telle quelle (pas de copie)
+        self._grid = self.storage.as_grid(value, copy=False)
+        self.mark_modified()
+   
+    @property
+    def rewards(self):
+        """Matrice de récompense."""
+        return self._rewards
+   
+    @rewards.setter
+    def rewards(self, value):
+        self._rewards = self.storage.as_rewards(value, copy=False)
+        self._version += 1
+        self._clear_change_log()
+   
+    def memory_usage(self):
+        """
+        Retourne la mémoire occupée par la grille, les récompenses et le graphe compilé.
+       
+        Returns:
+            dict: grid, rewards, graph (0 si le graphe n'est pas compilé ou s'il
+                  est lu à la demande dans les tuiles) et total (octets),
+                  storage (représentation)
+        """
+        grid_bytes = int(self.grid.nbytes)
+        rewards_bytes = int(self.rewards.nbytes)
+        graph_bytes = 0
+        if self._graph is not None and self._graph_version == self._version:
+            graph_bytes = getattr(self._graph, "nbytes", 0)
+        return {
+            "grid": grid_bytes,
+            "rewards": rewards_bytes,
+            "graph": graph_bytes,
+            "total": grid_bytes + rewards_bytes + graph_bytes,
+            "storage": self.storage,
+        }
+   
+    def save(self, path, metadata=None):
+        """
+        Enregistre le labyrinthe dans un fichier projetable en mémoire (voir maze_file.py).
+       
+        Args:
+            path (str): Chemin du fichier
+            metadata (dict, optional): Métadonnées libres (sérialisables en JSON)
+        """
+        save_maze(self, path, metadata)
+   
+    @classmethod
+    def load(cls, path, mmap_mode="c", storage=None):
+        """
+        Ouvre un labyrinthe enregistré par save, sans lire ni copier ses tableaux.
+       
+        La grille et les récompenses sont des projections numpy.memmap du fichier :
+        l'ouverture ne dépend pas de la taille de la carte, et les processus qui
+        ouvrent le même fichier partagent les mêmes pages du cache système.
+       
+        Args:
+            path (str): Chemin du fichier
+            mmap_mode (str): "c" (copie à l'écriture), "r" (lecture seule) ou
+                             "r+" (modifications écrites dans le fichier)
+            storage (str | GridStorage, optional): Représentation voulue (par défaut
+                celle du fichier ; une autre représentation copie les tableaux)
+           
+        Returns:
+            Maze: Labyrinthe de la classe appelante (Maze, DiagonalMaze, BiDirectionalMaze...)
+        """
+        return load_maze(cls, path, mmap_mode, storage)
+   
+    def save_tiled(self, path, tile_size=DEFAULT_TILE_SIZE, metadata=None):
+        """
+        Enregistre le labyrinthe dans un fichier de tuiles (voir tiled_grid.py).
+       
+        Args:
+            path (str): Chemin du fichier
+            tile_size (int): Côté des tuiles (cellules)
+            metadata (dict, optional): Métadonnées libres (sérialisables en JSON)
+        """
+        save_tiled(self, path, tile_size, metadata=metadata)
+   
+    @classmethod
+    def open_tiled(cls, path, cache_bytes=DEFAULT_CACHE_BYTES, readonly=False):
+        """
+        Ouvre un monde en tuiles : la grille et les récompenses sont lues tuile par
+        tuile quand la recherche les atteint, dans un cache LRU borné (maze.tiles).
+       
+        Les solveurs parcourent alors un graphe paresseux (voir get_graph) ; les
+        modifications sont écrites dans le fichier à l'éviction des tuiles ou par
+        maze.tiles.flush().
+       
+        Args:
+            path (str): Chemin du fichier (créé par save_tiled ou TileFile.create)
+            cache_bytes (int): Mémoire maximale des tuiles chargées
+            readonly (bool): Si True, toute modification de la grille lève une erreur
+           
+        Returns:
+            Maze: Labyrinthe de la classe appelante
+        """
+        return open_tiled(cls, path, cache_bytes, readonly)
+   
+    @property
+    def version(self):
+        """
+        Compteur de modifications de la grille et des récompenses.
+       
+        Les modifications passant par set_obstacle, remove_obstacle, set_reward
+        ou par une réaffectation de grid/rewards incrémentent ce compteur.
+        Une écriture directe dans le tableau (maze.grid[i, j] = 1) doit être
+        suivie d'un appel à mark_modified().
+        """
+        return self._version
+   
+    def mark_modified(self):
+        """Signale une modification de la grille faite hors des méthodes dédiées."""
+        self._version += 1
+        self._obstacle_version += 1
+        self._clear_change_log()
+   
+    def changes_since(self, version):
+        """
+        Retourne les cellules modifiées depuis une version donnée.
+       
+        Seules les modifications faites par set_obstacle, remove_obstacle et
+        set_reward sont journalisées cellule par cellule ; une nouvelle grille,
+        de nouvelles récompenses ou mark_modified rendent le journal incomplet.
+       
+        Args:
+            version (int): Version de référence (valeur de maze.version)
+           
+        Returns:
+            list ou None: Cellules (row, col) modifiées depuis version (éventuellement
+                          en double), None si le journal ne couvre pas cette version
+        """
+        if version < self._change_log_origin:
+            return None
+        first = bisect_right(self._change_log, version, key=lambda entry: entry[0])
+        return [cell for _, cell in self._change_log[first:]]
+   
+    def _record_change(self, row, col):
+        """Ajoute une cellule modifiée au journal (après incrément de la version)."""
+        if len(self._change_log) >= self.CHANGE_LOG_SIZE:
+            # Les entrées les plus anciennes sont oubliées
+            dropped = self._change_log[:len(self._change_log) // 2]
+            del self._change_log[:len(dropped)]
+            self._change_log_origin = dropped[-1][0]
+        self._change_log.append((self._version, (row, col)))
+   
+    def _clear_change_log(self):
+        """Vide le journal : les versions antérieures ne sont plus couvertes."""
+        self._change_log = []
+        self._change_log_origin = self._version
+   
+    def graph_directions(self):
+        """
+        Retourne les directions du voisinage utilisées pour compiler le graphe.
+       
+        Returns:
+            tuple: Tuples (delta_row, delta_col, multiplicateur_coût)
+        """
+        return self.DIRECTIONS
+   
+    def get_graph(self):
+        """
+        Retourne le graphe CSR compilé de la grille.
+       
+        Le graphe n'est recompilé que si la grille ou les récompenses ont changé
+        depuis la dernière compilation. Pour un monde en tuiles (open_tiled), les
+        voisins sont lus à la demande dans les tuiles (LazyGridGraph).
+       
+        Returns:
+            GridGraph: Graphe d'adjacence avec identifiants plats et coûts d'arêtes
+        """
+        if self._graph is None or self._graph_version != self._version:
+            if self.tiles is not None:
+                # Monde en tuiles : voisins lus à la demande, sans compilation
+                self._graph = self.tiles.graph(self.graph_directions())
+            else:
+                self._graph = compile_grid_graph(self.grid, self.rewards, self.graph_directions(),
+                                                 self.storage.weight_dtype)
+            self._graph_version = self._version
+        return self._graph
+   
+    def get_search_state(self, slot="forward"):
+        """
+        Retourne les tampons de recherche préalloués pour un emplacement donné.
+       
+        Les tampons sont alloués une seule fois par taille de grille puis réutilisés
+        par toutes les requêtes ; la remise à zéro se fait par numéro de génération.
+       
+        Args:
+            slot (str): Nom de l'emplacement ("forward", "backward" pour la
+                        recherche bidirectionnelle)
+           
+        Returns:
+            SearchState: Tampons g / parent / seen / closed
+        """
+        num_nodes = self.height * self.width
+        state = self._search_states.get(slot)
+        if state is None or state.num_nodes != num_nodes:
+            state = SearchState(num_nodes)
+            self._search_states[slot] = state
+        return state
+   
+    def uniform_goal_entry_cost(self, step_cost=0.0):
+        """
+        Retourne le coût commun des arêtes entrant dans l'arrivée.
+       
+        Entrer dans l'arrivée coûte multiplicateur * (-récompense de l'arrivée). Avec
+        des diagonales (multiplicateur √2 ou 2) et une récompense d'arrivée non
+        nulle, ce coût dépend de la direction d'entrée : l'arrivée ne peut alors
+        pas être ignorée par les tests de coûts (integer_edge_costs,
+        uniform_step_cost...).
+       
+        Args:
+            step_cost (float): Coût d'un pas ordinaire, si la recherche compte l'entrée
+                               dans l'arrivée comme un pas (step_cost * multiplicateur,
+                               JPS) : le résultat est alors l'écart commun entre le coût
+                               réel de l'entrée et ce pas
+       
+        Returns:
+            float ou None: Coût (ou écart) commun des arêtes vers l'arrivée (0.0 si
+                           aucune), None s'il dépend de la direction d'entrée
+        """
+        row, col = self.goal
+        reward_cost = -self.get_reward(row, col) - step_cost
+        costs = {mult * reward_cost for d_row, d_col, mult in self.graph_directions()
+                 if self.is_passable(row - d_row, col - d_col)}
+        if len(costs) > 1:
+            return None
+        return costs.pop() if costs else 0.0
+   
+    def integer_edge_costs(self, max_cost=1024):
+        """
+        Détecte si les coûts d'arête sont des entiers bornés, positifs ou nuls.
+       
+        C'est le cas des labyrinthes initialisés par initialize_uniform_rewards
+        (pas de -1, -2, -5...). L'arrivée est ignorée si toutes les arêtes qui y
+        entrent ont le même coût (uniform_goal_entry_cost) : Dijkstra s'arrête dès
+        qu'elle est extraite, donc sa récompense (souvent +100) ne change pas le
+        chemin optimal. Avec des diagonales, ce n'est plus le cas.
+       
+        Args:
+            max_cost (int): Coût d'arête maximal accepté
+           
+        Returns:
+            int ou None: Coût d'arête maximal si tous les coûts (hors arrivée, si elle
+                         est ignorée) sont des entiers dans [0, max_cost], None sinon
+        """
+        invalid_targets, max_valid, _ = self._edge_cost_profile()
+        goal = self.cell_id(*self.goal)
+        if len(invalid_targets) > 1:
+            return None
+        if len(invalid_targets) == 1 and (invalid_targets[0] != goal
+                                          or self.uniform_goal_entry_cost() is None):
+            return None
+        if max_valid > max_cost:
+            return None
+        return max(max_valid, 1)
+   
+    def _edge_cost_profile(self):
+        """
+        Retourne le profil des coûts d'arête, recalculé seulement après une modification.
+       
+        Returns:
+            tuple: (cibles des arêtes de coût non entier ou négatif, coût entier
+                   maximal des autres arêtes, cibles des arêtes de coût négatif)
+        """
+        if self._cost_profile is None or self._cost_profile_version != self._version:
+            graph = self.get_graph()
+            weights = graph.weights
+            valid = (weights >= 0) & (weights == np.floor(weights))
+            invalid_targets = np.unique(graph.indices[~valid])
+            max_valid = int(weights[valid].max()) if valid.any() else 0
+            negative_targets = np.unique(graph.indices[weights < 0])
+            self._cost_profile = (invalid_targets, max_valid, negative_targets)
+            self._cost_profile_version = self._version
+        return self._cost_profile
+   
+    def uniform_step_cost(self, ignored_cells=None):
+        """
+        Détecte une grille à coût uniforme (condition d'utilisation de JPS).
+       
+        Le départ et l'arrivée sont ignorés : un chemin optimal n'entre jamais dans
+        le départ, et l'arrivée n'est ignorable que si toutes les arêtes qui y
+        entrent ont le même coût (à vérifier avec uniform_goal_entry_cost).
+       
+        Args:
+            ignored_cells (iterable, optional): Cellules exclues du test
+                                                (par défaut le départ et l'arrivée)
+           
+        Returns:
+            float ou None: Coût commun (-récompense, > 0) des cellules franchissables,
+                           None si les coûts ne sont pas uniformes
+        """
+        if ignored_cells is None:
+            ignored_cells = (self.start, self.goal)
+        passable = self.grid == 0
+        for cell in ignored_cells:
+            passable[cell] = False
+        costs = -self.rewards[passable]
+        if costs.size == 0:
+            return 1.0
+        step_cost = float(costs[0])
+        if step_cost <= 0 or not np.all(costs == step_cost):
+            return None
+        return step_cost
+   
+    def get_jump_tables(self):
+        """
+        Retourne les tables de saut JPS+ de la grille.
+       
+        Les tables ne dépendent que des obstacles : elles sont recalculées
+        seulement après set_obstacle, remove_obstacle ou une nouvelle grille.
+       
+        Returns:
+            JumpTables: Tables de distances de saut (4 ou 8 directions)
+        """
+        if self._jump_tables is None or self._jump_tables_version != self._obstacle_version:
+            diagonal = len(self.graph_directions()) == 8
+            self._jump_tables = JumpTables(self.grid, diagonal)
+            self._jump_tables_version = self._obstacle_version
+        return self._jump_tables
+   
+    def _solve_jps(self, return_explored, stats=None):
+        """
+        A* par Jump Point Search sur une grille à coût uniforme.
+       
+        Args:
+            return_explored (bool): Si True, retourne aussi les points de saut développés
+            stats (SearchStats, optional): Instance remplie avec les compteurs
+           
+        La recherche compte l'entrée dans l'arrivée comme un pas ordinaire : le
+        chemin n'est optimal que si l'écart avec le coût réel de l'entrée est le
+        même pour toutes les directions. Ce n'est pas le cas d'un DiagonalMaze dont
+        la récompense d'arrivée diffère de celle des autres cellules (l'écart est
+        multiplié par le coût diagonal) ; A* est alors utilisé.
+       
+        Returns:
+            Même format que solve, ou NotImplemented si les coûts ne sont pas uniformes
+        """
+        step_cost = self.uniform_step_cost()
+        directions = self.graph_directions()
+        diagonal_multiplier = directions[-1][2] if len(directions) == 8 else 1.0
+        if step_cost is None or not 1.0 <= diagonal_multiplier <= 2.0:
+            return NotImplemented
+        goal_entry_offset = self.uniform_goal_entry_cost(step_cost)
+        if goal_entry_offset is None:
+            return NotImplemented
+        tables = self.get_jump_tables()
+        if stats is not None:
+            stats.algorithm += "_jps"
+        path, closed_set = tables.search(self.start, self.goal, self.grid == 0,
+                                         step_cost, diagonal_multiplier, stats)
+        if stats is not None and path is not None and len(path) > 1:
+            # Coût réel de l'entrée dans l'arrivée, comptée comme un pas ordinaire
+            stats.cost += goal_entry_offset
+        return (path, self._explored_cells(closed_set)) if return_explored else path
+   
+    def distance_field(self, source=None):
+        """
+        Calcule la distance de toutes les cellules vers une source (grille à coût uniforme).
+       
+        Un seul parcours en largeur vectorisé remplace un solve_dijkstra par départ
+        (cartes d'évacuation, carte de chaleur de l'interface...). Comme pour JPS,
+        la récompense de l'arrivée est ignorée.
+       
+        Args:
+            source (tuple, optional): Cellule source (par défaut l'arrivée)
+           
+        Returns:
+            DistanceField: Distances en pas, coûts et directions vers la source
+           
+        Raises:
+            ValueError: Si la source est un obstacle ou si les coûts ne sont pas uniformes
+        """
+        source = tuple(self.goal if source is None else source)
+        if not self.is_passable(*source):
+            raise ValueError(f"La source {source} n'est pas une cellule franchissable")
+        directions = self.graph_directions()
+        step_cost = self.uniform_step_cost(ignored_cells=(source, self.goal))
+        if step_cost is None or any(mult != 1.0 for _, _, mult in directions):
+            raise ValueError("distance_field exige un coût uniforme pour tous les déplacements "
+                             "(utiliser solve_dijkstra sinon)")
+        distances, predecessor = compute_distance_field(self.grid == 0, source, directions)
+        return DistanceField(source, distances, predecessor, directions, step_cost)
+   
+    def enable_goal_cache(self, max_bytes=DEFAULT_MAX_BYTES):
+        """
+        Active le cache des champs de coût restant indexé par arrivée.
+       
+        Une fois activé, solve et solve_dijkstra calculent pour chaque nouvelle
+        arrivée un Dijkstra inverse sur toute la grille, puis répondent aux requêtes
+        suivantes vers cette arrivée par descente gloutonne, sans recherche. Le
+        cache est invalidé à chaque modification de la grille ou des récompenses,
+        et ignoré si des bonus rendent des coûts d'arête négatifs.
+       
+        Args:
+            max_bytes (int): Mémoire maximale occupée par les champs (en octets)
+           
+        Returns:
+            GoalFieldCache: Le cache (compteurs hits / misses / evictions)
+        """
+        self.goal_cache = GoalFieldCache(max_bytes)
+        return self.goal_cache
+   
+    def enable_path_cache(self, max_bytes=DEFAULT_RESULT_BYTES):
+        """
+        Active le cache des résultats de recherche.
+       
+        Une fois activé, solve, solve_dijkstra et les recherches bidirectionnelles
+        retournent directement le résultat d'une requête (départ, arrivée,
+        paramètres) déjà résolue sur la même version du labyrinthe. Toute
+        modification de la grille ou des récompenses vide le cache.
+       
+        Args:
+            max_bytes (int): Mémoire maximale occupée par les résultats (en octets)
+           
+        Returns:
+            PathCache: Le cache (compteurs hits / misses / hit_rate, voir stats())
+        """
+        self.path_cache = PathCache(max_bytes)
+        return self.path_cache
+   
+    def enable_landmarks(self, count=8, selection="farthest", seed=0):
+        """
+        Active l'heuristique ALT (repères et inégalité triangulaire) pour A*.
+       
+        L'heuristique de base (heuristic) est remplacée par le maximum entre elle
+        et la borne des repères, dans solve, astar_bidirectional et leurs variantes
+        array_state. Les repères sont choisis et leurs distances calculées une fois,
+        puis réutilisés pour toutes les requêtes.
+       
+        Args:
+            count (int): Nombre de repères
+            selection (str): "farthest" ou "avoid" (voir landmarks)
+            seed (int): Graine du tirage des racines ("avoid")
+           
+        Returns:
+            LandmarkHeuristic: L'heuristique (repères, mémoire occupée)
+        """
+        self.landmarks = LandmarkHeuristic(count, selection, seed)
+        self.landmarks.build(self)
+        return self.landmarks
+   
+    def enable_connectivity_index(self):
+        """
+        Active l'index des composantes connexes.
+       
+        Une fois activé, solve, solve_dijkstra et les recherches bidirectionnelles
+        retournent « pas de chemin » en O(1) quand le départ et l'arrivée sont dans
+        des composantes différentes, sans explorer la région accessible. L'index est
+        mis à jour incrémentalement par set_obstacle et remove_obstacle.
+       
+        Returns:
+            ComponentIndex: L'index (étiquettes, compteurs de mise à jour)
+        """
+        self.connectivity = ComponentIndex()
+        self.connectivity.build(self)
+        return self.connectivity
+   
+    def is_unreachable(self):
+        """
+        Indique si l'index des composantes prouve qu'aucun chemin n'existe.
+       
+        Returns:
+            bool: True si le départ et l'arrivée sont déconnectés (toujours False
+                  si l'index n'est pas activé)
+        """
+        return self.connectivity is not None and not self.connectivity.connected(self, self.start, self.goal)
+   
+    def _solve_goal_cache(self, return_explored, stats=None):
+        """
+        Répond à la requête courante avec le champ de coût restant de l'arrivée.
+       
+        Le calcul du champ (au premier appel pour cette arrivée) est compté dans la
+        préparation de stats, la descente dans la recherche.
+       
+        Le Dijkstra inverse n'est exact que si les arêtes sont de coût positif ou
+        nul, hors arêtes entrant dans l'arrivée : relâchées une seule fois, depuis
+        la source du Dijkstra inverse, elles ne faussent pas le champ. Une cellule
+        bonus (récompense positive) rend négatives les arêtes qui y entrent : le
+        cache est alors ignoré plutôt que de retourner un chemin plus coûteux.
+       
+        Returns:
+            Même format que solve (aucune cellule explorée), ou NotImplemented si
+            une arête hors arrivée est de coût négatif ou si la descente échoue
+        """
+        negative_targets = self._edge_cost_profile()[2]
+        goal = self.cell_id(*self.goal)
+        if len(negative_targets) > 1 or (len(negative_targets) == 1 and negative_targets[0] != goal):
+            return NotImplemented
+        field = self.goal_cache.get_field(self, self.goal)
+        if stats is not None:
+            stats.lap("setup")
+        start = self.cell_id(*self.start)
+        path = descend(self.get_graph(), field, start, goal)
+        if path is NotImplemented:
+            return NotImplemented
+        if stats is not None:
+            stats.algorithm = "goal_cache"
+            stats.end_search(0, 0, 0, 0)
+        if path is not None:
+            path = [self.cell_coords(node) for node in path]
+        if stats is not None:
+            stats.finish(path, field[start] if path is not None else None)
+        return (path, set()) if return_explored else path
+   
+    def cell_id(self, row, col):
+        """Retourne l'identifiant plat d'une cellule (row * width + col)."""
+        return row * self.width + col
+   
+    def cell_coords(self, node):
+        """Retourne les coordonnées (row, col) d'un identifiant plat."""
+        return divmod(node, self.width)
        
     def is_in_bounds(self, row, col):
         """
@@ -110,7 +712,7 @@ class Maze:
             float: Valeur de la récompense
         """
         if self.is_in_bounds(row, col):
-            return self.rewards[row, col]
+            return float(self.rewards[row, col])
         return 0.0
    
     def set_obstacle(self, row, col):
@@ -123,6 +725,9 @@ class Maze:
         """
         if self.is_in_bounds(row, col):
             self.grid[row, col] = 1
+            self._version += 1
+            self._obstacle_version += 1
+            self._record_change(row, col)
            
     def remove_obstacle(self, row, col):
         """
@@ -134,6 +739,9 @@ class Maze:
         """
         if self.is_in_bounds(row, col):
             self.grid[row, col] = 0
+            self._version += 1
+            self._obstacle_version += 1
+            self._record_change(row, col)
            
     def set_reward(self, row, col, value):
         """
@@ -145,7 +753,9 @@ class Maze:
             value (float): Valeur de la récompense
         """
         if self.is_in_bounds(row, col):
-            self.rewards[row, col] = value
+            self.rewards[row, col] = self.storage.check_reward(value)
+            self._version += 1
+            self._record_change(row, col)
    
     def heuristic(self, row, col):
         """
@@ -156,34 +766,276 @@ class Maze:
             col (int): Colonne de la cellule
            
         Returns:
-            float: Distance de Manhattan jusqu'à l'arrivée
+            float: Distance de Manhattan jusqu'à l'arrivée (ou borne ALT si plus grande)
         """
         goal_row, goal_col = self.goal
-        return abs(row - goal_row) + abs(col - goal_col)
+        distance = abs(row - goal_row) + abs(col - goal_col)
+        if self.landmarks is not None:
+            return max(distance, self.landmarks.estimate(self, row, col, self.goal))
+        return distance
    
-    def solve(self, return_explored=False):
+    @cached_solver("astar")
+    def solve(self, return_explored=False, array_state=False, queue=None, jps=False, stats=None,
+              epsilon=0.0, focal=False):
         """
         Résout le labyrinthe en utilisant l'algorithme A*.
         Retourne le chemin optimal du point de départ au point d'arrivée.
+        Si le cache des arrivées est activé (enable_goal_cache) et qu'aucune arête
+        hors arrivée n'est de coût négatif, la requête est résolue par descente
+        sur le champ de coût restant de l'arrivée.
+        La recherche est celle de solve_iter, menée jusqu'au bout.
        
         Args:
             return_explored (bool): Si True, retourne aussi les cellules explorées
+            array_state (bool): Si True, l'état de recherche est stocké dans des
+                                tableaux NumPy préalloués (voir get_search_state)
+            queue (str | PriorityQueue, optional): File de priorité de la liste ouverte
+                                ("heapq", "packed", "indexed", "pairing" ou instance
+                                de priority_queues.PriorityQueue pour lire ses
+                                compteurs). Implique array_state=True.
+            jps (bool): Si True et que la grille est à coût uniforme (entrée dans
+                        l'arrivée comprise, voir _solve_jps), utilise
+                        Jump Point Search avec les tables JPS+ (get_jump_tables). Le
+                        chemin est optimal et développé cellule par cellule ; les
+                        cellules explorées sont les points de saut. Sinon, A* classique.
+            stats (SearchStats, optional): Instance remplie avec les compteurs et les
+                        temps de la recherche (voir search_stats.py)
+            epsilon (float): Sous-optimalité tolérée : si epsilon > 0, A* pondéré
+                        (priorité g + (1 + epsilon) * h) ; si aucun coût d'arête
+                        n'est négatif, le coût du chemin est au plus (1 + epsilon)
+                        fois l'optimum (stats.bound). Avec des coûts négatifs
+                        (bonus, récompense d'arrivée de create_complete_maze), ce
+                        rapport n'a pas de sens : le chemin est retourné sans
+                        garantie et stats.bound reste None. Les variantes exactes
+                        (cache des arrivées, JPS, array_state) ignorent epsilon.
+            focal (bool): Si True, recherche focale (A*_epsilon) plutôt que A*
+                        pondéré : parmi les cellules ouvertes de f au plus
+                        (1 + epsilon) fois le f minimal, la plus proche de l'arrivée
+                        (h minimal) est développée en premier
+       
+        Returns:
+            Si return_explored=False: list ou None (chemin optimal, ou à 1 + epsilon
+                                      de l'optimum)
+            Si return_explored=True: tuple (path, explored_set) ou (None, explored_set)
+       
+        Raises:
+            ValueError: Si epsilon est négatif
+        """
+        return drive(self.solve_iter(None, return_explored, array_state, queue, jps, stats,
+                                     epsilon, focal)).result
+   
+    def solve_iter(self, batch_size=DEFAULT_BATCH_SIZE, return_explored=False, array_state=False,
+                   queue=None, jps=False, stats=None, epsilon=0.0, focal=False):
+        """
+        A* pas à pas : générateur d'étapes (voir search_steps.py).
+       
+        Chaque étape porte les cellules développées depuis la précédente ; la
+        dernière (done=True) porte le résultat de solve. L'appelant peut cesser
+        d'itérer à tout moment pour abandonner la recherche.
+       
+        Args:
+            batch_size (int, optional): Cellules développées par étape (None : seule
+                                        l'étape finale est produite)
+            return_explored, array_state, queue, jps, stats, epsilon, focal: Voir solve
+       
+        Yields:
+            SearchStep: Étapes de la recherche
+        """
+        if epsilon < 0:
+            raise ValueError(f"epsilon doit être positif ou nul (reçu {epsilon})")
+        if stats is not None:
+            stats.reset("astar")
+        if self.is_unreachable():
+            if stats is not None:
+                stats.finish(None)
+            yield SearchStep.final((None, set()) if return_explored else None)
+            return
+       
+        if self.goal_cache is not None:
+            result = self._solve_goal_cache(return_explored, stats)
+            if result is not NotImplemented:
+                yield SearchStep.final(result)
+                return
+       
+        if jps:
+            result = self._solve_jps(return_explored, stats)
+            if result is not NotImplemented:
+                yield SearchStep.final(result)
+                return
+       
+        if array_state or queue is not None:
+            yield SearchStep.final(self._solve_array_state(True, return_explored, queue, stats=stats))
+            return
+       
+        if epsilon > 0 or focal:
+            if stats is not None:
+                stats.algorithm = "focal_astar" if focal else "weighted_astar"
+                # Rapport des coûts garanti seulement sans coût d'arête négatif
+                if len(self._edge_cost_profile()[2]) == 0:
+                    stats.bound = 1 + epsilon
+            if focal:
+                yield from self._focal_search_steps(1 + epsilon, return_explored, batch_size, stats)
+                return
+        yield from self._heap_search_steps(True, return_explored, batch_size, stats, 1 + epsilon)
+   
+    @cached_solver("dijkstra")
+    def solve_dijkstra(self, return_explored=False, array_state=False, queue=None, stats=None):
+        """
+        Résout le labyrinthe en utilisant l'algorithme de Dijkstra.
+        Retourne le chemin optimal du point de départ au point d'arrivée.
+        Si le cache des arrivées est activé (enable_goal_cache) et qu'aucune arête
+        hors arrivée n'est de coût négatif, la requête est résolue par descente
+        sur le champ de coût restant de l'arrivée.
+        La recherche est celle de solve_dijkstra_iter, menée jusqu'au bout.
+       
+        Args:
+            return_explored (bool): Si True, retourne aussi les cellules explorées
+            array_state (bool): Si True, l'état de recherche est stocké dans des
+                                tableaux NumPy préalloués (voir get_search_state)
+            queue (str | PriorityQueue, optional): File de priorité de la liste ouverte
+                                ("heapq", "packed", "indexed", "pairing" ou instance
+                                de priority_queues.PriorityQueue pour lire ses
+                                compteurs). Implique array_state=True.
+                                "bucket" (Dial) et "radix" exigent des coûts d'arête
+                                entiers positifs ou nuls ; "auto" mène la recherche
+                                avec des seaux de Dial intégrés à la boucle si
+                                integer_edge_costs() le permet (sans objet file ni
+                                array_state), et avec le tas binaire par défaut sinon.
+            stats (SearchStats, optional): Instance remplie avec les compteurs et les
+                                temps de la recherche (voir search_stats.py)
        
         Returns:
             Si return_explored=False: list ou None (chemin optimal)
             Si return_explored=True: tuple (path, explored_set) ou (None, explored_set)
         """
-        # File de priorité : (priorité, compteur, (row, col))
-        # priorité = coût_g + heuristique
+        return drive(self.solve_dijkstra_iter(None, return_explored, array_state, queue, stats)).result
+   
+    def solve_dijkstra_iter(self, batch_size=DEFAULT_BATCH_SIZE, return_explored=False,
+                            array_state=False, queue=None, stats=None):
+        """
+        Dijkstra pas à pas : générateur d'étapes (voir solve_iter et search_steps.py).
+       
+        Args:
+            batch_size (int, optional): Cellules développées par étape (None : seule
+                                        l'étape finale est produite)
+            return_explored, array_state, queue, stats: Voir solve_dijkstra
+       
+        Yields:
+            SearchStep: Étapes de la recherche
+        """
+        if stats is not None:
+            stats.reset("dijkstra")
+        if self.is_unreachable():
+            if stats is not None:
+                stats.finish(None)
+            yield SearchStep.final((None, set()) if return_explored else None)
+            return
+       
+        if self.goal_cache is not None:
+            result = self._solve_goal_cache(return_explored, stats)
+            if result is not NotImplemented:
+                yield SearchStep.final(result)
+                return
+       
+        if queue == "auto" or queue in MONOTONE_QUEUE_TYPES:
+            max_edge_cost = self.integer_edge_costs()
+            # Arrivée relâchée (coût d'entrée 0) si toutes ses arêtes ont le même coût
+            goal_entry_cost = 0 if self.uniform_goal_entry_cost() is not None else None
+            if max_edge_cost is None:
+                if queue != "auto":
+                    raise ValueError(f"La file {queue} nécessite des coûts d'arête entiers positifs ou nuls")
+                # Coûts non entiers ou négatifs : retour au tas binaire par défaut
+                queue = None
+            elif queue == "auto":
+                yield from self._bucket_search_steps(max_edge_cost, goal_entry_cost, return_explored,
+                                                     batch_size, stats)
+                return
+            else:
+                queue = make_queue(queue, self.width * self.height, max_edge_cost)
+                yield SearchStep.final(self._solve_array_state(False, return_explored, queue,
+                                                               goal_entry_cost=goal_entry_cost,
+                                                               stats=stats))
+                return
+       
+        if array_state or queue is not None:
+            yield SearchStep.final(self._solve_array_state(False, return_explored, queue, stats=stats))
+            return
+       
+        yield from self._heap_search_steps(False, return_explored, batch_size, stats)
+   
+    def solve_anytime(self, deadline=None, epsilons=DEFAULT_EPSILONS, stats=None):
+        """
+        Résout le labyrinthe par ARA* (anytime repairing A*) avant une échéance.
+       
+        Un premier chemin est trouvé vite avec une heuristique fortement gonflée,
+        puis amélioré avec des facteurs décroissants tant que l'échéance le permet
+        (voir anytime.py).
+       
+        Args:
+            deadline (float, optional): Échéance (time.perf_counter() + budget en
+                                        secondes) ; sans échéance, la recherche
+                                        continue jusqu'au chemin optimal
+            epsilons (iterable): Facteurs d'inflation décroissants de l'heuristique
+            stats (SearchStats, optional): Instance remplie avec les compteurs, le
+                                           coût et la borne atteinte
+       
+        Returns:
+            AnytimeSolution ou None: Meilleur chemin trouvé (avec sa borne de
+                                     sous-optimalité), None si aucun chemin n'a été
+                                     trouvé avant l'échéance
+       
+        Raises:
+            ValueError: Si un coût d'arête (hors arrivée) est négatif ou si le coût
+                        d'entrée dans l'arrivée dépend de la direction
+        """
+        solution = None
+        for solution in self.solve_anytime_iter(deadline, epsilons, stats):
+            pass
+        return solution
+   
+    def solve_anytime_iter(self, deadline=None, epsilons=DEFAULT_EPSILONS, stats=None):
+        """
+        ARA* pas à pas : générateur des chemins successifs (voir solve_anytime).
+       
+        Yields:
+            AnytimeSolution: Chemin de chaque itération terminée, de borne décroissante
+        """
+        if stats is not None:
+            stats.reset("ara_star")
+        if self.is_unreachable():
+            if stats is not None:
+                stats.finish(None)
+            return iter(())
+        return ara_star(self, epsilons, deadline, stats)
+   
+    def _heap_search_steps(self, use_heuristic, return_explored, batch_size, stats, weight=1):
+        """
+        A* (ou Dijkstra si use_heuristic=False) sur un tas heapq et des dictionnaires.
+       
+        Générateur commun à solve_iter et solve_dijkstra_iter : une étape toutes
+        les batch_size cellules développées (aucune si batch_size=None), puis
+        l'étape finale avec le résultat. Avec weight > 1, A* pondéré (priorité
+        g + weight * h) : sans redéveloppement des cellules fermées, le coût reste
+        au plus weight fois l'optimum avec une heuristique cohérente et des coûts
+        d'arête positifs ou nuls.
+        """
+        graph = self.get_graph()
+        indptr, indices, weights = graph.adjacency()
+        start = self.cell_id(*self.start)
+        goal = self.cell_id(*self.goal)
+        width = self.width
+        heuristic = self.heuristic
+       
+        # File de priorité : (priorité, compteur, identifiant)
+        # priorité = coût_g + heuristique (A*), ou coût_g seul (Dijkstra)
         open_set = []
         counter = 0  # Compteur pour départager les éléments de même priorité
        
-        start_row, start_col = self.start
-        heapq.heappush(open_set, (self.heuristic(start_row, start_col), counter, self.start))
+        heapq.heappush(open_set, (weight * heuristic(*self.start) if use_heuristic else 0, counter, start))
         counter += 1
        
         # Dictionnaire pour stocker le meilleur coût g pour atteindre chaque cellule
-        g_cost = {self.start: 0}
+        g_cost = {start: 0}
        
         # Dictionnaire pour stocker les relations de parenté (pour reconstruire le chemin)
         came_from = {}
@@ -191,35 +1043,56 @@ class Maze:
         # Ensemble des cellules déjà explorées
         closed_set = set()
        
+        # Instrumentation : seule la taille maximale de la file est suivie dans la boucle
+        track = stats is not None
+        peak_open = 0
+        if track:
+            stats.lap("setup")
+       
+        # Cellules développées depuis la dernière étape (recherche pas à pas)
+        batch = [] if batch_size else None
+       
         while open_set:
+            if track and len(open_set) > peak_open:
+                peak_open = len(open_set)
+           
             # Récupérer la cellule avec la priorité la plus basse
             _, _, current = heapq.heappop(open_set)
            
             # Si on a atteint l'arrivée, reconstruire et retourner le chemin
-            if current == self.goal:
-                path = self._reconstruct_path(came_from, current)
-                return (path, closed_set) if return_explored else path
+            if current == goal:
+                if track:
+                    self._end_heap_search(stats, counter, len(open_set), len(closed_set), peak_open, True)
+                path = self._reconstruct_cell_path(came_from, current)
+                if track:
+                    stats.finish(path, g_cost[goal])
+                result = (path, self._explored_cells(closed_set)) if return_explored else path
+                yield self._final_step(batch, len(closed_set), len(open_set), result)
+                return
            
             # Marquer la cellule comme explorée
             if current in closed_set:
                 continue
             closed_set.add(current)
            
-            current_row, current_col = current
+            if batch is not None:
+                batch.append(current)
+                if len(batch) >= batch_size:
+                    yield SearchStep(self._cell_list(batch), len(closed_set), len(open_set))
+                    batch = []
+           
             current_g_cost = g_cost[current]
            
-            # Explorer tous les voisins
-            for neighbor in self.get_neighbors(current_row, current_col):
-                neighbor_row, neighbor_col = neighbor
-               
+            # Explorer tous les voisins (arêtes du graphe compilé)
+            for edge in range(indptr[current], indptr[current + 1]):
+                neighbor = indices[edge]
                 # Ignorer les cellules déjà explorées
                 if neighbor in closed_set:
                     continue
                
-                # Calculer le coût g pour atteindre ce voisin
-                # Le coût est le coût actuel moins la récompense de la cellule voisine
+                # Le coût de l'arête est l'opposé de la récompense de la cellule voisine
                 # (les récompenses négatives augmentent le coût, les positives le diminuent)
-                tentative_g_cost = current_g_cost - self.get_reward(neighbor_row, neighbor_col)
+                tentative_g_cost = current_g_cost + weights[edge]
                
                 # Si ce chemin vers le voisin est meilleur que les précédents
                 if neighbor not in g_cost or tentative_g_cost < g_cost[neighbor]:
@@ -227,85 +1100,371 @@ class Maze:
                     came_from[neighbor] = current
                     g_cost[neighbor] = tentative_g_cost
                    
-                    # Calculer la priorité f = g + h
-                    f_cost = tentative_g_cost + self.heuristic(neighbor_row, neighbor_col)
+                    # Calculer la priorité f = g + h (g + weight * h pour A* pondéré)
+                    f_cost = tentative_g_cost
+                    if use_heuristic:
+                        f_cost += weight * heuristic(*divmod(neighbor, width))
                    
                     # Ajouter le voisin à la file de priorité
                     heapq.heappush(open_set, (f_cost, counter, neighbor))
                     counter += 1
        
         # Si la file est vide et qu'on n'a pas atteint l'arrivée, aucun chemin n'existe
-        return (None, closed_set) if return_explored else None
+        if track:
+            self._end_heap_search(stats, counter, 0, len(closed_set), peak_open, False)
+            stats.finish(None)
+        result = (None, self._explored_cells(closed_set)) if return_explored else None
+        yield self._final_step(batch, len(closed_set), 0, result)
    
-    def solve_dijkstra(self, return_explored=False):
+    def _bucket_search_steps(self, max_edge_cost, goal_entry_cost, return_explored, batch_size, stats):
         """
-        Résout le labyrinthe en utilisant l'algorithme de Dijkstra.
-        Retourne le chemin optimal du point de départ au point d'arrivée.
+        Dijkstra à seaux (Dial) intégrés à la boucle, pour des coûts d'arête entiers.
        
-        Args:
-            return_explored (bool): Si True, retourne aussi les cellules explorées
+        Les max_edge_cost + 1 seaux circulaires remplacent le tas : insertion et
+        extraction en O(1), sans appel de méthode par opération (contrairement
+        à la file BucketQueue, plus lente que le tas heapq en C). À coût égal,
+        l'ordre d'insertion est respecté, comme avec le tas. Même protocole
+        d'étapes que _heap_search_steps.
        
-        Returns:
-            Si return_explored=False: list ou None (chemin optimal)
-            Si return_explored=True: tuple (path, explored_set) ou (None, explored_set)
+        Args:
+            max_edge_cost (int): Coût d'arête entier maximal (integer_edge_costs)
+            goal_entry_cost (int, optional): Si fourni, remplace le coût des arêtes
+                                             entrant dans l'arrivée
         """
-        # File de priorité : (distance, compteur, (row, col))
-        open_set = []
-        counter = 0
+        graph = self.get_graph()
+        indptr, indices, weights = graph.adjacency()
+        start = self.cell_id(*self.start)
+        goal = self.cell_id(*self.goal)
+        relaxed_goal = goal if goal_entry_cost is not None else -1
        
-        # Distance initiale de 0 pour le départ
-        heapq.heappush(open_set, (0, counter, self.start))
-        counter += 1
-       
-        # Dictionnaire pour stocker les distances minimales
-        dist = {self.start: 0}
+        num_buckets = max_edge_cost + 1
+        buckets = [deque() for _ in range(num_buckets)]
+        buckets[0].append(start)
+        cursor = 0
+        size = 1
+        pushes = 1
        
-        # Dictionnaire pour stocker les relations de parenté
+        g_cost = {start: 0}
         came_from = {}
-       
-        # Ensemble des cellules déjà explorées
         closed_set = set()
        
-        while open_set:
-            # Récupérer la cellule avec la distance minimale
-            current_dist, _, current = heapq.heappop(open_set)
+        track = stats is not None
+        peak_open = 0
+        if track:
+            stats.lap("setup")
+       
+        batch = [] if batch_size else None
+       
+        while size:
+            bucket = buckets[cursor % num_buckets]
+            if not bucket:
+                cursor += 1
+                continue
+            if track and size > peak_open:
+                peak_open = size
+            current = bucket.popleft()
+            size -= 1
            
-            # Si on a atteint l'arrivée, reconstruire et retourner le chemin
-            if current == self.goal:
-                path = self._reconstruct_path(came_from, current)
-                return (path, closed_set) if return_explored else path
+            if current == goal:
+                if track:
+                    self._end_heap_search(stats, pushes, size, len(closed_set), peak_open, True)
+                path = self._reconstruct_cell_path(came_from, current)
+                if track:
+                    cost = g_cost[goal]
+                    if relaxed_goal >= 0 and goal in came_from:
+                        # Coût réel de l'arête d'arrivée (remplacé par goal_entry_cost)
+                        cost = g_cost[came_from[goal]] + dict(graph.neighbors(came_from[goal]))[goal]
+                    stats.finish(path, cost)
+                result = (path, self._explored_cells(closed_set)) if return_explored else path
+                yield self._final_step(batch, len(closed_set), size, result)
+                return
            
-            # Marquer la cellule comme explorée
             if current in closed_set:
                 continue
             closed_set.add(current)
            
-            current_row, current_col = current
+            if batch is not None:
+                batch.append(current)
+                if len(batch) >= batch_size:
+                    yield SearchStep(self._cell_list(batch), len(closed_set), size)
+                    batch = []
            
-            # Explorer tous les voisins
-            for neighbor in self.get_neighbors(current_row, current_col):
-                neighbor_row, neighbor_col = neighbor
-               
-                # Ignorer les cellules déjà explorées
+            current_g_cost = g_cost[current]
+            for edge in range(indptr[current], indptr[current + 1]):
+                neighbor = indices[edge]
                 if neighbor in closed_set:
                     continue
+                if neighbor == relaxed_goal:
+                    tentative_g_cost = current_g_cost + goal_entry_cost
+                else:
+                    tentative_g_cost = current_g_cost + weights[edge]
+                if neighbor not in g_cost or tentative_g_cost < g_cost[neighbor]:
+                    came_from[neighbor] = current
+                    g_cost[neighbor] = tentative_g_cost
+                    buckets[int(tentative_g_cost) % num_buckets].append(neighbor)
+                    size += 1
+                    pushes += 1
+       
+        if track:
+            self._end_heap_search(stats, pushes, 0, len(closed_set), peak_open, False)
+            stats.finish(None)
+        result = (None, self._explored_cells(closed_set)) if return_explored else None
+        yield self._final_step(batch, len(closed_set), 0, result)
+   
+    def _focal_search_steps(self, weight, return_explored, batch_size, stats):
+        """
+        Recherche focale (A*_epsilon, Pearl et Kim) : coût au plus weight fois l'optimum.
+       
+        La liste focale contient les cellules ouvertes de f = g + h au plus weight
+        fois le f minimal ; la cellule développée est celle de la liste focale la
+        plus proche de l'arrivée (h minimal). Les cellules fermées dont le coût g
+        s'améliore sont rouvertes : la borne est garantie avec une heuristique
+        admissible et des coûts d'arête positifs ou nuls. Avec des coûts négatifs
+        (bonus), un cycle de coût négatif rouvrirait ses cellules sans fin : les
+        cellules fermées le restent, comme dans _heap_search_steps.
+       
+        Même protocole d'étapes que _heap_search_steps.
+        """
+        graph = self.get_graph()
+        indptr, indices, weights = graph.adjacency()
+        start = self.cell_id(*self.start)
+        goal = self.cell_id(*self.goal)
+        width = self.width
+        heuristic = self.heuristic
+        reopen = len(self._edge_cost_profile()[2]) == 0
+       
+        h = {start: heuristic(*self.start)}
+        g_cost = {start: 0}
+        came_from = {}
+        closed_set = set()
+       
+        # f de l'entrée valide de chaque cellule ouverte (les autres entrées des
+        # tas sont périmées)
+        open_f = {start: h[start]}
+        # Tas de toutes les cellules ouvertes par f (f minimal), liste focale par
+        # (h, f) et tas des cellules ouvertes hors de la liste focale par f
+        by_f = [(h[start], 0, start)]
+        focal_list = [(h[start], h[start], 0, start)]
+        outside = []
+        counter = 1
+        focal_bound = weight * h[start]
+       
+        track = stats is not None
+        expansions = 0
+        stale_pops = 0
+        peak_open = 0
+        if track:
+            stats.lap("setup")
+       
+        batch = [] if batch_size else None
+       
+        while focal_list:
+            if track and len(open_f) > peak_open:
+                peak_open = len(open_f)
+           
+            _, f_cost, _, current = heapq.heappop(focal_list)
+            if open_f.get(current) != f_cost:
+                stale_pops += 1
+                continue
+           
+            if current == goal:
+                if track:
+                    stats.end_search(expansions, counter, stale_pops, peak_open, closed=len(closed_set))
+                path = self._reconstruct_cell_path(came_from, current)
+                if track:
+                    stats.finish(path, g_cost[goal])
+                result = (path, self._explored_cells(closed_set)) if return_explored else path
+                yield self._final_step(batch, expansions, len(open_f), result)
+                return
+           
+            del open_f[current]
+            closed_set.add(current)
+            expansions += 1
+           
+            if batch is not None:
+                batch.append(current)
+                if len(batch) >= batch_size:
+                    yield SearchStep(self._cell_list(batch), expansions, len(open_f))
+                    batch = []
+           
+            current_g_cost = g_cost[current]
+            for edge in range(indptr[current], indptr[current + 1]):
+                neighbor = indices[edge]
+                if not reopen and neighbor in closed_set:
+                    continue
+                tentative_g_cost = current_g_cost + weights[edge]
+                if neighbor not in g_cost or tentative_g_cost < g_cost[neighbor]:
+                    came_from[neighbor] = current
+                    g_cost[neighbor] = tentative_g_cost
+                    # Réouverture d'une cellule fermée dont le coût s'améliore
+                    closed_set.discard(neighbor)
+                    if neighbor not in h:
+                        h[neighbor] = heuristic(*divmod(neighbor, width))
+                    f_neighbor = tentative_g_cost + h[neighbor]
+                    open_f[neighbor] = f_neighbor
+                    heapq.heappush(by_f, (f_neighbor, counter, neighbor))
+                    if f_neighbor <= focal_bound:
+                        heapq.heappush(focal_list, (h[neighbor], f_neighbor, counter, neighbor))
+                    else:
+                        heapq.heappush(outside, (f_neighbor, counter, neighbor))
+                    counter += 1
+           
+            # Le f minimal a pu augmenter : la liste focale s'élargit d'autant
+            while by_f and open_f.get(by_f[0][2]) != by_f[0][0]:
+                heapq.heappop(by_f)
+            if by_f and weight * by_f[0][0] > focal_bound:
+                focal_bound = weight * by_f[0][0]
+                while outside and outside[0][0] <= focal_bound:
+                    f_neighbor, entry, neighbor = heapq.heappop(outside)
+                    if open_f.get(neighbor) == f_neighbor:
+                        heapq.heappush(focal_list, (h[neighbor], f_neighbor, entry, neighbor))
+       
+        if track:
+            stats.end_search(expansions, counter, stale_pops, peak_open, closed=len(closed_set))
+            stats.finish(None)
+        result = (None, self._explored_cells(closed_set)) if return_explored else None
+        yield self._final_step(batch, expansions, 0, result)
+   
+    def _final_step(self, batch, expansions, frontier, result, batch_backward=None):
+        """Étape finale d'une recherche pas à pas (avec les cellules du dernier paquet)."""
+        return SearchStep(self._cell_list(batch) if batch else [], expansions, frontier,
+                          self._cell_list(batch_backward) if batch_backward else [],
+                          done=True, result=result)
+   
+    def _cell_list(self, nodes):
+        """Convertit une liste d'identifiants plats en liste de cellules (row, col)."""
+        width = self.width
+        return [divmod(node, width) for node in nodes]
+   
+    @staticmethod
+    def _end_heap_search(stats, pushes, remaining, expanded, peak_open, goal_popped):
+        """
+        Complète stats à la fin d'une recherche sur un tas heapq.
+       
+        Les extractions périmées se déduisent des compteurs existants : toute entrée
+        insérée puis retirée sans être développée (ni être l'arrivée) était périmée.
+        """
+        pops = pushes - remaining
+        stats.end_search(expanded, pushes, pops - expanded - goal_popped, peak_open)
+   
+    def solve_many(self, queries, algorithm="astar", workers=None, **options):
+        """
+        Résout une série de requêtes (départ, arrivée) sur ce labyrinthe.
+       
+        La grille et les récompenses sont placées une fois en mémoire partagée puis
+        les requêtes sont réparties sur un pool de processus (voir batch.solve_many).
+        maze.start et maze.goal ne sont pas modifiés.
+       
+        Args:
+            queries (iterable): Couples (start, goal) de cellules (row, col)
+            algorithm (str): "astar", "dijkstra", "bidirectional_astar" ou
+                             "bidirectional_dijkstra"
+            workers (int, optional): Nombre de processus (par défaut os.cpu_count())
+            **options: Paramètres de la méthode de résolution (return_explored,
+                       array_state, queue, jps, chunksize...)
+           
+        Returns:
+            iterator: Résultats dans l'ordre des requêtes
+        """
+        return batch.solve_many(self, queries, algorithm=algorithm, workers=workers, **options)
+   
+    def _solve_array_state(self, use_heuristic, return_explored, queue=None, goal_entry_cost=None,
+                           stats=None):
+        """
+        A* (ou Dijkstra si use_heuristic=False) avec l'état de recherche en tableaux.
+       
+        Même algorithme et même ordre d'exploration que solve / solve_dijkstra,
+        mais g, les parents et l'ensemble fermé sont des tableaux indexés par
+        identifiant plat au lieu de dictionnaires de tuples.
+       
+        Args:
+            use_heuristic (bool): True pour A*, False pour Dijkstra
+            return_explored (bool): Si True, retourne aussi les cellules explorées
+            queue (str | PriorityQueue, optional): File de priorité (voir make_queue)
+            goal_entry_cost (float, optional): Si fourni, remplace le coût des arêtes
+                                entrant dans l'arrivée (files monotones, voir
+                                integer_edge_costs)
+            stats (SearchStats, optional): Instance remplie avec les compteurs
+           
+        Returns:
+            Même format que solve
+        """
+        graph = self.get_graph()
+        indptr, indices, weights = graph.adjacency()
+        state = self.get_search_state()
+        generation = state.reset()
+        g_cost, parent, seen, closed = state.views()
+        width = self.width
+        heuristic = self.heuristic
+       
+        start = self.cell_id(*self.start)
+        goal = self.cell_id(*self.goal)
+        seen[start] = generation
+        g_cost[start] = 0.0
+        parent[start] = -1
+       
+        open_set = make_queue(queue, graph.num_nodes)
+        push = open_set.push
+        pop = open_set.pop
+        # Compteurs de la file avant la requête (une instance fournie les cumule)
+        pushes, stale_pops = open_set.pushes, open_set.stale_pops
+        push(heuristic(*self.start) if use_heuristic else 0, start)
+        relaxed_goal = goal if goal_entry_cost is not None else -1
+       
+        track = stats is not None
+        peak_open = 0
+        if track:
+            stats.lap("setup")
+       
+        while open_set:
+            if track and len(open_set) > peak_open:
+                peak_open = len(open_set)
+            _, current = pop()
+           
+            if current == goal:
+                if track:
+                    stats.end_search(state.num_closed(), open_set.pushes - pushes,
+                                     open_set.stale_pops - stale_pops, peak_open)
+                path = [self.cell_coords(node) for node in state.path_to(current)]
+                if track:
+                    cost = g_cost[goal]
+                    if relaxed_goal >= 0 and parent[goal] >= 0:
+                        # Coût réel de l'arête d'arrivée (remplacé par goal_entry_cost)
+                        cost = g_cost[parent[goal]] + dict(graph.neighbors(parent[goal]))[goal]
+                    stats.finish(path, cost)
+                return (path, self._explored_cells(state.closed_nodes().tolist())) if return_explored else path
+           
+            if closed[current] == generation:
+                open_set.record_stale()
+                continue
+            closed[current] = generation
+           
+            current_g_cost = g_cost[current]
+           
+            for edge in range(indptr[current], indptr[current + 1]):
+                neighbor = indices[edge]
+                if closed[neighbor] == generation:
+                    continue
                
-                # Calculer la distance pour atteindre ce voisin
-                # La distance est la distance actuelle moins la récompense de la cellule voisine
-                tentative_dist = current_dist - self.get_reward(neighbor_row, neighbor_col)
+                tentative_g_cost = current_g_cost + weights[edge]
+                if neighbor == relaxed_goal:
+                    tentative_g_cost = current_g_cost + goal_entry_cost
                
-                # Si ce chemin vers le voisin est meilleur que les précédents
-                if neighbor not in dist or tentative_dist < dist[neighbor]:
-                    # Mémoriser ce meilleur chemin
-                    came_from[neighbor] = current
-                    dist[neighbor] = tentative_dist
+                if seen[neighbor] != generation or tentative_g_cost < g_cost[neighbor]:
+                    seen[neighbor] = generation
+                    parent[neighbor] = current
+                    g_cost[neighbor] = tentative_g_cost
                    
-                    # Ajouter le voisin à la file de priorité
-                    heapq.heappush(open_set, (tentative_dist, counter, neighbor))
-                    counter += 1
+                    f_cost = tentative_g_cost
+                    if use_heuristic:
+                        f_cost += heuristic(*divmod(neighbor, width))
+                    push(f_cost, neighbor)
        
-        # Si la file est vide et qu'on n'a pas atteint l'arrivée, aucun chemin n'existe
-        return (None, closed_set) if return_explored else None
+        if track:
+            stats.end_search(state.num_closed(), open_set.pushes - pushes,
+                             open_set.stale_pops - stale_pops, peak_open)
+            stats.finish(None)
+        return (None, self._explored_cells(state.closed_nodes().tolist())) if return_explored else None
    
     def _reconstruct_path(self, came_from, current):
         """
@@ -324,6 +1483,23 @@ class Maze:
             path.append(current)
         path.reverse()  # Inverser pour avoir le chemin du départ vers l'arrivée
         return path
+   
+    def _reconstruct_cell_path(self, came_from, current):
+        """
+        Reconstruit le chemin à partir de relations de parenté entre identifiants plats.
+       
+        Args:
+            came_from (dict): Relations de parenté entre identifiants plats
+            current (int): Identifiant de la cellule d'arrivée
+           
+        Returns:
+            list: Liste ordonnée des cellules (row, col) du chemin
+        """
+        return [self.cell_coords(node) for node in self._reconstruct_path(came_from, current)]
+   
+    def _explored_cells(self, closed_set):
+        """Convertit un ensemble d'identifiants plats en ensemble de cellules (row, col)."""
+        return {divmod(node, self.width) for node in closed_set}
            
     def __str__(self):
         """
@@ -0,0 +1,247 @@
+"""
+Recherche anytime bornée par une échéance : ARA* (Anytime Repairing A*).
+
+Likhachev, Gordon et Thrun (2003). A* pondéré (priorité g + epsilon * h)
+trouve vite un chemin dont le coût est au plus epsilon fois l'optimum ;
+ARA* répète la recherche avec des epsilon décroissants (DEFAULT_EPSILONS)
+tant que le temps le permet, et chaque itération réutilise l'effort des
+précédentes : les coûts g et les parents sont conservés, seules les
+cellules de la liste ouverte et les cellules « incohérentes » (améliorées
+après leur développement) sont reprises. Chaque itération terminée produit
+une AnytimeSolution avec la borne de sous-optimalité atteinte sur le coût de
+recherche search_cost (g de l'arrivée) :
+
+    bound = min(epsilon, g(arrivée) / min(g + h) sur ouverte ∪ incohérentes)
+
+La borne vaut 1.0 quand le chemin est optimal ; la recherche s'arrête alors,
+ou à l'échéance (time.perf_counter()), vérifiée toutes les
+DEADLINE_CHECK_INTERVAL cellules développées.
+
+La borne n'est garantie qu'avec des coûts d'arête positifs ou nuls et une
+heuristique cohérente (distance de Manhattan ou euclidienne avec des pas de
+coût au moins 1). Les arêtes entrant dans l'arrivée sont exclues du test :
+la recherche compte l'entrée dans l'arrivée comme un pas de coût 1
+(multiplicateur de la direction), et search_cost diffère du coût réel du
+chemin dans le graphe (cost) de cette seule arête. Ce remplacement ne change
+l'ordre des chemins que si l'écart avec le coût réel de l'entrée est le même
+pour toutes les directions (Maze.uniform_goal_entry_cost) : un DiagonalMaze
+dont l'arrivée a une récompense (entrée diagonale plus avantageuse qu'une
+entrée droite) est refusé, la borne serait fausse.
+"""
+
+import heapq
+import time
+
+import numpy as np
+
+
+# Facteurs d'inflation successifs de l'heuristique
+DEFAULT_EPSILONS = (3.0, 2.0, 1.5, 1.25, 1.1, 1.0)
+
+# Nombre de cellules développées entre deux lectures de l'horloge
+DEADLINE_CHECK_INTERVAL = 64
+
+
+class AnytimeSolution:
+    """
+    Chemin produit par une itération d'ARA*.
+    """
+
+    __slots__ = ("path", "cost", "search_cost", "epsilon", "bound", "iteration", "expansions", "elapsed")
+
+    def __init__(self, path, cost, search_cost, epsilon, bound, iteration, expansions, elapsed):
+        """
+        Args:
+            path (list): Cellules (row, col) du départ à l'arrivée
+            cost (float): Coût du chemin dans le graphe du labyrinthe
+            search_cost (float): Coût de recherche du chemin, au plus bound fois
+                                 le coût de recherche optimal
+            epsilon (float): Facteur d'inflation de l'itération
+            bound (float): Borne de sous-optimalité atteinte (1.0 : chemin optimal)
+            iteration (int): Indice du facteur d'inflation dans le calendrier
+            expansions (int): Cellules développées depuis le début de la recherche
+            elapsed (float): Temps écoulé depuis le début de la recherche (secondes)
+        """
+        self.path = path
+        self.cost = cost
+        self.search_cost = search_cost
+        self.epsilon = epsilon
+        self.bound = bound
+        self.iteration = iteration
+        self.expansions = expansions
+        self.elapsed = elapsed
+
+    def __repr__(self):
+        return (f"AnytimeSolution(cost={self.cost}, epsilon={self.epsilon}, bound={self.bound:.3f}, "
+                f"iteration={self.iteration}, expansions={self.expansions}, "
+                f"elapsed={self.elapsed * 1000:.2f} ms)")
+
+
+def goal_entry_costs(maze, graph, goal):
+    """
+    Coûts de recherche et coûts réels des arêtes entrant dans l'arrivée.
+
+    Args:
+        maze (Maze): Labyrinthe
+        graph (GridGraph): Graphe compilé du labyrinthe
+        goal (int): Identifiant de l'arrivée
+
+    Returns:
+        dict: Source -> (coût de recherche, coût réel) de chaque arête vers l'arrivée
+
+    Raises:
+        ValueError: Si une arête n'entrant pas dans l'arrivée a un coût négatif, ou
+                    si l'écart entre le coût réel de l'entrée dans l'arrivée et son
+                    coût de recherche dépend de la direction
+    """
+    into_goal = graph.indices == goal
+    if np.any(graph.weights[~into_goal] < 0):
+        raise ValueError("ARA* nécessite des coûts d'arête positifs ou nuls (hors arrivée)")
+    if maze.uniform_goal_entry_cost(1.0) is None:
+        raise ValueError("ARA* exige que l'entrée dans l'arrivée coûte le même écart dans toutes "
+                         "les directions (récompense d'arrivée avec des diagonales)")
+    positions = np.flatnonzero(into_goal)
+    sources = np.searchsorted(graph.indptr, positions, side="right") - 1
+    multipliers = [direction[2] for direction in maze.graph_directions()]
+    return {int(source): (float(multipliers[graph.edge_directions[position]]),
+                          float(graph.weights[position]))
+            for source, position in zip(sources, positions)}
+
+
+def ara_star(maze, epsilons=DEFAULT_EPSILONS, deadline=None, stats=None):
+    """
+    ARA* : générateur des chemins successifs, de borne décroissante.
+
+    Args:
+        maze (Maze): Labyrinthe (départ, arrivée, graphe compilé et heuristique)
+        epsilons (iterable): Facteurs d'inflation décroissants (au moins 1) ; un
+                             facteur supérieur à la borne déjà atteinte est sauté
+        deadline (float, optional): Échéance (time.perf_counter()) ; l'itération en
+                                    cours est abandonnée quand elle est atteinte
+        stats (SearchStats, optional): Instance complétée à la fin de la recherche
+                                       (meilleur chemin et sa borne)
+
+    Yields:
+        AnytimeSolution: Chemin de chaque itération terminée
+
+    Raises:
+        ValueError: Si un facteur est inférieur à 1, si un coût d'arête (hors
+                    arrivée) est négatif ou si le coût d'entrée dans l'arrivée
+                    dépend de la direction (voir goal_entry_costs)
+    """
+    epsilons = tuple(epsilons)
+    if any(epsilon < 1 for epsilon in epsilons):
+        raise ValueError("Les facteurs d'inflation doivent être supérieurs ou égaux à 1")
+    started = time.perf_counter()
+    graph = maze.get_graph()
+    indptr, indices, weights = graph.adjacency()
+    start = maze.cell_id(*maze.start)
+    goal = maze.cell_id(*maze.goal)
+    entry_costs = goal_entry_costs(maze, graph, goal)
+    width = maze.width
+    heuristic = maze.heuristic
+
+    # Heuristique de chaque cellule rencontrée (calculée une fois)
+    h = {start: heuristic(*maze.start)}
+    g = {start: 0.0}
+    parent = {}
+    # Liste ouverte (ensemble + tas à entrées périmées), ensemble fermé de
+    # l'itération et cellules incohérentes (améliorées une fois fermées)
+    open_nodes = {start}
+    heap = []
+    closed = set()
+    inconsistent = set()
+
+    counter = 0
+    expansions = 0
+    stale_pops = 0
+    peak_open = 0
+    track = stats is not None
+    if track:
+        stats.lap("setup")
+
+    best = None
+    bound = None
+    try:
+        for iteration, epsilon in enumerate(epsilons):
+            if bound is not None and epsilon >= bound:
+                continue
+            if deadline is not None and time.perf_counter() >= deadline:
+                return
+
+            # Réparation : la liste ouverte reprend les cellules incohérentes,
+            # avec les priorités du nouveau facteur
+            open_nodes |= inconsistent
+            inconsistent = set()
+            closed = set()
+            heap = []
+            for node in open_nodes:
+                heap.append((g[node] + epsilon * h[node], counter, node))
+                counter += 1
+            heapq.heapify(heap)
+
+            while heap:
+                if track and len(heap) > peak_open:
+                    peak_open = len(heap)
+                key, _, current = heap[0]
+                if current not in open_nodes:
+                    heapq.heappop(heap)
+                    stale_pops += 1
+                    continue
+                # Arrêt : aucune cellule ouverte ne peut encore améliorer l'arrivée
+                if g.get(goal, float("inf")) <= key:
+                    break
+                heapq.heappop(heap)
+                open_nodes.discard(current)
+                closed.add(current)
+                expansions += 1
+                if (deadline is not None and expansions % DEADLINE_CHECK_INTERVAL == 0
+                        and time.perf_counter() >= deadline):
+                    return
+
+                current_g = g[current]
+                for edge in range(indptr[current], indptr[current + 1]):
+                    neighbor = indices[edge]
+                    step_cost = entry_costs[current][0] if neighbor == goal else weights[edge]
+                    tentative_g = current_g + step_cost
+                    if tentative_g < g.get(neighbor, float("inf")):
+                        g[neighbor] = tentative_g
+                        parent[neighbor] = current
+                        if neighbor in closed:
+                            inconsistent.add(neighbor)
+                            continue
+                        if neighbor not in h:
+                            h[neighbor] = heuristic(*divmod(neighbor, width))
+                        open_nodes.add(neighbor)
+                        heapq.heappush(heap, (tentative_g + epsilon * h[neighbor], counter, neighbor))
+                        counter += 1
+
+            if goal not in g:
+                # Liste ouverte épuisée : l'arrivée est inaccessible
+                return
+
+            # Borne : g(arrivée) rapporté au minimum de g + h des cellules restantes
+            lower = min((g[node] + h[node] for node in open_nodes | inconsistent), default=None)
+            if lower is None:
+                bound = 1.0
+            elif lower > 0:
+                bound = max(1.0, min(epsilon, float(g[goal] / lower)))
+            else:
+                bound = epsilon
+
+            nodes = [goal]
+            while nodes[-1] in parent:
+                nodes.append(parent[nodes[-1]])
+            nodes.reverse()
+            cost = sum(dict(graph.neighbors(source))[target] for source, target in zip(nodes, nodes[1:]))
+            best = AnytimeSolution([divmod(node, width) for node in nodes], cost, g[goal], epsilon, bound,
+                                   iteration, expansions, time.perf_counter() - started)
+            yield best
+            if bound <= 1.0:
+                return
+    finally:
+        if track:
+            stats.end_search(expansions, counter, stale_pops, peak_open, closed=len(closed))
+            stats.bound = best.bound if best is not None else None
+            stats.finish(best.path if best is not None else None,
+                         best.cost if best is not None else None)
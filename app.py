@@ -14,6 +14,10 @@ from Maze import Maze
 from main import create_complete_maze
 
 
+# Cellules développées entre deux rafraîchissements de l'exploration
+STREAM_BATCH_SIZE = 64
+
+
 class MazeWindow(QMainWindow):
     """Fenêtre principale de l'application."""
     
@@ -207,14 +211,37 @@ class MazeWindow(QMainWindow):
             rect.setPen(QPen(color, 2))
             self.scene.addItem(rect)
     
+    def run_search(self, steps, color):
+        """
+        Mène une recherche pas à pas (solve_iter) en affichant les cellules
+        développées au fil de l'eau si l'affichage de l'exploration est activé.
+        
+        Args:
+            steps (generator): Étapes de la recherche
+            color (QColor): Couleur des cellules développées
+        
+        Returns:
+            tuple: (résultat de la recherche, temps de recherche en secondes, hors affichage)
+        """
+        show_exploration = self.ui.showExplorationCheckBox.isChecked()
+        elapsed_time = 0.0
+        while True:
+            start_time = time.time()
+            step = next(steps)
+            elapsed_time += time.time() - start_time
+            if step.done:
+                return step.result, elapsed_time
+            if show_exploration:
+                self.draw_explored(step.expanded, color, 0.8)
+                QApplication.processEvents()
+    
     def solve_astar(self):
         """Résout le labyrinthe avec A*."""
         if self.maze is None:
             return
         
-        start_time = time.time()
-        result = self.maze.solve(return_explored=True)
-        elapsed_time = time.time() - start_time
+        result, elapsed_time = self.run_search(self.maze.solve_iter(STREAM_BATCH_SIZE, return_explored=True),
+                                               self.color_explored_astar)
         
         self.path_astar, self.explored_astar = result
         
@@ -242,9 +269,9 @@ class MazeWindow(QMainWindow):
         if self.maze is None:
             return
         
-        start_time = time.time()
-        result = self.maze.solve_dijkstra(return_explored=True)
-        elapsed_time = time.time() - start_time
+        result, elapsed_time = self.run_search(
+            self.maze.solve_dijkstra_iter(STREAM_BATCH_SIZE, return_explored=True),
+            self.color_explored_dijkstra)
         
         self.path_dijkstra, self.explored_dijkstra = result
         
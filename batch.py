@@ -0,0 +1,176 @@
+"""
+Résolution d'un lot de requêtes (départ, arrivée) sur un même labyrinthe.
+
+Plutôt que de modifier maze.start / maze.goal et d'appeler solve() en série,
+solve_many répartit les requêtes sur un pool de processus :
+
+- la grille et les récompenses sont copiées une seule fois en mémoire partagée
+  (multiprocessing.shared_memory) ; chaque processus de travail construit un
+  labyrinthe qui pointe directement sur ces tampons, sans copie. Un labyrinthe
+  ouvert par Maze.load et non modifié depuis n'est pas copié : chaque processus
+  projette le même fichier en lecture seule. Un monde en tuiles (Maze.open_tiled)
+  est relu tuile par tuile par chaque processus, avec son propre cache ;
+- le graphe compilé et les tampons de recherche sont construits une fois par
+  processus, puis réutilisés pour toutes ses requêtes ;
+- les requêtes sont envoyées par paquets et les résultats reviennent au fil de
+  l'eau, dans l'ordre des requêtes.
+"""
+
+import multiprocessing
+import os
+from multiprocessing import shared_memory
+
+import numpy as np
+
+from maze_file import map_arrays
+
+
+# Nom de l'algorithme -> méthode de résolution du labyrinthe
+ALGORITHMS = {
+    "astar": "solve",
+    "dijkstra": "solve_dijkstra",
+    "bidirectional_astar": "astar_bidirectional",
+    "bidirectional_dijkstra": "dijkstra_bidirectional",
+}
+
+# Labyrinthe et paramètres de résolution du processus de travail courant
+_worker = {}
+
+
+def solve_many(maze, queries, algorithm="astar", workers=None, chunksize=None, **options):
+    """
+    Résout une liste de requêtes (départ, arrivée) sur un même labyrinthe.
+
+    Args:
+        maze (Maze): Labyrinthe (Maze, DiagonalMaze, BiDirectionalMaze...)
+        queries (iterable): Couples (start, goal) de cellules (row, col)
+        algorithm (str): "astar", "dijkstra", "bidirectional_astar" ou
+                         "bidirectional_dijkstra" (ces deux derniers
+                         demandent un BiDirectionalMaze)
+        workers (int, optional): Nombre de processus (par défaut os.cpu_count()).
+                                 Avec 1 processus, les requêtes sont résolues
+                                 en série dans le processus courant.
+        chunksize (int, optional): Nombre de requêtes envoyées ensemble à un processus
+        **options: Paramètres transmis à la méthode de résolution
+                   (return_explored, array_state, queue, jps...)
+
+    Returns:
+        iterator: Résultat de chaque requête (même format que la méthode de
+                  résolution), dans l'ordre des requêtes
+
+    Raises:
+        ValueError: Si l'algorithme est inconnu ou non supporté par ce labyrinthe
+    """
+    method_name = ALGORITHMS.get(algorithm)
+    if method_name is None or not hasattr(maze, method_name):
+        raise ValueError(f"Algorithme '{algorithm}' non supporté par {type(maze).__name__} "
+                         f"(choix: {', '.join(ALGORITHMS)})")
+    queries = [(tuple(start), tuple(goal)) for start, goal in queries]
+    if workers is None:
+        workers = os.cpu_count() or 1
+    workers = min(workers, len(queries))
+    if workers <= 1:
+        return _solve_serial(maze, queries, method_name, options)
+    if chunksize is None:
+        # Plusieurs paquets par processus pour équilibrer la charge
+        chunksize = max(1, len(queries) // (workers * 8))
+    return _solve_parallel(maze, queries, method_name, options, workers, chunksize)
+
+
+def _solve_serial(maze, queries, method_name, options):
+    """Résout les requêtes dans le processus courant, puis restaure start/goal."""
+    solver = getattr(maze, method_name)
+    saved = maze.start, maze.goal
+    try:
+        for start, goal in queries:
+            maze.start, maze.goal = start, goal
+            yield solver(**options)
+    finally:
+        maze.start, maze.goal = saved
+
+
+def _solve_parallel(maze, queries, method_name, options, workers, chunksize):
+    """Résout les requêtes sur un pool de processus partageant la grille."""
+    mapped = maze.mapped_file
+    buffers = []
+    if maze.tiles is not None:
+        # Les processus relisent les tuiles : les modifications doivent être écrites
+        maze.tiles.flush()
+        arrays = ("tiles",)
+    elif mapped is not None and mapped.version == maze.version:
+        # Le fichier reflète encore le labyrinthe : les processus le projettent
+        arrays = ("file", mapped.path)
+    else:
+        grid = np.ascontiguousarray(maze.grid)
+        rewards = np.ascontiguousarray(maze.rewards)
+        buffers = [_share_array(grid), _share_array(rewards)]
+        arrays = ("shared", (buffers[0].name, grid.shape, grid.dtype.str),
+                  (buffers[1].name, rewards.shape, rewards.dtype.str))
+    try:
+        initargs = (type(maze), _detached_state(maze), arrays, method_name, options)
+        with multiprocessing.Pool(workers, initializer=_init_worker, initargs=initargs) as pool:
+            yield from pool.imap(_solve_query, queries, chunksize)
+    finally:
+        for buffer in buffers:
+            buffer.close()
+            buffer.unlink()
+
+
+def _share_array(array):
+    """Copie un tableau dans un nouveau segment de mémoire partagée."""
+    buffer = shared_memory.SharedMemory(create=True, size=max(array.nbytes, 1))
+    np.ndarray(array.shape, dtype=array.dtype, buffer=buffer.buf)[...] = array
+    return buffer
+
+
+def _attach_array(description):
+    """Ouvre un segment partagé créé par _share_array et retourne (segment, tableau)."""
+    name, shape, dtype = description
+    buffer = shared_memory.SharedMemory(name=name)
+    return buffer, np.ndarray(shape, dtype=dtype, buffer=buffer.buf)
+
+
+def _detached_state(maze):
+    """
+    Retourne les attributs du labyrinthe sans la grille, les récompenses ni les caches.
+
+    Les caches (graphe compilé, tampons de recherche...) sont reconstruits dans
+    chaque processus de travail plutôt que sérialisés.
+    """
+    blank = object.__new__(type(maze))
+    blank._reset_caches()
+    excluded = set(blank.__dict__) | {"_grid", "_rewards"}
+    return {key: value for key, value in maze.__dict__.items() if key not in excluded}
+
+
+def _init_worker(maze_class, state, arrays, method_name, options):
+    """
+    Initialise un processus de travail : labyrinthe branché sur la mémoire partagée.
+
+    arrays indique l'origine de la grille et des récompenses : ("tiles",) pour
+    un monde en tuiles, ("file", chemin) pour un fichier projeté, ou
+    ("shared", description_grille, description_récompenses) pour les segments partagés.
+    """
+    maze = object.__new__(maze_class)
+    maze.__dict__.update(state)
+    buffers = ()
+    if arrays[0] == "tiles":
+        grid, rewards = maze.tiles.arrays()
+    elif arrays[0] == "file":
+        grid, rewards = map_arrays(arrays[1], "r")
+    else:
+        grid_buffer, grid = _attach_array(arrays[1])
+        rewards_buffer, rewards = _attach_array(arrays[2])
+        buffers = (grid_buffer, rewards_buffer)
+    maze._grid = grid
+    maze._rewards = rewards
+    maze._reset_caches()
+    _worker.update(maze=maze, solver=getattr(maze, method_name), options=options,
+                   buffers=buffers)
+
+
+def _solve_query(query):
+    """Résout une requête dans un processus de travail."""
+    maze = _worker["maze"]
+    maze.start, maze.goal = query
+    return _worker["solver"](**_worker["options"])
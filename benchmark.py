@@ -0,0 +1,435 @@
+"""
+Banc de mesure des solveurs : balayage des tailles, types d'obstacles et densités.
+
+Pour chaque scénario (taille, type d'obstacles, densité, graine) et chaque
+solveur, le banc mesure :
+
+- le temps de résolution avec time.perf_counter : quelques exécutions
+  d'échauffement (graphe compilé, tampons de recherche), puis plusieurs
+  répétitions dont on garde la médiane, le 95e centile, le minimum et la moyenne ;
+- le nombre de cellules développées (déterministe), lu lors d'une exécution
+  séparée avec return_explored=True ;
+- le pic de mémoire allouée pendant une résolution (tracemalloc, exécution
+  séparée pour ne pas fausser les temps) ;
+- la longueur et le coût du chemin trouvé.
+
+Une mesure sans chemin (départ et arrivée déconnectés pour la graine choisie)
+ne mesure qu'une recherche abandonnée au bout de quelques cellules : elle est
+reportée dans les mesures ignorées plutôt que dans les résultats.
+
+Les résultats sont enregistrés en JSON (métadonnées de l'exécution et une
+ligne par mesure) ou en CSV ; generate_tp2_plots.py trace ses figures à partir
+du fichier JSON.
+
+Solveurs : Dijkstra et A* unidirectionnels et bidirectionnels, A* et Dijkstra
+avec déplacements diagonaux, A* pondéré et recherche focale à BOUNDED_EPSILON
+de l'optimum (4 et 8 directions), et bidirectional_dijkstra de NetworkX si le
+paquet est installé (sur les graphes sans coût négatif). expansion_savings
+compare les recherches sous-optimales bornées à A* (cellules développées, coût
+et temps), scénario par scénario.
+
+Utilisation :
+
+    python benchmark.py --sizes 10 30 100 --repeat 7 --json resultats.json --csv resultats.csv
+"""
+
+import argparse
+import csv
+import json
+import platform
+import sys
+import time
+import tracemalloc
+
+import numpy as np
+
+from bidirectional import BiDirectionalMaze
+from diagonal_maze import DiagonalMaze
+from main import OBSTACLE_TYPES, create_complete_maze
+
+try:
+    import networkx as nx
+except ImportError:
+    nx = None
+
+
+# Paramètres des labyrinthes par défaut : coût uniforme, comme benchmark_networkx_tp2.py
+MAZE_DEFAULTS = {"step_cost": -1.0, "goal_reward": -1.0, "add_bonuses": False}
+
+# Sous-optimalité tolérée des solveurs A* pondéré et focal (chemin à 10 % de l'optimum)
+BOUNDED_EPSILON = 0.1
+
+# Colonnes d'une mesure (ordre du fichier CSV)
+FIELDS = ("width", "height", "obstacle_type", "density", "seed", "solver",
+          "path_length", "cost", "expansions", "median_ms", "p95_ms", "min_ms",
+          "mean_ms", "repeat", "peak_kib")
+
+
+def _unidirectional(method_name, **options):
+    def run(maze, return_explored):
+        result = getattr(maze, method_name)(return_explored=return_explored, **options)
+        if return_explored:
+            path, explored = result
+            return path, len(explored)
+        return result, None
+    return run
+
+
+def _bidirectional(method_name):
+    def run(maze, return_explored):
+        result = getattr(maze, method_name)(return_explored=return_explored)
+        if return_explored:
+            return result[0], result[3]
+        return result, None
+    return run
+
+
+def _networkx(graph, return_explored):
+    """bidirectional_dijkstra de NetworkX (nombre de cellules développées non disponible)."""
+    graph, source, target, width = graph
+    try:
+        _, nodes = nx.bidirectional_dijkstra(graph, source, target)
+    except nx.NetworkXNoPath:
+        return None, None
+    return [divmod(node, width) for node in nodes], None
+
+
+# Nom du solveur -> (labyrinthe utilisé, fonction (cible, return_explored) -> (chemin, développées))
+SOLVERS = {
+    "dijkstra": ("grid", _unidirectional("solve_dijkstra")),
+    "astar": ("grid", _unidirectional("solve")),
+    "bidirectional_dijkstra": ("grid", _bidirectional("dijkstra_bidirectional")),
+    "bidirectional_astar": ("grid", _bidirectional("astar_bidirectional")),
+    "diagonal_dijkstra": ("diagonal", _unidirectional("solve_dijkstra")),
+    "diagonal_astar": ("diagonal", _unidirectional("solve")),
+    "weighted_astar": ("grid", _unidirectional("solve", epsilon=BOUNDED_EPSILON)),
+    "focal_astar": ("grid", _unidirectional("solve", epsilon=BOUNDED_EPSILON, focal=True)),
+    "diagonal_weighted_astar": ("diagonal", _unidirectional("solve", epsilon=BOUNDED_EPSILON)),
+    "diagonal_focal_astar": ("diagonal", _unidirectional("solve", epsilon=BOUNDED_EPSILON, focal=True)),
+    "networkx_bidirectional_dijkstra": ("networkx", _networkx),
+}
+
+# Solveur exact de référence des recherches sous-optimales bornées (expansion_savings)
+REFERENCE_SOLVERS = {
+    "weighted_astar": "astar",
+    "focal_astar": "astar",
+    "diagonal_weighted_astar": "diagonal_astar",
+    "diagonal_focal_astar": "diagonal_astar",
+}
+
+
+def parse_size(size):
+    """
+    Lit une taille de grille.
+
+    Args:
+        size (int | str | tuple): Côté d'une grille carrée, "LARGEURxHAUTEUR" ou (width, height)
+
+    Returns:
+        tuple: (width, height)
+    """
+    if isinstance(size, str):
+        if "x" in size:
+            width, height = size.split("x")
+            return int(width), int(height)
+        size = int(size)
+    if isinstance(size, (tuple, list)):
+        return int(size[0]), int(size[1])
+    return int(size), int(size)
+
+
+def scenarios(sizes, obstacle_types=OBSTACLE_TYPES, densities=(0.2,), seeds=(0,)):
+    """
+    Énumère les scénarios d'un balayage.
+
+    La densité ne s'applique qu'aux obstacles aléatoires : les motifs
+    déterministes ne sont mesurés qu'une fois par taille et par graine.
+
+    Returns:
+        list: Dictionnaires (width, height, obstacle_type, density, seed)
+    """
+    cases = []
+    for size in sizes:
+        width, height = parse_size(size)
+        for obstacle_type in obstacle_types:
+            for density in (densities if obstacle_type == "random" else (None,)):
+                for seed in seeds:
+                    cases.append({"width": width, "height": height, "obstacle_type": obstacle_type,
+                                  "density": density, "seed": seed})
+    return cases
+
+
+def build_targets(case, solvers, **maze_options):
+    """
+    Construit le labyrinthe d'un scénario et ses variantes pour les solveurs demandés.
+
+    Returns:
+        dict: "grid" (BiDirectionalMaze), "diagonal" (DiagonalMaze) et "networkx"
+              (graphe orienté pondéré, départ, arrivée, largeur) selon les besoins
+    """
+    options = dict(MAZE_DEFAULTS, **maze_options)
+    if case["density"] is not None:
+        options["obstacle_density"] = case["density"]
+    maze = create_complete_maze(case["width"], case["height"], obstacle_type=case["obstacle_type"],
+                                seed=case["seed"], **options)
+    arrays = (maze.grid, maze.rewards, maze.start, maze.goal)
+    kinds = {SOLVERS[name][0] for name in solvers}
+    targets = {"grid": BiDirectionalMaze(maze.width, maze.height, *arrays)}
+    if "diagonal" in kinds:
+        targets["diagonal"] = DiagonalMaze(maze.width, maze.height, *arrays)
+    if "networkx" in kinds and nx is not None:
+        graph = targets["grid"].get_graph()
+        if not np.any(graph.weights < 0):
+            # Même graphe CSR que nos solveurs (arêtes orientées, coût de la cellule d'arrivée)
+            sources = np.repeat(np.arange(graph.num_nodes), np.diff(graph.indptr))
+            digraph = nx.DiGraph()
+            digraph.add_nodes_from(range(graph.num_nodes))
+            digraph.add_weighted_edges_from(zip(sources.tolist(), graph.indices.tolist(),
+                                                graph.weights.tolist()))
+            targets["networkx"] = (digraph, graph.node_id(*maze.start),
+                                   graph.node_id(*maze.goal), maze.width)
+    return targets
+
+
+def path_cost(maze, path):
+    """Coût d'un chemin dans le graphe compilé du labyrinthe (None sans chemin)."""
+    if not path:
+        return None
+    graph = maze.get_graph()
+    cost = 0.0
+    for (row, col), cell in zip(path, path[1:]):
+        cost += dict(graph.neighbors(graph.node_id(row, col)))[graph.node_id(*cell)]
+    return cost
+
+
+def measure(run, target, repeat=5, warmup=1, memory=True):
+    """
+    Mesure un solveur sur une cible.
+
+    Args:
+        run (callable): Fonction du solveur (voir SOLVERS)
+        target: Labyrinthe ou graphe NetworkX
+        repeat (int): Nombre d'exécutions chronométrées (au moins 1)
+        warmup (int): Nombre d'exécutions d'échauffement, non chronométrées
+        memory (bool): Si True, mesure le pic de mémoire (exécution supplémentaire)
+
+    Returns:
+        dict: path, expansions, times (secondes) et peak_bytes (None sans mesure)
+    """
+    for _ in range(warmup):
+        run(target, False)
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        run(target, False)
+        times.append(time.perf_counter() - start)
+    path, expansions = run(target, True)
+
+    peak_bytes = None
+    if memory:
+        tracing = tracemalloc.is_tracing()
+        if not tracing:
+            tracemalloc.start()
+        tracemalloc.reset_peak()
+        baseline = tracemalloc.get_traced_memory()[0]
+        run(target, False)
+        peak_bytes = tracemalloc.get_traced_memory()[1] - baseline
+        if not tracing:
+            tracemalloc.stop()
+    return {"path": path, "expansions": expansions, "times": times, "peak_bytes": peak_bytes}
+
+
+def run_benchmark(sizes=(10, 30, 100), obstacle_types=OBSTACLE_TYPES, densities=(0.2,),
+                  seeds=(0,), solvers=tuple(SOLVERS), repeat=5, warmup=1, memory=True,
+                  verbose=False, **maze_options):
+    """
+    Exécute un balayage complet.
+
+    Args:
+        sizes (tuple): Tailles de grille (voir parse_size)
+        obstacle_types (tuple): Types d'obstacles (voir main.OBSTACLE_TYPES)
+        densities (tuple): Densités des obstacles aléatoires
+        seeds (tuple): Graines de génération des labyrinthes
+        solvers (tuple): Noms des solveurs (clés de SOLVERS)
+        repeat (int): Nombre d'exécutions chronométrées par mesure
+        warmup (int): Nombre d'exécutions d'échauffement par mesure
+        memory (bool): Si True, mesure le pic de mémoire de chaque solveur
+        verbose (bool): Si True, affiche chaque mesure
+        **maze_options: Paramètres de create_complete_maze (par défaut MAZE_DEFAULTS)
+
+    Returns:
+        dict: "meta" (paramètres et environnement), "results" (une ligne par
+              scénario et solveur, colonnes FIELDS) et "skipped" (mesures impossibles
+              ou sans chemin trouvé, avec leur raison)
+
+    Raises:
+        ValueError: Si un solveur est inconnu ou si repeat < 1
+    """
+    if repeat < 1:
+        raise ValueError("Au moins une exécution chronométrée est nécessaire (repeat >= 1)")
+    for name in solvers:
+        if name not in SOLVERS:
+            raise ValueError(f"Solveur inconnu : '{name}' (choix: {', '.join(SOLVERS)})")
+    cases = scenarios(sizes, obstacle_types, densities, seeds)
+    results, skipped = [], []
+    for case in cases:
+        targets = build_targets(case, solvers, **maze_options)
+        for name in solvers:
+            kind, run = SOLVERS[name]
+            if kind not in targets:
+                reason = ("networkx non installé" if nx is None
+                          else "coûts négatifs non supportés")
+                skipped.append(dict(case, solver=name, reason=reason))
+                continue
+            measured = measure(run, targets[kind], repeat, warmup, memory)
+            times_ms = np.array(measured["times"]) * 1000
+            path = measured["path"]
+            if path is None:
+                skipped.append(dict(case, solver=name, reason="aucun chemin trouvé"))
+                continue
+            row = dict(case, solver=name, path_length=len(path),
+                       cost=path_cost(targets["grid" if kind == "networkx" else kind], path),
+                       expansions=measured["expansions"],
+                       median_ms=float(np.median(times_ms)),
+                       p95_ms=float(np.percentile(times_ms, 95)),
+                       min_ms=float(times_ms.min()),
+                       mean_ms=float(times_ms.mean()),
+                       repeat=repeat,
+                       peak_kib=(measured["peak_bytes"] / 1024
+                                 if measured["peak_bytes"] is not None else None))
+            results.append(row)
+            if verbose:
+                print(format_row(row))
+
+    meta = {
+        "created": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "python": platform.python_version(),
+        "numpy": np.__version__,
+        "networkx": nx.__version__ if nx is not None else None,
+        "platform": platform.platform(),
+        "sizes": [list(parse_size(size)) for size in sizes],
+        "obstacle_types": list(obstacle_types),
+        "densities": list(densities),
+        "seeds": list(seeds),
+        "solvers": list(solvers),
+        "repeat": repeat,
+        "warmup": warmup,
+        "maze_options": dict(MAZE_DEFAULTS, **maze_options),
+    }
+    return {"meta": meta, "results": results, "skipped": skipped}
+
+
+def case_label(row):
+    """Libellé court d'un scénario (ex. "30x30 random 0.2")."""
+    label = f"{row['width']}x{row['height']} {row['obstacle_type']}"
+    if row["density"] is not None:
+        label += f" {row['density']:g}"
+    return label
+
+
+def format_row(row):
+    """Ligne de tableau lisible d'une mesure."""
+    expansions = "-" if row["expansions"] is None else row["expansions"]
+    return (f"{case_label(row):<28} {row['solver']:<32} {expansions:>8} "
+            f"{row['median_ms']:>9.3f} ms  p95 {row['p95_ms']:>9.3f} ms  {row['peak_kib'] or 0:>9.1f} Kio")
+
+
+def expansion_savings(report):
+    """
+    Compare les recherches sous-optimales bornées à leur solveur exact de référence.
+
+    Args:
+        report (dict): Résultat de run_benchmark (ou rapport relu par load_results)
+
+    Returns:
+        list: Un dictionnaire par scénario et solveur mesurés avec leur référence :
+              case, solver, reference, expansions, reference_expansions, saving
+              (fraction de cellules développées en moins), cost_ratio (coût
+              rapporté au coût optimal) et speedup (rapport des temps médians)
+    """
+    measured = {(case_label(row), row["solver"]): row for row in report["results"]}
+    savings = []
+    for row in report["results"]:
+        reference = measured.get((case_label(row), REFERENCE_SOLVERS.get(row["solver"])))
+        if reference is None or not reference["expansions"] or row["expansions"] is None:
+            continue
+        savings.append({
+            "case": case_label(row),
+            "solver": row["solver"],
+            "reference": reference["solver"],
+            "expansions": row["expansions"],
+            "reference_expansions": reference["expansions"],
+            "saving": 1 - row["expansions"] / reference["expansions"],
+            "cost_ratio": (row["cost"] / reference["cost"]
+                           if row["cost"] is not None and reference["cost"] else None),
+            "speedup": reference["median_ms"] / row["median_ms"] if row["median_ms"] else None,
+        })
+    return savings
+
+
+def format_saving(saving):
+    """Ligne de tableau lisible d'une comparaison de expansion_savings."""
+    cost = "-" if saving["cost_ratio"] is None else f"{saving['cost_ratio']:.3f}"
+    speedup = "-" if saving["speedup"] is None else f"{saving['speedup']:.2f}x"
+    return (f"{saving['case']:<28} {saving['solver']:<24} {saving['expansions']:>8} / "
+            f"{saving['reference_expansions']:<8} {saving['saving']:>7.1%}  coût x{cost}  "
+            f"temps {speedup}")
+
+
+def save_results(report, path):
+    """
+    Enregistre les résultats d'un balayage.
+
+    Args:
+        report (dict): Résultat de run_benchmark
+        path (str): Fichier .csv (une ligne par mesure) ou JSON (rapport complet)
+    """
+    if path.endswith(".csv"):
+        with open(path, "w", newline="") as handle:
+            writer = csv.DictWriter(handle, fieldnames=FIELDS)
+            writer.writeheader()
+            for row in report["results"]:
+                writer.writerow({key: "" if row[key] is None else row[key] for key in FIELDS})
+    else:
+        with open(path, "w") as handle:
+            json.dump(report, handle, indent=2)
+
+
+def load_results(path):
+    """Relit un rapport JSON enregistré par save_results."""
+    with open(path) as handle:
+        return json.load(handle)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Banc de mesure des solveurs de labyrinthe")
+    parser.add_argument("--sizes", nargs="+", default=["10", "30", "100"],
+                        help="Tailles de grille (N ou LARGEURxHAUTEUR)")
+    parser.add_argument("--types", nargs="+", default=list(OBSTACLE_TYPES), choices=OBSTACLE_TYPES)
+    parser.add_argument("--densities", nargs="+", type=float, default=[0.2])
+    parser.add_argument("--seeds", nargs="+", type=int, default=[0])
+    parser.add_argument("--solvers", nargs="+", default=list(SOLVERS), choices=list(SOLVERS))
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--warmup", type=int, default=1)
+    parser.add_argument("--no-memory", action="store_true", help="Ne pas mesurer le pic de mémoire")
+    parser.add_argument("--json", help="Fichier JSON des résultats")
+    parser.add_argument("--csv", help="Fichier CSV des résultats")
+    args = parser.parse_args(argv)
+
+    report = run_benchmark(args.sizes, args.types, args.densities, args.seeds, args.solvers,
+                           args.repeat, args.warmup, not args.no_memory, verbose=True)
+    for row in report["skipped"]:
+        print(f"{case_label(row):<28} {row['solver']:<32} ignoré ({row['reason']})")
+    savings = expansion_savings(report)
+    if savings:
+        print(f"\nCellules développées en moins (epsilon = {BOUNDED_EPSILON}) par rapport à A* :")
+        for saving in savings:
+            print(format_saving(saving))
+    for path in (args.json, args.csv):
+        if path:
+            save_results(report, path)
+            print(f"Résultats enregistrés dans {path}")
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -4,92 +4,207 @@ Implémentation de la recherche bidirectionnelle pour optimiser la recherche de
 """
 
 import heapq
-import numpy as np
 import time
 
+from Maze import Maze
+from path_cache import cached_solver
+from priority_queues import make_queue
+from search_steps import DEFAULT_BATCH_SIZE, SearchStep, drive
 
-class BiDirectionalMaze:
+
+class BiDirectionalMaze(Maze):
     """
     Classe pour résoudre des labyrinthes avec recherche bidirectionnelle.
     Supporte Dijkstra bidirectionnel et A* bidirectionnel.
-    """
-    
-    def __init__(self, width, height, grid=None, rewards=None, start=None, goal=None):
-        """
-        Initialise le labyrinthe.
-        
-        Args:
-            width: Largeur du labyrinthe
-            height: Hauteur du labyrinthe
-            grid: Matrice d'obstacles (0=libre, 1=obstacle)
-            rewards: Matrice de récompenses
-            start: Position de départ (row, col)
-            goal: Position d'arrivée (row, col)
-        """
-        self.width = width
-        self.height = height
-        self.grid = np.zeros((height, width), dtype=int) if grid is None else np.array(grid, dtype=int)
-        self.rewards = np.ones((height, width), dtype=float) if rewards is None else np.array(rewards, dtype=float)
-        self.start = start if start is not None else (0, 0)
-        self.goal = goal if goal is not None else (height - 1, width - 1)
-        
-    def is_in_bounds(self, row, col):
-        """Vérifie si une cellule est dans la grille."""
-        return 0 <= row < self.height and 0 <= col < self.width
-    
-    def is_passable(self, row, col):
-        """Vérifie si une cellule est franchissable."""
-        return self.is_in_bounds(row, col) and self.grid[row, col] == 0
     
-    def get_neighbors(self, row, col):
-        """Retourne les voisins 4-connexes franchissables."""
-        neighbors = []
-        for dr, dc in [(-1, 0), (1, 0), (0, -1), (0, 1)]:
-            nr, nc = row + dr, col + dc
-            if self.is_passable(nr, nc):
-                neighbors.append((nr, nc))
-        return neighbors
+    La grille, les récompenses et le graphe compilé (voisins 4-connexes) sont
+    hérités de Maze ; les deux recherches parcourent le même graphe CSR.
+    """
     
     def heuristic(self, row, col, goal=None):
-        """Distance de Manhattan vers le but."""
+        """Distance de Manhattan vers le but (ou borne ALT si plus grande, voir enable_landmarks)."""
         if goal is None:
             goal = self.goal
-        return abs(goal[0] - row) + abs(goal[1] - col)
+        distance = abs(goal[0] - row) + abs(goal[1] - col)
+        if self.landmarks is not None:
+            return max(distance, self.landmarks.estimate(self, row, col, goal))
+        return distance
 
-    def _safe_reconstruct(self, came_from, start_node, reverse=False):
-        """Reconstruit un chemin parent->enfant avec garde anti-boucle."""
+    @staticmethod
+    def _safe_reconstruct(came_from, start_node, reverse=False):
+        """Reconstruit un chemin parent->enfant (RuntimeError si les parents bouclent)."""
         path = [start_node]
         current = start_node
         seen = {start_node}
-        max_steps = self.width * self.height + 1
+        max_steps = len(came_from) + 1
 
         for _ in range(max_steps):
             if current not in came_from:
                 break
             current = came_from[current]
             if current in seen:
-                # Garde anti-boucle : on arrête la reconstruction si un cycle apparaît.
-                break
+                raise RuntimeError(f"Boucle dans les parents en {current} : chemin incohérent")
             seen.add(current)
             path.append(current)
 
         if reverse:
             path.reverse()
         return path
-    
-    def dijkstra_bidirectional(self, return_explored=False, return_sets=False):
+
+    @staticmethod
+    def _meeting_path(came_from_forward, came_from_backward, meeting_point):
+        """
+        Assemble le chemin d'une recherche bidirectionnelle au point de rencontre.
+
+        Args:
+            came_from_forward (dict): Parents de la recherche avant (depuis le départ)
+            came_from_backward (dict): Parents de la recherche arrière (depuis l'arrivée)
+            meeting_point (int): Noeud atteint par les deux recherches
+
+        Returns:
+            list: Noeuds du départ à l'arrivée (sommet de rencontre non dupliqué)
+        """
+        # Chemin avant: start -> meeting
+        path_forward = BiDirectionalMaze._safe_reconstruct(came_from_forward, meeting_point, reverse=True)
+        # Chemin arrière: meeting -> goal
+        path_backward = BiDirectionalMaze._safe_reconstruct(came_from_backward, meeting_point)
+        return path_forward + path_backward[1:]
+
+    @staticmethod
+    def _unreachable_result(return_explored, return_sets):
+        """Résultat « pas de chemin » sans recherche (index des composantes)."""
+        if not return_explored:
+            return None
+        if return_sets:
+            return (None, 0, 0.0, 0, set(), set())
+        return (None, 0, 0.0, 0)
+
+    @cached_solver("bidirectional_dijkstra", elapsed_index=2)
+    def dijkstra_bidirectional(self, return_explored=False, return_sets=False, array_state=False,
+                               queue=None, stats=None):
         """
         Algorithme Dijkstra bidirectionnel.
         Recherche depuis le départ ET depuis le but simultanément.
+        La recherche est celle de dijkstra_bidirectional_iter, menée jusqu'au bout.
+        
+        Args:
+            return_explored (bool): Si True, retourne aussi coût, temps et cellules explorées
+            return_sets (bool): Si True (avec return_explored), retourne aussi les ensembles fermés
+            array_state (bool): Si True, l'état des deux recherches est stocké dans des
+                                tableaux NumPy préalloués (voir Maze.get_search_state)
+            queue (str | tuple, optional): Type de file de priorité ("heapq", "packed",
+                                "indexed", "pairing") ou couple d'instances
+                                (file avant, file arrière). Implique array_state=True.
+            stats (SearchStats, optional): Instance remplie avec les compteurs et les
+                                temps de la recherche (voir search_stats.py)
+        
+        Returns:
+            - return_explored=False: path ou None
+            - return_explored=True: (path, cost, elapsed, explored_count)
+            - return_explored=True et return_sets=True:
+                (path, cost, elapsed, explored_count, closed_forward, closed_backward)
+        """
+        return drive(self.dijkstra_bidirectional_iter(None, return_explored, return_sets,
+                                                      array_state, queue, stats)).result
+    
+    def dijkstra_bidirectional_iter(self, batch_size=DEFAULT_BATCH_SIZE, return_explored=False,
+                                    return_sets=False, array_state=False, queue=None, stats=None):
+        """
+        Dijkstra bidirectionnel pas à pas : générateur d'étapes (voir search_steps.py).
+        
+        Chaque étape porte les cellules développées par la recherche avant
+        (expanded) et arrière (expanded_backward) depuis la précédente.
+        
+        Args:
+            batch_size (int, optional): Cellules développées par étape, deux directions
+                                        confondues (None : seule l'étape finale est produite)
+            return_explored, return_sets, array_state, queue, stats: Voir dijkstra_bidirectional
+        
+        Yields:
+            SearchStep: Étapes de la recherche
+        """
+        return self._bidirectional_iter(False, batch_size, return_explored, return_sets,
+                                        array_state, queue, stats)
+    
+    @cached_solver("bidirectional_astar", elapsed_index=2)
+    def astar_bidirectional(self, return_explored=False, return_sets=False, array_state=False,
+                            queue=None, stats=None):
+        """
+        Algorithme A* bidirectionnel.
+        Utilise l'heuristique pour guider les deux recherches.
+        La recherche est celle de astar_bidirectional_iter, menée jusqu'au bout.
+        
+        Args:
+            return_explored (bool): Si True, retourne aussi coût, temps et cellules explorées
+            return_sets (bool): Si True (avec return_explored), retourne aussi les ensembles fermés
+            array_state (bool): Si True, l'état des deux recherches est stocké dans des
+                                tableaux NumPy préalloués (voir Maze.get_search_state)
+            queue (str | tuple, optional): Type de file de priorité ("heapq", "packed",
+                                "indexed", "pairing") ou couple d'instances
+                                (file avant, file arrière). Implique array_state=True.
+            stats (SearchStats, optional): Instance remplie avec les compteurs et les
+                                temps de la recherche (voir search_stats.py)
+        
+        Returns:
+            - return_explored=False: path ou None
+            - return_explored=True: (path, cost, elapsed, explored_count)
+            - return_explored=True et return_sets=True:
+                (path, cost, elapsed, explored_count, closed_forward, closed_backward)
+        """
+        return drive(self.astar_bidirectional_iter(None, return_explored, return_sets,
+                                                   array_state, queue, stats)).result
+    
+    def astar_bidirectional_iter(self, batch_size=DEFAULT_BATCH_SIZE, return_explored=False,
+                                 return_sets=False, array_state=False, queue=None, stats=None):
+        """
+        A* bidirectionnel pas à pas : générateur d'étapes (voir dijkstra_bidirectional_iter).
+        
+        Args:
+            batch_size (int, optional): Cellules développées par étape, deux directions
+                                        confondues (None : seule l'étape finale est produite)
+            return_explored, return_sets, array_state, queue, stats: Voir astar_bidirectional
+        
+        Yields:
+            SearchStep: Étapes de la recherche
+        """
+        return self._bidirectional_iter(True, batch_size, return_explored, return_sets,
+                                        array_state, queue, stats)
+    
+    def _bidirectional_iter(self, use_heuristic, batch_size, return_explored, return_sets,
+                            array_state, queue, stats):
+        """Générateur commun aux deux recherches bidirectionnelles (aiguillage des variantes)."""
+        if stats is not None:
+            stats.reset("bidirectional_astar" if use_heuristic else "bidirectional_dijkstra")
+        if self.is_unreachable():
+            if stats is not None:
+                stats.finish(None)
+            yield SearchStep.final(self._unreachable_result(return_explored, return_sets))
+            return
+        
+        if array_state or queue is not None:
+            yield SearchStep.final(self._bidirectional_array_state(use_heuristic, return_explored,
+                                                                   return_sets, queue, stats))
+            return
         
-                Returns:
-                        - return_explored=False: path ou None
-                        - return_explored=True: (path, cost, elapsed, explored_count)
-                        - return_explored=True et return_sets=True:
-                            (path, cost, elapsed, explored_count, closed_forward, closed_backward)
+        yield from self._bidirectional_steps(use_heuristic, return_explored, return_sets,
+                                             batch_size, stats)
+    
+    def _bidirectional_steps(self, use_heuristic, return_explored, return_sets, batch_size, stats):
+        """
+        Recherche bidirectionnelle sur deux tas heapq et des dictionnaires.
+        
+        Dijkstra (use_heuristic=False) ou A* (use_heuristic=True) : une étape
+        toutes les batch_size cellules développées (aucune si batch_size=None),
+        puis l'étape finale avec le résultat.
         """
         start_time = time.time()
         
+        graph = self.get_graph()
+        indptr, indices, weights = graph.adjacency()
+        start = self.cell_id(*self.start)
+        goal = self.cell_id(*self.goal)
+        width = self.width
+        
         # Files de priorité pour chaque direction
         open_forward = []
         open_backward = []
@@ -97,16 +212,18 @@ class BiDirectionalMaze:
         counter = [0, 0]  # Compteurs pour éviter les ties
         
         # Initialisation avant (départ → but)
-        heapq.heappush(open_forward, (0, counter[0], self.start))
+        h_forward = self.heuristic(self.start[0], self.start[1], self.goal) if use_heuristic else 0
+        heapq.heappush(open_forward, (h_forward, counter[0], start))
         counter[0] += 1
         
         # Initialisation arrière (but → départ)
-        heapq.heappush(open_backward, (0, counter[1], self.goal))
+        h_backward = self.heuristic(self.goal[0], self.goal[1], self.start) if use_heuristic else 0
+        heapq.heappush(open_backward, (h_backward, counter[1], goal))
         counter[1] += 1
         
         # Dictionnaires pour stocker les coûts et chemins
-        g_forward = {self.start: 0}
-        g_backward = {self.goal: 0}
+        g_forward = {start: 0}
+        g_backward = {goal: 0}
         
         came_from_forward = {}
         came_from_backward = {}
@@ -119,7 +236,26 @@ class BiDirectionalMaze:
         meeting_point_forward = None
         meeting_point_backward = None
         
+        track = stats is not None
+        peak_open = 0
+        if track:
+            stats.lap("setup")
+        
+        # Cellules développées depuis la dernière étape (recherche pas à pas)
+        streaming = bool(batch_size)
+        batch_forward = []
+        batch_backward = []
+        
         while open_forward or open_backward:
+            if track and len(open_forward) + len(open_backward) > peak_open:
+                peak_open = len(open_forward) + len(open_backward)
+            
+            if streaming and len(batch_forward) + len(batch_backward) >= batch_size:
+                yield SearchStep(self._cell_list(batch_forward), len(closed_forward) + len(closed_backward),
+                                 len(open_forward) + len(open_backward), self._cell_list(batch_backward))
+                batch_forward = []
+                batch_backward = []
+            
             # Étape avant
             if open_forward:
                 f_cost, _, current_f = heapq.heappop(open_forward)
@@ -128,6 +264,8 @@ class BiDirectionalMaze:
                     continue
                 
                 closed_forward.add(current_f)
+                if streaming:
+                    batch_forward.append(current_f)
                 
                 # Vérifier si on rencontre la recherche arrière
                 if current_f in closed_backward:
@@ -139,13 +277,20 @@ class BiDirectionalMaze:
                         meeting_point_backward = current_f
                 
                 # Explorer les voisins
-                for neighbor in self.get_neighbors(current_f[0], current_f[1]):
-                    new_cost = g_forward[current_f] - self.rewards[neighbor[0], neighbor[1]]
+                for edge in range(indptr[current_f], indptr[current_f + 1]):
+                    neighbor = indices[edge]
+                    if neighbor in closed_forward:
+                        # Parent figé une fois fermé (sinon boucle avec un coût négatif)
+                        continue
+                    new_cost = g_forward[current_f] + weights[edge]
                     
                     if neighbor not in g_forward or new_cost < g_forward[neighbor]:
                         g_forward[neighbor] = new_cost
                         came_from_forward[neighbor] = current_f
-                        heapq.heappush(open_forward, (new_cost, counter[0], neighbor))
+                        f = new_cost
+                        if use_heuristic:
+                            f += self.heuristic(*divmod(neighbor, width), self.goal)
+                        heapq.heappush(open_forward, (f, counter[0], neighbor))
                         counter[0] += 1
                         
                         # Vérifier convergence
@@ -164,6 +309,8 @@ class BiDirectionalMaze:
                     continue
                 
                 closed_backward.add(current_b)
+                if streaming:
+                    batch_backward.append(current_b)
                 
                 # Vérifier si on rencontre la recherche avant
                 if current_b in closed_forward:
@@ -174,13 +321,19 @@ class BiDirectionalMaze:
                         meeting_point_backward = current_b
                 
                 # Explorer les voisins
-                for neighbor in self.get_neighbors(current_b[0], current_b[1]):
-                    new_cost = g_backward[current_b] - self.rewards[neighbor[0], neighbor[1]]
+                for edge in range(indptr[current_b], indptr[current_b + 1]):
+                    neighbor = indices[edge]
+                    if neighbor in closed_backward:
+                        continue
+                    new_cost = g_backward[current_b] + weights[edge]
                     
                     if neighbor not in g_backward or new_cost < g_backward[neighbor]:
                         g_backward[neighbor] = new_cost
                         came_from_backward[neighbor] = current_b
-                        heapq.heappush(open_backward, (new_cost, counter[1], neighbor))
+                        f = new_cost
+                        if use_heuristic:
+                            f += self.heuristic(*divmod(neighbor, width), self.start)
+                        heapq.heappush(open_backward, (f, counter[1], neighbor))
                         counter[1] += 1
                         
                         # Vérifier convergence
@@ -197,181 +350,207 @@ class BiDirectionalMaze:
                     break
         
         elapsed = time.time() - start_time
+        explored = len(closed_forward) + len(closed_backward)
+        frontier = len(open_forward) + len(open_backward)
+        if track:
+            pushes = counter[0] + counter[1]
+            pops = pushes - frontier
+            stats.end_search(explored, pushes, pops - explored, peak_open)
         
         # Reconstruction du chemin
         if meeting_point_forward is None or best_cost == float('inf'):
-            if not return_explored:
-                return None
-            explored = len(closed_forward) + len(closed_backward)
-            if return_sets:
-                return (None, 0, elapsed, explored, closed_forward, closed_backward)
-            return (None, 0, elapsed, explored)
-        
-        # Chemin avant: start -> meeting
-        path_forward = self._safe_reconstruct(came_from_forward, meeting_point_forward, reverse=True)
-
-        # Chemin arrière: meeting -> goal
-        path_backward = self._safe_reconstruct(came_from_backward, meeting_point_backward, reverse=False)
-
-        # Combiner sans dupliquer le sommet de rencontre.
-        path = path_forward + path_backward[1:]
+            if track:
+                stats.finish(None)
+            path = None
+            best_cost = 0
+        else:
+            path = [self.cell_coords(node) for node in
+                    self._meeting_path(came_from_forward, came_from_backward, meeting_point_forward)]
+            if track:
+                stats.finish(path, best_cost)
         
+        result = path
         if return_explored:
-            explored = len(closed_forward) + len(closed_backward)
             if return_sets:
-                return (path, best_cost, elapsed, explored, closed_forward, closed_backward)
-            return (path, best_cost, elapsed, explored)
-        return path
+                result = (path, best_cost, elapsed, explored,
+                          self._explored_cells(closed_forward), self._explored_cells(closed_backward))
+            else:
+                result = (path, best_cost, elapsed, explored)
+        yield self._final_step(batch_forward, explored, frontier, result, batch_backward)
     
-    def astar_bidirectional(self, return_explored=False, return_sets=False):
+    def _bidirectional_array_state(self, use_heuristic, return_explored, return_sets, queue=None,
+                                   stats=None):
         """
-        Algorithme A* bidirectionnel.
-        Utilise l'heuristique pour guider les deux recherches.
+        Recherche bidirectionnelle avec l'état stocké dans des tableaux NumPy.
+        
+        Même algorithme et même ordre d'exploration que dijkstra_bidirectional
+        (use_heuristic=False) et astar_bidirectional (use_heuristic=True).
+        Chaque direction utilise ses propres tampons (emplacements "forward" et
+        "backward"), réutilisés d'une requête à l'autre.
         
-                Returns:
-                        - return_explored=False: path ou None
-                        - return_explored=True: (path, cost, elapsed, explored_count)
-                        - return_explored=True et return_sets=True:
-                            (path, cost, elapsed, explored_count, closed_forward, closed_backward)
+        Returns:
+            Même format que dijkstra_bidirectional / astar_bidirectional
         """
         start_time = time.time()
         
-        # Files de priorité
-        open_forward = []
-        open_backward = []
-        
-        counter = [0, 0]
-        
-        # Initialisation avant
-        h_forward = self.heuristic(self.start[0], self.start[1], self.goal)
-        heapq.heappush(open_forward, (h_forward, counter[0], self.start))
-        counter[0] += 1
+        graph = self.get_graph()
+        indptr, indices, weights = graph.adjacency()
+        start = self.cell_id(*self.start)
+        goal = self.cell_id(*self.goal)
+        width = self.width
         
-        # Initialisation arrière
-        h_backward = self.heuristic(self.goal[0], self.goal[1], self.start)
-        heapq.heappush(open_backward, (h_backward, counter[1], self.goal))
-        counter[1] += 1
+        state_forward = self.get_search_state("forward")
+        state_backward = self.get_search_state("backward")
+        gen_f = state_forward.reset()
+        gen_b = state_backward.reset()
+        g_forward, parent_forward, seen_forward, closed_forward = state_forward.views()
+        g_backward, parent_backward, seen_backward, closed_backward = state_backward.views()
         
-        # Dictionnaires
-        g_forward = {self.start: 0}
-        g_backward = {self.goal: 0}
+        seen_forward[start] = gen_f
+        g_forward[start] = 0.0
+        parent_forward[start] = -1
+        seen_backward[goal] = gen_b
+        g_backward[goal] = 0.0
+        parent_backward[goal] = -1
         
-        came_from_forward = {}
-        came_from_backward = {}
+        queue_forward, queue_backward = queue if isinstance(queue, tuple) else (queue, queue)
+        open_forward = make_queue(queue_forward, graph.num_nodes)
+        open_backward = make_queue(queue_backward, graph.num_nodes)
+        # Compteurs des files avant la requête (des instances fournies les cumulent)
+        queues = {id(open_set): open_set for open_set in (open_forward, open_backward)}.values()
+        pushes = sum(open_set.pushes for open_set in queues)
+        stale_pops = sum(open_set.stale_pops for open_set in queues)
         
-        closed_forward = set()
-        closed_backward = set()
+        h_forward = self.heuristic(self.start[0], self.start[1], self.goal) if use_heuristic else 0
+        open_forward.push(h_forward, start)
+        h_backward = self.heuristic(self.goal[0], self.goal[1], self.start) if use_heuristic else 0
+        open_backward.push(h_backward, goal)
         
-        # Conditions de convergence
         best_cost = float('inf')
-        meeting_point_forward = None
-        meeting_point_backward = None
+        meeting_point = None
+        
+        track = stats is not None
+        peak_open = 0
+        if track:
+            stats.lap("setup")
         
         while open_forward or open_backward:
+            if track and len(open_forward) + len(open_backward) > peak_open:
+                peak_open = len(open_forward) + len(open_backward)
+            
             # Étape avant
             if open_forward:
-                f_cost, _, current_f = heapq.heappop(open_forward)
+                _, current_f = open_forward.pop()
                 
-                if current_f in closed_forward:
+                if closed_forward[current_f] == gen_f:
+                    open_forward.record_stale()
                     continue
+                closed_forward[current_f] = gen_f
+                current_g = g_forward[current_f]
                 
-                closed_forward.add(current_f)
-                
-                # Vérifier rencontre
-                if current_f in closed_backward:
-                    cost = g_forward[current_f] + g_backward[current_f]
+                if closed_backward[current_f] == gen_b:
+                    cost = current_g + g_backward[current_f]
                     if cost < best_cost:
                         best_cost = cost
-                        meeting_point_forward = current_f
-                        meeting_point_backward = current_f
+                        meeting_point = current_f
                 
-                # Explorer voisins
-                for neighbor in self.get_neighbors(current_f[0], current_f[1]):
-                    new_cost = g_forward[current_f] - self.rewards[neighbor[0], neighbor[1]]
+                for edge in range(indptr[current_f], indptr[current_f + 1]):
+                    neighbor = indices[edge]
+                    if closed_forward[neighbor] == gen_f:
+                        # Parent figé une fois fermé (sinon boucle avec un coût négatif)
+                        continue
+                    new_cost = current_g + weights[edge]
                     
-                    if neighbor not in g_forward or new_cost < g_forward[neighbor]:
+                    if seen_forward[neighbor] != gen_f or new_cost < g_forward[neighbor]:
+                        seen_forward[neighbor] = gen_f
                         g_forward[neighbor] = new_cost
-                        came_from_forward[neighbor] = current_f
-                        h = self.heuristic(neighbor[0], neighbor[1], self.goal)
-                        f = new_cost + h
-                        heapq.heappush(open_forward, (f, counter[0], neighbor))
-                        counter[0] += 1
+                        parent_forward[neighbor] = current_f
+                        f = new_cost
+                        if use_heuristic:
+                            f += self.heuristic(*divmod(neighbor, width), self.goal)
+                        open_forward.push(f, neighbor)
                         
-                        # Vérifier convergence
-                        if neighbor in closed_backward:
+                        if closed_backward[neighbor] == gen_b:
                             cost = new_cost + g_backward[neighbor]
                             if cost < best_cost:
                                 best_cost = cost
-                                meeting_point_forward = neighbor
-                                meeting_point_backward = neighbor
+                                meeting_point = neighbor
             
             # Étape arrière
             if open_backward:
-                f_cost, _, current_b = heapq.heappop(open_backward)
+                _, current_b = open_backward.pop()
                 
-                if current_b in closed_backward:
+                if closed_backward[current_b] == gen_b:
+                    open_backward.record_stale()
                     continue
+                closed_backward[current_b] = gen_b
+                current_g = g_backward[current_b]
                 
-                closed_backward.add(current_b)
-                
-                # Vérifier rencontre
-                if current_b in closed_forward:
-                    cost = g_forward[current_b] + g_backward[current_b]
+                if closed_forward[current_b] == gen_f:
+                    cost = g_forward[current_b] + current_g
                     if cost < best_cost:
                         best_cost = cost
-                        meeting_point_forward = current_b
-                        meeting_point_backward = current_b
+                        meeting_point = current_b
                 
-                # Explorer voisins
-                for neighbor in self.get_neighbors(current_b[0], current_b[1]):
-                    new_cost = g_backward[current_b] - self.rewards[neighbor[0], neighbor[1]]
+                for edge in range(indptr[current_b], indptr[current_b + 1]):
+                    neighbor = indices[edge]
+                    if closed_backward[neighbor] == gen_b:
+                        continue
+                    new_cost = current_g + weights[edge]
                     
-                    if neighbor not in g_backward or new_cost < g_backward[neighbor]:
+                    if seen_backward[neighbor] != gen_b or new_cost < g_backward[neighbor]:
+                        seen_backward[neighbor] = gen_b
                         g_backward[neighbor] = new_cost
-                        came_from_backward[neighbor] = current_b
-                        h = self.heuristic(neighbor[0], neighbor[1], self.start)
-                        f = new_cost + h
-                        heapq.heappush(open_backward, (f, counter[1], neighbor))
-                        counter[1] += 1
+                        parent_backward[neighbor] = current_b
+                        f = new_cost
+                        if use_heuristic:
+                            f += self.heuristic(*divmod(neighbor, width), self.start)
+                        open_backward.push(f, neighbor)
                         
-                        # Vérifier convergence
-                        if neighbor in closed_forward:
+                        if closed_forward[neighbor] == gen_f:
                             cost = g_forward[neighbor] + new_cost
                             if cost < best_cost:
                                 best_cost = cost
-                                meeting_point_forward = neighbor
-                                meeting_point_backward = neighbor
+                                meeting_point = neighbor
             
             # Critère d'arrêt
             if open_forward and open_backward:
-                min_f_forward = open_forward[0][0]
-                min_f_backward = open_backward[0][0]
-                if min_f_forward + min_f_backward >= best_cost:
+                if open_forward.peek_priority() + open_backward.peek_priority() >= best_cost:
                     break
         
         elapsed = time.time() - start_time
+        if track:
+            stats.end_search(state_forward.num_closed() + state_backward.num_closed(),
+                             sum(open_set.pushes for open_set in queues) - pushes,
+                             sum(open_set.stale_pops for open_set in queues) - stale_pops, peak_open)
         
-        # Reconstruction du chemin
-        if meeting_point_forward is None or best_cost == float('inf'):
+        explored = 0
+        if return_explored:
+            explored = state_forward.num_closed() + state_backward.num_closed()
+        
+        if meeting_point is None or best_cost == float('inf'):
+            if track:
+                stats.finish(None)
             if not return_explored:
                 return None
-            explored = len(closed_forward) + len(closed_backward)
             if return_sets:
-                return (None, 0, elapsed, explored, closed_forward, closed_backward)
+                return (None, 0, elapsed, explored,
+                        self._explored_cells(state_forward.closed_nodes().tolist()),
+                        self._explored_cells(state_backward.closed_nodes().tolist()))
             return (None, 0, elapsed, explored)
         
-        # Chemin avant: start -> meeting
-        path_forward = self._safe_reconstruct(came_from_forward, meeting_point_forward, reverse=True)
-
-        # Chemin arrière: meeting -> goal
-        path_backward = self._safe_reconstruct(came_from_backward, meeting_point_backward, reverse=False)
-
-        # Combiner sans dupliquer le sommet de rencontre.
-        path = path_forward + path_backward[1:]
+        # start -> meeting (parents avant), puis meeting -> goal (parents arrière)
+        path_forward = state_forward.path_to(meeting_point)
+        path_backward = state_backward.path_to(meeting_point)
+        path_backward.reverse()
+        path = [self.cell_coords(node) for node in path_forward + path_backward[1:]]
+        if track:
+            stats.finish(path, best_cost)
         
         if return_explored:
-            explored = len(closed_forward) + len(closed_backward)
             if return_sets:
-                return (path, best_cost, elapsed, explored, closed_forward, closed_backward)
+                return (path, best_cost, elapsed, explored,
+                        self._explored_cells(state_forward.closed_nodes().tolist()),
+                        self._explored_cells(state_backward.closed_nodes().tolist()))
             return (path, best_cost, elapsed, explored)
         return path
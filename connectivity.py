@@ -0,0 +1,317 @@
+"""
+Index des composantes connexes pour rejeter instantanément les requêtes sans chemin.
+
+Quand le départ et l'arrivée sont séparés par un mur, A*, Dijkstra et les
+recherches bidirectionnelles explorent toute la région accessible avant de
+conclure qu'il n'y a pas de chemin : c'est le pire cas de latence. L'index
+attribue une étiquette de composante à chaque cellule franchissable ; deux
+cellules d'étiquettes différentes ne sont pas reliées, ce qui se vérifie en O(1).
+
+- Construction : étiquetage vectorisé par union-find (accrochage des racines
+  sur la plus petite voisine puis compression de chemins, répétés jusqu'à
+  stabilité).
+- Obstacle retiré : la cellule fusionne les composantes de ses voisines
+  (union-find sur les étiquettes, sans réétiqueter les cellules).
+- Obstacle ajouté : la composante peut se couper en morceaux. Des parcours en
+  largeur partent en parallèle des voisines de la cellule ; deux parcours qui se
+  croisent sont fusionnés. Dès qu'il ne reste qu'un groupe actif, c'est la plus
+  grande partie : elle garde son étiquette, et seuls les morceaux épuisés (les
+  plus petits) sont réétiquetés. Si les parcours dépassent un budget de
+  cellules (coupure en deux grands morceaux), l'étiquetage vectorisé complet
+  est relancé : il est alors plus rapide.
+
+L'index suit le journal des modifications du labyrinthe (Maze.changes_since) ;
+une nouvelle grille ou un mark_modified provoquent une reconstruction.
+"""
+
+from collections import deque
+
+import numpy as np
+
+
+# Étiquette des obstacles
+NO_COMPONENT = -1
+
+# Au-delà de cette fraction de cellules modifiées (ou visitées pour détecter une
+# coupure), l'index est reconstruit
+REBUILD_FRACTION = 1 / 64
+
+# Nombre minimal de cellules visitées avant d'abandonner la détection locale
+MIN_SEARCH_BUDGET = 1024
+
+
+class ComponentIndex:
+    """
+    Étiquettes de composantes connexes des cellules franchissables d'un labyrinthe.
+    """
+
+    def __init__(self):
+        """Initialise un index vide (construit au premier appel)."""
+        self.labels = None
+        self._version = None
+        self.rebuilds = 0
+        self.merges = 0
+        self.splits = 0
+        self.relabeled = 0
+
+    def __getstate__(self):
+        # Les étiquettes ne sont pas sérialisées (processus de travail de
+        # solve_many) : l'index est reconstruit à la première requête
+        state = self.__dict__.copy()
+        state.update(labels=None, _version=None)
+        return state
+
+    def stats(self):
+        """
+        Retourne les compteurs de l'index.
+
+        Returns:
+            dict: rebuilds, merges (obstacles retirés), splits (coupures détectées),
+                  relabeled (cellules réétiquetées), components
+        """
+        return {
+            "rebuilds": self.rebuilds,
+            "merges": self.merges,
+            "splits": self.splits,
+            "relabeled": self.relabeled,
+            "components": self.count() if self.labels is not None else 0,
+        }
+
+    def count(self):
+        """Nombre de composantes connexes."""
+        labels = np.asarray(self.labels)
+        roots = {self._find(label) for label in np.unique(labels[labels != NO_COMPONENT]).tolist()}
+        return len(roots)
+
+    def component(self, maze, row, col):
+        """
+        Retourne l'identifiant de la composante d'une cellule.
+
+        Args:
+            maze (Maze): Labyrinthe
+            row (int): Ligne de la cellule
+            col (int): Colonne de la cellule
+
+        Returns:
+            int ou None: Identifiant de composante, None pour un obstacle
+        """
+        self.sync(maze)
+        label = self.labels[row * self._width + col]
+        return None if label == NO_COMPONENT else self._find(label)
+
+    def connected(self, maze, start, goal):
+        """
+        Indique si un chemin peut exister entre deux cellules.
+
+        Un départ placé sur un obstacle peut encore en sortir vers une voisine
+        libre (comme dans les solveurs) : il est relié à leurs composantes.
+
+        Args:
+            maze (Maze): Labyrinthe
+            start (tuple): Cellule de départ (row, col)
+            goal (tuple): Cellule d'arrivée (row, col)
+
+        Returns:
+            bool: False si aucun chemin n'est possible
+        """
+        self.sync(maze)
+        width = self._width
+        start_id = start[0] * width + start[1]
+        goal_id = goal[0] * width + goal[1]
+        if start_id == goal_id:
+            return True
+        labels = self.labels
+        if labels[goal_id] == NO_COMPONENT:
+            return False
+        target = self._find(labels[goal_id])
+        if labels[start_id] != NO_COMPONENT:
+            return self._find(labels[start_id]) == target
+        return any(self._find(labels[neighbor]) == target
+                   for neighbor in self._neighbors(start_id) if labels[neighbor] != NO_COMPONENT)
+
+    def _find(self, label):
+        """Racine d'une étiquette (union-find avec compression de chemin)."""
+        merged = self._merged
+        root = label
+        while root in merged:
+            root = merged[root]
+        while label != root:
+            parent = merged[label]
+            merged[label] = root
+            label = parent
+        return root
+
+    def sync(self, maze):
+        """Met l'index à jour avec les modifications du labyrinthe depuis le dernier appel."""
+        if self._version == maze.version:
+            return
+        changes = None
+        if self.labels is not None and (maze.height, maze.width) == (self._height, self._width):
+            changes = maze.changes_since(self._version)
+        if changes is None or len(changes) > REBUILD_FRACTION * maze.width * maze.height:
+            self.build(maze)
+            return
+        grid = maze.grid
+        budget = max(MIN_SEARCH_BUDGET, int(REBUILD_FRACTION * maze.width * maze.height))
+        for row, col in dict.fromkeys(changes):
+            node = row * self._width + col
+            is_free = grid[row, col] == 0
+            if is_free and self.labels[node] == NO_COMPONENT:
+                self._add_cell(node)
+            elif not is_free and self.labels[node] != NO_COMPONENT:
+                if not self._remove_cell(node, budget):
+                    # Coupure en grands morceaux : l'étiquetage vectorisé est plus rapide
+                    self.build(maze)
+                    return
+        self._version = maze.version
+
+    def build(self, maze):
+        """
+        Étiquette toutes les cellules franchissables (union-find vectorisé).
+
+        Args:
+            maze (Maze): Labyrinthe
+        """
+        passable = np.asarray(maze.grid) == 0
+        height, width = passable.shape
+        nodes = np.arange(height * width, dtype=np.int64).reshape(height, width)
+        parent = nodes.reshape(-1).copy()
+
+        # Une seule direction par paire opposée : le voisinage est symétrique
+        first, second = [], []
+        for d_row, d_col, _ in maze.graph_directions():
+            if (d_row, d_col) <= (0, 0):
+                continue
+            src_rows = slice(0, height - d_row)
+            src_cols = slice(max(0, -d_col), width - max(0, d_col))
+            dst_rows = slice(d_row, height)
+            dst_cols = slice(max(0, d_col), width - max(0, -d_col))
+            both = passable[src_rows, src_cols] & passable[dst_rows, dst_cols]
+            first.append(nodes[src_rows, src_cols][both])
+            second.append(nodes[dst_rows, dst_cols][both])
+        first = np.concatenate(first) if first else np.zeros(0, dtype=np.int64)
+        second = np.concatenate(second) if second else np.zeros(0, dtype=np.int64)
+
+        while True:
+            root_first = parent[first]
+            root_second = parent[second]
+            differ = root_first != root_second
+            if not differ.any():
+                break
+            # Accrochage : la plus grande racine pointe vers la plus petite
+            np.minimum.at(parent, np.maximum(root_first, root_second)[differ],
+                          np.minimum(root_first, root_second)[differ])
+            # Compression : chaque cellule pointe directement vers sa racine
+            while True:
+                grand_parent = parent[parent]
+                if np.array_equal(grand_parent, parent):
+                    break
+                parent = grand_parent
+            first = first[differ]
+            second = second[differ]
+
+        parent[~passable.reshape(-1)] = NO_COMPONENT
+        self.labels = memoryview(parent)
+        self._height, self._width = height, width
+        self._offsets = [(d_row, d_col) for d_row, d_col, _ in maze.graph_directions()]
+        self._merged = {}
+        self._next_label = height * width
+        self._version = maze.version
+        self.rebuilds += 1
+
+    def _neighbors(self, node):
+        """Voisines (identifiants plats) dans la grille, franchissables ou non."""
+        row, col = divmod(node, self._width)
+        for d_row, d_col in self._offsets:
+            new_row = row + d_row
+            new_col = col + d_col
+            if 0 <= new_row < self._height and 0 <= new_col < self._width:
+                yield new_row * self._width + new_col
+
+    def _add_cell(self, node):
+        """Cellule libérée : elle rejoint ses voisines et fusionne leurs composantes."""
+        labels = self.labels
+        roots = {self._find(labels[neighbor]) for neighbor in self._neighbors(node)
+                 if labels[neighbor] != NO_COMPONENT}
+        if not roots:
+            labels[node] = self._new_label()
+            return
+        root = min(roots)
+        for other in roots:
+            if other != root:
+                self._merged[other] = root
+        labels[node] = root
+        self.merges += 1
+
+    def _new_label(self):
+        label = self._next_label
+        self._next_label += 1
+        return label
+
+    def _remove_cell(self, node, budget):
+        """
+        Cellule bloquée : parcours en parallèle depuis ses voisines pour détecter une coupure.
+
+        Args:
+            node (int): Cellule devenue obstacle
+            budget (int): Nombre maximal de cellules visitées
+
+        Returns:
+            bool: False si le budget est dépassé (l'index doit être reconstruit)
+        """
+        labels = self.labels
+        labels[node] = NO_COMPONENT
+        starts = [neighbor for neighbor in self._neighbors(node) if labels[neighbor] != NO_COMPONENT]
+        if len(starts) <= 1:
+            return True
+
+        # Chaque parcours a sa file ; group[k] relie les parcours qui se sont croisés
+        owner = {neighbor: k for k, neighbor in enumerate(starts)}
+        queues = [deque([neighbor]) for neighbor in starts]
+        group = list(range(len(starts)))
+
+        def find_group(k):
+            while group[k] != k:
+                group[k] = group[group[k]]
+                k = group[k]
+            return k
+
+        active = set(range(len(starts)))
+        while len(active) > 1:
+            emptied = False
+            for k in range(len(starts)):
+                queue = queues[k]
+                if not queue:
+                    continue
+                current = queue.popleft()
+                emptied = emptied or not queue
+                for neighbor in self._neighbors(current):
+                    if labels[neighbor] == NO_COMPONENT:
+                        continue
+                    other = owner.get(neighbor)
+                    if other is None:
+                        owner[neighbor] = k
+                        queue.append(neighbor)
+                        continue
+                    mine, theirs = find_group(k), find_group(other)
+                    if mine != theirs:
+                        group[max(mine, theirs)] = min(mine, theirs)
+                        active.discard(max(mine, theirs))
+            if len(owner) > budget:
+                return False
+            if not emptied:
+                continue
+
+            # Groupes dont tous les parcours sont épuisés : morceaux séparés
+            for root in list(active):
+                if len(active) == 1:
+                    break
+                if all(not queues[k] for k in range(len(starts)) if find_group(k) == root):
+                    active.discard(root)
+                    label = self._new_label()
+                    piece = [cell for cell, k in owner.items() if find_group(k) == root]
+                    for cell in piece:
+                        labels[cell] = label
+                    self.splits += 1
+                    self.relabeled += len(piece)
+        return True
@@ -0,0 +1,502 @@
+"""
+Hiérarchies de contraction (Geisberger et al., 2008) pour les cartes statiques.
+
+Quand une carte ne change pas pendant des jours mais reçoit un très grand nombre
+de requêtes, on peut payer un prétraitement long pour des requêtes quasi
+instantanées :
+
+- Ordre des noeuds : les cellules sont contractées une à une, de la moins
+  importante à la plus importante. L'importance d'une cellule combine la
+  différence d'arêtes (raccourcis ajoutés - arêtes supprimées), le nombre de
+  voisins déjà contractés et le niveau atteint dans la hiérarchie ; elle est
+  recalculée paresseusement au moment de contracter.
+- Raccourcis : contracter v retire v du graphe. Pour chaque couple u -> v -> x,
+  une recherche de témoin (Dijkstra limité depuis u, sans passer par v) vérifie
+  s'il existe un autre chemin au plus aussi court ; sinon le raccourci u -> x
+  (milieu v) est ajouté.
+- Requête : recherche bidirectionnelle montante (le départ ne suit que des
+  arêtes vers des noeuds de rang supérieur, l'arrivée remonte les arêtes
+  entrantes des noeuds de rang supérieur). Les deux recherches se rencontrent au
+  sommet du chemin ; le chemin est assemblé comme dans BiDirectionalMaze, puis
+  chaque raccourci est déplié récursivement en cellules.
+
+La hiérarchie peut être enregistrée (save) et rechargée (load) : une empreinte
+de la grille et des récompenses garantit qu'elle correspond au labyrinthe.
+
+Comme D* Lite et HPA*, les coûts doivent être positifs ou nuls (pas de cellules
+bonus) ; le coût d'entrée dans l'arrivée du labyrinthe est remplacé par le plus
+petit coût de la grille. Toute modification de la grille rend la hiérarchie
+périmée : il faut la reconstruire.
+"""
+
+import hashlib
+import heapq
+import time
+
+import numpy as np
+
+from bidirectional import BiDirectionalMaze
+
+
+INF = float("inf")
+
+# Nombre maximal de noeuds fixés par une recherche de témoin : au-delà, le
+# raccourci est ajouté (un raccourci inutile ne fausse pas les requêtes)
+WITNESS_SETTLE_LIMIT = 64
+
+# Marque des arêtes originales dans le tableau des milieux
+NO_MIDDLE = -1
+
+
+class ContractionHierarchy:
+    """
+    Hiérarchie de contraction d'un labyrinthe statique.
+    """
+
+    def __init__(self, width, height, rank, upward, downward, shortcuts, fingerprint=None):
+        """
+        Initialise une hiérarchie déjà construite (voir build et load).
+
+        Args:
+            width (int): Largeur du labyrinthe
+            height (int): Hauteur du labyrinthe
+            rank (np.ndarray): Rang de contraction de chaque cellule
+            upward (tuple): Arêtes montantes u -> x en CSR (indptr, indices, weights)
+            downward (tuple): Arêtes entrantes u -> x depuis les rangs supérieurs,
+                              rangées par x en CSR (indptr, indices, weights)
+            shortcuts (tuple): (clés u * N + x triées, milieux) des raccourcis
+            fingerprint (str, optional): Empreinte de la grille et des récompenses
+        """
+        self.width = width
+        self.height = height
+        self.rank = rank
+        self.upward = upward
+        self.downward = downward
+        self.shortcut_keys, self.shortcut_middles = shortcuts
+        self.fingerprint = fingerprint
+        self.maze = None
+        self._version = None
+        self.build_time = 0.0
+        self.settled = 0
+
+        # Listes Python pour des requêtes rapides
+        self._up = tuple(array.tolist() for array in upward)
+        self._down = tuple(array.tolist() for array in downward)
+        self._middles = dict(zip(self.shortcut_keys.tolist(), self.shortcut_middles.tolist()))
+
+    @classmethod
+    def build(cls, maze, witness_limit=WITNESS_SETTLE_LIMIT):
+        """
+        Construit la hiérarchie à partir du graphe compilé du labyrinthe.
+
+        Args:
+            maze (Maze): Labyrinthe (Maze ou DiagonalMaze)
+            witness_limit (int): Noeuds fixés au plus par une recherche de témoin
+
+        Returns:
+            ContractionHierarchy: Hiérarchie liée au labyrinthe
+
+        Raises:
+            ValueError: Si une cellule franchissable (hors arrivée) a un coût négatif
+        """
+        start_time = time.time()
+        graph = maze.get_graph()
+        num_nodes = graph.num_nodes
+        goal = maze.cell_id(*maze.goal)
+
+        step_cost = -np.asarray(maze.rewards, dtype=np.float64).reshape(-1)
+        others = (maze.grid == 0).reshape(-1)
+        others[goal] = False
+        costs = step_cost[others]
+        if costs.size and costs.min() < 0:
+            raise ValueError("Les hiérarchies de contraction exigent des coûts de déplacement "
+                             "positifs ou nuls (cellules bonus non supportées)")
+        min_cost = float(costs.min()) if costs.size else 1.0
+
+        # Coût d'entrée dans l'arrivée : le plus petit coût, comme D* Lite et HPA*
+        multipliers = np.array([mult for _, _, mult in maze.graph_directions()], dtype=np.float64)
+        weights = graph.weights.copy()
+        into_goal = graph.indices == goal
+        weights[into_goal] = min_cost * multipliers[graph.edge_directions[into_goal]]
+        contractor = _Contractor(num_nodes, graph.indptr.tolist(), graph.indices.tolist(),
+                                 weights.tolist(), witness_limit)
+        rank, upward, downward, shortcuts = contractor.run()
+
+        hierarchy = cls(maze.width, maze.height, rank, upward, downward, shortcuts,
+                        fingerprint=maze_fingerprint(maze))
+        hierarchy.maze = maze
+        hierarchy._version = maze.version
+        hierarchy.build_time = time.time() - start_time
+        return hierarchy
+
+    def save(self, path):
+        """
+        Enregistre la hiérarchie dans un fichier .npz.
+
+        Args:
+            path (str): Chemin du fichier
+        """
+        np.savez(path, shape=np.array([self.height, self.width]), rank=self.rank,
+                 up_indptr=self.upward[0], up_indices=self.upward[1], up_weights=self.upward[2],
+                 down_indptr=self.downward[0], down_indices=self.downward[1],
+                 down_weights=self.downward[2], shortcut_keys=self.shortcut_keys,
+                 shortcut_middles=self.shortcut_middles,
+                 fingerprint=np.array(self.fingerprint or ""))
+
+    @classmethod
+    def load(cls, path, maze=None):
+        """
+        Recharge une hiérarchie enregistrée par save.
+
+        Args:
+            path (str): Chemin du fichier
+            maze (Maze, optional): Labyrinthe auquel lier la hiérarchie
+
+        Returns:
+            ContractionHierarchy: Hiérarchie chargée
+
+        Raises:
+            ValueError: Si la hiérarchie ne correspond pas au labyrinthe
+        """
+        with np.load(path) as data:
+            height, width = (int(value) for value in data["shape"])
+            hierarchy = cls(width, height, data["rank"],
+                            (data["up_indptr"], data["up_indices"], data["up_weights"]),
+                            (data["down_indptr"], data["down_indices"], data["down_weights"]),
+                            (data["shortcut_keys"], data["shortcut_middles"]),
+                            fingerprint=str(data["fingerprint"]) or None)
+        if maze is not None:
+            if (maze.width, maze.height) != (width, height) or maze_fingerprint(maze) != hierarchy.fingerprint:
+                raise ValueError("La hiérarchie enregistrée ne correspond pas à ce labyrinthe")
+            hierarchy.maze = maze
+            hierarchy._version = maze.version
+        return hierarchy
+
+    def _check_maze(self):
+        if self.maze is not None and self.maze.version != self._version:
+            raise ValueError("Le labyrinthe a été modifié : la hiérarchie doit être reconstruite")
+
+    def _query(self, start, goal):
+        """
+        Recherche bidirectionnelle montante entre deux identifiants plats.
+
+        Returns:
+            tuple: (coût, noeuds du chemin dans la hiérarchie) ou (inf, None)
+        """
+        if start == goal:
+            self.settled = 0
+            return 0.0, [start]
+        up_indptr, up_indices, up_weights = self._up
+        down_indptr, down_indices, down_weights = self._down
+
+        g_forward = {start: 0.0}
+        g_backward = {goal: 0.0}
+        came_from_forward = {}
+        came_from_backward = {}
+        closed_forward = set()
+        closed_backward = set()
+        open_forward = [(0.0, start)]
+        open_backward = [(0.0, goal)]
+
+        best_cost = INF
+        meeting_point = None
+        while open_forward or open_backward:
+            # Étape avant : arêtes vers les rangs supérieurs
+            if open_forward:
+                cost, current = heapq.heappop(open_forward)
+                if cost >= best_cost:
+                    # Aucun sommet plus haut ne peut améliorer le chemin
+                    open_forward = []
+                elif current not in closed_forward:
+                    closed_forward.add(current)
+                    if current in g_backward and cost + g_backward[current] < best_cost:
+                        best_cost = cost + g_backward[current]
+                        meeting_point = current
+                    for edge in range(up_indptr[current], up_indptr[current + 1]):
+                        neighbor = up_indices[edge]
+                        new_cost = cost + up_weights[edge]
+                        if new_cost < g_forward.get(neighbor, INF):
+                            g_forward[neighbor] = new_cost
+                            came_from_forward[neighbor] = current
+                            heapq.heappush(open_forward, (new_cost, neighbor))
+
+            # Étape arrière : arêtes entrantes depuis les rangs supérieurs
+            if open_backward:
+                cost, current = heapq.heappop(open_backward)
+                if cost >= best_cost:
+                    open_backward = []
+                elif current not in closed_backward:
+                    closed_backward.add(current)
+                    if current in g_forward and g_forward[current] + cost < best_cost:
+                        best_cost = g_forward[current] + cost
+                        meeting_point = current
+                    for edge in range(down_indptr[current], down_indptr[current + 1]):
+                        neighbor = down_indices[edge]
+                        new_cost = cost + down_weights[edge]
+                        if new_cost < g_backward.get(neighbor, INF):
+                            g_backward[neighbor] = new_cost
+                            came_from_backward[neighbor] = current
+                            heapq.heappush(open_backward, (new_cost, neighbor))
+
+        self.settled = len(closed_forward) + len(closed_backward)
+        if meeting_point is None:
+            return INF, None
+        return best_cost, BiDirectionalMaze._meeting_path(came_from_forward, came_from_backward,
+                                                          meeting_point)
+
+    def _unpack(self, nodes):
+        """Remplace récursivement chaque raccourci par ses deux demi-arêtes."""
+        num_nodes = self.width * self.height
+        middles = self._middles
+        path = [nodes[0]]
+        for first, second in zip(nodes, nodes[1:]):
+            stack = [(first, second)]
+            while stack:
+                head, tail = stack.pop()
+                middle = middles.get(head * num_nodes + tail, NO_MIDDLE)
+                if middle == NO_MIDDLE:
+                    path.append(tail)
+                else:
+                    # Dernier empilé, premier déplié : (head, middle) d'abord
+                    stack.append((middle, tail))
+                    stack.append((head, middle))
+        return path
+
+    def distance(self, start=None, goal=None):
+        """
+        Coût du chemin optimal, sans dépliage des raccourcis.
+
+        Args:
+            start (tuple, optional): Cellule de départ (par défaut maze.start)
+            goal (tuple, optional): Cellule d'arrivée (par défaut maze.goal)
+
+        Returns:
+            float: Coût du chemin (inf s'il n'existe pas)
+
+        Raises:
+            ValueError: Si le labyrinthe lié a été modifié depuis la construction
+        """
+        start, goal = self._endpoints(start, goal)
+        return self._query(start, goal)[0]
+
+    def solve(self, start=None, goal=None, stats=None):
+        """
+        Calcule le chemin optimal entre deux cellules.
+
+        Args:
+            start (tuple, optional): Cellule de départ (par défaut maze.start)
+            goal (tuple, optional): Cellule d'arrivée (par défaut maze.goal)
+            stats (SearchStats, optional): Instance remplie avec les noeuds fixés
+                (expansions) et les temps ; la reconstruction comprend le dépliage
+                des raccourcis. Les compteurs de la file ne sont pas mesurés (None).
+
+        Returns:
+            list ou None: Chemin optimal (liste de cellules), None s'il n'existe pas
+
+        Raises:
+            ValueError: Si le labyrinthe lié a été modifié depuis la construction
+        """
+        if stats is not None:
+            stats.reset("contraction_hierarchy")
+        start, goal = self._endpoints(start, goal)
+        if stats is not None:
+            stats.lap("setup")
+        cost, nodes = self._query(start, goal)
+        if stats is not None:
+            stats.end_search(self.settled, None, None, None)
+        path = None
+        if nodes is not None:
+            path = [divmod(node, self.width) for node in self._unpack(nodes)]
+        if stats is not None:
+            stats.finish(path, cost)
+        return path
+
+    def _endpoints(self, start, goal):
+        """Identifiants plats du départ et de l'arrivée (par défaut ceux du labyrinthe)."""
+        self._check_maze()
+        if start is None:
+            start = self.maze.start
+        if goal is None:
+            goal = self.maze.goal
+        return start[0] * self.width + start[1], goal[0] * self.width + goal[1]
+
+    def stats(self):
+        """
+        Retourne les caractéristiques de la hiérarchie.
+
+        Returns:
+            dict: nodes, edges (arêtes montantes et descendantes), shortcuts,
+                  build_time (s), settled (noeuds fixés par la dernière requête)
+        """
+        return {
+            "nodes": self.width * self.height,
+            "edges": len(self._up[1]) + len(self._down[1]),
+            "shortcuts": len(self._middles),
+            "build_time": self.build_time,
+            "settled": self.settled,
+        }
+
+
+class _Contractor:
+    """État de la contraction : graphe restant, priorités et arêtes de la hiérarchie."""
+
+    def __init__(self, num_nodes, indptr, indices, weights, witness_limit):
+        self.num_nodes = num_nodes
+        self.witness_limit = witness_limit
+        self.out = [dict() for _ in range(num_nodes)]
+        self.incoming = [dict() for _ in range(num_nodes)]
+        for node in range(num_nodes):
+            for edge in range(indptr[node], indptr[node + 1]):
+                neighbor = indices[edge]
+                self.out[node][neighbor] = weights[edge]
+                self.incoming[neighbor][node] = weights[edge]
+        self.middles = {}
+        self.deleted_neighbors = [0] * num_nodes
+        self.levels = [0] * num_nodes
+
+    def _witness_costs(self, source, skipped, required, settle_limit):
+        """
+        Dijkstra limité depuis source dans le graphe restant, sans passer par skipped.
+
+        La recherche s'arrête dès que chaque cible de required est atteinte avec un
+        coût au plus égal au coût demandé, ou après settle_limit noeuds fixés.
+        """
+        out = self.out
+        costs = {source: 0.0}
+        open_set = [(0.0, source)]
+        limit = max(required.values())
+        pending = len(required)
+        settled = 0
+        while open_set and settled < settle_limit:
+            cost, node = heapq.heappop(open_set)
+            if cost > costs[node]:
+                continue
+            if cost > limit:
+                break
+            settled += 1
+            for neighbor, weight in out[node].items():
+                if neighbor == skipped:
+                    continue
+                new_cost = cost + weight
+                old_cost = costs.get(neighbor, INF)
+                if new_cost < old_cost:
+                    costs[neighbor] = new_cost
+                    heapq.heappush(open_set, (new_cost, neighbor))
+                    if neighbor in required and new_cost <= required[neighbor] < old_cost:
+                        pending -= 1
+                        if not pending:
+                            return costs
+        return costs
+
+    def _shortcuts(self, node, settle_limit):
+        """Raccourcis (u, x, coût) nécessaires si node est contracté."""
+        outgoing = self.out[node]
+        shortcuts = []
+        if not outgoing:
+            return shortcuts
+        for source, in_weight in self.incoming[node].items():
+            required = {target: in_weight + out_weight
+                        for target, out_weight in outgoing.items() if target != source}
+            if not required:
+                continue
+            witness = self._witness_costs(source, node, required, settle_limit)
+            for target, cost in required.items():
+                if witness.get(target, INF) > cost:
+                    shortcuts.append((source, target, cost))
+        return shortcuts
+
+    def _priority(self, node):
+        """Différence d'arêtes (doublée), voisins déjà contractés et niveau dans la hiérarchie."""
+        removed = len(self.out[node]) + len(self.incoming[node])
+        # Simulation avec une recherche de témoin plus courte que la contraction
+        shortcuts = self._shortcuts(node, max(1, self.witness_limit // 4))
+        return 2 * (len(shortcuts) - removed) + self.deleted_neighbors[node] + self.levels[node]
+
+    def run(self):
+        """
+        Contracte tous les noeuds.
+
+        Returns:
+            tuple: (rank, upward CSR, downward CSR, (clés, milieux) des raccourcis)
+        """
+        num_nodes = self.num_nodes
+        out = self.out
+        incoming = self.incoming
+        rank = np.full(num_nodes, -1, dtype=np.int64)
+        up_edges = [None] * num_nodes
+        down_edges = [None] * num_nodes
+
+        queue = [(self._priority(node), node) for node in range(num_nodes)]
+        heapq.heapify(queue)
+        current_rank = 0
+        while queue:
+            priority, node = heapq.heappop(queue)
+            if rank[node] >= 0:
+                continue
+            # Mise à jour paresseuse : la priorité a pu augmenter depuis l'insertion
+            new_priority = self._priority(node)
+            if queue and new_priority > queue[0][0]:
+                heapq.heappush(queue, (new_priority, node))
+                continue
+
+            shortcuts = self._shortcuts(node, self.witness_limit)
+            rank[node] = current_rank
+            current_rank += 1
+            # Les arêtes restantes mènent à des noeuds de rang supérieur
+            up_edges[node] = list(out[node].items())
+            down_edges[node] = list(incoming[node].items())
+
+            neighbors = set(out[node]) | set(incoming[node])
+            for neighbor in out[node]:
+                del incoming[neighbor][node]
+            for neighbor in incoming[node]:
+                del out[neighbor][node]
+            out[node] = {}
+            incoming[node] = {}
+
+            for source, target, cost in shortcuts:
+                if cost < out[source].get(target, INF):
+                    out[source][target] = cost
+                    incoming[target][source] = cost
+                    self.middles[source * num_nodes + target] = node
+
+            for neighbor in neighbors:
+                self.deleted_neighbors[neighbor] += 1
+                self.levels[neighbor] = max(self.levels[neighbor], self.levels[node] + 1)
+
+        # Un raccourci remplacé par une arête plus courte n'est plus utilisé :
+        # seuls les milieux des arêtes gardées sont conservés
+        kept = set()
+        for node in range(num_nodes):
+            kept.update(node * num_nodes + target for target, _ in up_edges[node])
+            kept.update(source * num_nodes + node for source, _ in down_edges[node])
+        keys = np.array(sorted(key for key in self.middles if key in kept), dtype=np.int64)
+        middles = np.array([self.middles[key] for key in keys.tolist()], dtype=np.int64)
+        return rank, _to_csr(up_edges), _to_csr(down_edges), (keys, middles)
+
+
+def _to_csr(adjacency):
+    """Convertit des listes d'adjacence [(voisin, poids)] en tableaux CSR."""
+    degrees = np.array([len(edges) for edges in adjacency], dtype=np.int64)
+    indptr = np.zeros(len(adjacency) + 1, dtype=np.int64)
+    np.cumsum(degrees, out=indptr[1:])
+    indices = np.array([neighbor for edges in adjacency for neighbor, _ in edges], dtype=np.int64)
+    weights = np.array([weight for edges in adjacency for _, weight in edges], dtype=np.float64)
+    return indptr, indices, weights
+
+
+def maze_fingerprint(maze):
+    """
+    Empreinte (SHA-256) des dimensions, des obstacles, des récompenses et de l'arrivée.
+
+    Args:
+        maze (Maze): Labyrinthe
+
+    Returns:
+        str: Empreinte hexadécimale
+    """
+    digest = hashlib.sha256()
+    digest.update(np.array([maze.height, maze.width, *maze.goal], dtype=np.int64).tobytes())
+    digest.update(np.ascontiguousarray(maze.grid != 0).tobytes())
+    digest.update(np.ascontiguousarray(maze.rewards, dtype=np.float64).tobytes())
+    return digest.hexdigest()
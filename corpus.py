@@ -0,0 +1,289 @@
+"""
+Corpus de scénarios : N labyrinthes de mêmes paramètres, empilés dans un seul fichier.
+
+Les campagnes de mesure et les tests de non-régression ont besoin de milliers
+de labyrinthes comparables. generate_corpus les génère sur un pool de processus
+et les enregistre sous forme de tableaux empilés :
+
+- grids (N, H, W, uint8) et rewards (N, H, W, float32 par défaut) ;
+- starts et goals (N, 2) : départ et arrivée de chaque labyrinthe ;
+- seeds (N,) : graine de chaque labyrinthe, tirée de la graine du corpus ;
+- types (N,) : indice du type d'obstacles dans header["obstacle_types"].
+
+Les types d'obstacles sont répartis à tour de rôle (par défaut tous les types
+de main.OBSTACLE_TYPES). Le labyrinthe i est exactement
+create_complete_maze(..., obstacle_type=types[i], seed=seeds[i]) : le corpus
+est reproductible à partir de sa graine, quel que soit le nombre de processus.
+
+Deux formats de fichier :
+
+- non compressé (défaut) : même disposition que maze_file.py (signature
+  CORPUS_MAGIC, en-tête JSON, tableaux alignés) ; load_corpus projette les
+  tableaux en mémoire sans les lire, et les processus de génération écrivent
+  directement leur part du fichier ;
+- compressé (compressed=True) : archive .npz (np.savez_compressed), lue
+  entièrement en mémoire à l'ouverture.
+"""
+
+import json
+import multiprocessing
+import os
+import tempfile
+
+import numpy as np
+
+from main import OBSTACLE_TYPES, create_complete_maze, make_rng
+from Maze import Maze
+from maze_file import FORMAT_VERSION, MMAP_MODES, layout_arrays, map_array, read_header, write_header
+from storage import GridStorage
+
+
+CORPUS_MAGIC = b"MAZECRP\x01"
+
+# Placement du départ et de l'arrivée : coins opposés ou cellules tirées au hasard
+ENDPOINTS = ("corners", "random")
+
+# Paramètres de create_complete_maze communs à tous les labyrinthes du corpus
+MAZE_PARAMETERS = ("obstacle_density", "step_cost", "goal_reward",
+                   "add_bonuses", "num_bonuses", "bonus_value")
+
+# Tableaux du corpus, dans l'ordre du fichier
+ARRAYS = ("grids", "rewards", "starts", "goals", "seeds", "types")
+
+
+class MazeCorpus:
+    """
+    Corpus de labyrinthes chargé depuis un fichier (voir load_corpus).
+    """
+
+    def __init__(self, header, arrays, path=None):
+        """
+        Args:
+            header (dict): En-tête du corpus (dimensions, paramètres, types d'obstacles...)
+            arrays (dict): Tableaux grids, rewards, starts, goals, seeds et types
+            path (str, optional): Chemin du fichier
+        """
+        self.header = header
+        self.path = path
+        self.width = header["width"]
+        self.height = header["height"]
+        self.obstacle_types = tuple(header["obstacle_types"])
+        self.parameters = header["parameters"]
+        self.metadata = header["metadata"]
+        self.storage = GridStorage("uint8", header["costs"])
+        for name in ARRAYS:
+            setattr(self, name, arrays[name])
+
+    def __len__(self):
+        return len(self.seeds)
+
+    def __iter__(self):
+        for index in range(len(self)):
+            yield self.maze(index)
+
+    def __repr__(self):
+        return (f"MazeCorpus(count={len(self)}, height={self.height}, width={self.width}, "
+                f"obstacle_types={self.obstacle_types})")
+
+    def obstacle_type(self, index):
+        """Type d'obstacles du labyrinthe index."""
+        return self.obstacle_types[self.types[index]]
+
+    def maze(self, index, maze_class=Maze, copy=False):
+        """
+        Construit le labyrinthe index du corpus.
+
+        Args:
+            index (int): Indice du labyrinthe
+            maze_class (type): Classe du labyrinthe (Maze, DiagonalMaze...)
+            copy (bool): Si False, la grille et les récompenses sont des vues des
+                tableaux du corpus (en lecture seule avec le mode "r" par défaut) ;
+                si True, le labyrinthe a ses propres tableaux, modifiables
+
+        Returns:
+            Maze: Labyrinthe
+        """
+        grid, rewards = self.grids[index], self.rewards[index]
+        if copy:
+            grid, rewards = np.array(grid), np.array(rewards)
+        start = tuple(int(value) for value in self.starts[index])
+        goal = tuple(int(value) for value in self.goals[index])
+        return maze_class(self.width, self.height, grid, rewards, start, goal, storage=self.storage)
+
+
+def generate_corpus(path, count, width, height, obstacle_types=OBSTACLE_TYPES,
+                    endpoints="corners", costs="float32", seed=None, workers=None,
+                    compressed=False, metadata=None, **parameters):
+    """
+    Génère un corpus de labyrinthes et l'enregistre dans un seul fichier.
+
+    Args:
+        path (str): Chemin du fichier (".npz" est ajouté s'il manque en mode compressé)
+        count (int): Nombre de labyrinthes
+        width (int): Largeur des labyrinthes
+        height (int): Hauteur des labyrinthes
+        obstacle_types (tuple): Types d'obstacles, attribués à tour de rôle
+        endpoints (str): "corners" (départ en haut à gauche, arrivée en bas à
+            droite) ou "random" (deux cellules distinctes tirées au hasard)
+        costs (str): Représentation des récompenses ("float64", "float32" ou "int16")
+        seed (int, optional): Graine du corpus (sans graine, voir make_rng)
+        workers (int, optional): Nombre de processus (par défaut os.cpu_count())
+        compressed (bool): Si True, archive .npz compressée plutôt que fichier projetable
+        metadata (dict, optional): Métadonnées libres (sérialisables en JSON)
+        **parameters: Paramètres de create_complete_maze (obstacle_density,
+            step_cost, goal_reward, add_bonuses, num_bonuses, bonus_value)
+
+    Returns:
+        MazeCorpus: Corpus relu depuis le fichier écrit
+
+    Raises:
+        ValueError: Si un type d'obstacles, le placement ou la représentation est inconnu
+        TypeError: Si un paramètre n'est pas un paramètre de create_complete_maze
+    """
+    obstacle_types = tuple(obstacle_types)
+    for obstacle_type in obstacle_types:
+        if obstacle_type not in OBSTACLE_TYPES:
+            raise ValueError(f"Type d'obstacles inconnu : '{obstacle_type}' "
+                             f"(choix: {', '.join(OBSTACLE_TYPES)})")
+    if not obstacle_types:
+        raise ValueError("Au moins un type d'obstacles est nécessaire")
+    if endpoints not in ENDPOINTS:
+        raise ValueError(f"Placement inconnu : '{endpoints}' (choix: {', '.join(ENDPOINTS)})")
+    for name in parameters:
+        if name not in MAZE_PARAMETERS:
+            raise TypeError(f"Paramètre inconnu : '{name}' (choix: {', '.join(MAZE_PARAMETERS)})")
+    storage = GridStorage("uint8", costs)
+
+    header = {
+        "format": FORMAT_VERSION,
+        "count": count,
+        "width": width,
+        "height": height,
+        "obstacle_types": list(obstacle_types),
+        "endpoints": endpoints,
+        "costs": costs,
+        "seed": seed,
+        "parameters": parameters,
+        "metadata": metadata or {},
+    }
+    shape = (count, height, width)
+    body, size = layout_arrays(CORPUS_MAGIC, header, {
+        "grids": (np.uint8, shape),
+        "rewards": (storage.reward_dtype, shape),
+        "starts": (np.int32, (count, 2)),
+        "goals": (np.int32, (count, 2)),
+        "seeds": (np.int64, (count,)),
+        "types": (np.uint8, (count,)),
+    })
+
+    if compressed:
+        if not path.endswith(".npz"):
+            path += ".npz"
+        handle, raw_path = tempfile.mkstemp(suffix=".corpus", dir=os.path.dirname(os.path.abspath(path)))
+        os.close(handle)
+    else:
+        raw_path = path
+
+    try:
+        with open(raw_path, "wb") as handle:
+            write_header(handle, CORPUS_MAGIC, body)
+            handle.truncate(size)
+        # Graines et types écrits avant la génération : chaque processus lit les siens
+        seeds = map_array(raw_path, header["seeds"], "r+")
+        seeds[...] = make_rng(seed).integers(0, np.iinfo(np.int64).max, size=count, dtype=np.int64)
+        types = map_array(raw_path, header["types"], "r+")
+        types[...] = np.arange(count) % len(obstacle_types)
+        for array in (seeds, types):
+            if isinstance(array, np.memmap):
+                array.flush()
+        del seeds, types
+
+        _generate(raw_path, header, workers)
+
+        if compressed:
+            arrays = {name: map_array(raw_path, header[name], "r") for name in ARRAYS}
+            np.savez_compressed(path, header=np.array(json.dumps(header)), **arrays)
+            del arrays
+    finally:
+        if compressed and os.path.exists(raw_path):
+            os.remove(raw_path)
+
+    return load_corpus(path)
+
+
+def _generate(path, header, workers):
+    """Répartit la génération des labyrinthes sur un pool de processus."""
+    count = header["count"]
+    if workers is None:
+        workers = os.cpu_count() or 1
+    workers = min(workers, count)
+    if workers <= 1:
+        if count:
+            _generate_range(path, header, 0, count)
+        return
+    # Plusieurs paquets par processus pour équilibrer la charge
+    bounds = np.linspace(0, count, workers * 4 + 1).astype(int)
+    tasks = [(path, header, int(low), int(high))
+             for low, high in zip(bounds[:-1], bounds[1:]) if high > low]
+    with multiprocessing.Pool(workers) as pool:
+        pool.starmap(_generate_range, tasks)
+
+
+def _generate_range(path, header, low, high):
+    """Génère les labyrinthes low à high - 1 et les écrit dans le fichier."""
+    arrays = {name: map_array(path, header[name], "r+") for name in ARRAYS}
+    storage = GridStorage("uint8", header["costs"])
+    width, height = header["width"], header["height"]
+    for index in range(low, high):
+        rng = make_rng(int(arrays["seeds"][index]))
+        start = goal = None
+        if header["endpoints"] == "random":
+            cells = rng.choice(height * width, size=2, replace=False)
+            start, goal = (tuple(int(value) for value in divmod(cell, width)) for cell in cells)
+        maze = create_complete_maze(width, height, start, goal,
+                                    obstacle_type=header["obstacle_types"][arrays["types"][index]],
+                                    storage=storage, seed=rng, **header["parameters"])
+        arrays["grids"][index] = maze.grid
+        arrays["rewards"][index] = maze.rewards
+        arrays["starts"][index] = maze.start
+        arrays["goals"][index] = maze.goal
+    for array in arrays.values():
+        if isinstance(array, np.memmap):
+            array.flush()
+
+
+def load_corpus(path, mmap_mode="r"):
+    """
+    Ouvre un corpus de labyrinthes.
+
+    Args:
+        path (str): Chemin du fichier
+        mmap_mode (str): Mode de projection d'un fichier non compressé ("r", "c"
+            ou "r+", voir maze_file.py) ; une archive .npz est lue en mémoire,
+            en lecture seule
+
+    Returns:
+        MazeCorpus: Corpus
+
+    Raises:
+        ValueError: Si le fichier n'est pas un corpus ou si le mode est inconnu
+    """
+    if mmap_mode not in MMAP_MODES:
+        raise ValueError(f"Mode de projection inconnu : '{mmap_mode}' (choix: {', '.join(MMAP_MODES)})")
+    with open(path, "rb") as handle:
+        magic = handle.read(len(CORPUS_MAGIC))
+    if magic == CORPUS_MAGIC:
+        header = read_header(path, CORPUS_MAGIC)
+        arrays = {name: map_array(path, header[name], mmap_mode) for name in ARRAYS}
+    else:
+        try:
+            with np.load(path) as archive:
+                header = json.loads(str(archive["header"]))
+                arrays = {name: archive[name] for name in ARRAYS}
+        except (OSError, KeyError, ValueError):
+            raise ValueError(f"{path} n'est pas un corpus de labyrinthes") from None
+        if header.get("format") != FORMAT_VERSION:
+            raise ValueError(f"Version de format non supportée : {header.get('format')}")
+        for array in arrays.values():
+            array.flags.writeable = False
+    return MazeCorpus(header, arrays, os.path.abspath(path))
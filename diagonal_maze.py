@@ -10,7 +10,6 @@ avec un coût adapté"
 """
 
 import numpy as np
-import heapq
 from Maze import Maze
 
 
@@ -23,7 +22,7 @@ class DiagonalMaze(Maze):
     """
     
     def __init__(self, width, height, grid=None, rewards=None, start=None, goal=None,
-                 diagonal_cost_multiplier=1.414):
+                 diagonal_cost_multiplier=1.414, storage="default"):
         """
         Initialise un labyrinthe avec support des déplacements diagonaux.
         
@@ -36,10 +35,46 @@ class DiagonalMaze(Maze):
             goal (tuple, optional): Point d'arrivée
             diagonal_cost_multiplier (float): Multiplicateur de coût pour les diagonales
                                              Par défaut √2 ≈ 1.414
+            storage (str | GridStorage): Représentation de la grille et des récompenses
         """
-        super().__init__(width, height, grid, rewards, start, goal)
+        super().__init__(width, height, grid, rewards, start, goal, storage=storage)
         self.diagonal_cost_multiplier = diagonal_cost_multiplier
     
+    @property
+    def diagonal_cost_multiplier(self):
+        """Multiplicateur de coût des déplacements diagonaux."""
+        return self._diagonal_cost_multiplier
+    
+    @diagonal_cost_multiplier.setter
+    def diagonal_cost_multiplier(self, value):
+        # Le multiplicateur fait partie du coût des arêtes : le graphe compilé doit être refait
+        self._diagonal_cost_multiplier = value
+        self.mark_modified()
+    
+    def graph_directions(self):
+        """
+        Retourne les 8 directions du voisinage avec leur multiplicateur de coût.
+        
+        Les solveurs A* et Dijkstra hérités de Maze parcourent le graphe compilé
+        à partir de ces directions : les arêtes diagonales ont un coût multiplié
+        par diagonal_cost_multiplier.
+        
+        Returns:
+            tuple: Tuples (delta_row, delta_col, multiplicateur_coût)
+        """
+        return (
+            # Orthogonales (coût normal)
+            (-1, 0, 1.0),   # Haut
+            (1, 0, 1.0),    # Bas
+            (0, -1, 1.0),   # Gauche
+            (0, 1, 1.0),    # Droite
+            # Diagonales (coût √2)
+            (-1, -1, self.diagonal_cost_multiplier),  # Haut-Gauche
+            (-1, 1, self.diagonal_cost_multiplier),   # Haut-Droite
+            (1, -1, self.diagonal_cost_multiplier),   # Bas-Gauche
+            (1, 1, self.diagonal_cost_multiplier),    # Bas-Droite
+        )
+    
     def get_neighbors(self, row, col):
         """
         Identifie les cellules voisines accessibles, incluant les diagonales.
@@ -59,21 +94,7 @@ class DiagonalMaze(Maze):
         neighbors = []
         
         # 8 directions : 4 orthogonales + 4 diagonales
-        # Format: (delta_row, delta_col, cost_multiplier)
-        directions = [
-            # Orthogonales (coût normal)
-            (-1, 0, 1.0),   # Haut
-            (1, 0, 1.0),    # Bas
-            (0, -1, 1.0),   # Gauche
-            (0, 1, 1.0),    # Droite
-            # Diagonales (coût √2)
-            (-1, -1, self.diagonal_cost_multiplier),  # Haut-Gauche
-            (-1, 1, self.diagonal_cost_multiplier),   # Haut-Droite
-            (1, -1, self.diagonal_cost_multiplier),   # Bas-Gauche
-            (1, 1, self.diagonal_cost_multiplier),    # Bas-Droite
-        ]
-        
-        for d_row, d_col, cost_mult in directions:
+        for d_row, d_col, cost_mult in self.graph_directions():
             new_row = row + d_row
             new_col = col + d_col
             
@@ -95,113 +116,13 @@ class DiagonalMaze(Maze):
             col (int): Colonne de la cellule
             
         Returns:
-            float: Distance euclidienne jusqu'à l'arrivée
+            float: Distance euclidienne jusqu'à l'arrivée (ou borne ALT si plus grande)
         """
         goal_row, goal_col = self.goal
-        return np.sqrt((row - goal_row)**2 + (col - goal_col)**2)
-    
-    def solve(self):
-        """
-        Résout le labyrinthe avec A* en tenant compte des déplacements diagonaux.
-        
-        Returns:
-            list: Liste ordonnée des cellules (row, col) du chemin optimal,
-                  ou None si aucun chemin n'existe
-        """
-        open_set = []
-        counter = 0
-        
-        start_row, start_col = self.start
-        heapq.heappush(open_set, (self.heuristic(start_row, start_col), counter, self.start))
-        counter += 1
-        
-        g_cost = {self.start: 0}
-        came_from = {}
-        closed_set = set()
-        
-        while open_set:
-            _, _, current = heapq.heappop(open_set)
-            
-            if current == self.goal:
-                return self._reconstruct_path(came_from, current)
-            
-            if current in closed_set:
-                continue
-            closed_set.add(current)
-            
-            current_row, current_col = current
-            current_g_cost = g_cost[current]
-            
-            # Explorer tous les voisins (8 directions)
-            for neighbor_row, neighbor_col, cost_mult in self.get_neighbors(current_row, current_col):
-                neighbor = (neighbor_row, neighbor_col)
-                
-                if neighbor in closed_set:
-                    continue
-                
-                # Le coût est ajusté par le multiplicateur de coût diagonal
-                # et la récompense de la cellule
-                move_cost = cost_mult * (-self.get_reward(neighbor_row, neighbor_col))
-                tentative_g_cost = current_g_cost + move_cost
-                
-                if neighbor not in g_cost or tentative_g_cost < g_cost[neighbor]:
-                    came_from[neighbor] = current
-                    g_cost[neighbor] = tentative_g_cost
-                    
-                    f_cost = tentative_g_cost + self.heuristic(neighbor_row, neighbor_col)
-                    heapq.heappush(open_set, (f_cost, counter, neighbor))
-                    counter += 1
-        
-        return None
-    
-    def solve_dijkstra(self):
-        """
-        Résout le labyrinthe avec Dijkstra en tenant compte des déplacements diagonaux.
-        
-        Returns:
-            list: Liste ordonnée des cellules (row, col) du chemin optimal,
-                  ou None si aucun chemin n'existe
-        """
-        open_set = []
-        counter = 0
-        
-        heapq.heappush(open_set, (0, counter, self.start))
-        counter += 1
-        
-        dist = {self.start: 0}
-        came_from = {}
-        closed_set = set()
-        
-        while open_set:
-            current_dist, _, current = heapq.heappop(open_set)
-            
-            if current == self.goal:
-                return self._reconstruct_path(came_from, current)
-            
-            if current in closed_set:
-                continue
-            closed_set.add(current)
-            
-            current_row, current_col = current
-            
-            # Explorer tous les voisins (8 directions)
-            for neighbor_row, neighbor_col, cost_mult in self.get_neighbors(current_row, current_col):
-                neighbor = (neighbor_row, neighbor_col)
-                
-                if neighbor in closed_set:
-                    continue
-                
-                move_cost = cost_mult * (-self.get_reward(neighbor_row, neighbor_col))
-                tentative_dist = current_dist + move_cost
-                
-                if neighbor not in dist or tentative_dist < dist[neighbor]:
-                    came_from[neighbor] = current
-                    dist[neighbor] = tentative_dist
-                    
-                    heapq.heappush(open_set, (tentative_dist, counter, neighbor))
-                    counter += 1
-        
-        return None
+        distance = np.sqrt((row - goal_row)**2 + (col - goal_col)**2)
+        if self.landmarks is not None:
+            return max(distance, self.landmarks.estimate(self, row, col, self.goal))
+        return distance
 
 
 def compare_4_vs_8_connectivity():
@@ -0,0 +1,173 @@
+"""
+Champ de distances vectorisé (parcours en largeur par front d'onde).
+
+Quand toutes les cellules ont le même coût, la distance d'une cellule à une
+source est son nombre de pas multiplié par ce coût : un parcours en largeur suffit.
+Plutôt que de lancer une recherche par départ, on calcule la distance de toutes
+les cellules d'un coup, par dilatation du masque du front d'onde :
+
+- le front contient les cellules atteintes à l'étape k ;
+- à l'étape k + 1, une cellule libre non visitée est atteinte si l'un de ses
+  voisins appartient au front (un décalage du masque par direction).
+
+Chaque étape ne traite que la fenêtre englobant le front (agrandie d'une case),
+ce qui garde le calcul rapide dans les couloirs étroits.
+
+Pour chaque cellule, le champ garde aussi la direction du pas qui la rapproche
+de la source : un chemin depuis n'importe quel départ se lit en O(longueur).
+"""
+
+import numpy as np
+
+from jps import _shifted
+
+
+# Valeurs sentinelles des tableaux distances et predecessor
+UNREACHABLE = -1
+NO_DIRECTION = -1
+
+
+class DistanceField:
+    """
+    Distances (en nombre de pas) de toutes les cellules vers une source.
+    """
+
+    def __init__(self, source, distances, predecessor, directions, step_cost=1.0):
+        """
+        Initialise le champ de distances.
+
+        Args:
+            source (tuple): Cellule source (row, col)
+            distances (np.ndarray): Nombre de pas vers la source (int32, -1 = inaccessible)
+            predecessor (np.ndarray): Indice de la direction du pas vers la source
+                                      (int8, -1 pour la source et les cellules inaccessibles)
+            directions (sequence): Tuples (delta_row, delta_col, ...) indexés par predecessor
+            step_cost (float): Coût uniforme d'un pas
+        """
+        self.source = tuple(source)
+        self.distances = distances
+        self.predecessor = predecessor
+        self.directions = tuple((d[0], d[1]) for d in directions)
+        self.step_cost = step_cost
+        self.height, self.width = distances.shape
+
+    def is_reachable(self, row, col):
+        """Indique si la source est accessible depuis la cellule."""
+        return bool(self.distances[row, col] != UNREACHABLE)
+
+    def cost(self, row, col):
+        """
+        Retourne le coût du chemin optimal de la cellule vers la source.
+
+        Returns:
+            float ou None: Coût du chemin, None si la source est inaccessible
+        """
+        steps = int(self.distances[row, col])
+        return None if steps == UNREACHABLE else steps * self.step_cost
+
+    def costs(self):
+        """
+        Retourne la carte des coûts (float64, inf pour les cellules inaccessibles).
+        """
+        costs = self.distances.astype(np.float64) * self.step_cost
+        costs[self.distances == UNREACHABLE] = np.inf
+        return costs
+
+    def path_from(self, start):
+        """
+        Lit le chemin optimal d'un départ vers la source en suivant les prédécesseurs.
+
+        Args:
+            start (tuple): Cellule de départ (row, col)
+
+        Returns:
+            list: Cellules du départ jusqu'à la source, None si la source est inaccessible
+        """
+        row, col = start
+        if not self.is_reachable(row, col):
+            return None
+        predecessor = memoryview(self.predecessor.reshape(-1))
+        directions = self.directions
+        width = self.width
+        path = [(row, col)]
+        direction = predecessor[row * width + col]
+        while direction != NO_DIRECTION:
+            d_row, d_col = directions[direction]
+            row += d_row
+            col += d_col
+            path.append((row, col))
+            direction = predecessor[row * width + col]
+        return path
+
+    @property
+    def nbytes(self):
+        """Mémoire occupée par les tableaux (en octets)."""
+        return self.distances.nbytes + self.predecessor.nbytes
+
+
+def compute_distance_field(passable, source, directions):
+    """
+    Calcule les distances de parcours en largeur vers une source par dilatation du front.
+
+    Le graphe de la grille est supposé symétrique (vrai pour Maze et DiagonalMaze) :
+    la distance d'une cellule vers la source est celle de la source vers la cellule.
+    À égalité, la direction retenue est la première dans l'ordre de directions.
+
+    Args:
+        passable (np.ndarray): Masque des cellules franchissables
+        source (tuple): Cellule source (row, col)
+        directions (sequence): Tuples (delta_row, delta_col, ...) du voisinage
+
+    Returns:
+        tuple: (distances int32, predecessor int8) de forme (height, width)
+    """
+    passable = np.asarray(passable, dtype=bool)
+    height, width = passable.shape
+    distances = np.full((height, width), UNREACHABLE, dtype=np.int32)
+    predecessor = np.full((height, width), NO_DIRECTION, dtype=np.int8)
+    visited = ~passable
+    frontier = np.zeros((height, width), dtype=bool)
+
+    source_row, source_col = source
+    distances[source_row, source_col] = 0
+    visited[source_row, source_col] = True
+    frontier[source_row, source_col] = True
+    # Boîte englobante du front (bornes incluses)
+    top, bottom, left, right = source_row, source_row, source_col, source_col
+    offsets = [(d[0], d[1]) for d in directions]
+
+    level = 0
+    while True:
+        level += 1
+        rows = slice(max(top - 1, 0), min(bottom + 2, height))
+        cols = slice(max(left - 1, 0), min(right + 2, width))
+        front = frontier[rows, cols]
+        window_visited = visited[rows, cols]
+        window_predecessor = predecessor[rows, cols]
+
+        reached = np.zeros_like(front)
+        for k, (d_row, d_col) in enumerate(offsets):
+            # Cellules dont le voisin (d_row, d_col) est sur le front
+            candidates = _shifted(front, d_row, d_col)
+            candidates &= ~window_visited
+            candidates &= ~reached
+            window_predecessor[candidates] = k
+            reached |= candidates
+
+        if not reached.any():
+            break
+
+        distances[rows, cols][reached] = level
+        window_visited |= reached
+        # L'ancien front est entièrement dans la fenêtre : il est remplacé
+        frontier[rows, cols] = reached
+
+        reached_rows = np.flatnonzero(reached.any(axis=1))
+        reached_cols = np.flatnonzero(reached.any(axis=0))
+        top = rows.start + reached_rows[0]
+        bottom = rows.start + reached_rows[-1]
+        left = cols.start + reached_cols[0]
+        right = cols.start + reached_cols[-1]
+
+    return distances, predecessor
+
@@ -0,0 +1,367 @@
+"""
+Replanification incrémentale par D* Lite (Koenig et Likhachev, 2002).
+
+Sur un robot, la grille d'occupation change quelques cellules à la fois et le
+robot avance entre deux replanifications. Relancer solve() à chaque fois refait
+toute la recherche. D* Lite cherche depuis l'arrivée vers le départ et garde
+son arbre de recherche entre deux appels :
+
+- g(s) : coût connu de s vers l'arrivée ; rhs(s) : valeur calculée à partir des
+  successeurs (rhs(s) = min c(s, s') + g(s')). Une cellule est « incohérente »
+  si g(s) != rhs(s) ; seules ces cellules sont dans la liste ouverte.
+- Quand une cellule change (set_obstacle, remove_obstacle, set_reward), seuls
+  rhs de la cellule et de ses voisins sont recalculés ; la recherche répare
+  ensuite uniquement la partie de l'arbre affectée.
+- Le départ peut se déplacer (maze.start) : le décalage km garde les clés de la
+  liste ouverte valides sans les recalculer (LPA* correspond au cas d'un départ fixe).
+
+Le planificateur lit les modifications dans le journal du labyrinthe
+(Maze.changes_since). Une nouvelle grille, un mark_modified ou un changement
+d'arrivée provoquent une replanification complète.
+
+D* Lite exige des coûts d'arête positifs ou nuls : les cellules bonus (récompense
+positive) sont refusées. Un coût d'entrée dans l'arrivée inférieur au plus
+petit coût de la grille (récompense d'arrivée, souvent +100) est remplacé par
+ce plus petit coût, multiplié par celui de la direction, ce qui garde
+l'heuristique cohérente. Le remplacement ne change pas le chemin optimal que si
+l'écart avec le coût réel est le même pour toutes les directions d'entrée
+(Maze.uniform_goal_entry_cost) ; il est alors ajouté au coût du chemin. Ce
+n'est pas le cas d'un DiagonalMaze dont l'arrivée a une récompense et des
+voisins droits et diagonaux franchissables : le labyrinthe est refusé.
+"""
+
+import heapq
+
+import numpy as np
+
+
+INF = float("inf")
+
+# Les clés sont arrondies : des sommes de coûts égales en théorie doivent être
+# égales en flottants pour que le départage par la seconde composante fonctionne
+KEY_DIGITS = 9
+
+
+class DStarLite:
+    """
+    Planificateur incrémental lié à un labyrinthe.
+    """
+
+    def __init__(self, maze):
+        """
+        Initialise le planificateur sur le départ et l'arrivée courants du labyrinthe.
+
+        Args:
+            maze (Maze): Labyrinthe (Maze ou DiagonalMaze)
+
+        Raises:
+            ValueError: Si une cellule franchissable (hors arrivée) a un coût négatif,
+                        ou si le coût d'entrée dans l'arrivée ne peut pas être
+                        remplacé (voir le module)
+        """
+        self.maze = maze
+        self.expansions = 0
+        self.total_expansions = 0
+        self.replans = 0
+        self._initialize()
+
+    def _initialize(self):
+        """(Re)construit l'état du planificateur à partir de la grille courante."""
+        maze = self.maze
+        self.width = width = maze.width
+        self.height = maze.height
+        self._version = maze.version
+        self.goal = tuple(maze.goal)
+        self._goal = maze.cell_id(*self.goal)
+        self._start = maze.cell_id(*maze.start)
+        self._last_start = self._start
+
+        directions = maze.graph_directions()
+        self._offsets = [(d_row, d_col, d_row * width + d_col, mult)
+                         for d_row, d_col, mult in directions]
+        self._free = bytearray(np.ascontiguousarray(maze.grid == 0, dtype=np.uint8).tobytes())
+
+        step_cost = -np.asarray(maze.rewards, dtype=np.float64).reshape(-1)
+        others = (maze.grid == 0).reshape(-1)
+        others[self._goal] = False
+        costs = step_cost[others]
+        if costs.size and costs.min() < 0:
+            raise ValueError("D* Lite exige des coûts de déplacement positifs ou nuls "
+                             "(cellules bonus non supportées)")
+        self._min_cost = float(costs.min()) if costs.size else 1.0
+        self._step_cost = step_cost.tolist()
+        # Écart entre le coût réel de l'entrée dans l'arrivée et le coût utilisé
+        # (None : coût réel utilisé)
+        self._goal_offset = None
+        if self._step_cost[self._goal] < self._min_cost:
+            self._goal_offset = maze.uniform_goal_entry_cost(self._min_cost)
+            if self._goal_offset is None:
+                raise ValueError("D* Lite exige que toutes les arêtes entrant dans l'arrivée "
+                                 "aient le même coût (récompense d'arrivée avec des diagonales)")
+            self._step_cost[self._goal] = self._min_cost
+
+        # Heuristique : distance de Manhattan (4 directions) ou octile (8 directions)
+        # multipliée par le plus petit coût de cellule
+        if len(directions) == 8:
+            diagonal_mult = max(mult for _, _, mult in directions)
+            self._straight_h = self._min_cost * min(1.0, diagonal_mult)
+            self._diagonal_h = self._min_cost * min(2.0, diagonal_mult)
+        else:
+            self._straight_h = self._min_cost
+            self._diagonal_h = None
+
+        self._km = 0.0
+        self._g = {}
+        self._rhs = {self._goal: 0.0}
+        self._open = []
+        self._open_keys = {}
+        self._push(self._goal, self._key(self._goal))
+
+    def _heuristic(self, node):
+        """Estimation admissible du coût entre le départ courant et node."""
+        start_row, start_col = divmod(self._start, self.width)
+        row, col = divmod(node, self.width)
+        d_row = abs(row - start_row)
+        d_col = abs(col - start_col)
+        if self._diagonal_h is None:
+            return self._straight_h * (d_row + d_col)
+        if d_row < d_col:
+            d_row, d_col = d_col, d_row
+        return self._diagonal_h * d_col + self._straight_h * (d_row - d_col)
+
+    def _key(self, node):
+        """Clé de priorité [min(g, rhs) + h + km ; min(g, rhs)]."""
+        value = min(self._g.get(node, INF), self._rhs.get(node, INF))
+        if value == INF:
+            return (INF, INF)
+        return (round(value + self._heuristic(node) + self._km, KEY_DIGITS), round(value, KEY_DIGITS))
+
+    def _push(self, node, key):
+        self._open_keys[node] = key
+        heapq.heappush(self._open, (key[0], key[1], node))
+
+    def _top(self):
+        """Retourne l'entrée valide de plus petite clé (entrées périmées ignorées)."""
+        open_set = self._open
+        open_keys = self._open_keys
+        while open_set:
+            k1, k2, node = open_set[0]
+            if open_keys.get(node) == (k1, k2):
+                return k1, k2, node
+            heapq.heappop(open_set)
+        return None
+
+    def _neighbors(self, node):
+        """Cellules voisines dans la grille, avec le multiplicateur de coût de la direction."""
+        row, col = divmod(node, self.width)
+        height = self.height
+        width = self.width
+        for d_row, d_col, delta, mult in self._offsets:
+            if 0 <= row + d_row < height and 0 <= col + d_col < width:
+                yield node + delta, mult
+
+    def _best_successor_value(self, node):
+        """rhs(node) = min sur les voisins franchissables de c(node, s') + g(s')."""
+        if not self._free[node]:
+            return INF
+        free = self._free
+        step_cost = self._step_cost
+        g = self._g
+        best = INF
+        for neighbor, mult in self._neighbors(node):
+            if free[neighbor]:
+                value = mult * step_cost[neighbor] + g.get(neighbor, INF)
+                if value < best:
+                    best = value
+        return best
+
+    def _update_vertex(self, node):
+        """Place node dans la liste ouverte s'il est incohérent, l'en retire sinon."""
+        if self._g.get(node, INF) != self._rhs.get(node, INF):
+            self._push(node, self._key(node))
+        else:
+            self._open_keys.pop(node, None)
+
+    def _compute_shortest_path(self):
+        """Développe les cellules incohérentes jusqu'à ce que le départ soit cohérent."""
+        g = self._g
+        rhs = self._rhs
+        free = self._free
+        step_cost = self._step_cost
+        open_keys = self._open_keys
+        start = self._start
+        goal = self._goal
+        expansions = 0
+
+        while True:
+            top = self._top()
+            if top is None:
+                break
+            start_key = self._key(start)
+            if (top[0], top[1]) >= start_key and rhs.get(start, INF) <= g.get(start, INF):
+                break
+            k_old = (top[0], top[1])
+            node = top[2]
+            k_new = self._key(node)
+            if k_old < k_new:
+                self._push(node, k_new)
+                continue
+
+            expansions += 1
+            g_node = g.get(node, INF)
+            rhs_node = rhs.get(node, INF)
+            if g_node > rhs_node:
+                # Sur-cohérente : g descend à rhs, les prédécesseurs en profitent
+                g[node] = rhs_node
+                del open_keys[node]
+                heapq.heappop(self._open)
+                entry_cost = step_cost[node]
+                for neighbor, mult in self._neighbors(node):
+                    if neighbor != goal and free[neighbor]:
+                        value = mult * entry_cost + rhs_node
+                        if value < rhs.get(neighbor, INF):
+                            rhs[neighbor] = value
+                            self._update_vertex(neighbor)
+            else:
+                # Sous-cohérente : g remonte à l'infini, node et ses prédécesseurs
+                # recalculent leur meilleur successeur
+                g[node] = INF
+                if node != goal:
+                    rhs[node] = self._best_successor_value(node)
+                self._update_vertex(node)
+                for neighbor, _ in self._neighbors(node):
+                    if neighbor != goal and free[neighbor]:
+                        rhs[neighbor] = self._best_successor_value(neighbor)
+                        self._update_vertex(neighbor)
+
+        self.expansions = expansions
+        self.total_expansions += expansions
+
+    def _apply_changes(self, cells):
+        """
+        Met à jour les coûts des cellules modifiées et les rhs affectés.
+
+        Returns:
+            bool: False si une replanification complète est nécessaire
+        """
+        maze = self.maze
+        goal_neighbors = {neighbor for neighbor, _ in self._neighbors(self._goal)}
+        affected = set()
+        for row, col in set(cells):
+            node = maze.cell_id(row, col)
+            is_free = 1 if maze.grid[row, col] == 0 else 0
+            cost = -float(maze.rewards[row, col])
+            if node == self._goal or (self._goal_offset is not None and node in goal_neighbors):
+                # Coût ou directions d'entrée dans l'arrivée modifiés
+                return False
+            if is_free and cost < self._min_cost:
+                # L'heuristique ne serait plus admissible
+                return False
+            self._free[node] = is_free
+            self._step_cost[node] = cost
+            affected.add(node)
+            affected.update(neighbor for neighbor, _ in self._neighbors(node))
+
+        for node in affected:
+            if node != self._goal:
+                self._rhs[node] = self._best_successor_value(node)
+                self._update_vertex(node)
+        return True
+
+    def plan(self, stats=None):
+        """
+        Calcule (ou répare) le chemin optimal du départ courant (maze.start) à l'arrivée.
+
+        Les modifications de la grille depuis l'appel précédent sont prises en compte
+        incrémentalement ; un déplacement du départ ne coûte qu'une mise à jour de km.
+
+        Args:
+            stats (SearchStats, optional): Instance remplie avec les cellules développées
+                et les temps (préparation : prise en compte des modifications ;
+                closed : cellules dont g est connu). Les compteurs de la file ne
+                sont pas mesurés (None).
+
+        Returns:
+            list ou None: Chemin optimal (liste de cellules), None s'il n'existe pas
+
+        Raises:
+            ValueError: Si la grille contient des coûts négatifs ou si le coût d'entrée
+                        dans l'arrivée ne peut pas être remplacé
+        """
+        if stats is not None:
+            stats.reset("dstar_lite")
+        maze = self.maze
+        changes = maze.changes_since(self._version)
+        if (tuple(maze.goal) != self.goal or changes is None
+                or (maze.width, maze.height) != (self.width, self.height)):
+            self._initialize()
+            changes = []
+        self.replans += 1
+
+        start = maze.cell_id(*maze.start)
+        if start != self._start:
+            # Départ déplacé : les clés existantes restent des bornes inférieures
+            self._start = start
+            self._km += self._heuristic(self._last_start)
+            self._last_start = start
+
+        if changes and not self._apply_changes(changes):
+            self._initialize()
+        self._version = maze.version
+
+        if not self._free[self._goal] or not self._free[self._start]:
+            if stats is not None:
+                stats.finish(None)
+            return None
+        if stats is not None:
+            stats.lap("setup")
+        self._compute_shortest_path()
+        if stats is not None:
+            stats.end_search(self.expansions, None, None, None, closed=len(self._g))
+        path = self._extract_path()
+        if stats is not None:
+            cost = self._rhs.get(self._start)
+            if path is not None and len(path) > 1 and self._goal_offset is not None:
+                cost += self._goal_offset
+            stats.finish(path, cost)
+        return path
+
+    def _extract_path(self):
+        """Suit le meilleur successeur depuis le départ jusqu'à l'arrivée."""
+        node = self._start
+        if self._rhs.get(node, INF) == INF and node != self._goal:
+            return None
+        g = self._g
+        free = self._free
+        step_cost = self._step_cost
+        path = [node]
+        visited = {node}
+        while node != self._goal:
+            best = -1
+            best_value = INF
+            for neighbor, mult in self._neighbors(node):
+                if free[neighbor]:
+                    value = mult * step_cost[neighbor] + g.get(neighbor, INF)
+                    if value < best_value:
+                        best = neighbor
+                        best_value = value
+            if best < 0 or best in visited:
+                return None
+            node = best
+            visited.add(node)
+            path.append(node)
+        return [self.maze.cell_coords(node) for node in path]
+
+    def stats(self):
+        """
+        Retourne les compteurs du planificateur.
+
+        Returns:
+            dict: expansions (dernier appel), total_expansions, replans, open_size
+        """
+        return {
+            "expansions": self.expansions,
+            "total_expansions": self.total_expansions,
+            "replans": self.replans,
+            "open_size": len(self._open_keys),
+        }
@@ -1,67 +1,100 @@
-"""Generate TP2 benchmark plots for Typst report."""
+"""Generate TP2 benchmark plots for Typst report.
+
+The plots are drawn from results stored by benchmark.py:
+
+    python generate_tp2_plots.py [results.json]
+
+Without argument, Document/assets/tp2_benchmark.json is used; if it does not
+exist yet, the TP2 sweep (TP2_SWEEP) is run first and its results are saved there.
+"""
 
 import os
+import sys
+
 import matplotlib.pyplot as plt
 import numpy as np
 
+from benchmark import case_label, load_results, run_benchmark, save_results
+
 
 ASSETS_DIR = os.path.join("Document", "assets")
 os.makedirs(ASSETS_DIR, exist_ok=True)
 
-# Measured results from tests_bidirectional.py and benchmark_networkx_tp2.py
-cases = ["10x10\nno obs", "10x10\nobs 0.2", "12x8\nvertical", "30x30\nmaze"]
+RESULTS_PATH = os.path.join(ASSETS_DIR, "tp2_benchmark.json")
+
+# Scenarios of the report: empty and random grids, walls and maze pattern
+TP2_SWEEP = {"sizes": (10, 30), "densities": (0.0, 0.2), "repeat": 20, "warmup": 3}
+
+# Case of the runtime comparison (falls back to the last case of the results)
+RUNTIME_CASE = "30x30 maze_pattern"
+
+# Solvers of the runtime comparison, with their labels and colors
+RUNTIME_SOLVERS = {
+    "dijkstra": ("Dijkstra uni", "#1f77b4"),
+    "bidirectional_dijkstra": ("Dijkstra bi", "#2ca02c"),
+    "astar": ("A* uni", "#9467bd"),
+    "bidirectional_astar": ("A* bi", "#ff7f0e"),
+    "diagonal_astar": ("A* diagonal", "#8c564b"),
+    "networkx_bidirectional_dijkstra": ("NetworkX bi", "#d62728"),
+}
+
+results_path = sys.argv[1] if len(sys.argv) > 1 else RESULTS_PATH
+if not os.path.exists(results_path):
+    print(f"{results_path} not found: running the TP2 benchmark sweep")
+    save_results(run_benchmark(**TP2_SWEEP), results_path)
+rows = load_results(results_path)["results"]
 
-# Explored nodes
-dijkstra_uni = [99, 83, 80, 520]
-dijkstra_bi = [92, 70, 76, 438]
+# Measured results, indexed by solver then by case label
+measured = {}
+for row in rows:
+    measured.setdefault(row["solver"], {})[case_label(row)] = row
+cases = list(dict.fromkeys(case_label(row) for row in rows))
 
-astar_uni = [99, 47, 80, 160]
-astar_bi = [92, 48, 70, 268]
 
-# Runtime on 30x30 maze_pattern (ms)
-algo_labels = ["Dijkstra uni", "Dijkstra bi", "A* uni", "A* bi", "NetworkX bi"]
-times_ms = [1.99, 1.28, 0.66, 1.11, 1.25]
+def column(solver, field):
+    """Values of a field for every case (NaN when the solver was not measured)."""
+    by_case = measured.get(solver, {})
+    return [by_case[case][field] if case in by_case and by_case[case][field] is not None else np.nan
+            for case in cases]
+
 
 plt.style.use("seaborn-v0_8-whitegrid")
 
-# Plot 1: Dijkstra explored nodes
+# Plots 1 and 2: explored nodes, unidirectional vs bidirectional
 x = np.arange(len(cases))
 width = 0.36
-fig, ax = plt.subplots(figsize=(9, 4.8), dpi=160)
-ax.bar(x - width / 2, dijkstra_uni, width, label="Unidirectional", color="#1f77b4")
-ax.bar(x + width / 2, dijkstra_bi, width, label="Bidirectional", color="#2ca02c")
-ax.set_title("Dijkstra: explored nodes")
-ax.set_ylabel("Explored nodes")
-ax.set_xticks(x)
-ax.set_xticklabels(cases)
-ax.legend()
-fig.tight_layout()
-fig.savefig(os.path.join(ASSETS_DIR, "tp2_plot_dijkstra_explored.png"), bbox_inches="tight")
-plt.close(fig)
-
-# Plot 2: A* explored nodes
-fig, ax = plt.subplots(figsize=(9, 4.8), dpi=160)
-ax.bar(x - width / 2, astar_uni, width, label="Unidirectional", color="#9467bd")
-ax.bar(x + width / 2, astar_bi, width, label="Bidirectional", color="#ff7f0e")
-ax.set_title("A*: explored nodes")
-ax.set_ylabel("Explored nodes")
-ax.set_xticks(x)
-ax.set_xticklabels(cases)
-ax.legend()
-fig.tight_layout()
-fig.savefig(os.path.join(ASSETS_DIR, "tp2_plot_astar_explored.png"), bbox_inches="tight")
-plt.close(fig)
+tick_labels = [case.replace(" ", "\n", 1) for case in cases]
+for name, title, colors in (("dijkstra", "Dijkstra", ("#1f77b4", "#2ca02c")),
+                            ("astar", "A*", ("#9467bd", "#ff7f0e"))):
+    fig, ax = plt.subplots(figsize=(max(9, len(cases) * 0.9), 4.8), dpi=160)
+    ax.bar(x - width / 2, column(name, "expansions"), width, label="Unidirectional", color=colors[0])
+    ax.bar(x + width / 2, column(f"bidirectional_{name}", "expansions"), width,
+           label="Bidirectional", color=colors[1])
+    ax.set_title(f"{title}: explored nodes")
+    ax.set_ylabel("Explored nodes")
+    ax.set_xticks(x)
+    ax.set_xticklabels(tick_labels)
+    ax.legend()
+    fig.tight_layout()
+    fig.savefig(os.path.join(ASSETS_DIR, f"tp2_plot_{name}_explored.png"), bbox_inches="tight")
+    plt.close(fig)
 
-# Plot 3: Runtime comparison on 30x30
+# Plot 3: runtime comparison (median, error bar up to the 95th percentile)
+runtime_case = RUNTIME_CASE if RUNTIME_CASE in cases else cases[-1]
+solvers = [solver for solver in RUNTIME_SOLVERS if runtime_case in measured.get(solver, {})]
+medians = [measured[solver][runtime_case]["median_ms"] for solver in solvers]
+p95 = [measured[solver][runtime_case]["p95_ms"] for solver in solvers]
 fig, ax = plt.subplots(figsize=(9, 4.8), dpi=160)
-bars = ax.bar(algo_labels, times_ms, color=["#1f77b4", "#2ca02c", "#9467bd", "#ff7f0e", "#d62728"])
-ax.set_title("Runtime on 30x30 maze_pattern")
+bars = ax.bar([RUNTIME_SOLVERS[solver][0] for solver in solvers], medians,
+              yerr=[np.zeros(len(solvers)), np.subtract(p95, medians)], capsize=4,
+              color=[RUNTIME_SOLVERS[solver][1] for solver in solvers])
+ax.set_title(f"Runtime on {runtime_case} (median, p95)")
 ax.set_ylabel("Time (ms)")
-ax.set_ylim(0, max(times_ms) * 1.25)
-for bar, value in zip(bars, times_ms):
+ax.set_ylim(0, max(p95) * 1.25)
+for bar, value in zip(bars, medians):
     ax.text(bar.get_x() + bar.get_width() / 2, bar.get_height() + 0.03, f"{value:.2f}", ha="center", va="bottom", fontsize=9)
 fig.tight_layout()
 fig.savefig(os.path.join(ASSETS_DIR, "tp2_plot_runtime_30x30.png"), bbox_inches="tight")
 plt.close(fig)
 
-print("Plots generated in Document/assets")
+print(f"Plots generated in Document/assets from {results_path}")
@@ -0,0 +1,238 @@
+"""
+Cache de champs de coût restant (cost-to-go) indexé par cellule d'arrivée.
+
+Quand beaucoup de requêtes partagent quelques arrivées (stations de recharge,
+sorties...), chaque appel à solve() refait une recherche complète. Un Dijkstra
+inverse lancé depuis l'arrivée donne, pour toutes les cellules, le coût du
+meilleur chemin jusqu'à cette arrivée. Une requête vers une arrivée en cache se
+résout alors sans recherche, par descente gloutonne : depuis le départ, on passe
+toujours au voisin v qui minimise coût(u -> v) + champ[v].
+
+Les champs sont gardés dans un cache LRU borné en mémoire. Ils sont associés à
+la version du labyrinthe : set_obstacle, remove_obstacle, set_reward (ou toute
+modification signalée par mark_modified) invalident tout le cache.
+"""
+
+import heapq
+from collections import OrderedDict
+
+import numpy as np
+
+
+# Budget mémoire par défaut des champs en cache (64 Mio)
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+
+
+class GoalFieldCache:
+    """
+    Cache LRU des champs de coût restant, avec budget mémoire.
+    """
+
+    def __init__(self, max_bytes=DEFAULT_MAX_BYTES):
+        """
+        Initialise un cache vide.
+
+        Args:
+            max_bytes (int): Mémoire maximale occupée par les champs (en octets)
+        """
+        self.max_bytes = max_bytes
+        self._fields = OrderedDict()
+        self._version = None
+        self.nbytes = 0
+        self.reset_stats()
+
+    def __len__(self):
+        return len(self._fields)
+
+    def __contains__(self, goal):
+        return tuple(goal) in self._fields
+
+    def __getstate__(self):
+        # Les champs ne sont pas sérialisés (processus de travail de solve_many) :
+        # la copie repart d'un cache vide avec le même budget
+        return {"max_bytes": self.max_bytes}
+
+    def __setstate__(self, state):
+        self.__init__(state["max_bytes"])
+
+    def reset_stats(self):
+        """Remet à zéro les compteurs."""
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+    def stats(self):
+        """
+        Retourne les compteurs du cache.
+
+        Returns:
+            dict: hits, misses, evictions, invalidations, fields, nbytes
+        """
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "invalidations": self.invalidations,
+            "fields": len(self._fields),
+            "nbytes": self.nbytes,
+        }
+
+    def clear(self):
+        """Vide le cache."""
+        self._fields.clear()
+        self.nbytes = 0
+
+    def get_field(self, maze, goal):
+        """
+        Retourne le champ de coût restant vers goal, calculé si besoin.
+
+        Args:
+            maze (Maze): Labyrinthe dont le graphe compilé est utilisé
+            goal (tuple): Cellule d'arrivée (row, col)
+
+        Returns:
+            np.ndarray: Coût restant de chaque cellule (float64, inf si inaccessible),
+                        indexé par identifiant plat
+        """
+        if self._version != maze.version:
+            if self._fields:
+                self.invalidations += 1
+            self.clear()
+            self._version = maze.version
+
+        goal = tuple(goal)
+        field = self._fields.get(goal)
+        if field is not None:
+            self._fields.move_to_end(goal)
+            self.hits += 1
+            return field
+
+        self.misses += 1
+        field = compute_cost_to_go(maze.get_graph(), maze.rewards, maze.graph_directions(),
+                                   maze.cell_id(*goal))
+        if field.nbytes <= self.max_bytes:
+            while self.nbytes + field.nbytes > self.max_bytes:
+                _, evicted = self._fields.popitem(last=False)
+                self.nbytes -= evicted.nbytes
+                self.evictions += 1
+            self._fields[goal] = field
+            self.nbytes += field.nbytes
+        return field
+
+
+def compute_cost_to_go(graph, rewards, directions, goal):
+    """
+    Dijkstra inverse : coût du meilleur chemin de chaque cellule vers goal.
+
+    Args:
+        graph (GridGraph): Graphe compilé (avec edge_directions)
+        rewards (np.ndarray): Matrice de récompense
+        directions (sequence): Tuples (delta_row, delta_col, multiplicateur_coût)
+        goal (int): Identifiant plat de l'arrivée
+
+    Returns:
+        np.ndarray: Coût restant (float64, inf pour les cellules sans chemin)
+    """
+    return dijkstra_distances(graph, reverse_edge_weights(graph, rewards, directions), goal)
+
+
+def reverse_edge_weights(graph, rewards, directions):
+    """
+    Coût de l'arête inverse (voisin -> v) pour chaque arête v -> voisin du graphe.
+
+    L'arête u -> v coûte multiplicateur * (-rewards[v]). Le voisinage étant
+    symétrique, les prédécesseurs de v sont ses voisins dans le graphe ; l'arête
+    v -> u du graphe compilé donne la direction, donc le multiplicateur.
+
+    Args:
+        graph (GridGraph): Graphe compilé (avec edge_directions)
+        rewards (np.ndarray): Matrice de récompense
+        directions (sequence): Tuples (delta_row, delta_col, multiplicateur_coût)
+
+    Returns:
+        np.ndarray: Poids alignés sur graph.indices (float64)
+    """
+    multipliers = np.array([mult for _, _, mult in directions], dtype=np.float64)
+    degrees = np.diff(graph.indptr)
+    step_cost = -np.asarray(rewards, dtype=np.float64).reshape(-1)
+    return multipliers[graph.edge_directions] * np.repeat(step_cost, degrees)
+
+
+def dijkstra_distances(graph, weights, source):
+    """
+    Dijkstra sur le graphe compilé avec des poids d'arête donnés.
+
+    Args:
+        graph (GridGraph): Graphe compilé
+        weights (np.ndarray): Poids alignés sur graph.indices
+        source (int): Identifiant plat de la source
+
+    Returns:
+        np.ndarray: Distance de la source à chaque cellule (float64, inf si inaccessible)
+    """
+    weights = np.asarray(weights, dtype=np.float64).tolist()
+    costs = np.full(graph.num_nodes, np.inf, dtype=np.float64)
+    cost_view = memoryview(costs)
+    indptr = graph.indptr.tolist()
+    indices = graph.indices.tolist()
+    closed = bytearray(graph.num_nodes)
+
+    cost_view[source] = 0.0
+    open_set = [(0.0, source)]
+    while open_set:
+        cost, node = heapq.heappop(open_set)
+        if closed[node]:
+            continue
+        closed[node] = 1
+        for edge in range(indptr[node], indptr[node + 1]):
+            neighbor = indices[edge]
+            if closed[neighbor]:
+                continue
+            new_cost = cost + weights[edge]
+            if new_cost < cost_view[neighbor]:
+                cost_view[neighbor] = new_cost
+                heapq.heappush(open_set, (new_cost, neighbor))
+    return costs
+
+
+def descend(graph, costs, start, goal):
+    """
+    Lit un chemin par descente gloutonne sur un champ de coût restant.
+
+    Args:
+        graph (GridGraph): Graphe compilé
+        costs (np.ndarray): Champ de coût restant vers goal
+        start (int): Identifiant plat du départ
+        goal (int): Identifiant plat de l'arrivée
+
+    Returns:
+        list ou None: Identifiants du départ à l'arrivée, None si l'arrivée est
+                      inaccessible, NotImplemented si la descente échoue (coûts
+                      négatifs : le champ n'est alors pas exact)
+    """
+    if costs[start] == np.inf:
+        return None
+    cost_view = memoryview(costs)
+    indptr = graph.indptr
+    indices = graph.indices
+    weights = graph.weights
+    path = [start]
+    on_path = {start}
+    node = start
+    while node != goal:
+        begin = int(indptr[node])
+        end = int(indptr[node + 1])
+        best = -1
+        best_cost = np.inf
+        for neighbor, weight in zip(indices[begin:end].tolist(), weights[begin:end].tolist()):
+            total = weight + cost_view[neighbor]
+            if total < best_cost and neighbor not in on_path:
+                best = neighbor
+                best_cost = total
+        if best < 0:
+            return NotImplemented
+        node = best
+        path.append(node)
+        on_path.add(node)
+    return path
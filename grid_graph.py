@@ -0,0 +1,201 @@
+"""
+Compilation de la grille d'un labyrinthe en graphe CSR (Compressed Sparse Row).
+
+Chaque cellule (row, col) reçoit un identifiant entier plat ``row * width + col``.
+Les voisins accessibles de chaque cellule sont stockés de manière contiguë dans
+``indices`` (int32), avec le coût de l'arête correspondante dans ``weights``.
+Les voisins de la cellule ``u`` sont ``indices[indptr[u]:indptr[u + 1]]``.
+Les boucles des solveurs parcourent ces tableaux arête par arête à travers
+``adjacency()`` (vues mémoire mises en cache), sans copie par cellule développée.
+
+La compilation est vectorisée avec NumPy, par tranches de lignes pour borner la
+mémoire temporaire sur les très grandes cartes : elle est faite une seule fois,
+puis réutilisée par tous les solveurs tant que la grille ne change pas. Le
+graphe occupe 8 octets par cellule (indptr) et, par arête, 4 octets (indices),
+1 octet (edge_directions) et 8 ou 4 octets (weights, float64 ou float32).
+"""
+
+import numpy as np
+
+
+# Cellules compilées par tranche (borne la mémoire des tableaux temporaires)
+CHUNK_CELLS = 1 << 18
+
+
+class GridGraph:
+    """
+    Graphe d'adjacence compilé à partir d'une grille d'obstacles et de récompenses.
+    """
+
+    def __init__(self, height, width, indptr, indices, weights, edge_directions=None):
+        """
+        Initialise le graphe compilé.
+
+        Args:
+            height (int): Nombre de lignes de la grille
+            width (int): Nombre de colonnes de la grille
+            indptr (np.ndarray): Décalages CSR (int64, taille height * width + 1)
+            indices (np.ndarray): Identifiants des voisins (int32)
+            weights (np.ndarray): Coût de chaque arête (float64, ou float32 en
+                                  stockage compact)
+            edge_directions (np.ndarray, optional): Indice de la direction de chaque
+                                                    arête (int8)
+        """
+        self.height = height
+        self.width = width
+        self.num_nodes = height * width
+        self.indptr = indptr
+        self.indices = indices
+        self.weights = weights
+        self.edge_directions = edge_directions
+        self._adjacency = None
+
+    def node_id(self, row, col):
+        """Retourne l'identifiant plat d'une cellule."""
+        return row * self.width + col
+
+    def node_coords(self, node):
+        """Retourne les coordonnées (row, col) d'un identifiant plat."""
+        return divmod(int(node), self.width)
+
+    def adjacency(self):
+        """
+        Retourne les tableaux CSR sous forme de vues mémoire (créées une fois).
+
+        L'indexation d'une vue rend directement un int ou un float Python : les
+        boucles des solveurs parcourent les arêtes d'une cellule par
+        ``for edge in range(indptr[u], indptr[u + 1])`` sans allouer de listes.
+
+        Returns:
+            tuple: (indptr, indices, weights) en memoryview
+        """
+        if self._adjacency is None:
+            self._adjacency = (memoryview(self.indptr), memoryview(self.indices),
+                               memoryview(self.weights))
+        return self._adjacency
+
+    def neighbors(self, node):
+        """
+        Retourne les voisins d'un noeud et le coût des arêtes associées.
+
+        Args:
+            node (int): Identifiant plat du noeud
+
+        Returns:
+            zip: Couples (voisin, coût) dans l'ordre des directions du labyrinthe
+        """
+        begin = self.indptr[node]
+        end = self.indptr[node + 1]
+        return zip(self.indices[begin:end].tolist(), self.weights[begin:end].tolist())
+
+    @property
+    def nbytes(self):
+        """Mémoire occupée par les tableaux CSR (octets)."""
+        arrays = (self.indptr, self.indices, self.weights, self.edge_directions)
+        return sum(int(array.nbytes) for array in arrays if array is not None)
+
+    def __len__(self):
+        return self.num_nodes
+
+
+def compile_grid_graph(grid, rewards, directions, weight_dtype=np.float64):
+    """
+    Compile une grille en graphe CSR.
+
+    Une arête u -> v existe si v est dans la grille et franchissable, comme dans
+    ``Maze.get_neighbors``. Son coût vaut ``multiplicateur * (-rewards[v])`` :
+    entrer dans une cellule coûte l'opposé de sa récompense.
+
+    La grille est traitée par tranches de lignes (CHUNK_CELLS cellules) : les
+    tableaux temporaires (cellules x directions) restent bornés quelle que soit
+    la taille de la carte, et seules les lignes de la tranche sont lues (une
+    grille PackedGrid n'est jamais décompactée en entier). Une première passe
+    compte les arêtes, la seconde remplit les tableaux CSR alloués une fois.
+
+    Args:
+        grid (np.ndarray | PackedGrid): Grille des obstacles (0 = libre, 1 = obstacle)
+        rewards (np.ndarray): Matrice de récompense
+        directions (sequence): Tuples (delta_row, delta_col, multiplicateur_coût),
+                               dans l'ordre d'exploration des voisins
+        weight_dtype (np.dtype): Type des coûts d'arête (float32 pour les
+                                 stockages compacts, voir storage.py)
+
+    Returns:
+        GridGraph: Le graphe compilé
+    """
+    height, width = grid.shape
+    num_nodes = height * width
+    chunk_rows = max(1, CHUNK_CELLS // max(width, 1))
+
+    # Première passe : degré de chaque cellule
+    indptr = np.zeros(num_nodes + 1, dtype=np.int64)
+    for top in range(0, height, chunk_rows):
+        bottom = min(height, top + chunk_rows)
+        valid, _, _ = _compile_rows(grid, rewards, directions, top, bottom, None)
+        indptr[top * width + 1:bottom * width + 1] = valid.sum(axis=1)
+    np.cumsum(indptr, out=indptr)
+
+    num_edges = int(indptr[-1])
+    indices = np.empty(num_edges, dtype=np.int32)
+    weights = np.empty(num_edges, dtype=weight_dtype)
+    edge_directions = np.empty(num_edges, dtype=np.int8)
+    direction_ids = np.arange(len(directions), dtype=np.int8)
+    for top in range(0, height, chunk_rows):
+        bottom = min(height, top + chunk_rows)
+        valid, targets, costs = _compile_rows(grid, rewards, directions, top, bottom, weight_dtype)
+        begin = indptr[top * width]
+        end = indptr[bottom * width]
+        # Le masque booléen parcourt les lignes dans l'ordre : l'ordre des directions est conservé
+        indices[begin:end] = targets[valid]
+        weights[begin:end] = costs[valid]
+        edge_directions[begin:end] = np.broadcast_to(direction_ids, valid.shape)[valid]
+
+    return GridGraph(height, width, indptr, indices, weights, edge_directions)
+
+
+def _compile_rows(grid, rewards, directions, top, bottom, weight_dtype):
+    """
+    Arêtes sortant des lignes [top, bottom) de la grille.
+
+    Returns:
+        tuple: (valid, targets, costs), tableaux (cellules de la tranche, directions) ;
+               targets et costs valent None si weight_dtype est None (comptage seul)
+    """
+    height, width = grid.shape
+    num_dirs = len(directions)
+    reach = max((abs(d_row) for d_row, _, _ in directions), default=0)
+    # Lignes lues : la tranche et ses voisines
+    low = max(0, top - reach)
+    high = min(height, bottom + reach)
+    passable = np.asarray(grid[low:high, :]) == 0
+    rows = bottom - top
+
+    valid = np.zeros((rows, width, num_dirs), dtype=bool)
+    if weight_dtype is not None:
+        step_cost = -np.asarray(rewards[low:high, :], dtype=float)
+        targets = np.zeros((rows, width, num_dirs), dtype=np.int32)
+        costs = np.zeros((rows, width, num_dirs), dtype=weight_dtype)
+
+    for k, (d_row, d_col, cost_mult) in enumerate(directions):
+        # Tranches source/destination pour le décalage (d_row, d_col)
+        first = max(top, -d_row)
+        last = min(bottom, height - d_row)
+        if first >= last:
+            continue
+        src_rows = slice(first - top, last - top)
+        dst_rows = slice(first + d_row - low, last + d_row - low)
+        src_cols = slice(max(0, -d_col), width - max(0, d_col))
+        dst_cols = slice(max(0, d_col), width - max(0, -d_col))
+
+        valid[src_rows, src_cols, k] = passable[dst_rows, dst_cols]
+        if weight_dtype is not None:
+            target_rows = np.arange(first + d_row, last + d_row, dtype=np.int64)[:, None]
+            target_cols = np.arange(dst_cols.start, dst_cols.stop, dtype=np.int64)[None, :]
+            targets[src_rows, src_cols, k] = target_rows * width + target_cols
+            costs[src_rows, src_cols, k] = cost_mult * step_cost[dst_rows, dst_cols]
+
+    valid = valid.reshape(rows * width, num_dirs)
+    if weight_dtype is None:
+        return valid, None, None
+    return (valid, targets.reshape(rows * width, num_dirs),
+            costs.reshape(rows * width, num_dirs))
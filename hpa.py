@@ -0,0 +1,587 @@
+"""
+Recherche hiérarchique HPA* (Botea, Müller et Schaeffer, 2004) pour les très grandes grilles.
+
+La grille est découpée en clusters carrés de cluster_size cellules de côté :
+
+- Entrées : sur chaque frontière entre deux clusters voisins (côtés et coins),
+  les passages franchissables forment des segments. Chaque segment donne une
+  transition (au milieu) ou deux (aux extrémités s'il est long). Les cellules de
+  transition sont les noeuds du graphe abstrait.
+- Distances internes : dans chaque cluster, un Dijkstra restreint au cluster
+  relie les noeuds de transition entre eux (arêtes intra-cluster) ; les arêtes
+  inter-cluster sont les déplacements d'une cellule de transition à sa voisine.
+- Requête : le départ et l'arrivée sont reliés aux transitions de leur cluster,
+  A* parcourt le petit graphe abstrait, puis chaque arête abstraite est raffinée
+  en cellules à partir des parents gardés par les Dijkstra internes.
+
+Les clusters et les frontières sont construits à la demande puis gardés en
+cache : une requête ne construit que les clusters de la zone traversée. Les
+modifications de la grille (journal Maze.changes_since) ne reconstruisent que
+les clusters touchés (celui de la cellule et ses voisins si elle est au bord).
+
+Le chemin abstrait est quasi optimal (quelques pour cent au-dessus de l'optimum).
+Avec optimal=True, une passe de raffinement A* sur la grille, bornée par le coût
+du chemin abstrait, rend le chemin optimal.
+
+Comme D* Lite, HPA* exige des coûts positifs ou nuls (pas de cellules bonus) ;
+le coût d'entrée dans l'arrivée est remplacé par le plus petit coût de la grille.
+"""
+
+import heapq
+
+import numpy as np
+
+
+INF = float("inf")
+
+# Taille de segment à partir de laquelle une entrée reçoit deux transitions
+LONG_ENTRANCE = 6
+
+# Nature des arêtes du graphe abstrait (pour le raffinement)
+EDGE_INTRA = 0
+EDGE_INTER = 1
+EDGE_START = 2
+EDGE_GOAL = 3
+
+
+class _Cluster:
+    """Données d'un cluster : noeuds de transition, arêtes abstraites et parents internes."""
+
+    __slots__ = ("nodes", "edges", "parents")
+
+    def __init__(self, nodes, edges, parents):
+        self.nodes = nodes
+        self.edges = edges
+        self.parents = parents
+
+
+class HierarchicalPlanner:
+    """
+    Planificateur HPA* lié à un labyrinthe.
+    """
+
+    def __init__(self, maze, cluster_size=16):
+        """
+        Initialise le planificateur (les clusters sont construits à la demande).
+
+        Args:
+            maze (Maze): Labyrinthe (Maze ou DiagonalMaze)
+            cluster_size (int): Côté des clusters en cellules
+
+        Raises:
+            ValueError: Si une cellule franchissable (hors arrivée) a un coût négatif
+        """
+        if cluster_size < 2:
+            raise ValueError("cluster_size doit être au moins 2")
+        self.maze = maze
+        self.cluster_size = cluster_size
+        self._offsets = [(d_row, d_col, mult) for d_row, d_col, mult in maze.graph_directions()]
+        self.clusters_built = 0
+        self.clusters_invalidated = 0
+        self.abstract_expansions = 0
+        self.refinement_expansions = 0
+        self._reset(tuple(maze.goal))
+
+    def _reset(self, goal):
+        """Oublie tous les clusters et relit les coûts de la grille."""
+        maze = self.maze
+        self.width = maze.width
+        self.height = maze.height
+        self._goal = goal
+        self._version = maze.version
+        self._clusters = {}
+        self._borders = {}
+
+        free = maze.grid == 0
+        free[self._goal] = False
+        costs = -maze.rewards[free]
+        if costs.size and costs.min() < 0:
+            raise ValueError("HPA* exige des coûts de déplacement positifs ou nuls "
+                             "(cellules bonus non supportées)")
+        self._min_cost = float(costs.min()) if costs.size else 1.0
+
+        if len(self._offsets) == 8:
+            diagonal_mult = max(mult for _, _, mult in self._offsets)
+            self._straight_h = min(1.0, diagonal_mult)
+            self._diagonal_h = min(2.0, diagonal_mult)
+        else:
+            self._straight_h = 1.0
+            self._diagonal_h = None
+
+    def _sync(self, goal):
+        """Prend en compte les modifications de la grille et le changement d'arrivée."""
+        maze = self.maze
+        changes = maze.changes_since(self._version)
+        if changes is None or (maze.width, maze.height) != (self.width, self.height):
+            self._reset(goal)
+            changes = []
+        for row, col in set(changes):
+            if maze.grid[row, col] == 0 and (row, col) != self._goal:
+                cost = -float(maze.rewards[row, col])
+                if cost < 0:
+                    raise ValueError(f"HPA* exige des coûts positifs ou nuls (cellule {(row, col)})")
+                if cost < self._min_cost:
+                    # Le coût d'entrée dans l'arrivée suit le plus petit coût
+                    self._min_cost = cost
+                    self._invalidate(*self._goal)
+            self._invalidate(row, col)
+
+        if goal != self._goal:
+            old_goal = self._goal
+            self._goal = goal
+            for row, col in (old_goal, goal):
+                self._invalidate(row, col)
+            if maze.grid[old_goal] == 0 and maze.rewards[old_goal] > 0:
+                # L'ancienne arrivée redevient une cellule ordinaire : son coût est vérifié
+                self._reset(goal)
+        self._version = maze.version
+
+    def _invalidate(self, row, col):
+        """Supprime les clusters et frontières qui dépendent d'une cellule."""
+        size = self.cluster_size
+        key = (row // size, col // size)
+        touched = {key}
+        for d_row in (-1, 0, 1):
+            for d_col in (-1, 0, 1):
+                r = row + d_row
+                c = col + d_col
+                if 0 <= r < self.height and 0 <= c < self.width:
+                    touched.add((r // size, c // size))
+        for other in touched:
+            if self._clusters.pop(other, None) is not None:
+                self.clusters_invalidated += 1
+            if other != key:
+                self._borders.get(min(key, other), {}).pop(max(key, other), None)
+
+    def _bounds(self, key):
+        """Bornes (top, left, bottom, right) d'un cluster, bornes basses exclues."""
+        top = key[0] * self.cluster_size
+        left = key[1] * self.cluster_size
+        return top, left, min(top + self.cluster_size, self.height), min(left + self.cluster_size, self.width)
+
+    def _cluster_key(self, node):
+        row, col = divmod(node, self.width)
+        return row // self.cluster_size, col // self.cluster_size
+
+    def _cell_cost(self, node):
+        """Coût d'entrée dans une cellule (plus petit coût pour l'arrivée)."""
+        row, col = divmod(node, self.width)
+        if (row, col) == self._goal:
+            return self._min_cost
+        return -float(self.maze.rewards[row, col])
+
+    def _local_adjacency(self, bounds, reverse=False):
+        """
+        Listes d'adjacence d'un cluster, indexées localement.
+
+        Args:
+            bounds (tuple): Bornes du cluster
+            reverse (bool): Si True, le coût de l'arête u -> v est celui de
+                            l'arête v -> u (recherche vers une cible)
+
+        Returns:
+            list: adjacency[u] = liste de couples (v, coût)
+        """
+        top, left, bottom, right = bounds
+        height = bottom - top
+        width = right - left
+        free = (self.maze.grid[top:bottom, left:right] == 0).ravel().tolist()
+        costs = (-self.maze.rewards[top:bottom, left:right].astype(np.float64)).ravel()
+        goal_row, goal_col = self._goal
+        if top <= goal_row < bottom and left <= goal_col < right:
+            costs[(goal_row - top) * width + goal_col - left] = self._min_cost
+        costs = costs.tolist()
+
+        adjacency = [[] for _ in range(height * width)]
+        for node in range(height * width):
+            if not free[node]:
+                continue
+            row, col = divmod(node, width)
+            edges = adjacency[node]
+            for d_row, d_col, mult in self._offsets:
+                r = row + d_row
+                c = col + d_col
+                if 0 <= r < height and 0 <= c < width:
+                    neighbor = r * width + c
+                    if free[neighbor]:
+                        edges.append((neighbor, mult * (costs[node] if reverse else costs[neighbor])))
+        return adjacency
+
+    @staticmethod
+    def _local_dijkstra(adjacency, source):
+        """
+        Dijkstra restreint à un cluster.
+
+        Args:
+            adjacency (list): Listes d'adjacence locales (voir _local_adjacency)
+            source (int): Indice local de la source
+
+        Returns:
+            tuple: (distances, parents) indexés localement ; avec une adjacence
+                   inversée, parents[u] est le pas suivant de u vers la source
+        """
+        distances = [INF] * len(adjacency)
+        parents = [-1] * len(adjacency)
+        distances[source] = 0.0
+        open_set = [(0.0, source)]
+        while open_set:
+            distance, node = heapq.heappop(open_set)
+            if distance > distances[node]:
+                continue
+            for neighbor, weight in adjacency[node]:
+                new_distance = distance + weight
+                if new_distance < distances[neighbor]:
+                    distances[neighbor] = new_distance
+                    parents[neighbor] = node
+                    heapq.heappush(open_set, (new_distance, neighbor))
+        return distances, parents
+
+    def _local_index(self, bounds, node):
+        row, col = divmod(node, self.width)
+        return (row - bounds[0]) * (bounds[3] - bounds[1]) + col - bounds[1]
+
+    def _global_id(self, bounds, local):
+        row, col = divmod(local, bounds[3] - bounds[1])
+        return (bounds[0] + row) * self.width + bounds[1] + col
+
+    def _border(self, key, other):
+        """
+        Transitions entre deux clusters voisins, vues depuis key.
+
+        Returns:
+            list: Déplacements (cellule de key, cellule de other, multiplicateur)
+        """
+        first, second = min(key, other), max(key, other)
+        by_second = self._borders.setdefault(first, {})
+        moves = by_second.get(second)
+        if moves is None:
+            moves = self._compute_border(first, second)
+            by_second[second] = moves
+        if key == first:
+            return moves
+        return [(b, a, mult) for a, b, mult in moves]
+
+    def _compute_border(self, first, second):
+        """Sélectionne les transitions représentatives de chaque segment de frontière."""
+        grid = self.maze.grid
+        width = self.width
+        top, left, bottom, right = self._bounds(first)
+        o_top, o_left, o_bottom, o_right = self._bounds(second)
+        # Cellules de first à distance 1 de second
+        rows = range(max(top, o_top - 1), min(bottom, o_bottom + 1))
+        cols = range(max(left, o_left - 1), min(right, o_right + 1))
+
+        moves = []
+        for row in rows:
+            for col in cols:
+                if grid[row, col] != 0:
+                    continue
+                for d_row, d_col, mult in self._offsets:
+                    r = row + d_row
+                    c = col + d_col
+                    if o_top <= r < o_bottom and o_left <= c < o_right and grid[r, c] == 0:
+                        moves.append((row + col, r + c, row * width + col, r * width + c, mult))
+        moves.sort()
+
+        # Segments : cellules consécutives des deux côtés (donc reliées dans chaque cluster)
+        selected = []
+        run = []
+        for move in moves:
+            if run and (move[0] - run[-1][0] > 1 or abs(move[1] - run[-1][1]) > 1):
+                selected.extend(self._representatives(run))
+                run = []
+            run.append(move)
+        if run:
+            selected.extend(self._representatives(run))
+        return [(a, b, mult) for _, _, a, b, mult in selected]
+
+    @staticmethod
+    def _representatives(run):
+        """Une transition au milieu d'un segment court, deux aux extrémités d'un long."""
+        if run[-1][0] - run[0][0] + 1 < LONG_ENTRANCE:
+            return [run[len(run) // 2]]
+        return [run[0], run[-1]]
+
+    def _cluster(self, key):
+        """Retourne les données d'un cluster, construites si besoin."""
+        cluster = self._clusters.get(key)
+        if cluster is None:
+            cluster = self._build_cluster(key)
+            self._clusters[key] = cluster
+            self.clusters_built += 1
+        return cluster
+
+    def _build_cluster(self, key):
+        """Calcule les transitions d'un cluster et les distances internes entre elles."""
+        rows = -(-self.height // self.cluster_size)
+        cols = -(-self.width // self.cluster_size)
+        edges = {}
+        for d_row in (-1, 0, 1):
+            for d_col in (-1, 0, 1):
+                other = (key[0] + d_row, key[1] + d_col)
+                if other == key or not (0 <= other[0] < rows and 0 <= other[1] < cols):
+                    continue
+                for a, b, mult in self._border(key, other):
+                    edges.setdefault(a, []).append((b, mult * self._cell_cost(b), EDGE_INTER))
+
+        nodes = sorted(edges)
+        bounds = self._bounds(key)
+        adjacency = self._local_adjacency(bounds)
+        parents = {}
+        for node in nodes:
+            distances, node_parents = self._local_dijkstra(adjacency, self._local_index(bounds, node))
+            parents[node] = node_parents
+            for other in nodes:
+                distance = distances[self._local_index(bounds, other)]
+                if other != node and distance < INF:
+                    edges[node].append((other, distance, EDGE_INTRA))
+        return _Cluster(nodes, edges, parents)
+
+    def precompute(self):
+        """Construit tous les clusters (sinon ils sont construits à la demande)."""
+        size = self.cluster_size
+        for row in range(0, self.height, size):
+            for col in range(0, self.width, size):
+                self._cluster((row // size, col // size))
+
+    def _heuristic(self, node, goal):
+        row, col = divmod(node, self.width)
+        d_row = abs(row - goal[0])
+        d_col = abs(col - goal[1])
+        if self._diagonal_h is None:
+            return self._min_cost * (d_row + d_col)
+        if d_row < d_col:
+            d_row, d_col = d_col, d_row
+        return self._min_cost * (self._diagonal_h * d_col + self._straight_h * (d_row - d_col))
+
+    def solve(self, start=None, goal=None, optimal=False, stats=None):
+        """
+        Cherche un chemin par HPA*.
+
+        Args:
+            start (tuple, optional): Départ (par défaut maze.start)
+            goal (tuple, optional): Arrivée (par défaut maze.goal)
+            optimal (bool): Si False, chemin abstrait raffiné (quasi optimal) ;
+                            si True, passe A* bornée par le coût du chemin abstrait
+                            (optimal, plus coûteux)
+            stats (SearchStats, optional): Instance remplie avec les noeuds abstraits
+                et les cellules développés (expansions) et les temps ; la préparation
+                comprend la reconstruction des clusters modifiés. Les compteurs de la
+                file ne sont pas mesurés (None) ; le coût n'est connu que sans
+                raffinement optimal.
+
+        Returns:
+            list ou None: Chemin (liste de cellules), None s'il n'existe pas
+
+        Raises:
+            ValueError: Si la grille contient des coûts négatifs
+        """
+        if stats is not None:
+            stats.reset("hpa_optimal" if optimal else "hpa")
+        maze = self.maze
+        start = tuple(maze.start if start is None else start)
+        goal = tuple(maze.goal if goal is None else goal)
+        self._sync(goal)
+        if maze.grid[start] != 0 or maze.grid[goal] != 0:
+            return self._finish_stats(stats, None)
+        if start == goal:
+            return self._finish_stats(stats, [start], 0.0)
+
+        if stats is not None:
+            stats.lap("setup")
+            expansions = self.abstract_expansions + self.refinement_expansions
+        abstract = self._abstract_search(start, goal)
+        if abstract is not None:
+            path, cost = abstract
+            if optimal:
+                path = self._bounded_astar(start, goal, cost)
+                cost = None
+        if stats is not None:
+            stats.end_search(self.abstract_expansions + self.refinement_expansions - expansions,
+                             None, None, None)
+        if abstract is None:
+            return self._finish_stats(stats, None)
+        return self._finish_stats(stats, [divmod(node, self.width) for node in path], cost)
+
+    @staticmethod
+    def _finish_stats(stats, path, cost=None):
+        """Complète stats (s'il est fourni) et retourne le chemin."""
+        if stats is not None:
+            stats.finish(path, cost)
+        return path
+
+    def _abstract_search(self, start, goal):
+        """
+        A* sur le graphe abstrait, puis raffinement en cellules.
+
+        Returns:
+            tuple ou None: (identifiants des cellules du chemin, coût), None sans chemin
+        """
+        source = start[0] * self.width + start[1]
+        target = goal[0] * self.width + goal[1]
+        start_key = self._cluster_key(source)
+        goal_key = self._cluster_key(target)
+        start_cluster = self._cluster(start_key)
+        goal_cluster = self._cluster(goal_key)
+        start_bounds = self._bounds(start_key)
+        goal_bounds = self._bounds(goal_key)
+
+        start_distances, start_parents = self._local_dijkstra(
+            self._local_adjacency(start_bounds), self._local_index(start_bounds, source))
+        goal_distances, goal_next = self._local_dijkstra(
+            self._local_adjacency(goal_bounds, reverse=True), self._local_index(goal_bounds, target))
+
+        start_edges = []
+        for node in start_cluster.nodes:
+            distance = start_distances[self._local_index(start_bounds, node)]
+            if distance < INF and node != source:
+                start_edges.append((node, distance, EDGE_START))
+        if start_key == goal_key:
+            distance = start_distances[self._local_index(goal_bounds, target)]
+            if distance < INF:
+                start_edges.append((target, distance, EDGE_START))
+        goal_edges = {}
+        for node in goal_cluster.nodes:
+            distance = goal_distances[self._local_index(goal_bounds, node)]
+            if distance < INF:
+                goal_edges[node] = distance
+
+        g_cost = {source: 0.0}
+        came_from = {}
+        closed = set()
+        open_set = [(self._heuristic(source, goal), 0.0, source)]
+        while open_set:
+            _, cost, node = heapq.heappop(open_set)
+            if node in closed:
+                continue
+            if node == target:
+                break
+            closed.add(node)
+            self.abstract_expansions += 1
+
+            edges = []
+            if node == source:
+                edges.extend(start_edges)
+            cluster = self._cluster(self._cluster_key(node))
+            edges.extend(cluster.edges.get(node, ()))
+            if node in goal_edges and node != target:
+                edges.append((target, goal_edges[node], EDGE_GOAL))
+            for neighbor, weight, kind in edges:
+                if neighbor in closed:
+                    continue
+                new_cost = cost + weight
+                if new_cost < g_cost.get(neighbor, INF):
+                    g_cost[neighbor] = new_cost
+                    came_from[neighbor] = (node, kind)
+                    heapq.heappush(open_set,
+                                   (new_cost + self._heuristic(neighbor, goal), new_cost, neighbor))
+        else:
+            return None
+
+        # Raffinement : chaque arête abstraite devient une suite de cellules
+        segments = []
+        node = target
+        while node != source:
+            previous, kind = came_from[node]
+            if kind == EDGE_INTER:
+                segment = [node]
+            elif kind == EDGE_INTRA:
+                bounds = self._bounds(self._cluster_key(previous))
+                segment = self._trace(bounds, self._cluster(self._cluster_key(previous)).parents[previous],
+                                      node)
+            elif kind == EDGE_START:
+                segment = self._trace(start_bounds, start_parents, node)
+            else:
+                segment = self._follow(goal_bounds, goal_next, previous)
+            segments.append(segment)
+            node = previous
+        path = [source]
+        for segment in reversed(segments):
+            path.extend(segment)
+        return path, g_cost[target]
+
+    def _trace(self, bounds, parents, node):
+        """Cellules de la source (exclue) jusqu'à node en remontant les parents locaux."""
+        local = self._local_index(bounds, node)
+        segment = []
+        while parents[local] >= 0:
+            segment.append(self._global_id(bounds, local))
+            local = parents[local]
+        segment.reverse()
+        return segment
+
+    def _follow(self, bounds, next_hops, node):
+        """Cellules de node (exclu) jusqu'à l'arrivée en suivant les pas suivants."""
+        local = next_hops[self._local_index(bounds, node)]
+        segment = []
+        while local >= 0:
+            segment.append(self._global_id(bounds, local))
+            local = next_hops[local]
+        return segment
+
+    def _bounded_astar(self, start, goal, upper_bound):
+        """
+        A* sur la grille complète, limité aux cellules de f <= upper_bound.
+
+        Le coût du chemin abstrait borne le coût optimal : les cellules au-delà
+        ne peuvent pas être sur un chemin optimal et ne sont jamais ajoutées.
+        """
+        maze = self.maze
+        width = self.width
+        height = self.height
+        free = memoryview(np.ascontiguousarray(maze.grid == 0, dtype=np.uint8).reshape(-1))
+        rewards = memoryview(np.ascontiguousarray(maze.rewards, dtype=np.float64).reshape(-1))
+        source = start[0] * width + start[1]
+        target = goal[0] * width + goal[1]
+        bound = upper_bound + 1e-9 * max(1.0, abs(upper_bound))
+
+        g_cost = {source: 0.0}
+        came_from = {}
+        closed = set()
+        open_set = [(self._heuristic(source, goal), 0.0, source)]
+        while open_set:
+            _, cost, node = heapq.heappop(open_set)
+            if node in closed:
+                continue
+            if node == target:
+                break
+            closed.add(node)
+            self.refinement_expansions += 1
+            row, col = divmod(node, width)
+            for d_row, d_col, mult in self._offsets:
+                r = row + d_row
+                c = col + d_col
+                if 0 <= r < height and 0 <= c < width:
+                    neighbor = r * width + c
+                    if not free[neighbor] or neighbor in closed:
+                        continue
+                    step = self._min_cost if neighbor == target else -rewards[neighbor]
+                    new_cost = cost + mult * step
+                    priority = new_cost + self._heuristic(neighbor, goal)
+                    if priority <= bound and new_cost < g_cost.get(neighbor, INF):
+                        g_cost[neighbor] = new_cost
+                        came_from[neighbor] = node
+                        heapq.heappush(open_set, (priority, new_cost, neighbor))
+
+        path = [target]
+        while path[-1] != source:
+            path.append(came_from[path[-1]])
+        path.reverse()
+        return path
+
+    def stats(self):
+        """
+        Retourne les compteurs du planificateur.
+
+        Returns:
+            dict: clusters en cache / construits / invalidés, noeuds abstraits,
+                  cellules développées par le raffinement optimal
+        """
+        return {
+            "clusters_cached": len(self._clusters),
+            "clusters_built": self.clusters_built,
+            "clusters_invalidated": self.clusters_invalidated,
+            "abstract_nodes": sum(len(cluster.nodes) for cluster in self._clusters.values()),
+            "abstract_expansions": self.abstract_expansions,
+            "refinement_expansions": self.refinement_expansions,
+        }
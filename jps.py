@@ -0,0 +1,354 @@
+"""
+Jump Point Search (JPS+) pour les grilles à coût uniforme.
+
+Sur une grille où toutes les cellules coûtent la même chose, A* explore un grand
+nombre de chemins symétriques. JPS ne développe que des « points de saut » :
+les cellules où un chemin optimal peut devoir changer de direction (voisins
+forcés par un obstacle). JPS+ précalcule, pour chaque cellule et chaque
+direction, la distance jusqu'au prochain point de saut (valeur positive) ou
+jusqu'au mur (valeur négative ou nulle). La recherche saute alors directement
+d'un point de saut au suivant.
+
+Deux modèles de déplacement sont supportés, comme dans Maze et DiagonalMaze :
+
+- 4 directions : les déplacements horizontaux sont des sauts « droits » ; les
+  déplacements verticaux jouent le rôle des diagonales et s'arrêtent dès qu'un
+  saut horizontal depuis la cellule trouve un point de saut.
+- 8 directions (coins coupés autorisés, comme DiagonalMaze) : règles de JPS de
+  Harabor et Grastien, avec un coût diagonal compris entre 1 et 2.
+
+Les tables sont calculées par balayages NumPy vectorisés (une boucle Python par
+ligne ou par colonne, pas par cellule).
+"""
+
+import heapq
+
+import numpy as np
+
+
+# Ordre des directions identique à Maze.DIRECTIONS / DiagonalMaze.graph_directions
+DIRECTIONS_4 = ((-1, 0), (1, 0), (0, -1), (0, 1))
+DIRECTIONS_8 = ((-1, 0), (1, 0), (0, -1), (0, 1), (-1, -1), (-1, 1), (1, -1), (1, 1))
+
+
+class JumpTables:
+    """
+    Tables de distances de saut JPS+ pour une grille d'obstacles.
+    """
+
+    def __init__(self, grid, diagonal):
+        """
+        Calcule les tables de saut.
+
+        Args:
+            grid (np.ndarray): Grille des obstacles (0 = libre, 1 = obstacle)
+            diagonal (bool): True pour 8 directions, False pour 4 directions
+        """
+        self.height, self.width = grid.shape
+        self.diagonal = diagonal
+        self.directions = DIRECTIONS_8 if diagonal else DIRECTIONS_4
+        self.distances = compute_jump_distances(np.asarray(grid) == 0, diagonal)
+        # Vues mémoire par direction, pour un accès scalaire rapide dans la recherche
+        flat = self.distances.reshape(len(self.directions), -1)
+        self._views = [memoryview(flat[k]) for k in range(len(self.directions))]
+
+    @property
+    def nbytes(self):
+        """Mémoire occupée par les tables (en octets)."""
+        return self.distances.nbytes
+
+    def search(self, start, goal, passable, step_cost, diagonal_cost_multiplier=1.414, stats=None):
+        """
+        Recherche A* sur les points de saut.
+
+        Args:
+            start (tuple): Cellule de départ (row, col)
+            goal (tuple): Cellule d'arrivée (row, col)
+            passable (np.ndarray): Masque des cellules franchissables
+            step_cost (float): Coût uniforme d'un déplacement orthogonal (> 0)
+            diagonal_cost_multiplier (float): Multiplicateur du coût diagonal
+            stats (SearchStats, optional): Instance complétée avec les compteurs de la
+                                           recherche (voir search_stats.py)
+
+        Returns:
+            tuple: (chemin cellule par cellule ou None, ensemble des points de saut développés)
+        """
+        width = self.width
+        height = self.height
+        directions = self.directions
+        tables = self._views
+        free = memoryview(np.ascontiguousarray(passable, dtype=np.uint8).reshape(-1))
+        diagonal = self.diagonal
+        diagonal_cost = diagonal_cost_multiplier * step_cost
+
+        goal_row, goal_col = goal
+        start_id = start[0] * width + start[1]
+        goal_id = goal_row * width + goal_col
+
+        def is_free(row, col):
+            return 0 <= row < height and 0 <= col < width and free[row * width + col]
+
+        def heuristic(row, col):
+            d_row = abs(row - goal_row)
+            d_col = abs(col - goal_col)
+            if diagonal:
+                low, high = (d_row, d_col) if d_row < d_col else (d_col, d_row)
+                return (high - low) * step_cost + low * diagonal_cost
+            return (d_row + d_col) * step_cost
+
+        open_set = []
+        counter = 0
+        heapq.heappush(open_set, (heuristic(*start), counter, start_id, -1))
+        counter += 1
+        g_cost = {start_id: 0.0}
+        came_from = {}
+        closed_set = set()
+
+        track = stats is not None
+        peak_open = 0
+        if track:
+            stats.lap("setup")
+
+        while open_set:
+            if track and len(open_set) > peak_open:
+                peak_open = len(open_set)
+            _, _, current, arrival = heapq.heappop(open_set)
+
+            if current == goal_id:
+                if track:
+                    pops = counter - len(open_set)
+                    stats.end_search(len(closed_set), counter, pops - len(closed_set) - 1, peak_open)
+                path = self._expand_path(came_from, current)
+                if track:
+                    stats.finish(path, g_cost[goal_id])
+                return path, closed_set
+
+            if current in closed_set:
+                continue
+            closed_set.add(current)
+
+            row, col = divmod(current, width)
+            current_g_cost = g_cost[current]
+
+            for k in self._successor_directions(row, col, arrival, is_free):
+                d_row, d_col = directions[k]
+                distance = tables[k][current]
+                reach = distance if distance > 0 else -distance
+                steps = 0
+
+                # Point de saut cible : l'arrivée est alignée avec la direction de saut
+                to_goal_row = (goal_row - row) * d_row
+                to_goal_col = (goal_col - col) * d_col
+                if d_row and d_col:
+                    if to_goal_row > 0 and to_goal_col > 0:
+                        target = min(to_goal_row, to_goal_col)
+                        if target <= reach:
+                            steps = target
+                elif d_row:
+                    # 4 directions : le saut vertical s'arrête sur la ligne de l'arrivée ;
+                    # 8 directions : seulement si l'arrivée est dans la même colonne
+                    if 0 < to_goal_row <= reach and (not diagonal or col == goal_col):
+                        steps = to_goal_row
+                elif 0 < to_goal_col <= reach and row == goal_row:
+                    steps = to_goal_col
+
+                if steps == 0:
+                    if distance <= 0:
+                        continue
+                    steps = distance
+
+                neighbor = (row + steps * d_row) * width + col + steps * d_col
+                if neighbor in closed_set:
+                    continue
+                tentative_g_cost = current_g_cost + steps * (diagonal_cost if d_row and d_col else step_cost)
+                if neighbor not in g_cost or tentative_g_cost < g_cost[neighbor]:
+                    g_cost[neighbor] = tentative_g_cost
+                    came_from[neighbor] = current
+                    f_cost = tentative_g_cost + heuristic(*divmod(neighbor, width))
+                    heapq.heappush(open_set, (f_cost, counter, neighbor, k))
+                    counter += 1
+
+        if track:
+            stats.end_search(len(closed_set), counter, counter - len(closed_set), peak_open)
+            stats.finish(None)
+        return None, closed_set
+
+    def _successor_directions(self, row, col, arrival, is_free):
+        """
+        Directions à explorer depuis un point de saut (règles d'élagage de JPS).
+
+        Args:
+            row (int): Ligne du point de saut
+            col (int): Colonne du point de saut
+            arrival (int): Indice de la direction d'arrivée (-1 pour le départ)
+            is_free (callable): Test de franchissabilité d'une cellule
+
+        Returns:
+            list: Indices des directions à explorer
+        """
+        if arrival < 0:
+            return range(len(self.directions))
+        d_row, d_col = self.directions[arrival]
+        if not self.diagonal:
+            # Horizontal : continuer + monter/descendre ; vertical : continuer + gauche/droite
+            return (arrival, 0, 1) if d_col else (arrival, 2, 3)
+
+        index = _DIRECTION_INDEX_8
+        if d_row and d_col:
+            result = [index[(d_row, 0)], index[(0, d_col)], arrival]
+            if not is_free(row, col - d_col):
+                result.append(index[(d_row, -d_col)])
+            if not is_free(row - d_row, col):
+                result.append(index[(-d_row, d_col)])
+            return result
+        result = [arrival]
+        if d_col:
+            for side in (-1, 1):
+                if not is_free(row + side, col):
+                    result.append(index[(side, d_col)])
+        else:
+            for side in (-1, 1):
+                if not is_free(row, col + side):
+                    result.append(index[(d_row, side)])
+        return result
+
+    def _expand_path(self, came_from, current):
+        """
+        Reconstruit le chemin de points de saut puis le développe cellule par cellule.
+
+        Returns:
+            list: Cellules (row, col) du départ jusqu'à l'arrivée
+        """
+        jump_points = [current]
+        while current in came_from:
+            current = came_from[current]
+            jump_points.append(current)
+        jump_points.reverse()
+
+        width = self.width
+        path = [divmod(jump_points[0], width)]
+        for node in jump_points[1:]:
+            row, col = path[-1]
+            next_row, next_col = divmod(node, width)
+            step_row = (next_row > row) - (next_row < row)
+            step_col = (next_col > col) - (next_col < col)
+            while (row, col) != (next_row, next_col):
+                row += step_row
+                col += step_col
+                path.append((row, col))
+        return path
+
+
+_DIRECTION_INDEX_8 = {direction: k for k, direction in enumerate(DIRECTIONS_8)}
+
+
+def _shifted(mask, d_row, d_col):
+    """
+    Retourne mask décalé : result[r, c] = mask[r + d_row, c + d_col] (False hors grille).
+    """
+    height, width = mask.shape
+    result = np.zeros_like(mask)
+    src_rows = slice(max(0, d_row), height + min(0, d_row))
+    src_cols = slice(max(0, d_col), width + min(0, d_col))
+    dst_rows = slice(max(0, -d_row), height + min(0, -d_row))
+    dst_cols = slice(max(0, -d_col), width + min(0, -d_col))
+    result[dst_rows, dst_cols] = mask[src_rows, src_cols]
+    return result
+
+
+def _scan(free, is_jump, d_row, d_col):
+    """
+    Calcule la table de distances de saut pour une direction.
+
+    table[x] = i si la i-ème cellule après x dans la direction est un point de
+    saut (et qu'aucun mur ne précède), sinon -(nombre de cellules libres avant le mur).
+
+    Le balayage part du bord vers lequel pointe la direction ; chaque itération
+    traite une ligne (ou une colonne pour les directions horizontales) entière.
+    """
+    height, width = free.shape
+    table = np.zeros((height, width), dtype=np.int32)
+
+    def combine(next_free, next_jump, next_table):
+        continued = np.where(next_table > 0, next_table + 1, next_table - 1)
+        return np.where(next_free, np.where(next_jump, 1, continued), 0).astype(np.int32)
+
+    if d_row == 0:
+        # Balayage colonne par colonne, vectorisé sur les lignes
+        cols = range(width - 2, -1, -1) if d_col > 0 else range(1, width)
+        for col in cols:
+            nxt = col + d_col
+            table[:, col] = combine(free[:, nxt], is_jump[:, nxt], table[:, nxt])
+        return table
+
+    # Balayage ligne par ligne, vectorisé sur les colonnes (verticales et diagonales)
+    rows = range(height - 2, -1, -1) if d_row > 0 else range(1, height)
+    for row in rows:
+        nxt = row + d_row
+        next_free = free[nxt]
+        next_jump = is_jump[nxt]
+        next_table = table[nxt]
+        if d_col:
+            # Cellule suivante (nxt, col + d_col) ; hors grille sur une colonne de bord
+            shifted_free = np.zeros(width, dtype=bool)
+            shifted_jump = np.zeros(width, dtype=bool)
+            shifted_table = np.zeros(width, dtype=np.int32)
+            if d_col > 0:
+                shifted_free[:-1], shifted_jump[:-1], shifted_table[:-1] = next_free[1:], next_jump[1:], next_table[1:]
+            else:
+                shifted_free[1:], shifted_jump[1:], shifted_table[1:] = next_free[:-1], next_jump[:-1], next_table[:-1]
+            next_free, next_jump, next_table = shifted_free, shifted_jump, shifted_table
+        table[row] = combine(next_free, next_jump, next_table)
+    return table
+
+
+def compute_jump_distances(free, diagonal):
+    """
+    Calcule les tables JPS+ pour toutes les directions.
+
+    Args:
+        free (np.ndarray): Masque booléen des cellules franchissables
+        diagonal (bool): True pour 8 directions, False pour 4 directions
+
+    Returns:
+        np.ndarray: Tableau int32 (nombre_directions, height, width)
+    """
+    def blocked(d_row, d_col):
+        return ~_shifted(free, d_row, d_col)
+
+    def opened(d_row, d_col):
+        return _shifted(free, d_row, d_col)
+
+    if not diagonal:
+        tables = np.zeros((4, *free.shape), dtype=np.int32)
+        # Horizontal : voisin forcé si la cellule au-dessus (ou au-dessous) est libre
+        # alors qu'elle était bloquée une colonne plus tôt
+        for k, d_col in ((2, -1), (3, 1)):
+            forced = ((opened(-1, 0) & blocked(-1, -d_col)) |
+                      (opened(1, 0) & blocked(1, -d_col)))
+            tables[k] = _scan(free, forced, 0, d_col)
+        # Vertical : voisin forcé latéral, ou saut horizontal qui trouve un point de saut
+        horizontal_hit = (tables[2] > 0) | (tables[3] > 0)
+        for k, d_row in ((0, -1), (1, 1)):
+            forced = ((opened(0, -1) & blocked(-d_row, -1)) |
+                      (opened(0, 1) & blocked(-d_row, 1)))
+            tables[k] = _scan(free, forced | horizontal_hit, d_row, 0)
+        return tables
+
+    tables = np.zeros((8, *free.shape), dtype=np.int32)
+    # Déplacements droits (coins coupés autorisés)
+    for k, (d_row, d_col) in enumerate(DIRECTIONS_8[:4]):
+        if d_col:
+            forced = ((opened(1, d_col) & blocked(1, 0)) |
+                      (opened(-1, d_col) & blocked(-1, 0)))
+        else:
+            forced = ((opened(d_row, 1) & blocked(0, 1)) |
+                      (opened(d_row, -1) & blocked(0, -1)))
+        tables[k] = _scan(free, forced, d_row, d_col)
+    # Diagonales : voisin forcé, ou saut droit (composante verticale/horizontale) fructueux
+    for k, (d_row, d_col) in enumerate(DIRECTIONS_8[4:], start=4):
+        forced = ((opened(d_row, -d_col) & blocked(0, -d_col)) |
+                  (opened(-d_row, d_col) & blocked(-d_row, 0)))
+        straight_hit = (tables[_DIRECTION_INDEX_8[(d_row, 0)]] > 0) | (tables[_DIRECTION_INDEX_8[(0, d_col)]] > 0)
+        tables[k] = _scan(free, forced | straight_hit, d_row, d_col)
+    return tables
@@ -0,0 +1,348 @@
+"""
+Heuristique ALT : A*, repères (landmarks) et inégalité triangulaire.
+
+La distance de Manhattan ignore les murs : dans un labyrinthe, A* explore alors
+presque autant de cellules que Dijkstra. L'heuristique ALT (Goldberg et
+Harrelson, 2005) précalcule, pour quelques cellules repères L, les distances
+exactes d(L, v) et d(v, L) vers toutes les cellules. Par inégalité triangulaire,
+pour toute cellule v et toute cible t :
+
+    d(v, t) >= d(v, L) - d(t, L)    et    d(v, t) >= d(L, t) - d(L, v)
+
+Le maximum de ces bornes sur les repères est une heuristique admissible et
+cohérente, qui « voit » les murs contournés par les chemins vers les repères.
+
+Choix des repères :
+
+- "farthest" : chaque nouveau repère est la cellule la plus éloignée des repères
+  déjà choisis (le premier est la cellule la plus éloignée du départ) ;
+- "avoid" : méthode de Goldberg et Harrelson. Dans un arbre de plus courts
+  chemins issu d'une racine tirée au hasard, chaque cellule pèse l'écart entre
+  sa distance réelle et la borne des repères existants ; on descend vers le
+  sous-arbre le plus lourd (sans repère) jusqu'à une feuille.
+
+Les distances sont stockées en uint16 quand elles sont entières (cas des grilles
+à coût de pas entier), en float32 sinon. Les coûts d'arête négatifs (cellules
+bonus, récompense de l'arrivée) sont ramenés à 0 : comme la distance de
+Manhattan, la borne n'est alors plus garantie admissible sur les cellules bonus.
+
+Ajouter des obstacles ne peut qu'allonger les distances : les bornes restent
+admissibles et les repères sont conservés. Toute autre modification (obstacle
+retiré, récompense modifiée, nouvelle grille) provoque un recalcul à la demande.
+"""
+
+import numpy as np
+
+from goal_cache import dijkstra_distances, reverse_edge_weights
+
+
+# Sentinelle des distances compactes en uint16 (cellule inaccessible)
+UNREACHABLE_UINT16 = np.iinfo(np.uint16).max
+
+# Nombre de cibles dont les bornes sont gardées (arrivée et départ en bidirectionnel)
+CACHED_TARGETS = 2
+
+# Marge relative appliquée aux bornes calculées en float32 (erreurs d'arrondi)
+FLOAT32_MARGIN = 1e-6
+
+SELECTIONS = ("farthest", "avoid")
+
+
+class LandmarkHeuristic:
+    """
+    Distances précalculées vers et depuis un petit ensemble de cellules repères.
+    """
+
+    def __init__(self, count=8, selection="farthest", seed=0):
+        """
+        Initialise l'heuristique (les repères sont choisis au premier appel).
+
+        Args:
+            count (int): Nombre de repères
+            selection (str): "farthest" ou "avoid"
+            seed (int, optional): Graine du tirage des racines ("avoid")
+
+        Raises:
+            ValueError: Si la méthode de sélection est inconnue
+        """
+        if selection not in SELECTIONS:
+            raise ValueError(f"Sélection de repères inconnue : '{selection}' "
+                             f"(choix: {', '.join(SELECTIONS)})")
+        self.count = count
+        self.selection = selection
+        self.seed = seed
+        self.landmarks = []
+        self.from_landmarks = None
+        self.to_landmarks = None
+        self.builds = 0
+        self._version = None
+        self._shape = None
+        self._bounds = {}
+
+    def __getstate__(self):
+        # Les bornes par cible sont recalculées à la demande (processus de travail)
+        state = self.__dict__.copy()
+        state["_bounds"] = {}
+        return state
+
+    @property
+    def nbytes(self):
+        """Mémoire occupée par les tableaux de distances (en octets)."""
+        if self.from_landmarks is None:
+            return 0
+        return self.from_landmarks.nbytes + self.to_landmarks.nbytes
+
+    def estimate(self, maze, row, col, target):
+        """
+        Borne inférieure du coût d'un chemin de la cellule vers target.
+
+        Args:
+            maze (Maze): Labyrinthe
+            row (int): Ligne de la cellule
+            col (int): Colonne de la cellule
+            target (tuple): Cellule cible (row, col)
+
+        Returns:
+            float: Borne ALT (0 si aucun repère ne couvre la cellule)
+        """
+        bounds = None
+        if self._version == maze.version:
+            bounds = self._bounds.get(target[0] * maze.width + target[1])
+        if bounds is None:
+            bounds = self.bounds(maze, target)
+        return bounds[row * maze.width + col]
+
+    def bounds(self, maze, target):
+        """
+        Calcule la borne ALT de toutes les cellules vers une cible.
+
+        Args:
+            maze (Maze): Labyrinthe
+            target (tuple): Cellule cible (row, col)
+
+        Returns:
+            list: Borne de chaque cellule, indexée par identifiant plat
+        """
+        self._sync(maze)
+        key = maze.cell_id(*target)
+        bounds = self._bounds.get(key)
+        if bounds is not None:
+            return bounds
+
+        best = np.zeros(maze.width * maze.height, dtype=np.float64)
+        for k in range(len(self.landmarks)):
+            to_landmark = self._decode(self.to_landmarks[k])
+            from_landmark = self._decode(self.from_landmarks[k])
+            with np.errstate(invalid="ignore"):
+                np.fmax(best, to_landmark - to_landmark[key], out=best)
+                np.fmax(best, from_landmark[key] - from_landmark, out=best)
+        # Cellules sans chemin vers la cible : borne neutre
+        best[~np.isfinite(best)] = 0.0
+        if self.to_landmarks.dtype == np.float32:
+            best *= 1.0 - FLOAT32_MARGIN
+
+        if len(self._bounds) >= CACHED_TARGETS:
+            self._bounds.pop(next(iter(self._bounds)))
+        bounds = self._bounds[key] = best.tolist()
+        return bounds
+
+    @staticmethod
+    def _decode(row):
+        """Convertit une ligne de distances compactes en float64 (inf = inaccessible)."""
+        decoded = row.astype(np.float64)
+        if row.dtype == np.uint16:
+            decoded[row == UNREACHABLE_UINT16] = np.inf
+        return decoded
+
+    def _sync(self, maze):
+        """Recalcule les repères si la grille a changé autrement que par des ajouts d'obstacles."""
+        if self._version == maze.version:
+            return
+        if self._shape == maze.grid.shape and self._version is not None:
+            changes = maze.changes_since(self._version)
+            if changes is not None and all(maze.grid[cell] != 0 for cell in changes):
+                # Les distances n'ont pu qu'augmenter : les bornes restent valides
+                self._version = maze.version
+                return
+        self.build(maze)
+
+    def build(self, maze):
+        """
+        Choisit les repères et calcule leurs distances vers et depuis toutes les cellules.
+
+        Args:
+            maze (Maze): Labyrinthe
+        """
+        graph = maze.get_graph()
+        directions = maze.graph_directions()
+        forward = np.maximum(graph.weights, 0.0)
+        multipliers = {mult for _, _, mult in directions}
+        if len(multipliers) == 1:
+            # Un seul multiplicateur : d(v, L) = d(L, v) - m * c(v) + m * c(L)
+            reverse = None
+            cell_cost = multipliers.pop() * np.maximum(-np.asarray(maze.rewards, dtype=np.float64), 0.0)
+            cell_cost = cell_cost.reshape(-1)
+        else:
+            reverse = np.maximum(reverse_edge_weights(graph, maze.rewards, directions), 0.0)
+
+        self.landmarks = []
+        from_rows = []
+        to_rows = []
+        passable = (maze.grid == 0).reshape(-1)
+        if passable.any():
+            rng = np.random.default_rng(self.seed)
+            root = maze.cell_id(*maze.start)
+            if not passable[root]:
+                root = int(rng.choice(np.flatnonzero(passable)))
+            for _ in range(self.count):
+                if self.selection == "avoid":
+                    landmark = self._select_avoid(graph, forward, from_rows, to_rows, root, rng)
+                else:
+                    landmark = self._select_farthest(graph, forward, from_rows, root)
+                if landmark is None or landmark in self.landmarks:
+                    landmark = self._select_farthest(graph, forward, from_rows, root)
+                    if landmark is None or landmark in self.landmarks:
+                        break
+                from_landmark = dijkstra_distances(graph, forward, landmark)
+                if reverse is None:
+                    to_landmark = from_landmark - cell_cost + cell_cost[landmark]
+                    to_landmark[landmark] = 0.0
+                else:
+                    to_landmark = dijkstra_distances(graph, reverse, landmark)
+                self.landmarks.append(landmark)
+                from_rows.append(from_landmark)
+                to_rows.append(to_landmark)
+
+        self.from_landmarks = _compact(from_rows, graph.num_nodes)
+        self.to_landmarks = _compact(to_rows, graph.num_nodes)
+        self._bounds = {}
+        self._shape = maze.grid.shape
+        self._version = maze.version
+        self.builds += 1
+
+    def _select_farthest(self, graph, forward, from_rows, root):
+        """Cellule accessible la plus éloignée des repères déjà choisis."""
+        if not from_rows:
+            distances = dijkstra_distances(graph, forward, root)
+        else:
+            distances = np.minimum.reduce(from_rows)
+        distances = np.where(np.isfinite(distances), distances, -1.0)
+        if distances.max() <= 0:
+            return None
+        return int(np.argmax(distances))
+
+    def _select_avoid(self, graph, forward, from_rows, to_rows, root, rng):
+        """
+        Sélection "avoid" : feuille du sous-arbre le plus mal couvert par les repères.
+
+        La racine est tirée parmi les cellules accessibles depuis la première racine.
+        """
+        if from_rows:
+            candidates = np.flatnonzero(np.isfinite(from_rows[0]))
+            root = int(rng.choice(candidates))
+        distances = dijkstra_distances(graph, forward, root)
+        reached = np.isfinite(distances)
+
+        # Poids : écart entre la distance depuis la racine et la borne actuelle
+        lower = np.zeros(graph.num_nodes, dtype=np.float64)
+        for from_landmark, to_landmark in zip(from_rows, to_rows):
+            with np.errstate(invalid="ignore"):
+                np.fmax(lower, from_landmark - from_landmark[root], out=lower)
+                np.fmax(lower, to_landmark[root] - to_landmark, out=lower)
+        with np.errstate(invalid="ignore"):
+            weight = np.where(reached, np.maximum(distances - lower, 0.0), 0.0)
+
+        # Arbre des plus courts chemins : un parent « serré » par cellule atteinte
+        sources = np.repeat(np.arange(graph.num_nodes), np.diff(graph.indptr))
+        targets = graph.indices
+        with np.errstate(invalid="ignore"):
+            tight = np.isclose(distances[sources] + forward, distances[targets]) & reached[targets]
+        tight &= targets != root
+        parent = np.full(graph.num_nodes, -1, dtype=np.int64)
+        parent[targets[tight]] = sources[tight]
+
+        # Poids des sous-arbres, des feuilles vers la racine ; un sous-arbre
+        # contenant un repère est ignoré
+        order = np.flatnonzero(reached)
+        order = order[np.argsort(-distances[order], kind="stable")].tolist()
+        parent_list = parent.tolist()
+        size = weight.tolist()
+        blocked = bytearray(graph.num_nodes)
+        for landmark in self.landmarks:
+            blocked[landmark] = 1
+        best_child = {}
+        for node in order:
+            up = parent_list[node]
+            if up < 0:
+                continue
+            if blocked[node]:
+                blocked[up] = 1
+            size[up] += size[node]
+            current = best_child.get(up)
+            if not blocked[node] and (current is None or size[node] > size[current]):
+                best_child[up] = node
+
+        node = root
+        while node in best_child:
+            node = best_child[node]
+        return node
+
+
+def _compact(rows, num_nodes):
+    """
+    Empile les distances des repères dans le type le plus compact possible.
+
+    Returns:
+        np.ndarray: (count, num_nodes) en uint16 (UNREACHABLE_UINT16 = inaccessible)
+                    si toutes les distances sont entières et petites, en float32 sinon
+    """
+    if not rows:
+        return np.zeros((0, num_nodes), dtype=np.uint16)
+    stacked = np.vstack(rows)
+    finite = stacked[np.isfinite(stacked)]
+    if (finite.size == 0 or (finite.max() < UNREACHABLE_UINT16 and finite.min() >= 0
+                             and np.all(finite == np.round(finite)))):
+        compact = np.full(stacked.shape, UNREACHABLE_UINT16, dtype=np.uint16)
+        mask = np.isfinite(stacked)
+        compact[mask] = stacked[mask]
+        return compact
+    return stacked.astype(np.float32)
+
+
+def compare_explored(maze, landmarks, queries):
+    """
+    Compare le nombre de cellules explorées avec et sans l'heuristique ALT.
+
+    Pour chaque requête, A* (et A* bidirectionnel si le labyrinthe le permet) est
+    lancé avec l'heuristique de base du labyrinthe, puis avec les repères.
+
+    Args:
+        maze (Maze): Labyrinthe (Maze, DiagonalMaze ou BiDirectionalMaze)
+        landmarks (LandmarkHeuristic): Heuristique à évaluer
+        queries (iterable): Couples (start, goal) de cellules (row, col)
+
+    Returns:
+        dict: Pour "astar" (et "bidirectional_astar") : cellules explorées "base"
+              et "alt" cumulées et réduction en pourcentage
+    """
+    solvers = {"astar": lambda: len(maze.solve(return_explored=True)[1])}
+    if hasattr(maze, "astar_bidirectional"):
+        solvers["bidirectional_astar"] = lambda: maze.astar_bidirectional(return_explored=True)[3]
+
+    saved = maze.start, maze.goal, maze.landmarks
+    report = {name: {"base": 0, "alt": 0} for name in solvers}
+    try:
+        for start, goal in queries:
+            maze.start, maze.goal = tuple(start), tuple(goal)
+            for name, solve in solvers.items():
+                maze.landmarks = None
+                report[name]["base"] += solve()
+                maze.landmarks = landmarks
+                report[name]["alt"] += solve()
+    finally:
+        maze.start, maze.goal, maze.landmarks = saved
+
+    for counts in report.values():
+        counts["reduction"] = (100.0 * (1 - counts["alt"] / counts["base"])
+                               if counts["base"] else 0.0)
+    return report
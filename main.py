@@ -2,7 +2,112 @@ import numpy as np
 from Maze import Maze
 
 
-def generate_random_obstacles(maze, obstacle_density=0.2, ensure_path=True):
+# Motifs d'obstacles reconnus par generate_deterministic_obstacles
+OBSTACLE_PATTERNS = ("vertical_walls", "horizontal_walls", "maze_pattern")
+
+# Types d'obstacles reconnus par create_complete_maze
+OBSTACLE_TYPES = ("random",) + OBSTACLE_PATTERNS
+
+
+def make_rng(seed=None):
+    """
+    Retourne le générateur pseudo-aléatoire utilisé par les fonctions de génération.
+   
+    Args:
+        seed (int | np.random.Generator, optional): Graine ou générateur existant.
+            Sans graine, le générateur est tiré de l'état global np.random : un
+            appel préalable à np.random.seed(...) rend donc aussi la génération
+            reproductible.
+       
+    Returns:
+        np.random.Generator: Générateur
+    """
+    if isinstance(seed, np.random.Generator):
+        return seed
+    if seed is None:
+        seed = np.random.randint(0, np.iinfo(np.int64).max, dtype=np.int64)
+    return np.random.default_rng(seed)
+
+
+def _protected_cells(maze):
+    """Masque du départ et de l'arrivée (cellules laissées libres)."""
+    protected = np.zeros((maze.height, maze.width), dtype=bool)
+    for row, col in (maze.start, maze.goal):
+        if maze.is_in_bounds(row, col):
+            protected[row, col] = True
+    return protected
+
+
+def _add_obstacles(maze, mask):
+    """Ajoute les obstacles d'un masque booléen à la grille (une seule réaffectation)."""
+    if mask.any():
+        maze.grid = (np.asarray(maze.grid) != 0) | mask
+
+
+def random_obstacle_mask(height, width, obstacle_density=0.2, rng=None):
+    """
+    Tire un masque d'obstacles aléatoires indépendants.
+   
+    Args:
+        height (int): Nombre de lignes
+        width (int): Nombre de colonnes
+        obstacle_density (float): Probabilité qu'une cellule soit un obstacle
+        rng (int | np.random.Generator, optional): Graine ou générateur (voir make_rng)
+       
+    Returns:
+        np.ndarray: Masque booléen (height, width), True = obstacle
+    """
+    return make_rng(rng).random((height, width)) < obstacle_density
+
+
+def pattern_obstacle_mask(height, width, obstacle_pattern="vertical_walls", rng=None,
+                          protected=None):
+    """
+    Construit le masque d'obstacles d'un motif déterministe.
+   
+    Args:
+        height (int): Nombre de lignes
+        width (int): Nombre de colonnes
+        obstacle_pattern (str): "vertical_walls", "horizontal_walls" ou "maze_pattern"
+        rng (int | np.random.Generator, optional): Graine ou générateur (seul
+            "maze_pattern" tire des directions aléatoires)
+        protected (np.ndarray, optional): Cellules jamais choisies comme mur ou pilier
+       
+    Returns:
+        np.ndarray: Masque booléen (height, width), True = obstacle (vide si le
+                    motif est inconnu)
+    """
+    mask = np.zeros((height, width), dtype=bool)
+    if protected is None:
+        protected = np.zeros((height, width), dtype=bool)
+   
+    if obstacle_pattern == "vertical_walls":
+        # Murs verticaux avec des ouvertures tous les 3 rangées
+        mask[:, 2::4] = (np.arange(height) % 3 != 0)[:, None]
+        mask &= ~protected
+       
+    elif obstacle_pattern == "horizontal_walls":
+        # Murs horizontaux avec des ouvertures toutes les 3 colonnes
+        mask[2::4, :] = (np.arange(width) % 3 != 0)[None, :]
+        mask &= ~protected
+       
+    elif obstacle_pattern == "maze_pattern":
+        # Piliers sur les cellules (impaire, impaire) hors bords, chacun étendu
+        # d'une cellule dans une direction aléatoire
+        pillars = np.zeros((height, width), dtype=bool)
+        pillars[1:height - 1:2, 1:width - 1:2] = True
+        pillars &= ~protected
+        rows, cols = np.nonzero(pillars)
+        directions = make_rng(rng).integers(0, 4, size=len(rows))
+        d_row = np.array([-1, 1, 0, 0])[directions]
+        d_col = np.array([0, 0, -1, 1])[directions]
+        mask[rows, cols] = True
+        mask[rows + d_row, cols + d_col] = True
+       
+    return mask
+
+
+def generate_random_obstacles(maze, obstacle_density=0.2, ensure_path=True, rng=None):
     """
     Génère des obstacles de manière aléatoire dans le labyrinthe.
    
@@ -10,69 +115,35 @@ def generate_random_obstacles(maze, obstacle_density=0.2, ensure_path=True):
         maze (Maze): Le labyrinthe à modifier
         obstacle_density (float): Densité d'obstacles (entre 0 et 1)
         ensure_path (bool): Si True, garantit que départ et arrivée restent franchissables
+        rng (int | np.random.Generator, optional): Graine ou générateur (voir make_rng)
        
     Returns:
         Maze: Le labyrinthe modifié
     """
-    for i in range(maze.height):
-        for j in range(maze.width):
-            # Ne jamais placer d'obstacle sur le départ ou l'arrivée
-            if ensure_path and ((i, j) == maze.start or (i, j) == maze.goal):
-                continue
-           
-            # Placer un obstacle avec une certaine probabilité
-            if np.random.random() < obstacle_density:
-                maze.set_obstacle(i, j)
-   
+    mask = random_obstacle_mask(maze.height, maze.width, obstacle_density, rng)
+    if ensure_path:
+        # Ne jamais placer d'obstacle sur le départ ou l'arrivée
+        mask &= ~_protected_cells(maze)
+    _add_obstacles(maze, mask)
     return maze
 
 
-def generate_deterministic_obstacles(maze, obstacle_pattern="vertical_walls"):
+def generate_deterministic_obstacles(maze, obstacle_pattern="vertical_walls", rng=None):
     """
     Génère des obstacles de manière déterministe selon un motif.
    
     Args:
         maze (Maze): Le labyrinthe à modifier
         obstacle_pattern (str): Type de motif ("vertical_walls", "horizontal_walls", "maze_pattern")
+        rng (int | np.random.Generator, optional): Graine ou générateur pour les
+            directions de "maze_pattern" (voir make_rng)
        
     Returns:
         Maze: Le labyrinthe modifié
     """
-    if obstacle_pattern == "vertical_walls":
-        # Murs verticaux avec des ouvertures
-        for col in range(2, maze.width, 4):
-            for row in range(maze.height):
-                if (row, col) != maze.start and (row, col) != maze.goal:
-                    # Laisser des ouvertures tous les 3 rangées
-                    if row % 3 != 0:
-                        maze.set_obstacle(row, col)
-                       
-    elif obstacle_pattern == "horizontal_walls":
-        # Murs horizontaux avec des ouvertures
-        for row in range(2, maze.height, 4):
-            for col in range(maze.width):
-                if (row, col) != maze.start and (row, col) != maze.goal:
-                    # Laisser des ouvertures toutes les 3 colonnes
-                    if col % 3 != 0:
-                        maze.set_obstacle(row, col)
-                       
-    elif obstacle_pattern == "maze_pattern":
-        # Motif de labyrinthe plus complexe
-        for i in range(1, maze.height - 1, 2):
-            for j in range(1, maze.width - 1, 2):
-                if (i, j) != maze.start and (i, j) != maze.goal:
-                    maze.set_obstacle(i, j)
-                    # Étendre l'obstacle dans une direction aléatoire
-                    direction = np.random.choice(['up', 'down', 'left', 'right'])
-                    if direction == 'up' and i > 0:
-                        maze.set_obstacle(i - 1, j)
-                    elif direction == 'down' and i < maze.height - 1:
-                        maze.set_obstacle(i + 1, j)
-                    elif direction == 'left' and j > 0:
-                        maze.set_obstacle(i, j - 1)
-                    elif direction == 'right' and j < maze.width - 1:
-                        maze.set_obstacle(i, j + 1)
-   
+    mask = pattern_obstacle_mask(maze.height, maze.width, obstacle_pattern, rng,
+                                 protected=_protected_cells(maze))
+    _add_obstacles(maze, mask)
     return maze
 
 
@@ -90,17 +161,18 @@ def initialize_uniform_rewards(maze, step_cost=-1.0, goal_reward=100.0):
         Maze: Le labyrinthe modifié
     """
     # Initialiser toutes les cellules avec le coût de déplacement
-    maze.rewards = np.full((maze.height, maze.width), step_cost, dtype=float)
+    # (directement dans la représentation du labyrinthe, sans tableau float64 intermédiaire)
+    maze.rewards = maze.storage.full_rewards((maze.height, maze.width), step_cost)
    
     # Définir une récompense significative pour la cellule d'arrivée
     goal_row, goal_col = maze.goal
-    maze.rewards[goal_row, goal_col] = goal_reward
+    maze.rewards[goal_row, goal_col] = maze.storage.check_reward(goal_reward)
    
     return maze
 
 
 def add_bonus_cells(maze, num_bonuses=5, bonus_value=10.0, random_placement=True,
-                    bonus_positions=None):
+                    bonus_positions=None, rng=None):
     """
     Ajoute des bonus sur certaines cellules du labyrinthe.
    
@@ -110,59 +182,60 @@ def add_bonus_cells(maze, num_bonuses=5, bonus_value=10.0, random_placement=True
         bonus_value (float): Valeur du bonus
         random_placement (bool): Si True, place les bonus aléatoirement
         bonus_positions (list): Liste de positions (row, col) pour les bonus (si random_placement=False)
+        rng (int | np.random.Generator, optional): Graine ou générateur (voir make_rng)
        
     Returns:
         Maze: Le labyrinthe modifié
     """
+    # Cellules éligibles : franchissables, hors départ et arrivée
+    eligible = (np.asarray(maze.grid) == 0) & ~_protected_cells(maze)
+   
     if random_placement:
-        # Placer des bonus de manière aléatoire
-        bonuses_placed = 0
-        attempts = 0
-        max_attempts = num_bonuses * 10  # Éviter une boucle infinie
-       
-        while bonuses_placed < num_bonuses and attempts < max_attempts:
-            row = np.random.randint(0, maze.height)
-            col = np.random.randint(0, maze.width)
-           
-            # Vérifier que la cellule est franchissable et n'est pas départ/arrivée
-            if (maze.is_passable(row, col) and
-                (row, col) != maze.start and
-                (row, col) != maze.goal):
-                maze.set_reward(row, col, bonus_value)
-                bonuses_placed += 1
-           
-            attempts += 1
+        # num_bonuses cellules distinctes tirées parmi les cellules éligibles
+        candidates = np.flatnonzero(eligible)
+        count = min(num_bonuses, len(candidates))
+        cells = make_rng(rng).choice(candidates, size=count, replace=False)
+        rows, cols = np.divmod(cells, maze.width)
     else:
         # Placer des bonus aux positions spécifiées
-        if bonus_positions is not None:
-            for row, col in bonus_positions:
-                if (maze.is_passable(row, col) and
-                    (row, col) != maze.start and
-                    (row, col) != maze.goal):
-                    maze.set_reward(row, col, bonus_value)
+        if not bonus_positions:
+            return maze
+        rows, cols = np.array(bonus_positions, dtype=np.int64).reshape(-1, 2).T
+        inside = (rows >= 0) & (rows < maze.height) & (cols >= 0) & (cols < maze.width)
+        rows, cols = rows[inside], cols[inside]
+        keep = eligible[rows, cols]
+        rows, cols = rows[keep], cols[keep]
+   
+    if len(rows):
+        rewards = np.array(maze.rewards)
+        rewards[rows, cols] = bonus_value
+        maze.rewards = rewards
    
     return maze
 
 
-def generate_movable_areas(maze, movable_ratio=0.7):
+def generate_movable_areas(maze, movable_ratio=0.7, rng=None):
     """
     Génère les zones franchissables en définissant le ratio de cellules libres.
    
     Args:
         maze (Maze): Le labyrinthe à modifier
         movable_ratio (float): Ratio de cellules franchissables (entre 0 et 1)
+        rng (int | np.random.Generator, optional): Graine ou générateur (voir make_rng)
        
     Returns:
         Maze: Le labyrinthe modifié
     """
     obstacle_density = 1.0 - movable_ratio
-    return generate_random_obstacles(maze, obstacle_density=obstacle_density, ensure_path=True)
+    return generate_random_obstacles(maze, obstacle_density=obstacle_density, ensure_path=True,
+                                     rng=rng)
 
 
 def create_complete_maze(width, height, start=None, goal=None,
                         obstacle_type="random", obstacle_density=0.2,
                         step_cost=-1.0, goal_reward=100.0,
-                        add_bonuses=True, num_bonuses=5, bonus_value=10.0):
+                        add_bonuses=True, num_bonuses=5, bonus_value=10.0,
+                        storage="default", seed=None):
     """
     Crée un labyrinthe complet avec obstacles et récompenses.
    
@@ -178,6 +251,11 @@ def create_complete_maze(width, height, start=None, goal=None,
         add_bonuses (bool): Ajouter des bonus
         num_bonuses (int): Nombre de bonus
         bonus_value (float): Valeur des bonus
+        storage (str | GridStorage): Représentation de la grille et des récompenses
+            ("default", "compact", "packed", "packed_int16", voir storage.py)
+        seed (int | np.random.Generator, optional): Graine de la génération ; la même
+            graine et les mêmes paramètres donnent exactement le même labyrinthe
+            (sans graine, voir make_rng)
        
     Returns:
         Maze: Le labyrinthe généré
@@ -188,14 +266,17 @@ def create_complete_maze(width, height, start=None, goal=None,
     if goal is None:
         goal = (height - 1, width - 1)
    
+    # Un seul générateur pour toutes les étapes
+    rng = make_rng(seed)
+   
     # Créer le labyrinthe de base
-    maze = Maze(width, height, start=start, goal=goal)
+    maze = Maze(width, height, start=start, goal=goal, storage=storage)
    
     # Générer les obstacles
     if obstacle_type == "random":
-        generate_random_obstacles(maze, obstacle_density=obstacle_density)
+        generate_random_obstacles(maze, obstacle_density=obstacle_density, rng=rng)
     else:
-        generate_deterministic_obstacles(maze, obstacle_pattern=obstacle_type)
+        generate_deterministic_obstacles(maze, obstacle_pattern=obstacle_type, rng=rng)
    
     # S'assurer que départ et arrivée sont franchissables
     maze.remove_obstacle(*start)
@@ -206,7 +287,7 @@ def create_complete_maze(width, height, start=None, goal=None,
    
     # Ajouter des bonus
     if add_bonuses:
-        add_bonus_cells(maze, num_bonuses=num_bonuses, bonus_value=bonus_value)
+        add_bonus_cells(maze, num_bonuses=num_bonuses, bonus_value=bonus_value, rng=rng)
    
     return maze
 
@@ -0,0 +1,244 @@
+"""
+Format de fichier des labyrinthes, ouvert par projection en mémoire (numpy.memmap).
+
+Reconstruire une grande carte cellule par cellule à chaque démarrage coûte
+plusieurs secondes. Un fichier de labyrinthe contient directement les tableaux
+de la grille et des récompenses dans leur représentation (voir storage.py) :
+Maze.load les projette en mémoire sans les lire ni les copier. Les pages ne sont
+chargées qu'au premier accès et restent dans le cache du système, partagé par
+tous les processus qui ouvrent le même fichier.
+
+Disposition du fichier :
+
+- signature MAGIC (8 octets) puis longueur de l'en-tête (uint64 little-endian) ;
+- en-tête JSON : classe, dimensions, départ, arrivée, représentation,
+  attributs propres à la classe (diagonal_cost_multiplier...), métadonnées
+  libres et position de chaque tableau ;
+- tableaux de la grille et des récompenses, alignés sur ALIGNMENT octets.
+
+Modes d'ouverture (paramètre mmap_mode, comme numpy.memmap) :
+
+- "c" (défaut) : copie à l'écriture, les modifications restent privées au processus ;
+- "r" : lecture seule, toute modification lève une erreur ;
+- "r+" : les modifications de la grille et des récompenses sont écrites dans le
+  fichier (le départ, l'arrivée et les métadonnées ne le sont pas).
+"""
+
+import json
+import os
+import struct
+
+import numpy as np
+
+from storage import GridStorage, PackedGrid
+
+
+MAGIC = b"MAZEMAP\x01"
+FORMAT_VERSION = 1
+
+# Alignement des tableaux dans le fichier (taille d'une page mémoire)
+ALIGNMENT = 4096
+
+# Attributs propres aux sous-classes, enregistrés dans l'en-tête
+CLASS_ATTRIBUTES = ("diagonal_cost_multiplier",)
+
+MMAP_MODES = ("r", "c", "r+")
+
+
+class MappedFile:
+    """
+    Fichier dont un labyrinthe projette la grille et les récompenses.
+    """
+
+    def __init__(self, path, mode, version, metadata):
+        """
+        Args:
+            path (str): Chemin du fichier
+            mode (str): Mode de projection ("r", "c" ou "r+")
+            version (int): Version du labyrinthe à l'ouverture (le fichier ne
+                           reflète plus le labyrinthe après une modification)
+            metadata (dict): Métadonnées enregistrées avec le labyrinthe
+        """
+        self.path = path
+        self.mode = mode
+        self.version = version
+        self.metadata = metadata
+
+    def __repr__(self):
+        return f"MappedFile(path={self.path!r}, mode={self.mode!r})"
+
+
+def _aligned(offset):
+    return -(-offset // ALIGNMENT) * ALIGNMENT
+
+
+def _raw_arrays(maze):
+    """Tableaux enregistrés : (grille ou octets compactés, récompenses)."""
+    grid = maze.grid
+    if isinstance(grid, PackedGrid):
+        grid = grid.bits
+    return np.ascontiguousarray(grid), np.ascontiguousarray(maze.rewards)
+
+
+def save_maze(maze, path, metadata=None):
+    """
+    Enregistre un labyrinthe dans un fichier projetable en mémoire.
+
+    Args:
+        maze (Maze): Labyrinthe (Maze, DiagonalMaze, BiDirectionalMaze...)
+        path (str): Chemin du fichier
+        metadata (dict, optional): Métadonnées libres (sérialisables en JSON)
+    """
+    grid, rewards = _raw_arrays(maze)
+    header = {
+        "format": FORMAT_VERSION,
+        "class": type(maze).__name__,
+        "width": maze.width,
+        "height": maze.height,
+        "start": list(maze.start),
+        "goal": list(maze.goal),
+        "storage": {"obstacles": maze.storage.obstacles, "costs": maze.storage.costs},
+        "attributes": {name: getattr(maze, name) for name in CLASS_ATTRIBUTES
+                       if hasattr(maze, name)},
+        "metadata": metadata or {},
+    }
+    arrays = {"grid": grid, "rewards": rewards}
+    body, size = layout_arrays(MAGIC, header, {name: (array.dtype, array.shape)
+                                                for name, array in arrays.items()})
+    with open(path, "wb") as handle:
+        write_header(handle, MAGIC, body)
+        for name, array in arrays.items():
+            handle.seek(header[name]["offset"])
+            handle.write(memoryview(array).cast("B"))
+        handle.truncate(size)
+
+
+def layout_arrays(magic, header, specs):
+    """
+    Place des tableaux après l'en-tête, alignés sur ALIGNMENT octets.
+
+    La position de chaque tableau est ajoutée à l'en-tête (header[nom] :
+    offset, dtype, shape) ; elle dépend de la taille de l'en-tête qui la contient.
+
+    Args:
+        magic (bytes): Signature du fichier
+        header (dict): En-tête (complété en place)
+        specs (dict): Nom -> (dtype, shape) de chaque tableau, dans l'ordre du fichier
+
+    Returns:
+        tuple: (en-tête encodé, taille totale du fichier)
+    """
+    start = _aligned(len(magic) + 8 + len(json.dumps(header)))
+    while True:
+        offset = start
+        for name, (dtype, shape) in specs.items():
+            dtype = np.dtype(dtype)
+            header[name] = {"offset": offset, "dtype": dtype.str, "shape": list(shape)}
+            offset = _aligned(offset + dtype.itemsize * int(np.prod(shape, dtype=np.int64)))
+        body = json.dumps(header).encode()
+        if len(magic) + 8 + len(body) <= start:
+            return body, offset
+        start = _aligned(len(magic) + 8 + len(body))
+
+
+def write_header(handle, magic, body):
+    """Écrit la signature, la longueur de l'en-tête puis l'en-tête encodé."""
+    handle.write(magic)
+    handle.write(struct.pack("<Q", len(body)))
+    handle.write(body)
+
+
+def map_array(path, layout, mmap_mode="c"):
+    """
+    Projette en mémoire un tableau placé par layout_arrays.
+
+    Args:
+        path (str): Chemin du fichier
+        layout (dict): Position du tableau (offset, dtype, shape)
+        mmap_mode (str): "r", "c" ou "r+"
+
+    Returns:
+        np.ndarray: Projection numpy.memmap (tableau vide en mémoire si la forme est nulle)
+    """
+    shape = tuple(layout["shape"])
+    if 0 in shape:
+        # numpy.memmap refuse les projections vides
+        return np.zeros(shape, dtype=layout["dtype"])
+    return np.memmap(path, dtype=layout["dtype"], mode=mmap_mode, offset=layout["offset"], shape=shape)
+
+
+def read_header(path, magic=MAGIC):
+    """
+    Lit l'en-tête d'un fichier de labyrinthe sans projeter les tableaux.
+
+    Args:
+        path (str): Chemin du fichier
+        magic (bytes): Signature attendue (MAGIC pour un labyrinthe)
+
+    Returns:
+        dict: En-tête (dimensions, départ, arrivée, représentation, métadonnées...)
+
+    Raises:
+        ValueError: Si le fichier n'est pas un fichier de labyrinthe
+    """
+    with open(path, "rb") as handle:
+        if handle.read(len(magic)) != magic:
+            raise ValueError(f"{path} n'est pas un fichier de labyrinthe")
+        (length,) = struct.unpack("<Q", handle.read(8))
+        header = json.loads(handle.read(length))
+    if header.get("format") != FORMAT_VERSION:
+        raise ValueError(f"Version de format non supportée : {header.get('format')}")
+    return header
+
+
+def map_arrays(path, mmap_mode="c", header=None):
+    """
+    Projette la grille et les récompenses d'un fichier en mémoire.
+
+    Args:
+        path (str): Chemin du fichier
+        mmap_mode (str): "r", "c" ou "r+"
+        header (dict, optional): En-tête déjà lu
+
+    Returns:
+        tuple: (grid, rewards) ; grid est un PackedGrid pour une représentation en bits
+
+    Raises:
+        ValueError: Si le mode est inconnu
+    """
+    if mmap_mode not in MMAP_MODES:
+        raise ValueError(f"Mode de projection inconnu : '{mmap_mode}' (choix: {', '.join(MMAP_MODES)})")
+    if header is None:
+        header = read_header(path)
+    grid = map_array(path, header["grid"], mmap_mode)
+    rewards = map_array(path, header["rewards"], mmap_mode)
+    if header["storage"]["obstacles"] == "bits":
+        grid = PackedGrid((header["height"], header["width"]), grid)
+    return grid, rewards
+
+
+def load_maze(maze_class, path, mmap_mode="c", storage=None):
+    """
+    Ouvre un fichier de labyrinthe par projection en mémoire.
+
+    Args:
+        maze_class (type): Classe du labyrinthe à construire
+        path (str): Chemin du fichier
+        mmap_mode (str): "r", "c" ou "r+"
+        storage (str | GridStorage, optional): Représentation voulue ; par défaut
+            celle du fichier. Une autre représentation convertit (et copie) les tableaux.
+
+    Returns:
+        Maze: Labyrinthe dont la grille et les récompenses pointent sur le fichier
+    """
+    header = read_header(path)
+    grid, rewards = map_arrays(path, mmap_mode, header)
+    if storage is None:
+        storage = GridStorage(**header["storage"])
+    maze = maze_class(header["width"], header["height"], grid, rewards,
+                      tuple(header["start"]), tuple(header["goal"]), storage=storage)
+    for name, value in header["attributes"].items():
+        if hasattr(maze, name):
+            setattr(maze, name, value)
+    maze.mapped_file = MappedFile(os.path.abspath(path), mmap_mode, maze.version, header["metadata"])
+    return maze
@@ -0,0 +1,219 @@
+"""
+Cache des résultats de recherche, invalidé par la version du labyrinthe.
+
+Un flux de requêtes contient souvent les mêmes triplets (départ, arrivée,
+algorithme) sur une carte inchangée : chaque requête relance pourtant une
+recherche complète. Le cache garde le résultat de chaque requête, indexé par
+l'algorithme, le départ, l'arrivée et les paramètres de l'appel :
+
+- Invalidation : les résultats sont associés à maze.version, que set_obstacle,
+  remove_obstacle, set_reward (et mark_modified) incrémentent. Au premier appel
+  après une modification, tout le cache est vidé.
+- Éviction LRU sous un budget mémoire : la taille de chaque résultat (chemin,
+  ensembles explorés...) est estimée avec sys.getsizeof.
+- Compteurs : succès, échecs, taux de succès, évictions et invalidations, au
+  total et par algorithme (stats).
+
+Les appels dont un paramètre n'est pas une valeur simple (par exemple une
+instance de PriorityQueue dont on veut lire les compteurs) ne passent pas par
+le cache. Les résultats sont copiés à l'entrée et à la sortie du cache : le
+chemin retourné peut être modifié sans altérer le cache. Un temps de recherche
+contenu dans le résultat (elapsed des recherches bidirectionnelles) n'est pas
+rejoué : il est remplacé par la durée de l'appel, lecture du cache comprise.
+"""
+
+import functools
+import inspect
+import sys
+import time
+from collections import OrderedDict
+
+
+# Budget mémoire par défaut des résultats en cache (32 Mio)
+DEFAULT_RESULT_BYTES = 32 * 1024 * 1024
+
+# Types de paramètres acceptés dans la clé d'une requête
+_KEY_TYPES = (type(None), bool, int, float, str)
+
+
+def result_nbytes(value):
+    """
+    Estime la mémoire occupée par un résultat de recherche.
+
+    Args:
+        value: Résultat (chemin, tuple de résultats, ensemble de cellules...)
+
+    Returns:
+        int: Taille estimée en octets (conteneurs et éléments)
+    """
+    size = sys.getsizeof(value)
+    if isinstance(value, (list, tuple, set, frozenset)):
+        size += sum(result_nbytes(item) for item in value)
+    return size
+
+
+def _copy_result(value):
+    """Copie les conteneurs modifiables d'un résultat (les tuples sont partagés)."""
+    if isinstance(value, list):
+        return list(value)
+    if isinstance(value, set):
+        return set(value)
+    if isinstance(value, tuple) and any(isinstance(item, (list, set, tuple)) for item in value):
+        return tuple(_copy_result(item) for item in value)
+    return value
+
+
+class PathCache:
+    """
+    Cache LRU des résultats de recherche, avec budget mémoire.
+    """
+
+    def __init__(self, max_bytes=DEFAULT_RESULT_BYTES):
+        """
+        Initialise un cache vide.
+
+        Args:
+            max_bytes (int): Mémoire maximale occupée par les résultats (en octets)
+        """
+        self.max_bytes = max_bytes
+        self._results = OrderedDict()
+        self._version = None
+        self.nbytes = 0
+        self.reset_stats()
+
+    def __len__(self):
+        return len(self._results)
+
+    def __getstate__(self):
+        # Les résultats ne sont pas sérialisés (processus de travail de
+        # solve_many) : la copie repart d'un cache vide avec le même budget
+        return {"max_bytes": self.max_bytes}
+
+    def __setstate__(self, state):
+        self.__init__(state["max_bytes"])
+
+    def reset_stats(self):
+        """Remet à zéro les compteurs."""
+        self.hits = 0
+        self.misses = 0
+        self.bypassed = 0
+        self.evictions = 0
+        self.invalidations = 0
+        self._per_algorithm = {}
+
+    def stats(self):
+        """
+        Retourne les compteurs du cache (exportables tels quels en JSON).
+
+        Returns:
+            dict: hits, misses, hit_rate, bypassed (appels hors cache), evictions,
+                  invalidations, entries, nbytes, max_bytes et algorithms
+                  (hits, misses, hit_rate par algorithme)
+        """
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": _rate(self.hits, self.misses),
+            "bypassed": self.bypassed,
+            "evictions": self.evictions,
+            "invalidations": self.invalidations,
+            "entries": len(self._results),
+            "nbytes": self.nbytes,
+            "max_bytes": self.max_bytes,
+            "algorithms": {
+                name: {"hits": hits, "misses": misses, "hit_rate": _rate(hits, misses)}
+                for name, (hits, misses) in self._per_algorithm.items()
+            },
+        }
+
+    def clear(self):
+        """Vide le cache."""
+        self._results.clear()
+        self.nbytes = 0
+
+    def _count(self, algorithm, hit):
+        hits, misses = self._per_algorithm.get(algorithm, (0, 0))
+        self._per_algorithm[algorithm] = (hits + 1, misses) if hit else (hits, misses + 1)
+
+    def solve(self, maze, algorithm, parameters, compute):
+        """
+        Retourne le résultat d'une requête, calculé par compute en cas d'échec.
+
+        Args:
+            maze (Maze): Labyrinthe (sa version et sa requête start/goal forment la clé)
+            algorithm (str): Nom de l'algorithme
+            parameters (tuple): Couples (nom, valeur) des paramètres de l'appel
+            compute (callable): Recherche non cachée (sans argument)
+
+        Returns:
+            Résultat de la recherche (copie)
+        """
+        if not all(isinstance(value, _KEY_TYPES) for _, value in parameters):
+            self.bypassed += 1
+            return compute()
+
+        if self._version != maze.version:
+            if self._results:
+                self.invalidations += 1
+            self.clear()
+            self._version = maze.version
+
+        key = (algorithm, tuple(maze.start), tuple(maze.goal), parameters)
+        entry = self._results.get(key)
+        if entry is not None:
+            self._results.move_to_end(key)
+            self.hits += 1
+            self._count(algorithm, True)
+            return _copy_result(entry[0])
+
+        self.misses += 1
+        self._count(algorithm, False)
+        result = compute()
+        size = result_nbytes(result)
+        if size <= self.max_bytes:
+            while self.nbytes + size > self.max_bytes:
+                _, (_, evicted_size) = self._results.popitem(last=False)
+                self.nbytes -= evicted_size
+                self.evictions += 1
+            self._results[key] = (_copy_result(result), size)
+            self.nbytes += size
+        return result
+
+
+def _rate(hits, misses):
+    return hits / (hits + misses) if hits + misses else 0.0
+
+
+def cached_solver(algorithm, elapsed_index=None):
+    """
+    Décorateur : fait passer une méthode de résolution par maze.path_cache.
+
+    Sans cache activé (maze.path_cache = None), l'appel est direct.
+
+    Args:
+        algorithm (str): Nom de l'algorithme dans les clés et les compteurs
+        elapsed_index (int, optional): Position du temps écoulé (secondes) dans un
+                                       résultat de type tuple ; il est remplacé
+                                       par la durée de l'appel, pour qu'un succès
+                                       du cache ne rejoue pas celui de la recherche
+    """
+    def decorate(solver):
+        signature = inspect.signature(solver)
+
+        @functools.wraps(solver)
+        def wrapper(self, *args, **kwargs):
+            if self.path_cache is None:
+                return solver(self, *args, **kwargs)
+            # Paramètres normalisés : solve() et solve(False) partagent la même clé
+            bound = signature.bind(self, *args, **kwargs)
+            bound.apply_defaults()
+            parameters = tuple(bound.arguments.items())[1:]
+            start_time = time.time()
+            result = self.path_cache.solve(self, algorithm, parameters,
+                                           lambda: solver(self, *args, **kwargs))
+            if elapsed_index is not None and isinstance(result, tuple):
+                result = (result[:elapsed_index] + (time.time() - start_time,)
+                          + result[elapsed_index + 1:])
+            return result
+        return wrapper
+    return decorate
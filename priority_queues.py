@@ -0,0 +1,579 @@
+"""
+Files de priorité interchangeables pour les listes ouvertes des solveurs.
+
+Toutes les files manipulent des identifiants plats de cellules (voir grid_graph)
+et exposent la même interface :
+
+- push(priority, node) : insère node, ou diminue sa priorité s'il est déjà présent
+  (pour les files qui le permettent)
+- pop() -> (priority, node) : retire l'élément de plus petite priorité
+- peek_priority() : plus petite priorité, sans retirer l'élément
+- record_stale() : appelé par le solveur quand un élément retiré était périmé
+- clear() : vide la file (les compteurs sont conservés, voir reset_stats)
+
+Implémentations disponibles (voir make_queue) :
+
+- "heapq" : référence, tas binaire de tuples (priorité, compteur, noeud) sans
+  suppression des doublons
+- "packed" : tas d'entiers Python, clé = priorité * N + noeud (priorités entières,
+  repli sur des tuples sinon)
+- "indexed" : tas binaire indexé avec véritable diminution de clé (pas de doublons)
+- "pairing" : tas d'appariement avec diminution de clé
+- "bucket" : file à seaux circulaire (algorithme de Dial), priorités entières
+  monotones et coût d'arête borné
+- "radix" : tas radix, priorités entières monotones
+
+Les files "bucket" et "radix" sont monotones : elles ne conviennent qu'à Dijkstra
+avec des coûts d'arête entiers positifs ou nuls (voir Maze.integer_edge_costs).
+
+Chaque file compte les insertions, extractions, extractions périmées et la
+taille maximale atteinte, afin de choisir la file adaptée à chaque famille de
+cartes à partir de mesures.
+"""
+
+import heapq
+from collections import deque
+
+
+class PriorityQueue:
+    """
+    Classe de base : compteurs communs à toutes les files de priorité.
+    """
+
+    name = "base"
+
+    def __init__(self):
+        self.reset_stats()
+
+    def reset_stats(self):
+        """Remet à zéro les compteurs d'instrumentation."""
+        self.pushes = 0
+        self.pops = 0
+        self.stale_pops = 0
+        self.decrease_keys = 0
+        self.max_size = 0
+
+    def record_stale(self):
+        """Signale qu'un élément retiré était périmé (cellule déjà fermée)."""
+        self.stale_pops += 1
+
+    def stats(self):
+        """
+        Retourne les compteurs d'instrumentation.
+
+        Returns:
+            dict: pushes, pops, stale_pops, decrease_keys, max_size
+        """
+        return {
+            "queue": self.name,
+            "pushes": self.pushes,
+            "pops": self.pops,
+            "stale_pops": self.stale_pops,
+            "decrease_keys": self.decrease_keys,
+            "max_size": self.max_size,
+        }
+
+    def __bool__(self):
+        return len(self) > 0
+
+
+class HeapQueue(PriorityQueue):
+    """
+    File de référence : tas heapq de tuples (priorité, compteur, noeud).
+
+    Une amélioration de priorité ajoute une nouvelle entrée ; l'ancienne reste
+    dans le tas et sera retirée plus tard comme entrée périmée.
+    """
+
+    name = "heapq"
+
+    def __init__(self):
+        super().__init__()
+        self._heap = []
+        self._counter = 0
+
+    def push(self, priority, node):
+        heapq.heappush(self._heap, (priority, self._counter, node))
+        self._counter += 1
+        self.pushes += 1
+        if len(self._heap) > self.max_size:
+            self.max_size = len(self._heap)
+
+    def pop(self):
+        priority, _, node = heapq.heappop(self._heap)
+        self.pops += 1
+        return priority, node
+
+    def peek_priority(self):
+        return self._heap[0][0]
+
+    def clear(self):
+        self._heap = []
+        self._counter = 0
+
+    def __len__(self):
+        return len(self._heap)
+
+
+class PackedHeapQueue(PriorityQueue):
+    """
+    Tas d'entiers : chaque entrée est la clé entière priorité * num_nodes + noeud.
+
+    Les comparaisons portent sur des entiers Python au lieu de tuples. Les
+    priorités multipliées par scale doivent être entières (coûts de pas entiers,
+    heuristique de Manhattan) ; à priorité égale, le plus petit identifiant sort
+    en premier. Dès qu'une priorité n'est pas entière (diagonales de coût √2,
+    heuristique euclidienne...), la file convertit ses entrées en tuples
+    (priorité, noeud) : même ordre d'extraction, sans le gain des entiers.
+    """
+
+    name = "packed"
+
+    def __init__(self, num_nodes, scale=1):
+        """
+        Args:
+            num_nodes (int): Nombre de noeuds du graphe (borne des identifiants)
+            scale (int): Facteur appliqué aux priorités avant encodage
+        """
+        super().__init__()
+        self.num_nodes = num_nodes
+        self.scale = scale
+        self._heap = []
+        # False après le repli sur des tuples (priorité non entière)
+        self.packed = True
+
+    def push(self, priority, node):
+        if self.packed:
+            scaled = priority * self.scale
+            key = int(scaled)
+            if key == scaled:
+                heapq.heappush(self._heap, key * self.num_nodes + node)
+            else:
+                self._unpack()
+                heapq.heappush(self._heap, (priority, node))
+        else:
+            heapq.heappush(self._heap, (priority, node))
+        self.pushes += 1
+        if len(self._heap) > self.max_size:
+            self.max_size = len(self._heap)
+
+    def pop(self):
+        entry = heapq.heappop(self._heap)
+        self.pops += 1
+        if not self.packed:
+            return entry
+        key, node = divmod(entry, self.num_nodes)
+        return key / self.scale if self.scale != 1 else key, node
+
+    def peek_priority(self):
+        if not self.packed:
+            return self._heap[0][0]
+        key = self._heap[0] // self.num_nodes
+        return key / self.scale if self.scale != 1 else key
+
+    def _unpack(self):
+        """Convertit les clés entières en tuples (priorité, noeud) (repli)."""
+        entries = [divmod(entry, self.num_nodes) for entry in self._heap]
+        if self.scale != 1:
+            entries = [(key / self.scale, node) for key, node in entries]
+        # L'ordre des clés entières est celui des tuples : le tas reste valide
+        self._heap = entries
+        self.packed = False
+
+    def clear(self):
+        self._heap = []
+        self.packed = True
+
+    def __len__(self):
+        return len(self._heap)
+
+
+class IndexedHeapQueue(PriorityQueue):
+    """
+    Tas binaire indexé avec diminution de clé.
+
+    Chaque noeud apparaît au plus une fois : une nouvelle priorité plus basse
+    remonte l'entrée existante au lieu d'en ajouter une seconde. Les clés sont
+    des couples (priorité, ordre d'insertion) pour départager les égalités dans
+    le même ordre que la file heapq.
+    """
+
+    name = "indexed"
+
+    def __init__(self):
+        super().__init__()
+        self._heap = []       # Noeuds ordonnés en tas
+        self._keys = {}       # noeud -> (priorité, ordre)
+        self._position = {}   # noeud -> indice dans _heap
+        self._counter = 0
+
+    def push(self, priority, node):
+        key = (priority, self._counter)
+        self._counter += 1
+        self.pushes += 1
+        index = self._position.get(node)
+        if index is None:
+            self._keys[node] = key
+            self._heap.append(node)
+            self._position[node] = len(self._heap) - 1
+            self._sift_up(len(self._heap) - 1)
+            if len(self._heap) > self.max_size:
+                self.max_size = len(self._heap)
+        elif priority < self._keys[node][0]:
+            self._keys[node] = key
+            self.decrease_keys += 1
+            self._sift_up(index)
+
+    def pop(self):
+        heap = self._heap
+        node = heap[0]
+        last = heap.pop()
+        if heap:
+            heap[0] = last
+            self._position[last] = 0
+            self._sift_down(0)
+        del self._position[node]
+        priority = self._keys.pop(node)[0]
+        self.pops += 1
+        return priority, node
+
+    def peek_priority(self):
+        return self._keys[self._heap[0]][0]
+
+    def clear(self):
+        self._heap = []
+        self._keys = {}
+        self._position = {}
+        self._counter = 0
+
+    def __len__(self):
+        return len(self._heap)
+
+    def _sift_up(self, index):
+        heap, keys, position = self._heap, self._keys, self._position
+        node = heap[index]
+        key = keys[node]
+        while index > 0:
+            parent_index = (index - 1) >> 1
+            parent = heap[parent_index]
+            if key >= keys[parent]:
+                break
+            heap[index] = parent
+            position[parent] = index
+            index = parent_index
+        heap[index] = node
+        position[node] = index
+
+    def _sift_down(self, index):
+        heap, keys, position = self._heap, self._keys, self._position
+        size = len(heap)
+        node = heap[index]
+        key = keys[node]
+        while True:
+            child = 2 * index + 1
+            if child >= size:
+                break
+            if child + 1 < size and keys[heap[child + 1]] < keys[heap[child]]:
+                child += 1
+            if keys[heap[child]] >= key:
+                break
+            heap[index] = heap[child]
+            position[heap[index]] = index
+            index = child
+        heap[index] = node
+        position[node] = index
+
+
+class _PairingNode:
+    """Noeud interne du tas d'appariement."""
+
+    __slots__ = ("key", "node", "child", "sibling", "prev")
+
+    def __init__(self, key, node):
+        self.key = key
+        self.node = node
+        self.child = None
+        self.sibling = None
+        self.prev = None  # Parent si premier enfant, sinon frère précédent
+
+
+class PairingHeapQueue(PriorityQueue):
+    """
+    Tas d'appariement (pairing heap) avec diminution de clé.
+
+    Insertion et diminution de clé en O(1), extraction du minimum en O(log n)
+    amorti. Comme IndexedHeapQueue, chaque noeud apparaît au plus une fois.
+    """
+
+    name = "pairing"
+
+    def __init__(self):
+        super().__init__()
+        self._root = None
+        self._handles = {}
+        self._counter = 0
+
+    def push(self, priority, node):
+        key = (priority, self._counter)
+        self._counter += 1
+        self.pushes += 1
+        handle = self._handles.get(node)
+        if handle is None:
+            handle = _PairingNode(key, node)
+            self._handles[node] = handle
+            self._root = handle if self._root is None else self._meld(self._root, handle)
+            if len(self._handles) > self.max_size:
+                self.max_size = len(self._handles)
+        elif priority < handle.key[0]:
+            handle.key = key
+            self.decrease_keys += 1
+            if handle is not self._root:
+                self._detach(handle)
+                self._root = self._meld(self._root, handle)
+
+    def pop(self):
+        root = self._root
+        del self._handles[root.node]
+        self._root = self._merge_pairs(root.child)
+        if self._root is not None:
+            self._root.prev = None
+        self.pops += 1
+        return root.key[0], root.node
+
+    def peek_priority(self):
+        return self._root.key[0]
+
+    def clear(self):
+        self._root = None
+        self._handles = {}
+        self._counter = 0
+
+    def __len__(self):
+        return len(self._handles)
+
+    @staticmethod
+    def _meld(a, b):
+        """Fusionne deux racines ; retourne la nouvelle racine."""
+        if b.key < a.key:
+            a, b = b, a
+        # b devient le premier enfant de a
+        b.prev = a
+        b.sibling = a.child
+        if a.child is not None:
+            a.child.prev = b
+        a.child = b
+        a.sibling = None
+        return a
+
+    @staticmethod
+    def _detach(handle):
+        """Détache un sous-arbre de son parent ou de ses frères."""
+        prev = handle.prev
+        if prev.child is handle:
+            prev.child = handle.sibling
+        else:
+            prev.sibling = handle.sibling
+        if handle.sibling is not None:
+            handle.sibling.prev = prev
+        handle.prev = None
+        handle.sibling = None
+
+    def _merge_pairs(self, first):
+        """Fusion en deux passes de la liste des enfants (itérative)."""
+        if first is None:
+            return None
+        # Première passe : fusion par paires, de gauche à droite
+        pairs = []
+        current = first
+        while current is not None:
+            a = current
+            b = current.sibling
+            current = b.sibling if b is not None else None
+            a.sibling = a.prev = None
+            if b is not None:
+                b.sibling = b.prev = None
+                a = self._meld(a, b)
+            pairs.append(a)
+        # Seconde passe : fusion de droite à gauche
+        root = pairs.pop()
+        while pairs:
+            root = self._meld(pairs.pop(), root)
+        return root
+
+
+class BucketQueue(PriorityQueue):
+    """
+    File à seaux circulaire (algorithme de Dial).
+
+    Avec des coûts d'arête entiers dans [0, max_edge_cost], toutes les priorités
+    présentes dans la file de Dijkstra sont comprises entre la priorité courante
+    et la priorité courante + max_edge_cost : max_edge_cost + 1 seaux suffisent.
+    Insertion en O(1), extraction en O(1) amorti ; à priorité égale, l'ordre
+    d'insertion est respecté.
+    """
+
+    name = "bucket"
+
+    def __init__(self, max_edge_cost):
+        """
+        Args:
+            max_edge_cost (int): Coût d'arête entier maximal
+        """
+        super().__init__()
+        self.max_edge_cost = int(max_edge_cost)
+        self._num_buckets = self.max_edge_cost + 1
+        self._buckets = [deque() for _ in range(self._num_buckets)]
+        self._cursor = 0
+        self._size = 0
+
+    def push(self, priority, node):
+        key = int(priority)
+        if key != priority:
+            raise ValueError(f"Priorité non entière pour la file bucket : {priority}")
+        if self._size == 0:
+            self._cursor = key
+        elif not self._cursor <= key <= self._cursor + self.max_edge_cost:
+            raise ValueError(f"Priorité hors de la fenêtre de la file bucket : {priority} "
+                             f"(attendu entre {self._cursor} et {self._cursor + self.max_edge_cost})")
+        self._buckets[key % self._num_buckets].append(node)
+        self._size += 1
+        self.pushes += 1
+        if self._size > self.max_size:
+            self.max_size = self._size
+
+    def _advance(self):
+        """Avance le curseur jusqu'au premier seau non vide."""
+        buckets = self._buckets
+        num_buckets = self._num_buckets
+        while not buckets[self._cursor % num_buckets]:
+            self._cursor += 1
+
+    def pop(self):
+        self._advance()
+        node = self._buckets[self._cursor % self._num_buckets].popleft()
+        self._size -= 1
+        self.pops += 1
+        return self._cursor, node
+
+    def peek_priority(self):
+        self._advance()
+        return self._cursor
+
+    def clear(self):
+        for bucket in self._buckets:
+            bucket.clear()
+        self._cursor = 0
+        self._size = 0
+
+    def __len__(self):
+        return self._size
+
+
+class RadixHeapQueue(PriorityQueue):
+    """
+    Tas radix pour priorités entières monotones.
+
+    Le seau i contient les clés dont le bit de poids fort différant de la
+    dernière clé extraite est le bit i - 1. Chaque clé ne descend que vers des
+    seaux d'indice plus petit : O(log C) amorti par opération, sans comparaison
+    de tuples.
+    """
+
+    name = "radix"
+
+    def __init__(self, key_bits=64):
+        """
+        Args:
+            key_bits (int): Nombre de bits maximal des clés
+        """
+        super().__init__()
+        self._buckets = [[] for _ in range(key_bits + 1)]
+        self._last = 0
+        self._size = 0
+
+    def push(self, priority, node):
+        key = int(priority)
+        if key != priority:
+            raise ValueError(f"Priorité non entière pour la file radix : {priority}")
+        if self._size == 0 and key < self._last:
+            self._last = key
+        elif key < self._last:
+            raise ValueError(f"Priorité non monotone pour la file radix : {priority} < {self._last}")
+        self._buckets[(key ^ self._last).bit_length()].append((key, node))
+        self._size += 1
+        self.pushes += 1
+        if self._size > self.max_size:
+            self.max_size = self._size
+
+    def _refill(self):
+        """Redistribue le premier seau non vide quand le seau 0 est vide."""
+        buckets = self._buckets
+        if buckets[0]:
+            return
+        index = 1
+        while not buckets[index]:
+            index += 1
+        entries = buckets[index]
+        buckets[index] = []
+        last = min(entries)[0]
+        self._last = last
+        for entry in entries:
+            buckets[(entry[0] ^ last).bit_length()].append(entry)
+
+    def pop(self):
+        self._refill()
+        key, node = self._buckets[0].pop()
+        self._size -= 1
+        self.pops += 1
+        return key, node
+
+    def peek_priority(self):
+        self._refill()
+        return self._last
+
+    def clear(self):
+        for bucket in self._buckets:
+            bucket.clear()
+        self._last = 0
+        self._size = 0
+
+    def __len__(self):
+        return self._size
+
+
+QUEUE_TYPES = ("heapq", "packed", "indexed", "pairing", "bucket", "radix")
+MONOTONE_QUEUE_TYPES = ("bucket", "radix")
+
+
+def make_queue(kind, num_nodes, max_edge_cost=None):
+    """
+    Crée une file de priorité à partir de son nom.
+
+    Args:
+        kind (str | PriorityQueue): Nom de la file (voir QUEUE_TYPES) ou file déjà
+                                    construite (retournée telle quelle après avoir
+                                    été vidée)
+        num_nodes (int): Nombre de noeuds du graphe
+        max_edge_cost (int, optional): Coût d'arête entier maximal (requis pour "bucket")
+
+    Returns:
+        PriorityQueue: La file de priorité, vide
+    """
+    if isinstance(kind, PriorityQueue):
+        kind.clear()
+        return kind
+    if kind is None or kind == "heapq":
+        return HeapQueue()
+    if kind == "packed":
+        return PackedHeapQueue(num_nodes)
+    if kind == "indexed":
+        return IndexedHeapQueue()
+    if kind == "pairing":
+        return PairingHeapQueue()
+    if kind == "bucket":
+        if max_edge_cost is None:
+            raise ValueError("La file bucket nécessite le coût d'arête maximal (max_edge_cost)")
+        return BucketQueue(max_edge_cost)
+    if kind == "radix":
+        return RadixHeapQueue()
+    raise ValueError(f"Type de file inconnu : {kind} (attendu : {', '.join(QUEUE_TYPES)})")
@@ -0,0 +1,110 @@
+"""
+État de recherche stocké dans des tableaux NumPy préalloués.
+
+Les solveurs par défaut gardent g, les parents et l'ensemble fermé dans des
+dictionnaires et ensembles indexés par cellule. Sur de grandes grilles, chaque
+requête alloue alors des millions d'entrées. SearchState remplace ces structures
+par des tableaux indexés par identifiant plat de cellule :
+
+- g (float64) : meilleur coût connu
+- parent (int32) : prédécesseur sur le meilleur chemin (-1 = aucun)
+- seen (uint32) : g[i] et parent[i] sont valides si seen[i] == generation
+- closed (uint32) : la cellule i est fermée si closed[i] == generation
+
+La remise à zéro entre deux requêtes se fait en O(1) : il suffit d'incrémenter
+la génération, les anciennes valeurs deviennent invalides d'elles-mêmes.
+
+Les boucles de recherche accèdent aux tableaux élément par élément : elles passent
+par des memoryview (voir SearchState.views), nettement plus rapides en Python pur
+que l'indexation scalaire NumPy, sans copie des données.
+"""
+
+import numpy as np
+
+
+class SearchState:
+    """
+    Tampons de recherche réutilisables entre les requêtes.
+    """
+
+    # Au-delà, les tampons uint32 sont remis à zéro (débordement de la génération)
+    MAX_GENERATION = np.iinfo(np.uint32).max
+
+    def __init__(self, num_nodes):
+        """
+        Alloue les tampons pour un graphe de num_nodes noeuds.
+
+        Args:
+            num_nodes (int): Nombre de cellules de la grille
+        """
+        self.num_nodes = num_nodes
+        self.g = np.zeros(num_nodes, dtype=np.float64)
+        self.parent = np.full(num_nodes, -1, dtype=np.int32)
+        self.seen = np.zeros(num_nodes, dtype=np.uint32)
+        self.closed = np.zeros(num_nodes, dtype=np.uint32)
+        self.generation = 0
+        self._views = (memoryview(self.g), memoryview(self.parent),
+                       memoryview(self.seen), memoryview(self.closed))
+
+    def reset(self):
+        """
+        Prépare les tampons pour une nouvelle requête.
+
+        Returns:
+            int: La génération courante à comparer aux tampons seen/closed
+        """
+        if self.generation >= self.MAX_GENERATION:
+            self.seen.fill(0)
+            self.closed.fill(0)
+            self.generation = 0
+        self.generation += 1
+        return self.generation
+
+    def views(self):
+        """
+        Retourne des vues mémoire sur les tampons, pour les boucles de recherche.
+
+        Returns:
+            tuple: (g, parent, seen, closed) sous forme de memoryview
+        """
+        return self._views
+
+    def closed_nodes(self):
+        """Retourne les identifiants des cellules fermées pendant la requête courante."""
+        return np.flatnonzero(self.closed == self.generation)
+
+    def num_closed(self):
+        """Retourne le nombre de cellules fermées pendant la requête courante."""
+        return int(np.count_nonzero(self.closed == self.generation))
+
+    def path_to(self, node):
+        """
+        Reconstruit le chemin en remontant les parents jusqu'à la racine.
+
+        Args:
+            node (int): Identifiant de la cellule finale
+
+        Returns:
+            list: Identifiants ordonnés de la racine jusqu'à node
+
+        Raises:
+            RuntimeError: Si les parents forment une boucle (chemin incohérent)
+        """
+        path = [node]
+        seen = {node}
+        parent = self._views[1]
+        for _ in range(self.num_nodes):
+            node = parent[node]
+            if node < 0:
+                break
+            if node in seen:
+                raise RuntimeError(f"Boucle dans les parents en {node} : chemin incohérent")
+            seen.add(node)
+            path.append(node)
+        path.reverse()
+        return path
+
+    @property
+    def nbytes(self):
+        """Mémoire occupée par les tampons (en octets)."""
+        return self.g.nbytes + self.parent.nbytes + self.seen.nbytes + self.closed.nbytes
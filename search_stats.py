@@ -0,0 +1,134 @@
+"""
+Instrumentation uniforme des recherches (paramètre stats des solveurs).
+
+Les formes de retour varient d'un solveur à l'autre : (path, explored_set) pour
+Maze.solve, tuples de 4 ou 6 éléments pour les recherches bidirectionnelles,
+compteurs propres à chaque planificateur (stats() de D* Lite, HPA*, CH). Tous
+les solveurs acceptent en plus un paramètre stats : une instance de SearchStats,
+remplie pendant l'appel avec les mêmes champs :
+
+- algorithm : variante exécutée ("astar", "dijkstra", "astar_jps", "goal_cache",
+  "bidirectional_astar", "dstar_lite", "hpa", "contraction_hierarchy",
+  "ara_star"...) ;
+- found, cost, path_length : résultat de la recherche (cost est le coût
+  calculé par le solveur, dans son propre graphe ; None s'il ne le connaît pas) ;
+- bound : borne de sous-optimalité garantie du coût (1.0 : chemin optimal) pour
+  les recherches sous-optimales bornées (ARA*), None sinon ;
+- expansions : cellules (ou noeuds) développées ;
+- pushes : insertions dans la liste ouverte ;
+- stale_pops : extractions d'entrées périmées (cellule déjà fermée) ;
+- peak_open : taille maximale de la liste ouverte (somme des deux listes pour
+  une recherche bidirectionnelle) ;
+- closed : taille de l'ensemble fermé à la fin de la recherche ;
+- setup_time, search_time, reconstruction_time (secondes, time.perf_counter) :
+  préparation (graphe compilé, tampons, synchronisation du planificateur),
+  boucle de recherche et reconstruction du chemin.
+
+Un compteur qu'un solveur ne peut pas mesurer vaut None. Sans stats (défaut),
+les solveurs n'exécutent aucune mesure : seul un test par extraction de la
+liste ouverte (taille maximale) distingue les deux modes.
+"""
+
+import time
+
+
+class SearchStats:
+    """
+    Compteurs et temps d'une recherche.
+    """
+
+    __slots__ = ("algorithm", "found", "cost", "bound", "path_length", "expansions", "pushes",
+                 "stale_pops", "peak_open", "closed", "setup_time", "search_time",
+                 "reconstruction_time", "_clock")
+
+    # Champs exportés par as_dict, dans l'ordre
+    FIELDS = __slots__[:-1]
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self, algorithm=None):
+        """
+        Remet tous les champs à zéro et démarre le chronomètre.
+
+        Args:
+            algorithm (str, optional): Variante exécutée
+        """
+        self.algorithm = algorithm
+        self.found = False
+        self.cost = None
+        self.bound = None
+        self.path_length = 0
+        self.expansions = 0
+        self.pushes = 0
+        self.stale_pops = 0
+        self.peak_open = 0
+        self.closed = 0
+        self.setup_time = 0.0
+        self.search_time = 0.0
+        self.reconstruction_time = 0.0
+        self._clock = time.perf_counter()
+
+    def lap(self, phase):
+        """
+        Attribue le temps écoulé depuis le dernier appel à une phase.
+
+        Args:
+            phase (str): "setup", "search" ou "reconstruction"
+        """
+        now = time.perf_counter()
+        attribute = phase + "_time"
+        setattr(self, attribute, getattr(self, attribute) + now - self._clock)
+        self._clock = now
+
+    def end_search(self, expansions, pushes, stale_pops, peak_open, closed=None):
+        """
+        Enregistre les compteurs de la boucle de recherche et son temps.
+
+        Args:
+            expansions (int): Cellules développées
+            pushes (int): Insertions dans la liste ouverte
+            stale_pops (int): Extractions d'entrées périmées
+            peak_open (int): Taille maximale de la liste ouverte
+            closed (int, optional): Taille de l'ensemble fermé (par défaut expansions)
+        """
+        self.lap("search")
+        self.expansions = expansions
+        self.pushes = pushes
+        self.stale_pops = stale_pops
+        self.peak_open = peak_open
+        self.closed = expansions if closed is None else closed
+
+    def finish(self, path, cost=None):
+        """
+        Enregistre le résultat et attribue le temps restant à la reconstruction.
+
+        Args:
+            path (list | None): Chemin trouvé
+            cost (float, optional): Coût du chemin, s'il est connu du solveur
+        """
+        self.lap("reconstruction")
+        self.found = path is not None
+        self.path_length = len(path) if path else 0
+        if cost is not None and self.found:
+            self.cost = float(cost)
+
+    @property
+    def total_time(self):
+        """Durée totale de la recherche (secondes)."""
+        return self.setup_time + self.search_time + self.reconstruction_time
+
+    def as_dict(self):
+        """
+        Retourne les champs (exportables tels quels en JSON).
+
+        Returns:
+            dict: Champs de FIELDS et total_time
+        """
+        values = {name: getattr(self, name) for name in self.FIELDS}
+        values["total_time"] = self.total_time
+        return values
+
+    def __repr__(self):
+        return ("SearchStats(" + ", ".join(f"{name}={getattr(self, name)!r}" for name in self.FIELDS)
+                + ")")
@@ -0,0 +1,101 @@
+"""
+Recherche pas à pas : générateurs d'étapes des solveurs (solve_iter...).
+
+solve() exécute une recherche jusqu'au bout avant de rendre la main. Les
+variantes pas à pas (Maze.solve_iter, Maze.solve_dijkstra_iter,
+BiDirectionalMaze.dijkstra_bidirectional_iter et astar_bidirectional_iter)
+sont des générateurs : la recherche avance d'un paquet de batch_size cellules
+développées à chaque itération et produit une SearchStep :
+
+- expanded (et expanded_backward pour la recherche arrière d'une recherche
+  bidirectionnelle) : cellules (row, col) développées depuis l'étape précédente ;
+- expansions : cellules développées depuis le début ;
+- frontier : taille de la liste ouverte (des deux listes en bidirectionnel) ;
+- done, result : la dernière étape a done=True et result contient exactement
+  ce que retournerait la méthode de résolution correspondante (path reprend
+  le chemin).
+
+L'appelant peut afficher les cellules au fil de l'eau, ou arrêter la
+recherche à tout moment en cessant d'itérer (drive applique un budget de
+cellules ou une échéance). solve() est lui-même drive(solve_iter(None, ...)) :
+avec batch_size=None, le générateur ne produit que l'étape finale.
+
+Les variantes sans boucle pas à pas (cache des arrivées, JPS, array_state et
+files de priorité, composantes disjointes) produisent directement l'étape
+finale. Les temps de SearchStats et le temps écoulé des recherches
+bidirectionnelles incluent le temps passé par l'appelant entre deux étapes.
+"""
+
+import time
+
+
+# Taille par défaut des paquets de cellules développées
+DEFAULT_BATCH_SIZE = 256
+
+
+class SearchStep:
+    """
+    Étape d'une recherche pas à pas.
+    """
+
+    __slots__ = ("expanded", "expanded_backward", "expansions", "frontier", "done", "result")
+
+    def __init__(self, expanded, expansions, frontier, expanded_backward=(), done=False, result=None):
+        """
+        Args:
+            expanded (list): Cellules développées depuis l'étape précédente
+            expansions (int | None): Cellules développées depuis le début (None si
+                                     la variante ne les compte pas)
+            frontier (int | None): Taille de la liste ouverte
+            expanded_backward (list): Cellules développées par la recherche arrière
+            done (bool): True pour la dernière étape
+            result: Résultat de la méthode de résolution (dernière étape)
+        """
+        self.expanded = expanded
+        self.expanded_backward = expanded_backward
+        self.expansions = expansions
+        self.frontier = frontier
+        self.done = done
+        self.result = result
+
+    @classmethod
+    def final(cls, result):
+        """Étape finale unique d'une variante sans boucle pas à pas."""
+        return cls([], None, None, done=True, result=result)
+
+    @property
+    def path(self):
+        """Chemin trouvé (None avant la dernière étape ou sans chemin)."""
+        if not self.done:
+            return None
+        return self.result[0] if isinstance(self.result, tuple) else self.result
+
+    def __repr__(self):
+        return (f"SearchStep(expanded={len(self.expanded) + len(self.expanded_backward)}, "
+                f"expansions={self.expansions}, frontier={self.frontier}, done={self.done})")
+
+
+def drive(steps, max_expansions=None, deadline=None):
+    """
+    Fait avancer une recherche pas à pas jusqu'à la fin ou l'épuisement du budget.
+
+    Args:
+        steps (generator): Générateur d'étapes (solve_iter...)
+        max_expansions (int, optional): Arrête la recherche dès qu'une étape
+                                        atteint ce nombre de cellules développées
+        deadline (float, optional): Arrête la recherche à la première étape
+                                    produite après cette échéance (time.perf_counter())
+
+    Returns:
+        SearchStep: Dernière étape (done=False si la recherche a été interrompue ;
+                    le générateur est alors fermé)
+    """
+    step = None
+    for step in steps:
+        if step.done:
+            return step
+        if ((max_expansions is not None and step.expansions >= max_expansions)
+                or (deadline is not None and time.perf_counter() >= deadline)):
+            steps.close()
+            return step
+    return step
@@ -0,0 +1,305 @@
+"""
+Représentations compactes de la grille d'obstacles et de la matrice de récompense.
+
+Par défaut, Maze stocke la grille en entiers 64 bits et les récompenses en
+float64 : 16 octets par cellule, soit 6,4 Go pour une carte 20 000 x 20 000
+avant toute recherche. Un GridStorage choisit une représentation plus compacte :
+
+- obstacles : "int64" (défaut), "uint8" (1 octet par cellule) ou "bits"
+  (1 bit par cellule, PackedGrid) ;
+- coûts : "float64" (défaut), "float32" ou "int16" (récompenses entières
+  entre -32767 et 32767).
+
+Les solveurs compilent la grille en graphe CSR (grid_graph.py) par tranches de
+lignes, sans décompacter la grille entière. Les coûts d'arête suivent le
+stockage : float64 par défaut, float32 pour les coûts "float32" et "int16"
+(produits par le multiplicateur diagonal, non entiers). Le graphe reste la
+plus grosse structure (environ 9 à 13 octets par arête, 8 par cellule) :
+Maze.memory_usage le compte à part une fois compilé.
+
+Préréglages (paramètre storage de Maze et de create_complete_maze) :
+
+- "default" : int64 / float64 (comportement historique)
+- "compact" : uint8 / float32
+- "packed" : bits / float32
+- "packed_int16" : bits / int16
+"""
+
+import numbers
+
+import numpy as np
+
+
+OBSTACLE_FORMATS = ("int64", "uint8", "bits")
+COST_FORMATS = ("float64", "float32", "int16")
+
+# Bornes des récompenses représentables en int16 (-32768 n'a pas d'opposé)
+INT16_LIMIT = np.iinfo(np.int16).max
+
+
+class PackedGrid:
+    """
+    Grille d'obstacles à 1 bit par cellule (np.packbits, ligne par ligne).
+
+    Se comporte comme un tableau NumPy 2D de 0 et de 1 pour les accès utilisés
+    par les solveurs : lecture et écriture d'une cellule, tranches de lignes,
+    comparaisons (grid == 0) et conversion np.asarray.
+    """
+
+    def __init__(self, shape, bits=None):
+        """
+        Initialise une grille compacte.
+
+        Args:
+            shape (tuple): (height, width)
+            bits (np.ndarray, optional): Octets (height, ceil(width / 8)) déjà compactés
+        """
+        height, width = shape
+        self.shape = (height, width)
+        self._row_bytes = (width + 7) // 8
+        if bits is None:
+            bits = np.zeros((height, self._row_bytes), dtype=np.uint8)
+        self._set_bits(bits)
+
+    def _set_bits(self, bits):
+        # Octets projetés depuis un fichier (voir maze_file.py) : jamais copiés
+        self.mapped = isinstance(bits, np.memmap)
+        self.bits = np.ascontiguousarray(bits, dtype=np.uint8)
+        self._view = memoryview(self.bits.reshape(-1))
+
+    @classmethod
+    def from_array(cls, values):
+        """Compacte un tableau 2D (cellule non nulle = obstacle)."""
+        values = np.asarray(values)
+        return cls(values.shape, np.packbits(values != 0, axis=1))
+
+    ndim = 2
+    dtype = np.dtype(np.uint8)
+
+    @property
+    def size(self):
+        return self.shape[0] * self.shape[1]
+
+    @property
+    def nbytes(self):
+        return self.bits.nbytes
+
+    def __len__(self):
+        return self.shape[0]
+
+    def _cell(self, key):
+        """Retourne (row, col) positifs si key désigne une seule cellule, sinon None."""
+        if not (isinstance(key, tuple) and len(key) == 2
+                and isinstance(key[0], numbers.Integral) and isinstance(key[1], numbers.Integral)):
+            return None
+        row, col = int(key[0]), int(key[1])
+        height, width = self.shape
+        if row < 0:
+            row += height
+        if col < 0:
+            col += width
+        if not (0 <= row < height and 0 <= col < width):
+            raise IndexError(f"Cellule {key} hors de la grille {self.shape}")
+        return row, col
+
+    def __getitem__(self, key):
+        cell = self._cell(key)
+        if cell is not None:
+            row, col = cell
+            return (self._view[row * self._row_bytes + (col >> 3)] >> (7 - (col & 7))) & 1
+        if isinstance(key, tuple) and len(key) == 2 and isinstance(key[0], (slice, numbers.Integral)):
+            # Seules les lignes demandées sont décompactées
+            rows = np.unpackbits(self.bits[key[0]], axis=-1, count=self.shape[1])
+            return rows[..., key[1]]
+        return self.unpack()[key]
+
+    def __setitem__(self, key, value):
+        if self._view.readonly:
+            # Même erreur qu'un tableau NumPy projeté en lecture seule
+            raise ValueError("assignment destination is read-only")
+        cell = self._cell(key)
+        if cell is not None:
+            row, col = cell
+            index = row * self._row_bytes + (col >> 3)
+            mask = 1 << (7 - (col & 7))
+            if value:
+                self._view[index] |= mask
+            else:
+                self._view[index] &= ~mask & 0xFF
+            return
+        values = self.unpack()
+        values[key] = value
+        self._set_bits(np.packbits(values != 0, axis=1))
+
+    def unpack(self):
+        """Retourne la grille décompactée (uint8, 0 = libre, 1 = obstacle)."""
+        return np.unpackbits(self.bits, axis=1, count=self.shape[1])
+
+    def __array__(self, dtype=None, copy=None):
+        values = self.unpack()
+        return values if dtype is None else values.astype(dtype)
+
+    def __eq__(self, other):
+        return self.unpack() == other
+
+    def __ne__(self, other):
+        return self.unpack() != other
+
+    __hash__ = None
+
+    def astype(self, dtype):
+        return self.unpack().astype(dtype)
+
+    def copy(self):
+        return PackedGrid(self.shape, self.bits.copy())
+
+    def __getstate__(self):
+        return {"shape": self.shape, "bits": self.bits}
+
+    def __setstate__(self, state):
+        self.__init__(state["shape"], state["bits"])
+
+    def __repr__(self):
+        return f"PackedGrid(shape={self.shape}, nbytes={self.nbytes})"
+
+
+def _is_external(values):
+    """Indique si un tableau est servi depuis un fichier (projection ou tuiles)."""
+    return isinstance(values, np.memmap) or getattr(values, "mapped", False)
+
+
+class GridStorage:
+    """
+    Représentation de la grille d'obstacles et des récompenses d'un labyrinthe.
+    """
+
+    def __init__(self, obstacles="int64", costs="float64"):
+        """
+        Args:
+            obstacles (str): "int64", "uint8" ou "bits"
+            costs (str): "float64", "float32" ou "int16"
+
+        Raises:
+            ValueError: Si un format est inconnu
+        """
+        if obstacles not in OBSTACLE_FORMATS:
+            raise ValueError(f"Format d'obstacles inconnu : '{obstacles}' "
+                             f"(choix: {', '.join(OBSTACLE_FORMATS)})")
+        if costs not in COST_FORMATS:
+            raise ValueError(f"Format de coûts inconnu : '{costs}' "
+                             f"(choix: {', '.join(COST_FORMATS)})")
+        self.obstacles = obstacles
+        self.costs = costs
+        self.reward_dtype = np.dtype(costs)
+        # Coûts d'arête du graphe compilé (float32 exact sur les coûts int16)
+        self.weight_dtype = np.dtype(np.float64 if costs == "float64" else np.float32)
+
+    def __repr__(self):
+        return f"GridStorage(obstacles={self.obstacles!r}, costs={self.costs!r})"
+
+    def __eq__(self, other):
+        return (isinstance(other, GridStorage)
+                and (self.obstacles, self.costs) == (other.obstacles, other.costs))
+
+    def __hash__(self):
+        return hash((self.obstacles, self.costs))
+
+    def bytes_per_cell(self):
+        """Mémoire occupée par cellule (grille et récompenses, en octets)."""
+        grid_bytes = {"int64": 8, "uint8": 1, "bits": 0.125}[self.obstacles]
+        return grid_bytes + self.reward_dtype.itemsize
+
+    def empty_grid(self, shape):
+        """Grille sans obstacle dans cette représentation."""
+        if self.obstacles == "bits":
+            return PackedGrid(shape)
+        return np.zeros(shape, dtype=self.obstacles)
+
+    def as_grid(self, values, copy=True):
+        """
+        Convertit une grille d'obstacles dans cette représentation.
+
+        Un tableau externe déjà au bon format (numpy.memmap projeté depuis un
+        fichier, grille en tuiles de tiled_grid.py) n'est jamais copié.
+
+        Args:
+            values (array-like): Grille (0 = libre, non nul = obstacle)
+            copy (bool): Si False, un tableau déjà au bon format est gardé tel quel
+
+        Returns:
+            np.ndarray ou PackedGrid: Grille convertie
+        """
+        if self.obstacles == "bits":
+            if isinstance(values, PackedGrid):
+                return values.copy() if copy and not values.mapped else values
+            return PackedGrid.from_array(values)
+        if (not isinstance(values, PackedGrid) and getattr(values, "dtype", None) == self.obstacles
+                and (not copy or _is_external(values))):
+            return values
+        return np.array(values, dtype=self.obstacles)
+
+    def full_rewards(self, shape, value):
+        """Matrice de récompense constante dans cette représentation."""
+        rewards = np.empty(shape, dtype=self.reward_dtype)
+        rewards[...] = self.check_reward(value)
+        return rewards
+
+    def as_rewards(self, values, copy=True):
+        """
+        Convertit une matrice de récompense dans cette représentation.
+
+        Comme pour as_grid, un tableau externe déjà au bon format n'est jamais copié.
+
+        Raises:
+            ValueError: Si une récompense n'est pas représentable en int16
+        """
+        if (getattr(values, "dtype", None) == self.reward_dtype
+                and (not copy or _is_external(values))):
+            return values
+        if self.costs == "int16":
+            values = np.asarray(values)
+            if values.size and (not np.all(values == np.round(values))
+                                or np.abs(values).max() > INT16_LIMIT):
+                raise ValueError(f"Les récompenses doivent être entières et comprises entre "
+                                 f"-{INT16_LIMIT} et {INT16_LIMIT} en stockage int16")
+        return np.array(values, dtype=self.reward_dtype)
+
+    def check_reward(self, value):
+        """
+        Vérifie qu'une récompense est représentable.
+
+        Raises:
+            ValueError: Si la valeur n'est pas représentable en int16
+        """
+        if self.costs == "int16" and (value != round(value) or abs(value) > INT16_LIMIT):
+            raise ValueError(f"Récompense {value} non représentable en stockage int16")
+        return value
+
+
+# Préréglages nommés
+STORAGES = {
+    "default": GridStorage("int64", "float64"),
+    "compact": GridStorage("uint8", "float32"),
+    "packed": GridStorage("bits", "float32"),
+    "packed_int16": GridStorage("bits", "int16"),
+}
+
+
+def get_storage(storage):
+    """
+    Retourne la représentation correspondant à un préréglage ou à une instance.
+
+    Args:
+        storage (str | GridStorage): Nom du préréglage ou représentation
+
+    Returns:
+        GridStorage: Représentation
+
+    Raises:
+        ValueError: Si le préréglage est inconnu
+    """
+    if isinstance(storage, GridStorage):
+        return storage
+    if storage not in STORAGES:
+        raise ValueError(f"Stockage inconnu : '{storage}' (choix: {', '.join(STORAGES)})")
+    return STORAGES[storage]
@@ -13,7 +13,7 @@ Ce fichier répond aux questions du TP et teste les différents scénarios deman
 import time
 import numpy as np
 from Maze import Maze
-from main import create_complete_maze
+from main import create_complete_maze, add_bonus_cells
 
 
 def test_case(name, maze, show_grid=True):
@@ -210,6 +210,1045 @@ def test_5_comparison_large():
     test_case("Grand labyrinthe 30x30 avec motif complexe", maze, show_grid=False)
 
 
+def test_6_compiled_graph():
+    """Test 6: Graphe compilé réutilisé et recompilé après modification."""
+    print("\n" + "♦" * 70)
+    print("TEST 6 : GRAPHE COMPILÉ (CSR)")
+    print("♦" * 70)
+    
+    maze = create_complete_maze(
+        width=10,
+        height=10,
+        obstacle_type="random",
+        obstacle_density=0.0,
+        step_cost=-1.0,
+        goal_reward=100.0,
+        add_bonuses=False
+    )
+    
+    graph = maze.get_graph()
+    print(f"Noeuds: {graph.num_nodes}, arêtes: {len(graph.indices)}")
+    print(f"Graphe réutilisé sans modification: {'Oui' if maze.get_graph() is graph else 'Non'}")
+    
+    # Un obstacle sur (0, 1) retire l'arête (0, 0) -> (0, 1)
+    maze.set_obstacle(0, 1)
+    new_graph = maze.get_graph()
+    neighbors = [maze.cell_coords(v) for v, _ in new_graph.neighbors(maze.cell_id(0, 0))]
+    print(f"Graphe recompilé après set_obstacle: {'Oui' if new_graph is not graph else 'Non'}")
+    print(f"Voisins de (0, 0): {neighbors} (attendu: {maze.get_neighbors(0, 0)})")
+    
+    # Les solveurs parcourent les vues CSR arête par arête (sans liste par cellule)
+    indptr, indices, weights = new_graph.adjacency()
+    same_edges = all(
+        [(indices[edge], weights[edge]) for edge in range(indptr[node], indptr[node + 1])]
+        == list(new_graph.neighbors(node))
+        for node in range(new_graph.num_nodes)
+    )
+    print(f"adjacency() identique à neighbors(): {'✅' if same_edges else '❌'}")
+    
+    test_case("Labyrinthe 10x10 avec obstacle ajouté", maze, show_grid=False)
+
+
+def test_7_priority_queues():
+    """Test 7: Comparaison des files de priorité de la liste ouverte."""
+    print("\n" + "♦" * 70)
+    print("TEST 7 : FILES DE PRIORITÉ")
+    print("♦" * 70)
+    
+    from priority_queues import MONOTONE_QUEUE_TYPES, QUEUE_TYPES, make_queue
+    
+    maze = create_complete_maze(
+        width=30,
+        height=30,
+        obstacle_type="maze_pattern",
+        step_cost=-1.0,
+        goal_reward=-1.0,
+        add_bonuses=False,
+        seed=7
+    )
+    reference = maze.solve()
+    reference_cost = sum(-maze.rewards[i, j] for i, j in reference[1:]) if reference else None
+    
+    # Les files monotones (bucket, radix) sont réservées à Dijkstra : voir test 8
+    for kind in [k for k in QUEUE_TYPES if k not in MONOTONE_QUEUE_TYPES]:
+        queue = make_queue(kind, maze.width * maze.height)
+        start_time = time.time()
+        path = maze.solve(queue=queue)
+        elapsed = time.time() - start_time
+        cost = sum(-maze.rewards[i, j] for i, j in path[1:]) if path else None
+        stats = queue.stats()
+        print(f"{kind:>8} : coût {cost} ({'✅' if cost == reference_cost else '❌'}), "
+              f"{elapsed*1000:.2f} ms, insertions {stats['pushes']}, "
+              f"périmées {stats['stale_pops']}, taille max {stats['max_size']}")
+    
+    # DiagonalMaze : priorités non entières (diagonales de coût √2), la file
+    # packed se replie sur des tuples au lieu de lever une erreur
+    from benchmark import path_cost
+    from diagonal_maze import DiagonalMaze
+    diagonal = DiagonalMaze(maze.width, maze.height, maze.grid, maze.rewards, maze.start, maze.goal)
+    reference_cost = path_cost(diagonal, diagonal.solve())
+    for kind in [k for k in QUEUE_TYPES if k not in MONOTONE_QUEUE_TYPES]:
+        path = diagonal.solve(queue=kind)
+        cost = path_cost(diagonal, path)
+        print(f"{kind:>8} (diagonales) : coût {cost:.3f} "
+              f"({'✅' if abs(cost - reference_cost) < 1e-9 else '❌'})")
+
+
+def test_8_integer_costs_dijkstra():
+    """Test 8: Dijkstra avec file à seaux (Dial) sur des coûts entiers."""
+    print("\n" + "♦" * 70)
+    print("TEST 8 : DIJKSTRA AVEC COÛTS ENTIERS (DIAL / RADIX)")
+    print("♦" * 70)
+    
+    from benchmark import path_cost
+    from diagonal_maze import DiagonalMaze
+    
+    maze = create_complete_maze(
+        width=30,
+        height=30,
+        obstacle_type="random",
+        obstacle_density=0.2,
+        step_cost=-2.0,
+        goal_reward=100.0,
+        add_bonuses=False,
+        seed=8
+    )
+    # Diagonales de coût double : entrer dans l'arrivée en diagonale coûte
+    # 2 * -100, les arêtes vers l'arrivée n'ont plus toutes le même coût
+    diagonal = DiagonalMaze(maze.width, maze.height, maze.grid, maze.rewards, maze.start, maze.goal,
+                            diagonal_cost_multiplier=2.0)
+    
+    for target in (maze, diagonal):
+        print(f"{type(target).__name__} : coût d'arête entier maximal détecté "
+              f"{target.integer_edge_costs()}, entrée dans l'arrivée {target.uniform_goal_entry_cost()}")
+        reference_cost = path_cost(target, target.solve_dijkstra())
+        for kind in ("heapq", "auto", "bucket", "radix"):
+            start_time = time.time()
+            try:
+                path = target.solve_dijkstra(queue=kind)
+            except ValueError:
+                # L'arrivée ne peut pas être ignorée : les files monotones refusent
+                print(f"{kind:>7} : refusée ({'✅' if target is diagonal else '❌'})")
+                continue
+            elapsed = time.time() - start_time
+            cost = path_cost(target, path)
+            print(f"{kind:>7} : coût {cost} ({'✅' if path and cost == reference_cost else '❌'}), "
+                  f"{elapsed*1000:.2f} ms")
+    
+    # Avec des bonus (récompenses positives), les coûts ne sont plus positifs : retour au tas
+    maze.set_reward(3, 3, 5.0)
+    print(f"Après ajout d'un bonus, coût maximal détecté: {maze.integer_edge_costs()} "
+          f"(auto -> tas binaire)")
+    maze.solve_dijkstra(queue="auto")
+
+
+def test_9_jump_point_search():
+    """Test 9: Jump Point Search (JPS+) sur grilles à coût uniforme, 4 et 8 directions."""
+    print("\n" + "♦" * 70)
+    print("TEST 9 : JUMP POINT SEARCH (JPS+)")
+    print("♦" * 70)
+    
+    from diagonal_maze import DiagonalMaze
+    from benchmark import path_cost
+    from search_stats import SearchStats
+    
+    # Graine choisie pour qu'un chemin existe
+    maze = create_complete_maze(
+        width=40,
+        height=40,
+        obstacle_type="random",
+        obstacle_density=0.25,
+        step_cost=-1.0,
+        goal_reward=100.0,
+        add_bonuses=False,
+        seed=9
+    )
+    diagonal_maze = DiagonalMaze(maze.width, maze.height, grid=maze.grid, rewards=maze.rewards,
+                                 start=maze.start, goal=maze.goal)
+    # Récompense d'arrivée égale à celle des autres cellules : entrée uniforme
+    plain_rewards = maze.rewards.copy()
+    plain_rewards[maze.goal] = -1.0
+    plain_diagonal_maze = DiagonalMaze(maze.width, maze.height, grid=maze.grid, rewards=plain_rewards,
+                                       start=maze.start, goal=maze.goal)
+    
+    # Avec une récompense d'arrivée, l'entrée diagonale coûte plus cher : A* remplace JPS
+    for name, m, expected in (("4 directions", maze, "astar_jps"),
+                              ("8 directions", plain_diagonal_maze, "astar_jps"),
+                              ("8 directions, récompense d'arrivée", diagonal_maze, "astar")):
+        path, explored = m.solve_dijkstra(return_explored=True)
+        stats = SearchStats()
+        path_jps, jump_points = m.solve(return_explored=True, jps=True, stats=stats)
+        if path is None or path_jps is None:
+            print(f"❌ {name} : Dijkstra {path is not None}, JPS {path_jps is not None}")
+            continue
+        reference_cost = path_cost(m, path)
+        same_cost = (abs(reference_cost - path_cost(m, path_jps)) < 1e-9
+                     and abs(stats.cost - reference_cost) < 1e-9)
+        print(f"{name} : coût Dijkstra {reference_cost:.2f}, coût {stats.algorithm} "
+              f"{path_cost(m, path_jps):.2f} ({'✅' if same_cost else '❌'}), "
+              f"variante attendue {'✅' if stats.algorithm == expected else '❌'}, "
+              f"cellules explorées {len(explored)} -> {len(jump_points)}")
+    
+    # Les tables sont invalidées par un changement d'obstacle
+    tables = maze.get_jump_tables()
+    maze.set_obstacle(0, 1)
+    print(f"Tables recalculées après set_obstacle: {'Oui' if maze.get_jump_tables() is not tables else 'Non'}")
+
+
+def test_10_distance_field():
+    """Test 10: Champ de distances vectorisé vers l'arrivée (grille à coût uniforme)."""
+    print("\n" + "♦" * 70)
+    print("TEST 10 : CHAMP DE DISTANCES (FRONT D'ONDE)")
+    print("♦" * 70)
+    
+    from collections import deque
+    from benchmark import path_cost
+    
+    # Graine choisie pour que le départ soit relié à l'arrivée
+    maze = create_complete_maze(
+        width=30,
+        height=30,
+        obstacle_type="random",
+        obstacle_density=0.25,
+        step_cost=-1.0,
+        goal_reward=100.0,
+        add_bonuses=False,
+        seed=1
+    )
+    
+    field = maze.distance_field()
+    reachable = int((field.distances >= 0).sum())
+    print(f"Cellules reliées à l'arrivée: {reachable} / {maze.width * maze.height}")
+    
+    path_dijkstra = maze.solve_dijkstra()
+    path_field = field.path_from(maze.start)
+    if path_dijkstra is None or path_field is None:
+        print(f"❌ Chemin Dijkstra: {path_dijkstra is not None}, chemin du champ: {path_field is not None}")
+    else:
+        cost_dijkstra = path_cost(maze, path_dijkstra)
+        cost_field = path_cost(maze, path_field)
+        same_cost = (abs(cost_dijkstra - cost_field) < 1e-9 and path_field[0] == maze.start
+                     and path_field[-1] == maze.goal)
+        print(f"Coût Dijkstra: {cost_dijkstra:.1f}, coût du chemin lu dans le champ: {cost_field:.1f} "
+              f"({'✅' if same_cost else '❌'})")
+    
+    # Distances de référence : parcours en largeur depuis l'arrivée
+    reference = np.full((maze.height, maze.width), -1)
+    reference[maze.goal] = 0
+    frontier = deque([maze.goal])
+    while frontier:
+        row, col = frontier.popleft()
+        for next_row, next_col in ((row - 1, col), (row + 1, col), (row, col - 1), (row, col + 1)):
+            if maze.is_passable(next_row, next_col) and reference[next_row, next_col] < 0:
+                reference[next_row, next_col] = reference[row, col] + 1
+                frontier.append((next_row, next_col))
+    free_cells = np.argwhere(maze.grid == 0)
+    samples = free_cells[np.random.default_rng(10).choice(len(free_cells), size=20, replace=False)]
+    same_distances = all(field.distances[row, col] == reference[row, col] for row, col in samples)
+    print(f"Distances de 20 cellules identiques au parcours en largeur: {'✅' if same_distances else '❌'}")
+    
+    # Avec des bonus, les coûts ne sont plus uniformes
+    add_bonus_cells(maze, num_bonuses=3, bonus_value=10.0)
+    try:
+        maze.distance_field()
+        print("Coûts non uniformes acceptés ❌")
+    except ValueError:
+        print("Coûts non uniformes refusés ✅")
+
+
+def test_11_solve_many():
+    """Test 11: Lot de requêtes résolues en parallèle sur une grille partagée."""
+    print("\n" + "♦" * 70)
+    print("TEST 11 : LOT DE REQUÊTES (POOL DE PROCESSUS)")
+    print("♦" * 70)
+    
+    maze = create_complete_maze(
+        width=40,
+        height=40,
+        obstacle_type="random",
+        obstacle_density=0.2,
+        add_bonuses=False
+    )
+    free_cells = [tuple(int(v) for v in cell) for cell in np.argwhere(maze.grid == 0)]
+    rng = np.random.default_rng(0)
+    queries = [(free_cells[i], free_cells[j])
+               for i, j in rng.integers(len(free_cells), size=(50, 2))]
+    
+    start_time = time.time()
+    serial = list(maze.solve_many(queries, workers=1))
+    serial_time = time.time() - start_time
+    
+    start_time = time.time()
+    parallel = list(maze.solve_many(queries, workers=2))
+    parallel_time = time.time() - start_time
+    
+    print(f"{len(queries)} requêtes : série {serial_time*1000:.1f} ms, "
+          f"2 processus {parallel_time*1000:.1f} ms")
+    print(f"Résultats identiques et dans l'ordre: {'✅' if serial == parallel else '❌'}")
+    print(f"Départ/arrivée du labyrinthe inchangés: {maze.start}, {maze.goal}")
+
+
+def test_12_goal_cache():
+    """Test 12: Cache des champs de coût restant pour des requêtes vers la même arrivée."""
+    print("\n" + "♦" * 70)
+    print("TEST 12 : CACHE DES CHAMPS PAR ARRIVÉE")
+    print("♦" * 70)
+    
+    maze = create_complete_maze(
+        width=60,
+        height=60,
+        obstacle_type="random",
+        obstacle_density=0.2,
+        add_bonuses=False
+    )
+    free_cells = [tuple(int(v) for v in cell) for cell in np.argwhere(maze.grid == 0)]
+    rng = np.random.default_rng(1)
+    starts = [free_cells[i] for i in rng.integers(len(free_cells), size=30)]
+    
+    def path_cost(path):
+        return sum(-maze.rewards[cell] for cell in path[1:])
+    
+    start_time = time.time()
+    reference = []
+    for start in starts:
+        maze.start = start
+        reference.append(maze.solve_dijkstra())
+    search_time = time.time() - start_time
+    
+    cache = maze.enable_goal_cache()
+    start_time = time.time()
+    cached = []
+    for start in starts:
+        maze.start = start
+        cached.append(maze.solve_dijkstra())
+    cache_time = time.time() - start_time
+    
+    same_costs = all((p is None and q is None) or
+                     (p is not None and q is not None and path_cost(p) == path_cost(q))
+                     for p, q in zip(reference, cached))
+    print(f"{len(starts)} requêtes : Dijkstra {search_time*1000:.1f} ms, "
+          f"cache {cache_time*1000:.1f} ms (coûts identiques: {'✅' if same_costs else '❌'})")
+    print(f"Statistiques: {cache.stats()}")
+    
+    maze.set_obstacle(*free_cells[len(free_cells) // 2])
+    maze.solve_dijkstra()
+    print(f"Invalidation après set_obstacle: {'✅' if cache.invalidations == 1 else '❌'}")
+    
+    # Les bonus rendent des coûts d'arête négatifs : le champ inverse n'est plus
+    # exact, le cache doit céder la place à la recherche habituelle
+    from benchmark import path_cost as graph_path_cost
+    from search_stats import SearchStats
+    
+    same_costs = True
+    algorithms = set()
+    for seed in range(25, 35):
+        bonus_maze = create_complete_maze(20, 20, add_bonuses=True, seed=seed)
+        reference_cost = graph_path_cost(bonus_maze, bonus_maze.solve_dijkstra())
+        bonus_maze.enable_goal_cache()
+        stats = SearchStats()
+        cached_cost = graph_path_cost(bonus_maze, bonus_maze.solve_dijkstra(stats=stats))
+        algorithms.add(stats.algorithm)
+        same_costs &= (reference_cost is None) == (cached_cost is None) and (
+            reference_cost is None or abs(reference_cost - cached_cost) < 1e-9)
+    print(f"Labyrinthes à bonus, coûts identiques avec et sans cache: {'✅' if same_costs else '❌'} "
+          f"(variantes {sorted(algorithms)})")
+
+
+def test_13_incremental_replanning():
+    """Test 13: Replanification incrémentale D* Lite après des changements d'obstacles."""
+    print("\n" + "♦" * 70)
+    print("TEST 13 : REPLANIFICATION INCRÉMENTALE (D* LITE)")
+    print("♦" * 70)
+    
+    from dstar_lite import DStarLite
+    
+    maze = create_complete_maze(
+        width=80,
+        height=80,
+        obstacle_type="random",
+        obstacle_density=0.2,
+        add_bonuses=False
+    )
+    planner = DStarLite(maze)
+    
+    start_time = time.time()
+    path = planner.plan()
+    initial_time = time.time() - start_time
+    print(f"Planification initiale: {initial_time*1000:.1f} ms, "
+          f"{planner.expansions} cellules développées")
+    
+    all_match = True
+    replan_times = []
+    for step in range(5):
+        if path is None or len(path) < 10:
+            break
+        # Le robot avance d'une case puis découvre un obstacle sur son chemin
+        maze.start = path[1]
+        maze.set_obstacle(*path[len(path) // 2])
+        start_time = time.time()
+        path = planner.plan()
+        replan_times.append(time.time() - start_time)
+        reference = maze.solve_dijkstra()
+        all_match &= (path is None) == (reference is None) and \
+            (path is None or len(path) == len(reference))
+    
+    if replan_times:
+        print(f"Replanification moyenne: {np.mean(replan_times)*1000:.2f} ms, "
+              f"dernière: {planner.expansions} cellules développées")
+    print(f"Chemins de même longueur que Dijkstra: {'✅' if all_match else '❌'}")
+    
+    # Récompense d'arrivée avec des diagonales : l'entrée diagonale coûte plus
+    # cher que l'entrée droite, le coût d'entrée ne peut pas être remplacé
+    from diagonal_maze import DiagonalMaze
+    diagonal_maze = DiagonalMaze(9, 9, start=(0, 0), goal=(4, 4), diagonal_cost_multiplier=2.0)
+    diagonal_maze.set_reward(4, 4, 100.0)
+    try:
+        DStarLite(diagonal_maze)
+        refused = False
+    except ValueError:
+        refused = True
+    print(f"Entrées diagonales et droites de coûts différents refusées: {'✅' if refused else '❌'}")
+
+
+def test_14_hierarchical_search():
+    """Test 14: Recherche hiérarchique HPA* (chemin quasi optimal et raffinement optimal)."""
+    print("\n" + "♦" * 70)
+    print("TEST 14 : RECHERCHE HIÉRARCHIQUE (HPA*)")
+    print("♦" * 70)
+    
+    from hpa import HierarchicalPlanner
+    from benchmark import path_cost
+    
+    # Graine choisie pour qu'un chemin existe
+    maze = create_complete_maze(
+        width=120,
+        height=120,
+        obstacle_type="random",
+        obstacle_density=0.2,
+        add_bonuses=False,
+        seed=2
+    )
+    planner = HierarchicalPlanner(maze, cluster_size=16)
+    
+    start_time = time.time()
+    reference = maze.solve_dijkstra()
+    dijkstra_time = time.time() - start_time
+    
+    planner.solve()
+    start_time = time.time()
+    path = planner.solve()
+    hpa_time = time.time() - start_time
+    optimal_path = planner.solve(optimal=True)
+    
+    if reference is None or path is None or optimal_path is None:
+        print(f"❌ Chemins trouvés - Dijkstra: {reference is not None}, HPA*: {path is not None}, "
+              f"HPA* optimal: {optimal_path is not None}")
+    else:
+        # Chemin valide : du départ à l'arrivée, par des cellules libres voisines
+        steps = {(d_row, d_col) for d_row, d_col, _ in maze.graph_directions()}
+        valid = (path[0] == maze.start and path[-1] == maze.goal
+                 and all(maze.is_passable(*cell) for cell in path)
+                 and all((r2 - r1, c2 - c1) in steps for (r1, c1), (r2, c2) in zip(path, path[1:])))
+        reference_cost = path_cost(maze, reference)
+        hpa_cost = path_cost(maze, path)
+        optimal_cost = path_cost(maze, optimal_path)
+        print(f"Dijkstra: coût {reference_cost:.1f} en {dijkstra_time*1000:.1f} ms")
+        print(f"HPA* (clusters en cache): coût {hpa_cost:.1f} en {hpa_time*1000:.1f} ms, "
+              f"chemin valide {'✅' if valid else '❌'}")
+        print(f"HPA* avec raffinement optimal: coût {optimal_cost:.1f} "
+              f"({'✅' if abs(optimal_cost - reference_cost) < 1e-9 else '❌'})")
+    
+    # Une modification ne reconstruit que les clusters qui touchent la cellule
+    # (au coin de quatre clusters ici)
+    planner.precompute()
+    before = planner.stats()
+    row, col = 63, 64
+    size = planner.cluster_size
+    touched = {((row + d_row) // size, (col + d_col) // size)
+               for d_row in (-1, 0, 1) for d_col in (-1, 0, 1)}
+    maze.set_obstacle(row, col)
+    planner.solve()
+    planner.precompute()
+    stats = planner.stats()
+    invalidated = stats["clusters_invalidated"] - before["clusters_invalidated"]
+    rebuilt = stats["clusters_built"] - before["clusters_built"]
+    print(f"Clusters invalidés après set_obstacle: {invalidated}, reconstruits: {rebuilt} "
+          f"(clusters touchés: {len(touched)}) "
+          f"{'✅' if invalidated == rebuilt == len(touched) else '❌'}")
+
+
+def test_15_landmark_heuristic():
+    """Test 15: Heuristique ALT (repères) comparée à la distance de Manhattan."""
+    print("\n" + "♦" * 70)
+    print("TEST 15 : HEURISTIQUE ALT (REPÈRES)")
+    print("♦" * 70)
+    
+    from bidirectional import BiDirectionalMaze
+    from landmarks import compare_explored
+    
+    for obstacle_type in ["maze_pattern", "vertical_walls"]:
+        base = create_complete_maze(
+            width=80,
+            height=80,
+            obstacle_type=obstacle_type,
+            add_bonuses=False
+        )
+        maze = BiDirectionalMaze(base.width, base.height, base.grid, base.rewards,
+                                 base.start, base.goal)
+        reference = maze.solve()
+        landmarks = maze.enable_landmarks(count=8, selection="farthest")
+        path = maze.solve()
+        
+        queries = [(maze.start, maze.goal), (maze.goal, maze.start),
+                   ((0, maze.width - 1), (maze.height - 1, 0))]
+        report = compare_explored(maze, landmarks, queries)
+        
+        print(f"\n{obstacle_type}: {len(landmarks.landmarks)} repères, "
+              f"{landmarks.nbytes / 1024:.0f} Kio ({landmarks.to_landmarks.dtype})")
+        if reference is not None and path is not None:
+            print(f"  Chemin A* inchangé: {'✅' if len(path) == len(reference) else '❌'}")
+        for name, counts in report.items():
+            print(f"  {name}: {counts['base']} → {counts['alt']} cellules explorées "
+                  f"(-{counts['reduction']:.1f}%)")
+
+
+def test_16_contraction_hierarchy():
+    """Test 16: Hiérarchie de contraction (prétraitement, requêtes, sauvegarde)."""
+    print("\n" + "♦" * 70)
+    print("TEST 16 : HIÉRARCHIE DE CONTRACTION")
+    print("♦" * 70)
+    
+    import os
+    import tempfile
+    from contraction_hierarchy import ContractionHierarchy
+    
+    maze = create_complete_maze(
+        width=60,
+        height=60,
+        obstacle_type="random",
+        obstacle_density=0.2,
+        add_bonuses=False,
+        seed=0
+    )
+    hierarchy = ContractionHierarchy.build(maze)
+    stats = hierarchy.stats()
+    print(f"Prétraitement: {stats['build_time']:.2f} s, {stats['shortcuts']} raccourcis")
+    
+    reference = maze.solve_dijkstra()
+    start_time = time.time()
+    path = hierarchy.solve()
+    query_time = time.time() - start_time
+    
+    if reference is None or path is None:
+        print(f"Chemins trouvés - Dijkstra: {reference is not None}, CH: {path is not None}")
+    else:
+        print(f"Requête CH: {len(path)} cellules en {query_time*1000:.2f} ms "
+              f"({hierarchy.settled} noeuds fixés) "
+              f"{'✅' if len(path) == len(reference) else '❌'}")
+    
+    with tempfile.TemporaryDirectory() as directory:
+        filename = os.path.join(directory, "hierarchy.npz")
+        hierarchy.save(filename)
+        loaded = ContractionHierarchy.load(filename, maze)
+        print(f"Hiérarchie rechargée: chemin identique "
+              f"{'✅' if loaded.solve() == path else '❌'}")
+
+
+def test_17_connectivity_index():
+    """Test 17: Index des composantes connexes (rejet immédiat des requêtes sans chemin)."""
+    print("\n" + "♦" * 70)
+    print("TEST 17 : INDEX DES COMPOSANTES CONNEXES")
+    print("♦" * 70)
+    
+    maze = Maze(200, 200, start=(0, 0), goal=(199, 199))
+    # Mur complet sur la ligne 100 : aucun chemin possible
+    for j in range(maze.width):
+        maze.set_obstacle(100, j)
+    
+    start_time = time.time()
+    path_without_index = maze.solve()
+    time_without_index = time.time() - start_time
+    
+    index = maze.enable_connectivity_index()
+    start_time = time.time()
+    path_with_index = maze.solve()
+    time_with_index = time.time() - start_time
+    
+    print(f"Sans index: {path_without_index} en {time_without_index*1000:.1f} ms")
+    print(f"Avec index: {path_with_index} en {time_with_index*1000:.3f} ms")
+    
+    # Ouverture d'un passage puis fermeture : mises à jour incrémentales
+    maze.remove_obstacle(100, 50)
+    print(f"Passage ouvert: chemin trouvé {'✅' if maze.solve() is not None else '❌'}")
+    maze.set_obstacle(100, 50)
+    print(f"Passage refermé: requête rejetée {'✅' if maze.is_unreachable() else '❌'}")
+    print(f"Compteurs: {index.stats()}")
+
+
+def test_18_compact_storage():
+    """Test 18: Stockage compact de la grille et des récompenses."""
+    print("\n" + "♦" * 70)
+    print("TEST 18 : STOCKAGE COMPACT (OBSTACLES EN BITS, COÛTS FLOAT32 / INT16)")
+    print("♦" * 70)
+    
+    paths = {}
+    for storage in ("default", "compact", "packed", "packed_int16"):
+        np.random.seed(42)
+        maze = create_complete_maze(100, 100, obstacle_type="maze_pattern", storage=storage)
+        start_time = time.time()
+        paths[storage] = maze.solve()
+        elapsed = time.time() - start_time
+        usage = maze.memory_usage()
+        graph = maze.get_graph()
+        print(f"{storage:>13}: {usage['grid'] + usage['rewards']:>7} octets "
+              f"(grille {type(maze.grid).__name__}, récompenses {maze.rewards.dtype}), "
+              f"graphe {usage['graph']} octets (coûts {graph.weights.dtype}"
+              f"{' ✅' if usage['graph'] == graph.nbytes > 0 else ' ❌'}), A* en {elapsed*1000:.1f} ms")
+    
+    same = all(path == paths["default"] for path in paths.values())
+    print(f"Chemins identiques dans toutes les représentations: {'✅' if same else '❌'}")
+    
+    # Compilation par tranches de lignes : même graphe qu'en une seule tranche
+    import grid_graph
+    maze = create_complete_maze(100, 100, obstacle_type="random", storage="packed", seed=18)
+    whole = maze.get_graph()
+    chunk_cells = grid_graph.CHUNK_CELLS
+    grid_graph.CHUNK_CELLS = 250
+    try:
+        chunked = grid_graph.compile_grid_graph(maze.grid, maze.rewards, maze.graph_directions(),
+                                                maze.storage.weight_dtype)
+    finally:
+        grid_graph.CHUNK_CELLS = chunk_cells
+    same = all(np.array_equal(getattr(whole, name), getattr(chunked, name))
+               for name in ("indptr", "indices", "weights", "edge_directions"))
+    print(f"Graphe compilé par tranches identique: {'✅' if same else '❌'}")
+
+
+def test_19_mapped_maze_file():
+    """Test 19: Fichier de labyrinthe projeté en mémoire (numpy.memmap)."""
+    print("\n" + "♦" * 70)
+    print("TEST 19 : FICHIER DE LABYRINTHE PROJETÉ EN MÉMOIRE")
+    print("♦" * 70)
+    
+    import os
+    import tempfile
+    
+    np.random.seed(42)
+    maze = create_complete_maze(100, 100, obstacle_type="maze_pattern", storage="packed")
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "maze_100x100.maze")
+        maze.save(path, metadata={"pattern": "maze_pattern", "seed": 42})
+    
+        start_time = time.time()
+        loaded = Maze.load(path)
+        load_time = time.time() - start_time
+    
+        print(f"Fichier: {os.path.getsize(path)} octets, ouvert en {load_time*1000:.2f} ms")
+        print(f"Grille: {type(loaded.grid).__name__}, récompenses: {type(loaded.rewards).__name__}")
+        print(f"Métadonnées: {loaded.mapped_file.metadata}")
+        print(f"Même chemin que l'original: {'✅' if loaded.solve() == maze.solve() else '❌'}")
+    
+        # Copie à l'écriture : le fichier n'est pas modifié
+        loaded.set_obstacle(0, 1)
+        print(f"Fichier inchangé après modification: {'✅' if Maze.load(path).is_passable(0, 1) else '❌'}")
+
+
+def test_20_tiled_world():
+    """Test 20: Monde en tuiles chargées à la demande (cache LRU borné)."""
+    print("\n" + "♦" * 70)
+    print("TEST 20 : MONDE EN TUILES (CHARGEMENT À LA DEMANDE, CACHE LRU)")
+    print("♦" * 70)
+    
+    import os
+    import tempfile
+    
+    np.random.seed(42)
+    maze = create_complete_maze(300, 300, obstacle_type="random", obstacle_density=0.2)
+    reference = maze.solve()
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "world.tiles")
+        maze.save_tiled(path, tile_size=32)
+        
+        # Cache limité à 16 tuiles sur 100
+        tiled = Maze.open_tiled(path, cache_bytes=16 * 32 * 32 * 9)
+        start_time = time.time()
+        path_tiled = tiled.solve()
+        elapsed = time.time() - start_time
+        stats = tiled.tiles.stats()
+        
+        print(f"A* sur tuiles: {elapsed*1000:.1f} ms, même chemin qu'en mémoire: "
+              f"{'✅' if path_tiled == reference else '❌'}")
+        print(f"Tuiles: {stats['misses']} lectures, {stats['evictions']} évictions, "
+              f"taux de succès {stats['hit_rate']:.1%}, {stats['loaded']}/{stats['capacity']} en mémoire")
+
+
+def test_21_path_cache():
+    """Test 21: Cache des résultats de recherche invalidé par la version du labyrinthe."""
+    print("\n" + "♦" * 70)
+    print("TEST 21 : CACHE DES RÉSULTATS DE RECHERCHE")
+    print("♦" * 70)
+    
+    np.random.seed(42)
+    maze = create_complete_maze(150, 150, obstacle_type="maze_pattern")
+    cache = maze.enable_path_cache()
+    queries = [((0, 0), (149, 149)), ((0, 149), (149, 0)), ((75, 0), (75, 149))]
+    
+    start_time = time.time()
+    for _ in range(10):
+        for start, goal in queries:
+            maze.start, maze.goal = start, goal
+            maze.solve()
+    elapsed = time.time() - start_time
+    print(f"30 requêtes (3 distinctes): {elapsed*1000:.1f} ms, {cache.hits} succès / {cache.misses} échecs")
+    
+    # Une modification de la grille invalide les résultats
+    maze.set_obstacle(1, 0)
+    maze.start, maze.goal = queries[0]
+    path = maze.solve()
+    print(f"Après set_obstacle: recalcul {'✅' if cache.misses == 4 and (1, 0) not in path else '❌'}")
+    print(f"Compteurs: {cache.stats()}")
+    
+    # Un succès du cache retourne la durée de l'appel, pas celle de la recherche en cache
+    from bidirectional import BiDirectionalMaze
+    bidirectional_maze = BiDirectionalMaze(maze.width, maze.height, maze.grid, maze.rewards,
+                                           maze.start, maze.goal)
+    bidirectional_maze.enable_path_cache()
+    path, cost, search_elapsed, _ = bidirectional_maze.astar_bidirectional(return_explored=True)
+    cached_path, cached_cost, hit_elapsed, _ = bidirectional_maze.astar_bidirectional(return_explored=True)
+    print(f"A* bidirectionnel en cache: recherche {search_elapsed*1000:.2f} ms, "
+          f"succès {hit_elapsed*1000:.3f} ms "
+          f"{'✅' if cached_path == path and cached_cost == cost and hit_elapsed < search_elapsed else '❌'}")
+
+
+def test_22_seeded_generation():
+    """Test 22: Génération vectorisée et reproductible (paramètre seed)."""
+    print("\n" + "♦" * 70)
+    print("TEST 22 : GÉNÉRATION VECTORISÉE ET REPRODUCTIBLE")
+    print("♦" * 70)
+    
+    for obstacle_type in ("random", "vertical_walls", "horizontal_walls", "maze_pattern"):
+        start_time = time.time()
+        first = create_complete_maze(2000, 2000, obstacle_type=obstacle_type, seed=123)
+        elapsed = time.time() - start_time
+        second = create_complete_maze(2000, 2000, obstacle_type=obstacle_type, seed=123)
+        same = (np.array_equal(first.grid, second.grid)
+                and np.array_equal(first.rewards, second.rewards))
+        print(f"{obstacle_type:>16}: 2000x2000 en {elapsed*1000:.0f} ms, "
+              f"même graine -> même labyrinthe {'✅' if same else '❌'}")
+
+
+def test_23_maze_corpus():
+    """Test 23: Corpus de labyrinthes empilés, généré en parallèle."""
+    import os
+    import tempfile
+    from corpus import generate_corpus
+    from main import OBSTACLE_TYPES
+    
+    print("\n" + "♦" * 70)
+    print("TEST 23 : CORPUS DE LABYRINTHES")
+    print("♦" * 70)
+    
+    with tempfile.TemporaryDirectory() as directory:
+        start_time = time.time()
+        corpus = generate_corpus(os.path.join(directory, "corpus.maze"), 1000, 64, 64,
+                                 seed=42, workers=2)
+        elapsed = time.time() - start_time
+        print(f"{len(corpus)} labyrinthes 64x64 en {elapsed*1000:.0f} ms, "
+              f"tableaux {corpus.grids.shape}")
+        
+        types = {corpus.obstacle_type(index) for index in range(len(corpus))}
+        print(f"Tous les types d'obstacles: {'✅' if len(types) == len(OBSTACLE_TYPES) else '❌'}")
+        
+        again = generate_corpus(os.path.join(directory, "corpus"), 1000, 64, 64,
+                                seed=42, workers=1, compressed=True)
+        same = (np.array_equal(corpus.grids, again.grids)
+                and np.array_equal(corpus.rewards, again.rewards))
+        print(f"Même graine, 1 processus, archive compressée -> même corpus: {'✅' if same else '❌'}")
+        
+        maze = create_complete_maze(64, 64, obstacle_type=corpus.obstacle_type(7),
+                                    seed=int(corpus.seeds[7]))
+        print(f"Labyrinthe 7 = create_complete_maze(seed=seeds[7]): "
+              f"{'✅' if np.array_equal(maze.grid, corpus.grids[7]) else '❌'}")
+        print(f"Chemin dans le labyrinthe 7 du corpus: "
+              f"{'✅' if corpus.maze(7).solve() == maze.solve() else '❌'}")
+        del corpus, again
+
+
+def test_24_benchmark_harness():
+    """Test 24: Banc de mesure (médiane, p95, cellules développées, pic mémoire)."""
+    import os
+    import tempfile
+    from benchmark import load_results, run_benchmark, save_results
+    
+    print("\n" + "♦" * 70)
+    print("TEST 24 : BANC DE MESURE DES SOLVEURS")
+    print("♦" * 70)
+    
+    # Graine 1 : départ et arrivée connectés pour les deux types d'obstacles
+    report = run_benchmark(sizes=(20,), obstacle_types=("random", "maze_pattern"), seeds=(1,),
+                           solvers=("dijkstra", "astar", "bidirectional_astar", "diagonal_astar"),
+                           repeat=3, warmup=1)
+    for row in report["results"]:
+        print(f"{row['obstacle_type']:>12} {row['solver']:<20} {row['expansions']:>5} développées, "
+              f"médiane {row['median_ms']:.3f} ms, p95 {row['p95_ms']:.3f} ms, "
+              f"pic {row['peak_kib']:.1f} Kio")
+    print(f"Mesures toutes avec un chemin: {'✅' if len(report['results']) == 8 else '❌'}")
+    
+    # Graine 0 : l'obstacle aléatoire déconnecte l'arrivée, mesures reportées à part
+    disconnected = run_benchmark(sizes=(20,), obstacle_types=("random",), seeds=(0,),
+                                 solvers=("dijkstra", "astar"), repeat=1, warmup=0, memory=False)
+    print(f"Scénario sans chemin ignoré: "
+          f"{'✅' if not disconnected['results'] and len(disconnected['skipped']) == 2 else '❌'} "
+          f"({[row['reason'] for row in disconnected['skipped']]})")
+    
+    again = run_benchmark(sizes=(20,), obstacle_types=("random", "maze_pattern"), seeds=(1,),
+                          solvers=("dijkstra", "astar", "bidirectional_astar", "diagonal_astar"),
+                          repeat=1, warmup=0, memory=False)
+    same = ([row["expansions"] for row in report["results"]]
+            == [row["expansions"] for row in again["results"]])
+    print(f"Cellules développées identiques d'une exécution à l'autre: {'✅' if same else '❌'}")
+    
+    with tempfile.TemporaryDirectory() as directory:
+        save_results(report, os.path.join(directory, "resultats.json"))
+        save_results(report, os.path.join(directory, "resultats.csv"))
+        reloaded = load_results(os.path.join(directory, "resultats.json"))
+        with open(os.path.join(directory, "resultats.csv")) as handle:
+            lines = handle.read().splitlines()
+    print(f"Résultats JSON relus: {'✅' if reloaded['results'] == report['results'] else '❌'}, "
+          f"CSV: {'✅' if len(lines) == len(report['results']) + 1 else '❌'}")
+
+
+def test_25_performance_baseline():
+    """Test 25: Comparaison à une référence de performance (tests_performance.py)."""
+    from tests_performance import compare, run_corpus
+    
+    print("\n" + "♦" * 70)
+    print("TEST 25 : RÉFÉRENCE DE PERFORMANCE")
+    print("♦" * 70)
+    
+    corpus = {"count": 4, "width": 16, "height": 16, "seed": 1, "endpoints": "random"}
+    baseline = run_corpus(corpus, ("astar", "bidirectional_astar"), repeat=1, warmup=0)
+    run = run_corpus(corpus, ("astar", "bidirectional_astar"), repeat=1, warmup=0)
+    rows = compare(run, baseline, check_time=False)
+    print(f"Même corpus, mêmes cellules développées et mêmes coûts: "
+          f"{'✅' if not any(row[5] for row in rows) else '❌'}")
+    
+    baseline["solvers"]["astar"]["expansions"][0] -= 1
+    rows = compare(run, baseline, check_time=False)
+    flagged = [row[:2] for row in rows if row[5]]
+    print(f"Une cellule développée de plus est une régression: "
+          f"{'✅' if flagged == [('astar', 'développées')] else '❌'}")
+
+
+def test_26_search_stats():
+    """Test 26: Statistiques uniformes des recherches (search_stats.py)."""
+    from bidirectional import BiDirectionalMaze
+    from main import create_complete_maze
+    from search_stats import SearchStats
+    
+    print("\n" + "♦" * 70)
+    print("TEST 26 : STATISTIQUES DES RECHERCHES")
+    print("♦" * 70)
+    
+    maze = create_complete_maze(30, 30, obstacle_type="random", add_bonuses=False, seed=26)
+    maze = BiDirectionalMaze(maze.width, maze.height, maze.grid, maze.rewards, maze.start, maze.goal)
+    
+    stats = SearchStats()
+    path, explored = maze.solve(return_explored=True, stats=stats)
+    print(f"A*: {stats.expansions} développées, {stats.pushes} insertions, "
+          f"pic {stats.peak_open}, {stats.total_time * 1000:.2f} ms")
+    print(f"Cellules développées cohérentes avec return_explored: "
+          f"{'✅' if stats.expansions == len(explored) and stats.path_length == len(path) else '❌'}")
+    
+    dict_stats, array_stats = SearchStats(), SearchStats()
+    maze.astar_bidirectional(stats=dict_stats)
+    maze.astar_bidirectional(array_state=True, stats=array_stats)
+    same = all(getattr(dict_stats, name) == getattr(array_stats, name)
+               for name in ("algorithm", "expansions", "pushes", "stale_pops", "peak_open", "cost"))
+    print(f"Mêmes compteurs avec et sans array_state: {'✅' if same else '❌'}")
+
+
+def test_27_search_steps():
+    """Test 27: Recherche pas à pas et interruption (search_steps.py)."""
+    from bidirectional import BiDirectionalMaze
+    from main import create_complete_maze
+    from search_steps import drive
+    
+    print("\n" + "♦" * 70)
+    print("TEST 27 : RECHERCHE PAS À PAS")
+    print("♦" * 70)
+    
+    maze = create_complete_maze(30, 30, obstacle_type="random", seed=27)
+    maze = BiDirectionalMaze(maze.width, maze.height, maze.grid, maze.rewards, maze.start, maze.goal)
+    
+    steps = list(maze.solve_iter(batch_size=50, return_explored=True))
+    streamed = [cell for step in steps for cell in step.expanded]
+    path, explored = maze.solve(return_explored=True)
+    print(f"A*: {len(steps)} étapes, {len(streamed)} cellules développées")
+    print(f"Étapes cohérentes avec solve: "
+          f"{'✅' if steps[-1].path == path and set(streamed) == explored else '❌'}")
+    
+    steps = list(maze.astar_bidirectional_iter(batch_size=50, return_explored=True))
+    streamed = sum(len(step.expanded) + len(step.expanded_backward) for step in steps)
+    reference = maze.astar_bidirectional(return_explored=True)
+    print(f"A* bidirectionnel pas à pas identique: "
+          f"{'✅' if steps[-1].result[0] == reference[0] and streamed == reference[3] else '❌'}")
+    
+    step = drive(maze.solve_dijkstra_iter(batch_size=20), max_expansions=100)
+    print(f"Interruption après {step.expansions} cellules développées: "
+          f"{'✅' if not step.done and step.path is None else '❌'}")
+
+
+def test_28_anytime_search():
+    """Test 28: Recherche anytime ARA* avec échéance (anytime.py)."""
+    import time
+    from main import create_complete_maze
+    
+    print("\n" + "♦" * 70)
+    print("TEST 28 : RECHERCHE ANYTIME (ARA*)")
+    print("♦" * 70)
+    
+    maze = create_complete_maze(60, 60, obstacle_type="maze_pattern", add_bonuses=False, seed=28)
+    solutions = list(maze.solve_anytime_iter())
+    for solution in solutions:
+        print(f"epsilon={solution.epsilon:<5} borne={solution.bound:.3f} coût={solution.cost:.1f} "
+              f"développées={solution.expansions}")
+    optimal = maze.solve_anytime(epsilons=(1.0,))
+    bounds = [solution.bound for solution in solutions]
+    print(f"Bornes décroissantes et respectées: "
+          f"{'✅' if bounds == sorted(bounds, reverse=True) and all(solution.search_cost <= solution.bound * optimal.search_cost + 1e-9 for solution in solutions) else '❌'}")
+    print(f"Dernier chemin optimal: "
+          f"{'✅' if solutions[-1].bound == 1.0 and solutions[-1].search_cost == optimal.search_cost else '❌'}")
+    
+    expired = maze.solve_anytime(deadline=time.perf_counter())
+    print(f"Échéance dépassée, aucun chemin: {'✅' if expired is None else '❌'}")
+    
+    # Récompenses par défaut avec des diagonales : l'entrée diagonale dans l'arrivée
+    # rapporte plus qu'une entrée droite, la borne serait fausse
+    from benchmark import path_cost
+    from diagonal_maze import DiagonalMaze
+    diagonal = DiagonalMaze(maze.width, maze.height, maze.grid, maze.rewards, maze.start, maze.goal)
+    try:
+        diagonal.solve_anytime()
+        refused = False
+    except ValueError:
+        refused = True
+    print(f"DiagonalMaze avec récompense d'arrivée refusé: {'✅' if refused else '❌'}")
+    
+    rewards = maze.rewards.copy()
+    rewards[maze.goal] = -1.0
+    diagonal = DiagonalMaze(maze.width, maze.height, maze.grid, rewards, maze.start, maze.goal)
+    solution = diagonal.solve_anytime()
+    optimal_cost = path_cost(diagonal, diagonal.solve_dijkstra())
+    print(f"DiagonalMaze sans récompense d'arrivée, coût {solution.cost:.2f} / {optimal_cost:.2f}: "
+          f"{'✅' if solution.bound == 1.0 and abs(solution.cost - optimal_cost) < 1e-9 else '❌'}")
+
+
+def test_29_bounded_suboptimal_search():
+    """Test 29: A* pondéré et recherche focale à (1 + epsilon) de l'optimum."""
+    from benchmark import MAZE_DEFAULTS, expansion_savings, path_cost, run_benchmark
+    from diagonal_maze import DiagonalMaze
+    from main import create_complete_maze
+    from search_stats import SearchStats
+    
+    print("\n" + "♦" * 70)
+    print("TEST 29 : RECHERCHE SOUS-OPTIMALE BORNÉE")
+    print("♦" * 70)
+    
+    maze = create_complete_maze(60, 60, obstacle_type="random", seed=30, **MAZE_DEFAULTS)
+    diagonal = DiagonalMaze(maze.width, maze.height, maze.grid, maze.rewards, maze.start, maze.goal)
+    for target in (maze, diagonal):
+        optimal = path_cost(target, target.solve_dijkstra())
+        _, explored = target.solve(return_explored=True)
+        for focal in (False, True):
+            stats = SearchStats()
+            path = target.solve(epsilon=0.1, focal=focal, stats=stats)
+            cost = path_cost(target, path)
+            print(f"{type(target).__name__:<12} {stats.algorithm:<15} {stats.expansions:>5} développées "
+                  f"(A*: {len(explored)}), coût {cost:.2f} / {optimal:.2f}, borne {stats.bound}")
+            print(f"Coût dans la borne (1 + epsilon): {'✅' if cost <= stats.bound * optimal + 1e-9 else '❌'}")
+    
+    # Récompenses par défaut (bonus, récompense d'arrivée) : coûts négatifs, le
+    # rapport (1 + epsilon) n'a pas de sens et aucune borne n'est annoncée
+    maze = create_complete_maze(60, 60, obstacle_type="random", seed=30)
+    diagonal = DiagonalMaze(maze.width, maze.height, maze.grid, maze.rewards, maze.start, maze.goal)
+    for target in (maze, diagonal):
+        optimal = path_cost(target, target.solve_dijkstra())
+        for focal in (False, True):
+            stats = SearchStats()
+            cost = path_cost(target, target.solve(epsilon=0.1, focal=focal, stats=stats))
+            print(f"{type(target).__name__:<12} {stats.algorithm:<15} coût {cost:.2f} / {optimal:.2f}, "
+                  f"coûts négatifs, borne {stats.bound}: {'✅' if stats.bound is None else '❌'}")
+    
+    report = run_benchmark(sizes=(30,), obstacle_types=("vertical_walls",), repeat=1, warmup=0,
+                           memory=False, solvers=("astar", "weighted_astar"))
+    saving = expansion_savings(report)[0]
+    print(f"A* pondéré: {saving['saving']:.0%} de cellules développées en moins: "
+          f"{'✅' if saving['saving'] > 0 else '❌'}")
+
+
+def test_30_array_search_state():
+    """Test 30: État de recherche en tableaux (array_state) identique aux dictionnaires."""
+    from bidirectional import BiDirectionalMaze
+    from main import create_complete_maze
+    from search_stats import SearchStats
+    
+    print("\n" + "♦" * 70)
+    print("TEST 30 : ÉTAT DE RECHERCHE EN TABLEAUX (ARRAY_STATE)")
+    print("♦" * 70)
+    
+    maze = create_complete_maze(40, 40, obstacle_type="random", obstacle_density=0.25,
+                                add_bonuses=False, seed=30)
+    maze = BiDirectionalMaze(maze.width, maze.height, maze.grid, maze.rewards, maze.start, maze.goal)
+    state = maze.get_search_state()
+    
+    # Deux requêtes sur les mêmes tampons : la seconde ne voit rien de la première
+    for query, start in enumerate((maze.start, (maze.height - 1, 0)), 1):
+        maze.start = start
+        for name, method in (("A*", maze.solve), ("Dijkstra", maze.solve_dijkstra)):
+            results = []
+            for array_state in (False, True):
+                stats = SearchStats()
+                path, explored = method(return_explored=True, array_state=array_state, stats=stats)
+                results.append((path, stats.cost, explored))
+            same = results[0] == results[1]
+            print(f"Requête {query} {name:<9} chemin {len(results[0][0]) if results[0][0] else None}, "
+                  f"coût {results[0][1]}, {len(results[0][2])} explorées : "
+                  f"array_state identique {'✅' if same else '❌'}")
+        for name, method in (("A* bi.", maze.astar_bidirectional),
+                             ("Dijkstra bi.", maze.dijkstra_bidirectional)):
+            reference = method(return_explored=True, return_sets=True)
+            result = method(return_explored=True, return_sets=True, array_state=True)
+            same = (reference[:2], reference[3:]) == (result[:2], result[3:])
+            print(f"Requête {query} {name:<12} array_state identique (chemin, coût, explorées) "
+                  f"{'✅' if same else '❌'}")
+    print(f"Tampons réutilisés entre les requêtes: {'✅' if maze.get_search_state() is state else '❌'}")
+
+    # Récompenses par défaut (arrivée et bonus négatifs) : chemins complets, jamais tronqués
+    complete = True
+    for seed in range(10):
+        bonus = create_complete_maze(20, 20, num_bonuses=30, seed=seed)
+        bonus = BiDirectionalMaze(bonus.width, bonus.height, bonus.grid, bonus.rewards,
+                                  bonus.start, bonus.goal)
+        for method in (bonus.astar_bidirectional, bonus.dijkstra_bidirectional):
+            for array_state in (False, True):
+                path = method(array_state=array_state)
+                if path is not None and (path[0] != bonus.start or path[-1] != bonus.goal):
+                    complete = False
+    print(f"Chemins bidirectionnels complets avec bonus: {'✅' if complete else '❌'}")
+
+    # Parents corrompus en boucle : erreur plutôt qu'un chemin tronqué
+    state.reset()
+    _, parent, _, _ = state.views()
+    parent[0], parent[1] = 1, 0
+    try:
+        state.path_to(0)
+        raised = False
+    except RuntimeError:
+        raised = True
+    print(f"Boucle de parents détectée (RuntimeError): {'✅' if raised else '❌'}")
+
+
 def answer_questions():
     """Répond aux questions théoriques du TP."""
     print("\n" + "#" * 70)
@@ -306,6 +1345,31 @@ def main():
     test_3_no_path()
     test_4_negative_weights()
     test_5_comparison_large()
+    test_6_compiled_graph()
+    test_7_priority_queues()
+    test_8_integer_costs_dijkstra()
+    test_9_jump_point_search()
+    test_10_distance_field()
+    test_11_solve_many()
+    test_12_goal_cache()
+    test_13_incremental_replanning()
+    test_14_hierarchical_search()
+    test_15_landmark_heuristic()
+    test_16_contraction_hierarchy()
+    test_17_connectivity_index()
+    test_18_compact_storage()
+    test_19_mapped_maze_file()
+    test_20_tiled_world()
+    test_21_path_cache()
+    test_22_seeded_generation()
+    test_23_maze_corpus()
+    test_24_benchmark_harness()
+    test_25_performance_baseline()
+    test_26_search_stats()
+    test_27_search_steps()
+    test_28_anytime_search()
+    test_29_bounded_suboptimal_search()
+    test_30_array_search_state()
     
     # Réponses théoriques
     answer_questions()
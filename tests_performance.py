@@ -0,0 +1,225 @@
+"""
+Tests de performance - Comparaison des solveurs à une référence enregistrée
+
+Les solveurs sont exécutés sur un corpus de labyrinthes généré avec une graine
+fixe (corpus.py), puis comparés à la référence performance_baseline.json :
+
+- cellules développées : déterministes, comparées labyrinthe par labyrinthe
+  (toute augmentation au-delà de --expansion-tolerance est une régression) ;
+- coût des chemins : un écart signale un chemin non optimal ou une arrivée
+  devenue inaccessible ;
+- temps : somme sur le corpus des médianes par labyrinthe (perf_counter, avec
+  échauffement), régression au-delà de --time-tolerance (50 % par défaut :
+  d'une exécution à l'autre, les temps varient d'environ 20 % sur une machine
+  partagée ; une machine dédiée permet un seuil plus strict). Les temps
+  dépendent de la machine : --no-time ne vérifie que les cellules développées
+  et les coûts.
+
+Le script affiche un tableau des écarts et se termine avec le code 1 en cas de
+régression (2 si la référence est absente).
+
+Utilisation :
+
+    python tests_performance.py                       # comparaison à la référence
+    python tests_performance.py --update              # enregistre une nouvelle référence
+    python tests_performance.py --time-tolerance 0.2  # seuil plus strict (machine dédiée)
+    python tests_performance.py --no-time             # cellules développées et coûts seulement
+"""
+
+import argparse
+import json
+import os
+import platform
+import sys
+import tempfile
+import time
+
+import numpy as np
+
+from benchmark import SOLVERS, measure, path_cost
+from bidirectional import BiDirectionalMaze
+from corpus import generate_corpus
+from diagonal_maze import DiagonalMaze
+
+
+BASELINE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "performance_baseline.json")
+
+# Corpus de référence (les paramètres enregistrés dans la référence priment)
+CORPUS = {"count": 24, "width": 48, "height": 48, "seed": 2024, "endpoints": "random"}
+
+# Solveurs suivis
+GATED_SOLVERS = ("astar", "dijkstra", "bidirectional_astar", "bidirectional_dijkstra", "diagonal_astar")
+
+# Classe de labyrinthe de chaque type de cible de benchmark.SOLVERS
+MAZE_CLASSES = {"grid": BiDirectionalMaze, "diagonal": DiagonalMaze}
+
+
+def run_corpus(corpus_parameters=CORPUS, solvers=GATED_SOLVERS, repeat=7, warmup=2):
+    """
+    Mesure les solveurs sur le corpus de référence.
+
+    Args:
+        corpus_parameters (dict): Paramètres de generate_corpus (count, width,
+                                  height, seed, endpoints)
+        solvers (tuple): Noms des solveurs (clés de benchmark.SOLVERS, hors NetworkX)
+        repeat (int): Nombre d'exécutions chronométrées par labyrinthe
+        warmup (int): Nombre d'exécutions d'échauffement par labyrinthe
+
+    Returns:
+        dict: "meta" (corpus, paramètres, environnement) et "solvers" (par
+              solveur : expansions et cost par labyrinthe, totaux et temps en ms)
+    """
+    with tempfile.TemporaryDirectory() as directory:
+        corpus = generate_corpus(os.path.join(directory, "corpus.maze"), workers=1,
+                                 **corpus_parameters)
+        mazes = {kind: [corpus.maze(index, maze_class, copy=True) for index in range(len(corpus))]
+                 for kind, maze_class in MAZE_CLASSES.items()}
+        del corpus
+
+    results = {}
+    for name in solvers:
+        kind, run = SOLVERS[name]
+        expansions, costs, times = [], [], []
+        for maze in mazes[kind]:
+            measured = measure(run, maze, repeat, warmup, memory=False)
+            expansions.append(measured["expansions"])
+            costs.append(path_cost(maze, measured["path"]))
+            times.append(float(np.median(measured["times"])) * 1000)
+        results[name] = {
+            "expansions": expansions,
+            "cost": costs,
+            "total_expansions": sum(expansions),
+            "found": sum(cost is not None for cost in costs),
+            "time_ms": sum(times),
+        }
+
+    meta = {
+        "created": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "python": platform.python_version(),
+        "numpy": np.__version__,
+        "platform": platform.platform(),
+        "corpus": dict(corpus_parameters),
+        "repeat": repeat,
+        "warmup": warmup,
+    }
+    return {"meta": meta, "solvers": results}
+
+
+def _relative(current, reference):
+    if reference == 0:
+        return 0.0 if current == 0 else float("inf")
+    return (current - reference) / reference
+
+
+def _same_cost(current, reference):
+    if current is None or reference is None:
+        return current is None and reference is None
+    return abs(current - reference) <= 1e-6 * max(1.0, abs(reference))
+
+
+def compare(run, baseline, time_tolerance=0.5, expansion_tolerance=0.0, check_time=True):
+    """
+    Compare une exécution à la référence.
+
+    Args:
+        run (dict): Résultat de run_corpus
+        baseline (dict): Référence (même format)
+        time_tolerance (float): Ralentissement relatif toléré du temps total
+        expansion_tolerance (float): Augmentation relative tolérée des cellules
+                                     développées, par labyrinthe
+        check_time (bool): Si False, les temps sont affichés sans être vérifiés
+
+    Returns:
+        list: Lignes du tableau (solveur, mesure, référence, actuel, écart relatif,
+              régression, détail)
+    """
+    rows = []
+    for name, reference in baseline["solvers"].items():
+        current = run["solvers"].get(name)
+        if current is None:
+            rows.append((name, "solveur", "présent", "absent", None, True, ""))
+            continue
+
+        worse = [index for index, (now, before)
+                 in enumerate(zip(current["expansions"], reference["expansions"]))
+                 if _relative(now, before) > expansion_tolerance]
+        detail = ""
+        if worse:
+            detail = "plus de cellules : labyrinthes " + ", ".join(map(str, worse[:8])) + (" ..." if len(worse) > 8 else "")
+        rows.append((name, "développées", reference["total_expansions"], current["total_expansions"],
+                     _relative(current["total_expansions"], reference["total_expansions"]),
+                     bool(worse), detail))
+
+        changed = [index for index, (now, before) in enumerate(zip(current["cost"], reference["cost"]))
+                   if not _same_cost(now, before)]
+        detail = ""
+        if changed:
+            detail = "coût différent : labyrinthes " + ", ".join(map(str, changed[:8])) + (" ..." if len(changed) > 8 else "")
+        rows.append((name, "chemins trouvés", reference["found"], current["found"],
+                     _relative(current["found"], reference["found"]), bool(changed), detail))
+
+        slowdown = _relative(current["time_ms"], reference["time_ms"])
+        rows.append((name, "temps (ms)", reference["time_ms"], current["time_ms"], slowdown,
+                     check_time and slowdown > time_tolerance, "" if check_time else "non vérifié"))
+    return rows
+
+
+def _cell(value):
+    return f"{value:>11.2f}" if isinstance(value, float) else f"{value!s:>11}"
+
+
+def format_table(rows):
+    """Tableau lisible des écarts."""
+    lines = [f"{'solveur':<24} {'mesure':<16} {'référence':>11} {'actuel':>11} {'écart':>9}  statut",
+             "-" * 86]
+    for name, metric, reference, current, change, regression, detail in rows:
+        change = "" if change is None else f"{change:+.1%}"
+        status = "❌ régression" if regression else "✅"
+        lines.append(f"{name:<24} {metric:<16} {_cell(reference)} {_cell(current)} {change:>9}  {status}"
+                     + (f" ({detail})" if detail else ""))
+    return "\n".join(lines)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Comparaison des solveurs à une référence de performance")
+    parser.add_argument("--baseline", default=BASELINE_PATH, help="Fichier de référence (JSON)")
+    parser.add_argument("--update", action="store_true", help="Enregistre une nouvelle référence")
+    parser.add_argument("--time-tolerance", type=float, default=0.5,
+                        help="Ralentissement relatif toléré (0.5 = +50 %%)")
+    parser.add_argument("--expansion-tolerance", type=float, default=0.0,
+                        help="Augmentation relative tolérée des cellules développées")
+    parser.add_argument("--no-time", action="store_true", help="Ne pas vérifier les temps")
+    parser.add_argument("--repeat", type=int, default=7)
+    parser.add_argument("--warmup", type=int, default=2)
+    args = parser.parse_args(argv)
+
+    if args.update:
+        run = run_corpus(CORPUS, GATED_SOLVERS, args.repeat, args.warmup)
+        with open(args.baseline, "w") as handle:
+            json.dump(run, handle, indent=2)
+        print(f"Référence enregistrée dans {args.baseline}")
+        return 0
+
+    if not os.path.exists(args.baseline):
+        print(f"Référence absente : {args.baseline} (créez-la avec --update)")
+        return 2
+    with open(args.baseline) as handle:
+        baseline = json.load(handle)
+
+    corpus = baseline["meta"]["corpus"]
+    print(f"Corpus : {corpus['count']} labyrinthes {corpus['width']}x{corpus['height']}, "
+          f"graine {corpus['seed']} ; référence du {baseline['meta']['created']}")
+    solvers = tuple(name for name in baseline["solvers"] if name in SOLVERS)
+    run = run_corpus(corpus, solvers, args.repeat, args.warmup)
+    rows = compare(run, baseline, args.time_tolerance, args.expansion_tolerance, not args.no_time)
+    print(format_table(rows))
+
+    if any(row[5] for row in rows):
+        print("\n❌ Régression détectée")
+        return 1
+    print("\n✅ Aucune régression")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
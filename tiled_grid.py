@@ -0,0 +1,645 @@
+"""
+Grille en tuiles chargées à la demande, pour les mondes qui ne tiennent pas en mémoire.
+
+Le monde est découpé en tuiles carrées de tile_size x tile_size cellules,
+enregistrées l'une après l'autre dans un fichier (obstacles en uint8 puis
+récompenses). Seules les tuiles atteintes par la recherche sont lues :
+
+- TileCache garde les tuiles chargées dans un cache LRU borné en octets ; la
+  tuile la moins récemment utilisée est évincée (et réécrite si elle a été
+  modifiée). Les compteurs hits / misses / evictions servent à dimensionner le cache.
+- TiledArray présente la grille ou les récompenses comme un tableau 2D
+  (lecture et écriture d'une cellule, tranches rectangulaires).
+- LazyGridGraph remplace le graphe CSR compilé : les voisins d'une cellule et le
+  coût des arêtes sont calculés à la volée depuis les tuiles, avec les mêmes
+  conventions que compile_grid_graph. A*, Dijkstra et les recherches
+  bidirectionnelles fonctionnent donc sans modification.
+
+Les traitements vectorisés sur toute la grille (tables JPS+, champs de
+distance, repères ALT, index des composantes, hiérarchies...) matérialisent
+la grille complète et ne conviennent pas à un monde hors mémoire.
+
+Les tuiles du bord sont complétées par des obstacles jusqu'à tile_size.
+Les modifications (set_obstacle, set_reward...) sont écrites dans le fichier à
+l'éviction de la tuile ou par TileCache.flush().
+"""
+
+import json
+import os
+import struct
+from collections import OrderedDict
+
+import numpy as np
+
+from maze_file import ALIGNMENT, CLASS_ATTRIBUTES
+from storage import GridStorage
+
+
+MAGIC = b"MAZETIL\x01"
+FORMAT_VERSION = 1
+
+DEFAULT_TILE_SIZE = 256
+
+# Mémoire maximale occupée par les tuiles chargées (octets)
+DEFAULT_CACHE_BYTES = 256 * 1024 * 1024
+
+COST_FORMATS = ("float64", "float32")
+
+
+class _Tile:
+    """Tuile chargée : tableaux 2D et vues plates pour l'accès cellule par cellule."""
+
+    __slots__ = ("grid", "rewards", "blocked", "costs", "dirty")
+
+    def __init__(self, grid, rewards):
+        self.grid = grid
+        self.rewards = rewards
+        self.blocked = memoryview(grid.reshape(-1))
+        self.costs = memoryview(rewards.reshape(-1))
+        self.dirty = False
+
+
+class TileFile:
+    """
+    Fichier de tuiles : en-tête JSON puis tuiles de taille fixe.
+    """
+
+    def __init__(self, path, readonly=False):
+        """
+        Ouvre un fichier de tuiles existant.
+
+        Args:
+            path (str): Chemin du fichier
+            readonly (bool): Si True, les tuiles ne peuvent pas être modifiées
+
+        Raises:
+            ValueError: Si le fichier n'est pas un fichier de tuiles
+        """
+        self.path = os.path.abspath(path)
+        self.readonly = readonly
+        with open(path, "rb") as handle:
+            if handle.read(len(MAGIC)) != MAGIC:
+                raise ValueError(f"{path} n'est pas un fichier de tuiles")
+            (length,) = struct.unpack("<Q", handle.read(8))
+            self.header = json.loads(handle.read(length))
+        if self.header.get("format") != FORMAT_VERSION:
+            raise ValueError(f"Version de format non supportée : {self.header.get('format')}")
+        self.width = self.header["width"]
+        self.height = self.header["height"]
+        self.tile_size = self.header["tile_size"]
+        self.reward_dtype = np.dtype(self.header["costs"])
+        self.tiles_down = -(-self.height // self.tile_size)
+        self.tiles_across = -(-self.width // self.tile_size)
+        cells = self.tile_size * self.tile_size
+        self.grid_bytes = cells
+        self.tile_bytes = cells * (1 + self.reward_dtype.itemsize)
+        self._handle = None
+
+    @classmethod
+    def create(cls, path, width, height, tile_size=DEFAULT_TILE_SIZE, costs="float32",
+               reward=1.0, start=None, goal=None, attributes=None, metadata=None):
+        """
+        Crée un fichier de tuiles sans obstacle, tuile par tuile (sans allouer le monde).
+
+        Args:
+            path (str): Chemin du fichier
+            width (int): Largeur du monde
+            height (int): Hauteur du monde
+            tile_size (int): Côté des tuiles (cellules)
+            costs (str): Format des récompenses ("float32" ou "float64")
+            reward (float): Récompense initiale de chaque cellule
+            start (tuple, optional): Départ (par défaut (0, 0))
+            goal (tuple, optional): Arrivée (par défaut le coin opposé)
+            attributes (dict, optional): Attributs propres à la classe du labyrinthe
+            metadata (dict, optional): Métadonnées libres (sérialisables en JSON)
+
+        Returns:
+            TileFile: Fichier ouvert en écriture
+
+        Raises:
+            ValueError: Si le format des récompenses est inconnu
+        """
+        if costs not in COST_FORMATS:
+            raise ValueError(f"Format de coûts inconnu : '{costs}' (choix: {', '.join(COST_FORMATS)})")
+        header = {
+            "format": FORMAT_VERSION,
+            "width": width,
+            "height": height,
+            "tile_size": tile_size,
+            "costs": costs,
+            "start": list(start if start is not None else (0, 0)),
+            "goal": list(goal if goal is not None else (height - 1, width - 1)),
+            "attributes": attributes or {},
+            "metadata": metadata or {},
+        }
+        # La position des tuiles dépend de la taille de l'en-tête qui la contient
+        data_offset = 0
+        while True:
+            header["data_offset"] = data_offset
+            body = json.dumps(header).encode()
+            if len(MAGIC) + 8 + len(body) <= data_offset:
+                break
+            data_offset = -(-(len(MAGIC) + 8 + len(body)) // ALIGNMENT) * ALIGNMENT
+        with open(path, "wb") as handle:
+            handle.write(MAGIC)
+            handle.write(struct.pack("<Q", len(body)))
+            handle.write(body)
+
+        tiles = cls(path)
+        blank = _Tile(np.zeros((tile_size, tile_size), dtype=np.uint8),
+                      np.full((tile_size, tile_size), reward, dtype=costs))
+        for tile_row in range(tiles.tiles_down):
+            for tile_col in range(tiles.tiles_across):
+                tiles.write_tile(tile_row, tile_col, tiles._padded(tile_row, tile_col, blank))
+        return tiles
+
+    def _padded(self, tile_row, tile_col, tile):
+        """Marque comme obstacles les cellules d'une tuile du bord hors du monde."""
+        rows = self.height - tile_row * self.tile_size
+        cols = self.width - tile_col * self.tile_size
+        if rows >= self.tile_size and cols >= self.tile_size:
+            return tile
+        grid = tile.grid.copy()
+        grid[rows:, :] = 1
+        grid[:, cols:] = 1
+        return _Tile(grid, tile.rewards)
+
+    def _offset(self, tile_row, tile_col):
+        return self.header["data_offset"] + (tile_row * self.tiles_across + tile_col) * self.tile_bytes
+
+    def _file(self):
+        if self._handle is None:
+            self._handle = open(self.path, "rb" if self.readonly else "r+b")
+        return self._handle
+
+    def read_tile(self, tile_row, tile_col):
+        """Lit une tuile depuis le fichier."""
+        size = self.tile_size
+        grid = np.empty((size, size), dtype=np.uint8)
+        rewards = np.empty((size, size), dtype=self.reward_dtype)
+        handle = self._file()
+        handle.seek(self._offset(tile_row, tile_col))
+        handle.readinto(memoryview(grid).cast("B"))
+        handle.readinto(memoryview(rewards).cast("B"))
+        if self.readonly:
+            grid.flags.writeable = False
+            rewards.flags.writeable = False
+        return _Tile(grid, rewards)
+
+    def write_tile(self, tile_row, tile_col, tile):
+        """Écrit une tuile dans le fichier."""
+        handle = self._file()
+        handle.seek(self._offset(tile_row, tile_col))
+        handle.write(memoryview(np.ascontiguousarray(tile.grid, dtype=np.uint8)).cast("B"))
+        handle.write(memoryview(np.ascontiguousarray(tile.rewards, dtype=self.reward_dtype)).cast("B"))
+
+    def close(self):
+        if self._handle is not None:
+            self._handle.close()
+            self._handle = None
+
+    def __getstate__(self):
+        # Le descripteur de fichier n'est pas transmis : il est rouvert à la demande
+        state = self.__dict__.copy()
+        state["_handle"] = None
+        return state
+
+
+class TileCache:
+    """
+    Cache LRU des tuiles chargées, borné en octets.
+    """
+
+    def __init__(self, tiles, max_bytes=DEFAULT_CACHE_BYTES):
+        """
+        Args:
+            tiles (TileFile): Fichier de tuiles
+            max_bytes (int): Mémoire maximale des tuiles chargées (au moins une tuile)
+        """
+        self.tiles = tiles
+        self.tile_size = tiles.tile_size
+        self.max_bytes = max_bytes
+        self.capacity = max(1, max_bytes // tiles.tile_bytes)
+        self._loaded = OrderedDict()
+        # Dernière tuile servie : les voisins successifs tombent presque toujours
+        # dans la même tuile, sans passer par l'OrderedDict
+        self._last_key = None
+        self._last_tile = None
+        self.reset_stats()
+
+    def __getstate__(self):
+        # Les tuiles chargées ne sont pas sérialisées (processus de travail de
+        # solve_many) : elles sont relues à la demande
+        state = self.__dict__.copy()
+        state.update(_loaded=OrderedDict(), _last_key=None, _last_tile=None)
+        return state
+
+    def reset_stats(self):
+        """Remet les compteurs à zéro."""
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.writes = 0
+
+    def stats(self):
+        """
+        Retourne les compteurs du cache.
+
+        Returns:
+            dict: hits, misses, hit_rate, evictions, writes (tuiles réécrites),
+                  loaded (tuiles en mémoire), capacity, bytes (mémoire des tuiles chargées)
+        """
+        accesses = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / accesses if accesses else 0.0,
+            "evictions": self.evictions,
+            "writes": self.writes,
+            "loaded": len(self._loaded),
+            "capacity": self.capacity,
+            "bytes": len(self._loaded) * self.tiles.tile_bytes,
+        }
+
+    def tile(self, tile_row, tile_col):
+        """
+        Retourne une tuile, lue depuis le fichier si elle n'est pas en cache.
+
+        Args:
+            tile_row (int): Ligne de la tuile
+            tile_col (int): Colonne de la tuile
+
+        Returns:
+            _Tile: Tuile chargée
+        """
+        key = (tile_row, tile_col)
+        if key == self._last_key:
+            # Déjà la plus récente de l'ordre LRU
+            self.hits += 1
+            return self._last_tile
+        loaded = self._loaded
+        tile = loaded.get(key)
+        if tile is not None:
+            self.hits += 1
+            loaded.move_to_end(key)
+        else:
+            tile = self._load(key)
+        self._last_key = key
+        self._last_tile = tile
+        return tile
+
+    def _load(self, key):
+        """Lit une tuile absente du cache et évince la moins récemment utilisée."""
+        self.misses += 1
+        loaded = self._loaded
+        tile = self.tiles.read_tile(*key)
+        loaded[key] = tile
+        if len(loaded) > self.capacity:
+            old_key, old_tile = loaded.popitem(last=False)
+            self.evictions += 1
+            if old_tile.dirty:
+                self.tiles.write_tile(*old_key, old_tile)
+                self.writes += 1
+        return tile
+
+    def flush(self):
+        """Écrit dans le fichier les tuiles modifiées encore en cache."""
+        for key, tile in self._loaded.items():
+            if tile.dirty:
+                self.tiles.write_tile(*key, tile)
+                tile.dirty = False
+                self.writes += 1
+        if self.tiles._handle is not None:
+            self.tiles._handle.flush()
+
+    def clear(self):
+        """Vide le cache (les tuiles modifiées sont d'abord écrites)."""
+        self.flush()
+        self._loaded.clear()
+        self._last_key = None
+        self._last_tile = None
+
+    def arrays(self):
+        """Retourne les vues (grid, rewards) du monde en tuiles."""
+        return TiledArray(self, "grid"), TiledArray(self, "rewards")
+
+    def graph(self, directions):
+        """Retourne le graphe paresseux du monde pour un voisinage donné."""
+        return LazyGridGraph(self, directions)
+
+
+class TiledArray:
+    """
+    Grille d'obstacles ou matrice de récompense servie par un TileCache.
+    """
+
+    # Tableau externe : GridStorage ne le copie pas
+    mapped = True
+    ndim = 2
+
+    def __init__(self, cache, field):
+        """
+        Args:
+            cache (TileCache): Cache des tuiles
+            field (str): "grid" ou "rewards"
+        """
+        self.cache = cache
+        self.field = field
+        tiles = cache.tiles
+        self.shape = (tiles.height, tiles.width)
+        self.dtype = np.dtype(np.uint8) if field == "grid" else tiles.reward_dtype
+
+    @property
+    def size(self):
+        return self.shape[0] * self.shape[1]
+
+    @property
+    def nbytes(self):
+        return self.size * self.dtype.itemsize
+
+    def __len__(self):
+        return self.shape[0]
+
+    def _cell(self, key):
+        """Retourne (tuile, indice plat dans la tuile) si key désigne une cellule, sinon None."""
+        if not (isinstance(key, tuple) and len(key) == 2
+                and isinstance(key[0], (int, np.integer)) and isinstance(key[1], (int, np.integer))):
+            return None
+        row, col = int(key[0]), int(key[1])
+        height, width = self.shape
+        if row < 0:
+            row += height
+        if col < 0:
+            col += width
+        if not (0 <= row < height and 0 <= col < width):
+            raise IndexError(f"Cellule {key} hors de la grille {self.shape}")
+        size = self.cache.tile_size
+        tile_row, in_row = divmod(row, size)
+        tile_col, in_col = divmod(col, size)
+        return self.cache.tile(tile_row, tile_col), in_row * size + in_col
+
+    def _region(self, key):
+        """Tranches de lignes et de colonnes (pas de 1) d'une clé rectangulaire, sinon None."""
+        if not isinstance(key, tuple):
+            key = (key, slice(None))
+        if len(key) != 2:
+            return None
+        bounds = []
+        for part, length in zip(key, self.shape):
+            if isinstance(part, (int, np.integer)):
+                part = int(part) + length if part < 0 else int(part)
+                bounds.append((part, part + 1))
+            elif isinstance(part, slice) and part.step in (None, 1):
+                bounds.append(part.indices(length)[:2])
+            else:
+                return None
+        return bounds
+
+    def _blocks(self, bounds):
+        """Parcourt les intersections d'une région avec les tuiles."""
+        (top, bottom), (left, right) = bounds
+        size = self.cache.tile_size
+        for tile_row in range(top // size, -(-bottom // size)):
+            row_begin = max(top, tile_row * size)
+            row_end = min(bottom, (tile_row + 1) * size)
+            for tile_col in range(left // size, -(-right // size)):
+                col_begin = max(left, tile_col * size)
+                col_end = min(right, (tile_col + 1) * size)
+                tile = self.cache.tile(tile_row, tile_col)
+                yield (tile, (slice(row_begin - top, row_end - top), slice(col_begin - left, col_end - left)),
+                       (slice(row_begin - tile_row * size, row_end - tile_row * size),
+                        slice(col_begin - tile_col * size, col_end - tile_col * size)))
+
+    def __getitem__(self, key):
+        cell = self._cell(key)
+        if cell is not None:
+            tile, index = cell
+            return (tile.blocked if self.field == "grid" else tile.costs)[index]
+        bounds = self._region(key)
+        if bounds is None:
+            return np.asarray(self)[key]
+        (top, bottom), (left, right) = bounds
+        values = np.empty((max(0, bottom - top), max(0, right - left)), dtype=self.dtype)
+        for tile, target, source in self._blocks(bounds):
+            values[target] = getattr(tile, self.field)[source]
+        # Même forme que l'indexation NumPy (dimensions indexées par un entier retirées)
+        if not isinstance(key, tuple):
+            key = (key, slice(None))
+        squeeze = tuple(axis for axis, part in enumerate(key) if not isinstance(part, slice))
+        return values.squeeze(axis=squeeze) if squeeze else values
+
+    def __setitem__(self, key, value):
+        if self.cache.tiles.readonly:
+            # Même erreur qu'un tableau NumPy en lecture seule
+            raise ValueError("assignment destination is read-only")
+        cell = self._cell(key)
+        if cell is not None:
+            tile, index = cell
+            (tile.blocked if self.field == "grid" else tile.costs)[index] = value
+            tile.dirty = True
+            return
+        bounds = self._region(key)
+        if bounds is None:
+            raise TypeError("Une grille en tuiles n'accepte que des affectations rectangulaires")
+        (top, bottom), (left, right) = bounds
+        values = np.broadcast_to(np.asarray(value, dtype=self.dtype),
+                                 (max(0, bottom - top), max(0, right - left)))
+        for tile, target, source in self._blocks(bounds):
+            getattr(tile, self.field)[source] = values[target]
+            tile.dirty = True
+
+    def __array__(self, dtype=None, copy=None):
+        # Matérialise tout le monde : réservé aux mondes qui tiennent en mémoire
+        values = self[:, :]
+        return values if dtype is None else values.astype(dtype)
+
+    def __eq__(self, other):
+        return np.asarray(self) == other
+
+    def __ne__(self, other):
+        return np.asarray(self) != other
+
+    __hash__ = None
+
+    def astype(self, dtype):
+        return np.asarray(self).astype(dtype)
+
+    def copy(self):
+        return np.asarray(self)
+
+    def __repr__(self):
+        return f"TiledArray(field={self.field!r}, shape={self.shape}, tile_size={self.cache.tile_size})"
+
+
+class LazyGridGraph:
+    """
+    Graphe d'un monde en tuiles : voisins et coûts calculés à la demande.
+
+    Même interface de parcours que GridGraph (adjacency, neighbors, num_nodes,
+    node_id, node_coords) sans tableaux CSR.
+    """
+
+    def __init__(self, cache, directions):
+        """
+        Args:
+            cache (TileCache): Cache des tuiles
+            directions (tuple): Tuples (delta_row, delta_col, multiplicateur_coût)
+        """
+        self.cache = cache
+        self.directions = tuple(directions)
+        self.height = cache.tiles.height
+        self.width = cache.tiles.width
+        self.num_nodes = self.height * self.width
+        self._adjacency = None
+
+    def node_id(self, row, col):
+        """Retourne l'identifiant plat d'une cellule."""
+        return row * self.width + col
+
+    def node_coords(self, node):
+        """Retourne les coordonnées (row, col) d'un identifiant plat."""
+        return divmod(int(node), self.width)
+
+    def adjacency(self):
+        """
+        Retourne des vues d'arêtes parcourues comme GridGraph.adjacency.
+
+        Les arêtes ne sont pas numérotées globalement : indptr[u] calcule les
+        voisins de u dans les listes indices et weights (réécrites en place) et
+        retourne 0 ; l'appel suivant indptr[u + 1] retourne leur nombre. La
+        boucle ``for edge in range(indptr[u], indptr[u + 1])`` des solveurs
+        parcourt ainsi les arêtes de u sans autre appel par arête.
+
+        Returns:
+            tuple: (indptr, indices, weights)
+        """
+        if self._adjacency is None:
+            offsets = _LazyOffsets(self)
+            self._adjacency = (offsets, offsets.indices, offsets.weights)
+        return self._adjacency
+
+    def neighbors(self, node):
+        """
+        Retourne les voisins franchissables d'un noeud et le coût des arêtes.
+
+        Args:
+            node (int): Identifiant plat du noeud
+
+        Returns:
+            list: Couples (voisin, coût) dans l'ordre des directions du labyrinthe
+        """
+        return list(zip(*self.edges(node)))
+
+    def edges(self, node):
+        """
+        Retourne les voisins franchissables d'un noeud et le coût des arêtes.
+
+        Args:
+            node (int): Identifiant plat du noeud
+
+        Returns:
+            tuple: (voisins, coûts), listes dans l'ordre des directions du labyrinthe
+        """
+        height, width = self.height, self.width
+        size = self.cache.tile_size
+        tile = self.cache.tile
+        row, col = divmod(node, width)
+        targets = []
+        costs = []
+        for d_row, d_col, mult in self.directions:
+            new_row = row + d_row
+            new_col = col + d_col
+            if 0 <= new_row < height and 0 <= new_col < width:
+                tile_row, in_row = divmod(new_row, size)
+                tile_col, in_col = divmod(new_col, size)
+                target = tile(tile_row, tile_col)
+                index = in_row * size + in_col
+                if target.blocked[index] == 0:
+                    targets.append(new_row * width + new_col)
+                    costs.append(mult * -target.costs[index])
+        return targets, costs
+
+    def __len__(self):
+        return self.num_nodes
+
+
+class _LazyOffsets:
+    """Décalages des arêtes d'un LazyGridGraph, calculées noeud par noeud (voir adjacency)."""
+
+    __slots__ = ("graph", "indices", "weights", "_pending")
+
+    def __init__(self, graph):
+        self.graph = graph
+        self.indices = []
+        self.weights = []
+        # Noeud dont le début a été demandé et dont la fin ne l'a pas encore été
+        self._pending = -1
+
+    def __getitem__(self, node):
+        if node == self._pending + 1 and self._pending >= 0:
+            self._pending = -1
+            return len(self.indices)
+        self.indices[:], self.weights[:] = self.graph.edges(node)
+        self._pending = node
+        return 0
+
+
+def save_tiled(maze, path, tile_size=DEFAULT_TILE_SIZE, costs=None, metadata=None):
+    """
+    Enregistre un labyrinthe en mémoire dans un fichier de tuiles.
+
+    Args:
+        maze (Maze): Labyrinthe
+        path (str): Chemin du fichier
+        tile_size (int): Côté des tuiles (cellules)
+        costs (str, optional): Format des récompenses (par défaut celui du
+                               labyrinthe, float32 pour des récompenses int16)
+        metadata (dict, optional): Métadonnées libres
+
+    Returns:
+        TileFile: Fichier écrit
+    """
+    if costs is None:
+        costs = maze.storage.costs if maze.storage.costs in COST_FORMATS else "float32"
+    attributes = {name: getattr(maze, name) for name in CLASS_ATTRIBUTES if hasattr(maze, name)}
+    tiles = TileFile.create(path, maze.width, maze.height, tile_size, costs, 0.0,
+                            maze.start, maze.goal, attributes, metadata)
+    grid = maze.grid
+    rewards = maze.rewards
+    for tile_row in range(tiles.tiles_down):
+        for tile_col in range(tiles.tiles_across):
+            top, left = tile_row * tile_size, tile_col * tile_size
+            bottom, right = min(top + tile_size, maze.height), min(left + tile_size, maze.width)
+            tile = _Tile(np.ones((tile_size, tile_size), dtype=np.uint8),
+                         np.zeros((tile_size, tile_size), dtype=costs))
+            tile.grid[:bottom - top, :right - left] = np.asarray(grid[top:bottom, left:right]) != 0
+            tile.rewards[:bottom - top, :right - left] = rewards[top:bottom, left:right]
+            tiles.write_tile(tile_row, tile_col, tile)
+    tiles.close()
+    return tiles
+
+
+def open_tiled(maze_class, path, cache_bytes=DEFAULT_CACHE_BYTES, readonly=False):
+    """
+    Ouvre un fichier de tuiles comme labyrinthe, sans charger aucune tuile.
+
+    Args:
+        maze_class (type): Classe du labyrinthe à construire
+        path (str): Chemin du fichier
+        cache_bytes (int): Mémoire maximale des tuiles chargées
+        readonly (bool): Si True, toute modification de la grille lève une erreur
+
+    Returns:
+        Maze: Labyrinthe dont maze.tiles est le TileCache
+    """
+    tiles = TileFile(path, readonly)
+    cache = TileCache(tiles, cache_bytes)
+    grid, rewards = cache.arrays()
+    header = tiles.header
+    maze = maze_class(tiles.width, tiles.height, grid, rewards, tuple(header["start"]),
+                      tuple(header["goal"]), storage=GridStorage("uint8", header["costs"]))
+    for name, value in header["attributes"].items():
+        if hasattr(maze, name):
+            setattr(maze, name, value)
+    maze.tiles = cache
+    return maze